@@ -9,7 +9,10 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Type
 
 from docx.api import Document
+from docx.compose import compose
+from docx.metadata import probe
 from docx.parts.ftnedn import EndnotesPart, FootnotesPart
+from docx.streaming import StreamingDocumentWriter
 
 if TYPE_CHECKING:
     from docx.opc.part import Part
@@ -18,7 +21,7 @@ __version__ = "1.2.12"
 __fork__ = "adrijh/python-docx"
 
 
-__all__ = ["Document"]
+__all__ = ["Document", "StreamingDocumentWriter", "compose", "probe"]
 
 
 # -- register custom Part classes with opc package reader --
@@ -27,11 +30,18 @@ from docx.opc.constants import CONTENT_TYPE as CT
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.part import PartFactory
 from docx.opc.parts.coreprops import CorePropertiesPart
+from docx.parts.comments import (
+    CommentsExtendedPart,
+    CommentsExtensiblePart,
+    CommentsIdsPart,
+    CommentsPart,
+)
 from docx.parts.document import DocumentPart
 from docx.parts.hdrftr import FooterPart, HeaderPart
 from docx.parts.image import ImagePart
 from docx.parts.numbering import NumberingPart
 from docx.parts.ole import OlePart
+from docx.parts.people import PeoplePart
 from docx.parts.settings import SettingsPart
 from docx.parts.styles import StylesPart
 
@@ -48,10 +58,15 @@ def part_class_selector(content_type: str, reltype: str) -> Type[Part] | None:
 
 PartFactory.part_class_selector = part_class_selector
 PartFactory.part_type_for[CT.OPC_CORE_PROPERTIES] = CorePropertiesPart
+PartFactory.part_type_for[CT.WML_COMMENTS] = CommentsPart
+PartFactory.part_type_for[CT.WML_COMMENTS_EXTENDED] = CommentsExtendedPart
+PartFactory.part_type_for[CT.WML_COMMENTS_EXTENSIBLE] = CommentsExtensiblePart
+PartFactory.part_type_for[CT.WML_COMMENTS_IDS] = CommentsIdsPart
 PartFactory.part_type_for[CT.WML_DOCUMENT_MAIN] = DocumentPart
 PartFactory.part_type_for[CT.WML_FOOTER] = FooterPart
 PartFactory.part_type_for[CT.WML_HEADER] = HeaderPart
 PartFactory.part_type_for[CT.WML_NUMBERING] = NumberingPart
+PartFactory.part_type_for[CT.WML_PEOPLE] = PeoplePart
 PartFactory.part_type_for[CT.WML_SETTINGS] = SettingsPart
 PartFactory.part_type_for[CT.WML_STYLES] = StylesPart
 PartFactory.part_type_for[CT.WML_FOOTNOTES] = FootnotesPart
@@ -59,12 +74,17 @@ PartFactory.part_type_for[CT.WML_ENDNOTES] = EndnotesPart
 
 del (
     CT,
+    CommentsExtendedPart,
+    CommentsExtensiblePart,
+    CommentsIdsPart,
+    CommentsPart,
     CorePropertiesPart,
     DocumentPart,
     FooterPart,
     HeaderPart,
     NumberingPart,
     PartFactory,
+    PeoplePart,
     SettingsPart,
     StylesPart,
     FootnotesPart,
@@ -0,0 +1,111 @@
+"""Opening and saving documents from asyncio code without blocking the event loop.
+
+Reading a package (unzip, inflate, XML parse) and writing one (XML serialize, deflate,
+zip) are CPU-bound and run in an executor, the default executor of the running loop
+unless another is given. Async byte sources and sinks, like an `asyncio.StreamReader`
+or an `aiofiles` file, are read and written on the event loop, with the package itself
+held in a spooled temporary file that moves to disk when it grows large.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import tempfile
+from typing import IO, TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, TypeVar, Unpack
+
+from docx.api import Document
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from docx.document import Document as DocumentObject
+    from docx.types import DocumentOpts
+
+T = TypeVar("T")
+
+# -- a package larger than this is spooled to a temporary file rather than memory --
+_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+
+async def open_document(
+    docx: str | IO[bytes] | Any | None = None,
+    executor: Executor | None = None,
+    **kwargs: Unpack[DocumentOpts],
+) -> DocumentObject:
+    """Return a |Document| loaded from `docx` without blocking the event loop.
+
+    `docx` can be anything |Document| accepts, or an async byte source: an object with
+    an `async read(size)` method or an async iterable of `bytes` chunks. An async source
+    is read to its end on the event loop before the package is loaded in `executor`.
+
+    Cancelling the call while the package is loading does not interrupt the executor,
+    but the document it produces is discarded.
+    """
+    if not _is_async_source(docx):
+        return await _run(executor, functools.partial(Document, docx, **kwargs))
+
+    with tempfile.SpooledTemporaryFile(_SPOOL_MAX_SIZE) as spool:
+        await _read_into(docx, spool)
+        spool.seek(0)
+        return await _run(executor, functools.partial(Document, spool, **kwargs))
+
+
+async def save_document(
+    document: DocumentObject,
+    path_or_stream: str | IO[bytes] | Any,
+    executor: Executor | None = None,
+):
+    """Save `document` to `path_or_stream` without blocking the event loop.
+
+    `path_or_stream` can be anything :meth:`.Document.save` accepts, or an async byte
+    sink: an object with an `async write(data)` method, or a `write(data)` method and an
+    `async drain()` method like `asyncio.StreamWriter`. The document must not be changed
+    until saving completes.
+
+    When the call is cancelled, nothing more is written to an async sink. A save to a
+    path or stream already under way in `executor` runs to completion.
+    """
+    if not _is_async_sink(path_or_stream):
+        return await _run(executor, functools.partial(document.save, path_or_stream))
+
+    with tempfile.SpooledTemporaryFile(_SPOOL_MAX_SIZE) as spool:
+        await _run(executor, functools.partial(document.save, spool))
+        spool.seek(0)
+        while chunk := spool.read(_CHUNK_SIZE):
+            result = path_or_stream.write(chunk)
+            if inspect.isawaitable(result):
+                await result
+            drain = getattr(path_or_stream, "drain", None)
+            if drain is not None:
+                await drain()
+
+
+def _is_async_sink(obj: object) -> bool:
+    """True when `obj` must be written to by awaiting its `write()` or `drain()`."""
+    return inspect.iscoroutinefunction(getattr(obj, "write", None)) or (
+        inspect.iscoroutinefunction(getattr(obj, "drain", None))
+    )
+
+
+def _is_async_source(obj: object) -> bool:
+    """True when `obj` must be read from by awaiting its `read()` or async iteration."""
+    return inspect.iscoroutinefunction(getattr(obj, "read", None)) or isinstance(obj, AsyncIterable)
+
+
+async def _read_into(source: Any, file: IO[bytes]):
+    """Write all the bytes of async `source` to `file`."""
+    if inspect.iscoroutinefunction(getattr(source, "read", None)):
+        while chunk := await source.read(_CHUNK_SIZE):
+            file.write(chunk)
+        return
+
+    async for chunk in source:
+        file.write(chunk)
+
+
+def _run(executor: Executor | None, fn: Callable[[], T]) -> Awaitable[T]:
+    """Future of the result of calling `fn` in `executor`."""
+    return asyncio.get_running_loop().run_in_executor(executor, fn)
@@ -5,6 +5,7 @@ Provides a syntactically more convenient API for interacting with the OpcPackage
 
 from __future__ import annotations
 
+import functools
 import os
 from typing import IO, TYPE_CHECKING, Unpack, cast
 
@@ -22,16 +23,30 @@ def Document(docx: str | IO[bytes] | None = None, **kwargs: Unpack[DocumentOpts]
     to a ``.docx`` file (a string) or a file-like object.
 
     If `docx` is missing or ``None``, the built-in default document "template" is
-    loaded.
+    loaded. The default template is read and parsed only once; each call produces an
+    independent in-memory copy of it.
+
+    Distinct documents can be opened, edited and saved in different threads at the same
+    time; each thread parses with its own XML parser. A single document must not be
+    used from more than one thread at once.
     """
-    docx = _default_docx_path() if docx is None else docx
-    document_part = cast("DocumentPart", Package.open(docx, **kwargs).main_document_part)
+    package = _default_package().clone() if docx is None else Package.open(docx, **kwargs)
+    document_part = cast("DocumentPart", package.main_document_part)
     if document_part.content_type != CT.WML_DOCUMENT_MAIN:
         tmpl = "file '%s' is not a Word file, content type is '%s'"
         raise ValueError(tmpl % (docx, document_part.content_type))
     return document_part.document
 
 
+@functools.lru_cache(maxsize=1)
+def _default_package() -> Package:
+    """The package loaded from the built-in default .docx, loaded once and cached.
+
+    This package is never handed out directly, only clones of it, so it stays pristine.
+    """
+    return cast(Package, Package.open(_default_docx_path()))
+
+
 def _default_docx_path():
     """Return the path to the built-in default .docx package."""
     _thisdir = os.path.split(__file__)[0]
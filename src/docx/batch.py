@@ -0,0 +1,201 @@
+"""Running a function over many documents in a pool of worker processes.
+
+Opening and saving a document is CPU-bound (inflate, XML parse and serialize), so a batch
+of documents is spread over processes rather than threads. Results stream back as each
+chunk of documents finishes, so memory use does not grow with the number of documents.
+"""
+
+from __future__ import annotations
+
+import os
+import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from docx.api import Document
+from docx.package import Package
+
+if TYPE_CHECKING:
+    import docx.document
+    from docx.parts.document import DocumentPart
+
+StrPath = Union[str, "os.PathLike[str]"]
+
+T = TypeVar("T")
+
+# -- template package of a worker process, loaded once by `_init_worker()` --
+_template_package: Package | None = None
+
+
+def map_documents(
+    paths: Iterable[StrPath],
+    fn: Callable[..., T],
+    workers: int | None = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+    template: str | None = None,
+) -> Iterator[BatchResult[T]]:
+    """Generate a |BatchResult| for each of `paths` after calling `fn` on its document.
+
+    `fn` is called in a worker process as `fn(path, document)`, where `document` is the
+    |Document| opened from `path`. When `template` is the path of a .docx file, it is
+    loaded once in each worker and `fn` is called as `fn(path, document, template)`
+    with a fresh copy of it for each path, for example to fill it from `document` and
+    save it. `fn` and its return value must be picklable, so `fn` is typically a
+    module-level function.
+
+    `workers` is the number of processes, the CPU count by default. Paths are sent to
+    workers `chunksize` at a time; a larger chunk reduces overhead when documents are
+    small. Results are generated in the order of `paths` when `ordered` is |True| and
+    in the order they complete otherwise.
+
+    An exception raised while processing a document is reported in its result rather
+    than raised, so one bad file does not stop the batch. When a worker process dies,
+    for example when it runs out of memory, each path of the chunks in flight at that
+    time is reported as failed and the batch carries on in a new pool of workers.
+    Closing the generator early cancels the chunks not yet started.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1, got %d" % chunksize)
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(paths, chunksize)
+    # -- a couple of chunks per worker keeps workers busy without reading all of
+    # -- `paths` up front, which may be a generator over a very large folder
+    max_pending = workers * 2
+
+    def new_executor() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(template,))
+
+    executor = new_executor()
+    try:
+        with_template = template is not None
+
+        def submit(chunk: List[StrPath]) -> Future[List[BatchResult[T]]]:
+            nonlocal executor
+            try:
+                return executor.submit(_process_chunk, fn, chunk, with_template)
+            except BrokenProcessPool:
+                # -- a worker died; the futures of the old pool have all failed with
+                # -- `BrokenProcessPool` and are reported as errors by `_chunk_results()`
+                executor.shutdown(wait=False, cancel_futures=True)
+                executor = new_executor()
+                return executor.submit(_process_chunk, fn, chunk, with_template)
+
+        if ordered:
+            queue: Deque[Tuple[List[StrPath], Future[List[BatchResult[T]]]]] = deque(
+                (chunk, submit(chunk)) for chunk in islice(chunks, max_pending)
+            )
+            while queue:
+                results = _chunk_results(*queue.popleft())
+                queue.extend((chunk, submit(chunk)) for chunk in islice(chunks, 1))
+                yield from results
+        else:
+            pending: Dict[Future[List[BatchResult[T]]], List[StrPath]] = {
+                submit(chunk): chunk for chunk in islice(chunks, max_pending)
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                results = [r for f in done for r in _chunk_results(pending.pop(f), f)]
+                pending.update((submit(chunk), chunk) for chunk in islice(chunks, len(done)))
+                yield from results
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+class BatchResult(Generic[T]):
+    """Outcome of processing one document with :func:`map_documents`.
+
+    `value` is what the function returned, |None| when it raised. `error` is the
+    exception raised, |None| on success, and `traceback` its formatted traceback.
+    """
+
+    __slots__ = ("path", "value", "error", "traceback")
+
+    def __init__(
+        self,
+        path: StrPath,
+        value: T | None = None,
+        error: BaseException | None = None,
+        traceback: str | None = None,
+    ):
+        self.path = path
+        self.value = value
+        self.error = error
+        self.traceback = traceback
+
+    def __repr__(self) -> str:
+        if self.error is None:
+            return "BatchResult(%r, value=%r)" % (self.path, self.value)
+        return "BatchResult(%r, error=%r)" % (self.path, self.error)
+
+    @property
+    def ok(self) -> bool:
+        """|True| when the function returned without raising."""
+        return self.error is None
+
+
+def _chunk_results(
+    chunk: List[StrPath], future: Future[List[BatchResult[T]]]
+) -> List[BatchResult[T]]:
+    """Results of the chunk processed by `future`.
+
+    When the chunk as a whole failed, for example because a result could not be pickled
+    or a worker process died, the failure is reported for each path in the chunk.
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        tb = "".join(traceback.format_exception(e))
+        return [BatchResult(path, error=e, traceback=tb) for path in chunk]
+
+
+def _chunks(paths: Iterable[StrPath], chunksize: int) -> Iterator[List[StrPath]]:
+    """Generate successive lists of at most `chunksize` items from `paths`."""
+    paths = iter(paths)
+    while chunk := list(islice(paths, chunksize)):
+        yield chunk
+
+
+def _init_worker(template: str | None):
+    """Load the template of the batch once, when a worker process starts."""
+    global _template_package
+    _template_package = None if template is None else cast(Package, Package.open(template))
+
+
+def _process_chunk(
+    fn: Callable[..., T], chunk: List[StrPath], with_template: bool
+) -> List[BatchResult[T]]:
+    """Call `fn` on the document at each path in `chunk`, in a worker process."""
+    results: List[BatchResult[T]] = []
+    for path in chunk:
+        try:
+            args: List[object] = [path, Document(os.fspath(path))]
+            if with_template:
+                args.append(_template_document())
+            results.append(BatchResult(path, value=fn(*args)))
+        except Exception as e:
+            results.append(BatchResult(path, error=e, traceback=traceback.format_exc()))
+    return results
+
+
+def _template_document() -> docx.document.Document:
+    """A new copy of the template document of this worker process."""
+    assert _template_package is not None
+    document_part = cast("DocumentPart", _template_package.clone().main_document_part)
+    return document_part.document
@@ -8,7 +8,7 @@ specialized ones like structured document tags.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterator
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Tuple, TypeVar
 
 from typing_extensions import TypeAlias
 
@@ -16,7 +16,8 @@ from docx.oxml.ftnedn import CT_FtnEdn
 from docx.oxml.table import CT_Tbl
 from docx.oxml.text.block import CT_Sdt
 from docx.oxml.text.paragraph import CT_P
-from docx.shared import StoryChild
+from docx.oxml.xmlchemy import tree_version
+from docx.shared import ProxySequence, StoryChild
 from docx.text.paragraph import Paragraph
 
 if TYPE_CHECKING:
@@ -24,13 +25,16 @@ if TYPE_CHECKING:
     from docx.oxml.document import CT_Body
     from docx.oxml.section import CT_HdrFtr
     from docx.oxml.table import CT_Tc
-    from docx.shared import Length
+    from docx.oxml.xmlchemy import BaseOxmlElement
+    from docx.shared import Length, ProxyCache
     from docx.styles.style import ParagraphStyle
     from docx.table import Table
     from docx.text.block import SdtBlock
 
 BlockItemElement: TypeAlias = "CT_Body | CT_HdrFtr | CT_Tc | CT_FtnEdn"
 
+T = TypeVar("T")
+
 
 class BlockItemContainer(StoryChild):
     """Base class for proxy objects that can contain block items.
@@ -40,9 +44,14 @@ class BlockItemContainer(StoryChild):
     paragraph or table.
     """
 
+    __slots__ = ("_element", "_views")
+
     def __init__(self, element: BlockItemElement, parent: t.ProvidesStoryPart):
         super(BlockItemContainer, self).__init__(parent)
         self._element = element
+        self._views: Dict[
+            Any, Tuple[int, BaseOxmlElement, ProxyCache | None, ProxySequence[Any]]
+        ] = {}
 
     def add_paragraph(self, text: str = "", style: str | ParagraphStyle | None = None) -> Paragraph:
         """Return paragraph newly added to the end of the content in this container.
@@ -93,22 +102,43 @@ class BlockItemContainer(StoryChild):
             return SdtBlock(elem, self)
 
     @property
-    def paragraphs(self):
-        """A list containing the paragraphs in this container, in document order.
-
-        Read-only.
+    def paragraphs(self) -> ProxySequence[Paragraph]:
+        """A sequence containing the paragraphs in this container, in document order.
+
+        Each |Paragraph| is constructed on first access, so `len()` and indexed access
+        don't create a proxy for every paragraph. The same sequence is returned until
+        an element is added to or removed from the document, so accessing this property
+        once per item, as in `container.paragraphs[i]`, doesn't search the container
+        each time. Read-only.
         """
-        return [Paragraph(p, self) for p in self._element.p_lst]
+        return self._view(Paragraph, lambda element: element.p_lst)
 
     @property
-    def tables(self):
-        """A list containing the tables in this container, in document order.
+    def tables(self) -> ProxySequence[Table]:
+        """A sequence containing the tables in this container, in document order.
 
         Read-only.
         """
         from docx.table import Table
 
-        return [Table(tbl, self) for tbl in self._element.tbl_lst]
+        return self._view(Table, lambda element: element.tbl_lst)
+
+    def _view(
+        self, proxy_cls: Callable[[Any, Any], T], find: Callable[[Any], List[Any]]
+    ) -> ProxySequence[T]:
+        """Sequence of `proxy_cls` proxies for the elements `find` gets from the container.
+
+        The sequence is reused while the container element, its proxy cache and the
+        elements of every document are unchanged, see `tree_version()`.
+        """
+        element, cache, version = self._element, self._proxy_cache, tree_version()
+        views = self._views
+        view = views.get(proxy_cls)
+        if view is not None and view[0] == version and view[1] is element and view[2] is cache:
+            return view[3]
+        sequence = ProxySequence(find(element), proxy_cls, self, cache)
+        views[proxy_cls] = (version, element, cache, sequence)
+        return sequence
 
     def _add_paragraph(self):
         """Return paragraph newly added to the end of the content in this container."""
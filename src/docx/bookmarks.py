@@ -0,0 +1,278 @@
+"""Bookmarks, named ranges of a document that hyperlinks and fields can refer to.
+
+A bookmark is delimited by a `w:bookmarkStart` element carrying its name and a
+`w:bookmarkEnd` element having the same `w:id`. Either can appear in a paragraph, between
+blocks or in a table row, in the body or in any other story of the document. Finding one
+by name means searching every story, so the bookmarks of a document are indexed by name
+in one pass over its stories the first time one is looked up, and the index is updated as
+bookmarks are added and removed through |Bookmarks|.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterator, NamedTuple, cast
+
+from docx.oxml.ns import qn
+from docx.oxml.parser import OxmlElement
+
+if TYPE_CHECKING:
+    from docx.oxml.table import CT_Tbl
+    from docx.oxml.text.paragraph import CT_P
+    from docx.oxml.xmlchemy import BaseOxmlElement
+    from docx.parts.document import DocumentPart
+    from docx.parts.story import StoryPart
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+    from docx.text.run import Run
+
+_bookmarkEnd_tag = qn("w:bookmarkEnd")
+_bookmarkStart_tag = qn("w:bookmarkStart")
+_block_tags = frozenset((qn("w:p"), qn("w:tbl")))
+_p_tag = qn("w:p")
+_pPr_tag = qn("w:pPr")
+_w_id = qn("w:id")
+_w_name = qn("w:name")
+
+
+class BookmarkLocation(NamedTuple):
+    """Where a bookmark is in a document.
+
+    `start` and `end` are the `w:bookmarkStart` and `w:bookmarkEnd` elements of the
+    bookmark, `end` is |None| when the document has no matching end. `block` is the
+    paragraph or table holding `start`, or the block following it when `start` lies
+    between blocks. `part` is the story part `start` is in.
+    """
+
+    start: BaseOxmlElement
+    end: BaseOxmlElement | None
+    block: BaseOxmlElement | None
+    part: StoryPart
+
+
+class BookmarkIndex:
+    """The location of each bookmark in the stories of a document, by name.
+
+    The index is built in a single pass over the body, headers, footers, footnotes and
+    endnotes when it's first used. A bookmark whose start element has been removed from
+    the document by other means is noticed when it is looked up, and the index rebuilt.
+    Bookmarks added by other means, like appending content, are only seen after
+    :meth:`refresh`. As in Word, the first of several bookmarks having the same name
+    is the one indexed.
+    """
+
+    def __init__(self, document_part: DocumentPart):
+        self._document_part = document_part
+        self._locations: Dict[str, BookmarkLocation] | None = None
+        self._max_id = -1
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.get(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._index))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add(self, name: str, start: BaseOxmlElement, end: BaseOxmlElement | None, part: StoryPart):
+        """Index bookmark `name` delimited by `start` and `end`, just added to `part`."""
+        self._index[name] = BookmarkLocation(start, end, _block_of(start), part)
+        self._max_id = max(self._max_id, _id_of(start))
+
+    def get(self, name: str) -> BookmarkLocation | None:
+        """The location of bookmark `name`, |None| when there is no such bookmark."""
+        location = self._index.get(name)
+        if location is None or _is_attached(location):
+            return location
+        self.refresh()
+        return self._index.get(name)
+
+    def next_id(self) -> int:
+        """An id not used by any bookmark in the document."""
+        if self._locations is None:
+            self._locations = self._build()
+        return self._max_id + 1
+
+    def refresh(self):
+        """Forget the index, which is built again when next used."""
+        self._locations = None
+
+    def remove(self, name: str):
+        """Remove bookmark `name` from the index, its elements having been removed."""
+        self._index.pop(name, None)
+
+    @property
+    def _index(self) -> Dict[str, BookmarkLocation]:
+        locations = self._locations
+        if locations is None:
+            locations = self._locations = self._build()
+        return locations
+
+    def _build(self) -> Dict[str, BookmarkLocation]:
+        locations: Dict[str, BookmarkLocation] = {}
+        self._max_id = -1
+        for part in self._document_part.iter_story_parts():
+            starts: Dict[str, BaseOxmlElement] = {}
+            ends: Dict[str, BaseOxmlElement] = {}
+            for e in part.element.iter(_bookmarkStart_tag, _bookmarkEnd_tag):
+                bookmark_id = e.get(_w_id, "")
+                if e.tag == _bookmarkEnd_tag:
+                    ends.setdefault(bookmark_id, e)
+                    continue
+                self._max_id = max(self._max_id, _id_of(e))
+                name = e.get(_w_name)
+                if name is not None and name not in locations and name not in starts:
+                    starts[name] = e
+            for name, start in starts.items():
+                end = ends.get(start.get(_w_id, ""))
+                locations[name] = BookmarkLocation(start, end, _block_of(start), part)
+        return locations
+
+
+class Bookmark:
+    """A named range of a document, the target of internal hyperlinks and `REF` fields."""
+
+    def __init__(self, name: str, location: BookmarkLocation):
+        self._name = name
+        self._location = location
+
+    def __repr__(self) -> str:
+        return "Bookmark(%r)" % self._name
+
+    @property
+    def block(self) -> Paragraph | Table | None:
+        """The paragraph or table the bookmark begins in.
+
+        When the bookmark begins between two blocks this is the block following it.
+        |None| when no block follows it.
+        """
+        from docx.table import Table
+        from docx.text.paragraph import Paragraph
+
+        block, part = self._location.block, self._location.part
+        if block is None:
+            return None
+        if block.tag == _p_tag:
+            return Paragraph(cast("CT_P", block), part)
+        return Table(cast("CT_Tbl", block), part)
+
+    @property
+    def id(self) -> int:
+        """The `w:id` of the bookmark, matching its start and end."""
+        return _id_of(self._location.start)
+
+    @property
+    def name(self) -> str:
+        """The name of the bookmark, like "_Toc147925734"."""
+        return self._name
+
+    @property
+    def part(self) -> StoryPart:
+        """The story part the bookmark begins in, the document part or a header part say."""
+        return self._location.part
+
+
+class Bookmarks:
+    """The bookmarks of a document, looked up by name.
+
+    Supports `len()`, iteration, `in` and lookup by name with `bookmarks["name"]`.
+    Lookups use the bookmark index of the document part, so checking the target of each
+    internal hyperlink of a document doesn't search the document each time.
+    """
+
+    def __init__(self, document_part: DocumentPart):
+        self._document_part = document_part
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __getitem__(self, name: str) -> Bookmark:
+        location = self._index.get(name)
+        if location is None:
+            raise KeyError("no bookmark named '%s'" % name)
+        return Bookmark(name, location)
+
+    def __iter__(self) -> Iterator[Bookmark]:
+        index = self._index
+        for name in index:
+            location = index.get(name)
+            if location is not None:
+                yield Bookmark(name, location)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add(
+        self, name: str, start: Paragraph | Run, end: Paragraph | Run | None = None
+    ) -> Bookmark:
+        """Add a bookmark named `name` and return it.
+
+        The bookmark begins at `start` and finishes at `end`, at `start` when `end` is
+        omitted. A paragraph is bookmarked from the beginning of its content for a start
+        and to the end of its content for an end; a run is bookmarked from just before it
+        or to just after it. Raises |ValueError| when the document has a bookmark named
+        `name` already.
+        """
+        if name in self._index:
+            raise ValueError("document already has a bookmark named '%s'" % name)
+        end = start if end is None else end
+        bookmark_id = str(self._index.next_id())
+        bookmarkStart = OxmlElement("w:bookmarkStart", attrs={_w_id: bookmark_id, _w_name: name})
+        bookmarkEnd = OxmlElement("w:bookmarkEnd", attrs={_w_id: bookmark_id})
+
+        start_elm = start._element  # pyright: ignore[reportPrivateUsage]
+        if start_elm.tag == _p_tag:
+            pPr = next(start_elm.iterchildren(_pPr_tag), None)
+            start_elm.insert(0 if pPr is None else 1, bookmarkStart)
+        else:
+            start_elm.addprevious(bookmarkStart)
+        end_elm = end._element  # pyright: ignore[reportPrivateUsage]
+        if end_elm.tag == _p_tag:
+            end_elm.append(bookmarkEnd)
+        else:
+            end_elm.addnext(bookmarkEnd)
+
+        self._index.add(name, bookmarkStart, bookmarkEnd, start.part)
+        return self[name]
+
+    def get(self, name: str, default: Bookmark | None = None) -> Bookmark | None:
+        """The bookmark named `name`, `default` when there is no such bookmark."""
+        location = self._index.get(name)
+        return default if location is None else Bookmark(name, location)
+
+    def remove(self, name: str):
+        """Remove the bookmark named `name`, leaving the content it delimits in place.
+
+        Raises |KeyError| when there is no bookmark named `name`.
+        """
+        location = self._index.get(name)
+        if location is None:
+            raise KeyError("no bookmark named '%s'" % name)
+        for e in (location.start, location.end):
+            parent = None if e is None else e.getparent()
+            if parent is not None:
+                parent.remove(e)
+        self._index.remove(name)
+
+    @property
+    def _index(self) -> BookmarkIndex:
+        return self._document_part.bookmark_index
+
+
+def _block_of(bookmarkStart: BaseOxmlElement) -> BaseOxmlElement | None:
+    """The paragraph or table holding `bookmarkStart`, else the block following it."""
+    for ancestor in bookmarkStart.iterancestors():
+        if ancestor.tag in _block_tags:
+            return ancestor
+    return next(bookmarkStart.itersiblings(*_block_tags), None)
+
+
+def _id_of(bookmarkStart: BaseOxmlElement) -> int:
+    bookmark_id = bookmarkStart.get(_w_id, "")
+    return int(bookmark_id) if bookmark_id.lstrip("-").isdigit() else -1
+
+
+def _is_attached(location: BookmarkLocation) -> bool:
+    """True when the start of the bookmark at `location` is still in its story."""
+    ancestors = list(location.start.iterancestors())
+    return bool(ancestors) and ancestors[-1] is location.part.element
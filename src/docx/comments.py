@@ -0,0 +1,497 @@
+"""Comments, their anchors in the document and their threading and done state.
+
+A comment lives in the comments part and is anchored in the document by three elements
+sharing its id: `w:commentRangeStart` and `w:commentRangeEnd` around the commented text
+and a run holding a `w:commentReference` where Word shows the comment mark. Replies and
+the done state of a comment are stored in the comments-extended part (`w15:commentEx`),
+keyed by the `w14:paraId` of the last paragraph of the comment, and the people part
+identifies each author. |CommentIndex| ties these together in one pass over the
+document, so listing every comment with its anchored text is linear.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import random
+from typing import TYPE_CHECKING, Dict, Iterator, List, NamedTuple, Sequence, cast
+
+from docx.blkcntnr import BlockItemContainer
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml.ns import qn
+from docx.oxml.parser import OxmlElement
+from docx.shared import ElementProxy
+
+if TYPE_CHECKING:
+    from docx.oxml.comments import CT_Comment, CT_Comments
+    from docx.oxml.xmlchemy import BaseOxmlElement
+    from docx.parts.comments import CommentsPart
+    from docx.parts.document import DocumentPart
+    from docx.parts.story import StoryPart
+    from docx.text.run import Run
+
+_commentEx_tag = qn("w15:commentEx")
+_commentRangeEnd_tag = qn("w:commentRangeEnd")
+_commentRangeStart_tag = qn("w:commentRangeStart")
+_commentReference_tag = qn("w:commentReference")
+_p_tag = qn("w:p")
+_person_tag = qn("w15:person")
+_presenceInfo_tag = qn("w15:presenceInfo")
+_w14_paraId = qn("w14:paraId")
+_w15_author = qn("w15:author")
+_w15_done = qn("w15:done")
+_w15_paraId = qn("w15:paraId")
+_w15_paraIdParent = qn("w15:paraIdParent")
+_w15_providerId = qn("w15:providerId")
+_w15_userId = qn("w15:userId")
+_w_id = qn("w:id")
+_anchor_tags = (_commentRangeStart_tag, _commentRangeEnd_tag, _commentReference_tag)
+# -- run content contributing to the anchored text of a comment --
+_text_tags = tuple(qn(tag) for tag in ("w:t", "w:tab", "w:br", "w:cr", "w:noBreakHyphen", "w:ptab"))
+
+
+class CommentAnchor(NamedTuple):
+    """Where a comment is anchored in a document.
+
+    `range_start`, `range_end` and `reference` are the `w:commentRangeStart`,
+    `w:commentRangeEnd` and `w:commentReference` elements of the comment, each |None|
+    when missing. `part` is the story part holding them.
+    """
+
+    range_start: BaseOxmlElement | None
+    range_end: BaseOxmlElement | None
+    reference: BaseOxmlElement | None
+    part: StoryPart
+
+
+class CommentPerson(NamedTuple):
+    """An author of comments as identified in the people part (`w15:person`)."""
+
+    author: str
+    provider_id: str | None
+    user_id: str | None
+
+
+class _Tables(NamedTuple):
+    comments: Dict[int, CT_Comment]
+    anchors: Dict[int, CommentAnchor]
+    texts: Dict[int, str]
+    ids_by_para_id: Dict[str, int]
+    extended: Dict[str, BaseOxmlElement]
+    replies: Dict[int, List[int]]
+    people: Dict[str, CommentPerson]
+
+
+class CommentIndex:
+    """The comments of a document with their anchors, anchored text and extended data.
+
+    Built when first used, in one pass over the comments part and one over the stories
+    of the document, collecting the text between the range start and end of each comment
+    as it goes. Comments, replies and done states set through |Comments| and |Comment|
+    keep the index current; after other changes to the comments or their anchors call
+    :meth:`refresh`.
+    """
+
+    def __init__(self, document_part: DocumentPart):
+        self._document_part = document_part
+        self._tables: _Tables | None = None
+
+    def anchor(self, comment_id: int) -> CommentAnchor | None:
+        """The |CommentAnchor| of comment `comment_id`, |None| when it is not anchored."""
+        return self._index.anchors.get(comment_id)
+
+    def anchored_text(self, comment_id: int) -> str:
+        """The text between the range start and end of comment `comment_id`."""
+        return self._index.texts.get(comment_id, "")
+
+    def comment(self, comment_id: int) -> CT_Comment | None:
+        """The `w:comment` element of comment `comment_id`, |None| when not present."""
+        return self._index.comments.get(comment_id)
+
+    def comment_ids(self) -> List[int]:
+        """The id of each comment, in the order of the comments part."""
+        return list(self._index.comments)
+
+    def commentEx(self, comment: CT_Comment) -> BaseOxmlElement | None:
+        """The `w15:commentEx` element of `comment`, |None| when it has none."""
+        para_id = _para_id(comment)
+        return None if para_id is None else self._index.extended.get(para_id)
+
+    def next_id(self) -> int:
+        """An id not used by any comment of the document."""
+        return max(self._index.comments, default=-1) + 1
+
+    def parent_id(self, comment: CT_Comment) -> int | None:
+        """The id of the comment `comment` replies to, |None| when it is not a reply."""
+        commentEx = self.commentEx(comment)
+        parent_para_id = None if commentEx is None else commentEx.get(_w15_paraIdParent)
+        return None if parent_para_id is None else self._index.ids_by_para_id.get(parent_para_id)
+
+    def person(self, author: str) -> CommentPerson | None:
+        """The |CommentPerson| for `author` in the people part, |None| when not there."""
+        return self._index.people.get(author)
+
+    def refresh(self):
+        """Forget the index, which is built again when next used."""
+        self._tables = None
+
+    def reply_ids(self, comment_id: int) -> List[int]:
+        """The id of each reply to comment `comment_id`, in order."""
+        return list(self._index.replies.get(comment_id, []))
+
+    @property
+    def _index(self) -> _Tables:
+        tables = self._tables
+        if tables is None:
+            tables = self._tables = self._build()
+        return tables
+
+    def _add_comment(self, comment: CT_Comment, anchor: CommentAnchor | None, text: str):
+        tables = self._index
+        tables.comments[comment.id] = comment
+        if anchor is not None:
+            tables.anchors[comment.id] = anchor
+            tables.texts[comment.id] = text
+
+    def _add_commentEx(self, comment: CT_Comment, commentEx: BaseOxmlElement):
+        tables = self._index
+        para_id = commentEx.get(_w15_paraId, "")
+        tables.extended[para_id] = commentEx
+        tables.ids_by_para_id[para_id] = comment.id
+        parent_id = tables.ids_by_para_id.get(commentEx.get(_w15_paraIdParent, ""))
+        if parent_id is not None:
+            tables.replies.setdefault(parent_id, []).append(comment.id)
+
+    def _build(self) -> _Tables:
+        tables = _Tables({}, {}, {}, {}, {}, {}, {})
+        comments_part = _related_part(self._document_part, RT.COMMENTS)
+        if comments_part is not None:
+            for comment in cast("CT_Comments", comments_part.element).comment_lst:
+                tables.comments.setdefault(comment.id, comment)
+                para_id = _para_id(comment)
+                if para_id is not None:
+                    tables.ids_by_para_id[para_id] = comment.id
+
+        extended_part = _related_part(self._document_part, RT.COMMENTS_EXTENDED)
+        if extended_part is not None:
+            for commentEx in extended_part.element.iterchildren(_commentEx_tag):
+                tables.extended[commentEx.get(_w15_paraId, "")] = commentEx
+                parent_id = tables.ids_by_para_id.get(commentEx.get(_w15_paraIdParent, ""))
+                comment_id = tables.ids_by_para_id.get(commentEx.get(_w15_paraId, ""))
+                if parent_id is not None and comment_id is not None:
+                    tables.replies.setdefault(parent_id, []).append(comment_id)
+
+        people_part = _related_part(self._document_part, RT.PEOPLE)
+        if people_part is not None:
+            for person in people_part.element.iterchildren(_person_tag):
+                author = person.get(_w15_author, "")
+                presenceInfo = next(person.iterchildren(_presenceInfo_tag), None)
+                provider_id = user_id = None
+                if presenceInfo is not None:
+                    provider_id = presenceInfo.get(_w15_providerId)
+                    user_id = presenceInfo.get(_w15_userId)
+                tables.people.setdefault(author, CommentPerson(author, provider_id, user_id))
+
+        for part in self._document_part.iter_story_parts():
+            self._scan_anchors(part, tables)
+        return tables
+
+    def _scan_anchors(self, part: StoryPart, tables: _Tables):
+        """Record the anchors of comments in `part` and the text each range holds."""
+        anchors: Dict[int, List[BaseOxmlElement | None]] = {}
+        open_ranges: Dict[int, List[str]] = {}
+        for e in part.element.iter(_p_tag, *_anchor_tags, *_text_tags):
+            tag = e.tag
+            if tag in _text_tags:
+                if open_ranges:
+                    text = str(e)
+                    for pieces in open_ranges.values():
+                        pieces.append(text)
+                continue
+            if tag == _p_tag:
+                for pieces in open_ranges.values():
+                    if pieces:
+                        pieces.append("\n")
+                continue
+            comment_id = _int(e.get(_w_id))
+            if comment_id is None:
+                continue
+            elements = anchors.setdefault(comment_id, [None, None, None])
+            position = _anchor_tags.index(tag)
+            if elements[position] is None:
+                elements[position] = e
+            if tag == _commentRangeStart_tag:
+                open_ranges.setdefault(comment_id, [])
+            elif tag == _commentRangeEnd_tag and comment_id in open_ranges:
+                tables.texts[comment_id] = "".join(open_ranges.pop(comment_id))
+        for comment_id, (range_start, range_end, reference) in anchors.items():
+            tables.anchors.setdefault(
+                comment_id, CommentAnchor(range_start, range_end, reference, part)
+            )
+
+
+class Comment(BlockItemContainer):
+    """A comment of a document, holding paragraphs and tables like a footnote.
+
+    Its anchor, anchored text, replies and done state come from the comment index of the
+    document.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, comment: CT_Comment, parent: CommentsPart):
+        super().__init__(comment, parent)  # pyright: ignore[reportArgumentType]
+        self._element = comment
+
+    def __repr__(self) -> str:
+        return "Comment(id=%d, author=%r)" % (self.id, self.author)
+
+    def add_reply(self, text: str = "", author: str = "", initials: str | None = None) -> Comment:
+        """Add a reply to this comment and return it.
+
+        The reply is anchored to the same text as this comment, if this comment is
+        anchored.
+        """
+        comments_part = cast("CommentsPart", self._parent)
+        reply = comments_part.comments.add_comment(text, author, initials)
+        anchor = self._index.anchor(self.id)
+        if anchor is not None:
+            _anchor_reply(anchor, reply.id)
+            self._index._add_comment(reply._comment, anchor, self.anchored_text)  # pyright: ignore[reportPrivateUsage]
+        parent_para_id = _get_or_add_commentEx(self._document_part, self._comment).get(_w15_paraId)
+        _get_or_add_commentEx(self._document_part, reply._comment, parent_para_id)
+        return reply
+
+    @property
+    def anchor(self) -> CommentAnchor | None:
+        """The |CommentAnchor| of this comment in the document, |None| if not anchored."""
+        return self._index.anchor(self.id)
+
+    @property
+    def anchored_text(self) -> str:
+        """The text of the document this comment refers to, its range."""
+        return self._index.anchored_text(self.id)
+
+    @property
+    def author(self) -> str:
+        """The name of the author of this comment."""
+        return self._comment.author
+
+    @property
+    def date(self) -> dt.datetime | None:
+        """The date and time this comment was made, |None| when not recorded."""
+        date = self._comment.date
+        if not date:
+            return None
+        try:
+            return dt.datetime.fromisoformat(date)
+        except ValueError:
+            return None
+
+    @property
+    def done(self) -> bool:
+        """Read/write. True when this comment is marked as done (resolved)."""
+        commentEx = self._index.commentEx(self._comment)
+        return commentEx is not None and commentEx.get(_w15_done) in ("1", "true", "on")
+
+    @done.setter
+    def done(self, value: bool):
+        commentEx = _get_or_add_commentEx(self._document_part, self._comment)
+        commentEx.set(_w15_done, "1" if value else "0")
+
+    @property
+    def id(self) -> int:
+        """The id of this comment, shared by its anchors in the document."""
+        return self._comment.id
+
+    @property
+    def initials(self) -> str | None:
+        """The initials of the author of this comment, |None| when not recorded."""
+        return self._comment.initials
+
+    @property
+    def parent(self) -> Comment | None:
+        """The comment this comment is a reply to, |None| when it is not a reply."""
+        parent_id = self._index.parent_id(self._comment)
+        return None if parent_id is None else self._comment_proxy(parent_id)
+
+    @property
+    def person(self) -> CommentPerson | None:
+        """The |CommentPerson| identifying the author, |None| when not in the people part."""
+        return self._index.person(self.author)
+
+    @property
+    def replies(self) -> List[Comment]:
+        """The replies to this comment, in order."""
+        replies = (self._comment_proxy(reply_id) for reply_id in self._index.reply_ids(self.id))
+        return [reply for reply in replies if reply is not None]
+
+    @property
+    def text(self) -> str:
+        """The text of this comment, with a newline between paragraphs."""
+        return "\n".join(p.text for p in self.paragraphs)
+
+    @property
+    def _comment(self) -> CT_Comment:
+        return cast("CT_Comment", self._element)
+
+    def _comment_proxy(self, comment_id: int) -> Comment | None:
+        comment = self._index.comment(comment_id)
+        return None if comment is None else Comment(comment, cast("CommentsPart", self._parent))
+
+    @property
+    def _document_part(self) -> DocumentPart:
+        package = self._parent.part.package
+        assert package is not None
+        return cast("DocumentPart", package.main_document_part)
+
+    @property
+    def _index(self) -> CommentIndex:
+        return self._document_part.comment_index
+
+
+class Comments(ElementProxy):
+    """The comments of a document, in the order of the comments part.
+
+    Supports `len()`, iteration and lookup by id with :meth:`get`.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, comments: CT_Comments, parent: CommentsPart):
+        super().__init__(comments, parent)
+
+    def __iter__(self) -> Iterator[Comment]:
+        parent = cast("CommentsPart", self._parent)
+        return (Comment(comment, parent) for comment in self._comments.comment_lst)
+
+    def __len__(self) -> int:
+        return len(self._comments.comment_lst)
+
+    def add_comment(self, text: str = "", author: str = "", initials: str | None = None) -> Comment:
+        """Add a comment having `text` and return it, not anchored in the document.
+
+        Use :meth:`.Document.add_comment` to add a comment on some runs.
+        """
+        index = self._index
+        date = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        comment_elm = self._comments.add_comment(index.next_id(), author, initials, date)
+        comment = Comment(comment_elm, cast("CommentsPart", self._parent))
+        p = comment.add_paragraph()
+        r = p._p.add_r()  # pyright: ignore[reportPrivateUsage]
+        r.append(OxmlElement("w:annotationRef"))
+        if text:
+            p.add_run(text)
+        index._add_comment(comment_elm, None, "")  # pyright: ignore[reportPrivateUsage]
+        return comment
+
+    def get(self, comment_id: int) -> Comment | None:
+        """The comment having `comment_id`, |None| when there is no such comment."""
+        comment = self._index.comment(comment_id)
+        return None if comment is None else Comment(comment, cast("CommentsPart", self._parent))
+
+    @property
+    def _comments(self) -> CT_Comments:
+        return cast("CT_Comments", self._element)
+
+    @property
+    def _index(self) -> CommentIndex:
+        package = cast("CommentsPart", self._parent).package
+        assert package is not None
+        return cast("DocumentPart", package.main_document_part).comment_index
+
+
+def add_comment(
+    document_part: DocumentPart,
+    runs: Run | Sequence[Run],
+    text: str,
+    author: str,
+    initials: str | None,
+) -> Comment:
+    """Add a comment on `runs` to the document of `document_part` and return it."""
+    from docx.text.run import Run
+
+    runs = [runs] if isinstance(runs, Run) else list(runs)
+    if not runs:
+        raise ValueError("a comment must be anchored on at least one run")
+    comment = document_part.comments.add_comment(text, author, initials)
+    first, last = runs[0]._r, runs[-1]._r  # pyright: ignore[reportPrivateUsage]
+    range_start = OxmlElement("w:commentRangeStart", attrs={_w_id: str(comment.id)})
+    range_end = OxmlElement("w:commentRangeEnd", attrs={_w_id: str(comment.id)})
+    reference = OxmlElement("w:commentReference", attrs={_w_id: str(comment.id)})
+    first.addprevious(range_start)
+    last.addnext(range_end)
+    reference_r = OxmlElement("w:r")
+    reference_r.append(reference)
+    range_end.addnext(reference_r)
+
+    anchor = CommentAnchor(range_start, range_end, reference, runs[0].part)
+    anchored_text = "".join(run.text for run in runs)
+    document_part.comment_index._add_comment(comment._comment, anchor, anchored_text)  # pyright: ignore[reportPrivateUsage]
+    return comment
+
+
+def _anchor_reply(anchor: CommentAnchor, reply_id: int):
+    """Anchor comment `reply_id` alongside the comment anchored at `anchor`."""
+    for e in (anchor.range_start, anchor.range_end):
+        if e is not None:
+            e.addnext(OxmlElement(_prefixed(e), attrs={_w_id: str(reply_id)}))
+    reference = anchor.reference
+    if reference is not None:
+        reference_r = OxmlElement("w:r")
+        reference_r.append(OxmlElement("w:commentReference", attrs={_w_id: str(reply_id)}))
+        reference_run = reference.getparent()
+        (reference_run if reference_run is not None else reference).addnext(reference_r)
+
+
+def _get_or_add_commentEx(
+    document_part: DocumentPart, comment: CT_Comment, parent_para_id: str | None = None
+) -> BaseOxmlElement:
+    """The `w15:commentEx` of `comment`, added to the comments-extended part if needed.
+
+    A new entry marks the comment as a reply to the comment having `parent_para_id`,
+    when given.
+    """
+    index = document_part.comment_index
+    commentEx = index.commentEx(comment)
+    if commentEx is not None:
+        return commentEx
+    attrs = {_w15_paraId: _get_or_add_para_id(comment)}
+    if parent_para_id is not None:
+        attrs[_w15_paraIdParent] = parent_para_id
+    attrs[_w15_done] = "0"
+    commentEx = OxmlElement("w15:commentEx", attrs=attrs)
+    document_part._comments_extended_part.element.append(commentEx)  # pyright: ignore[reportPrivateUsage]
+    index._add_commentEx(comment, commentEx)  # pyright: ignore[reportPrivateUsage]
+    return commentEx
+
+
+def _get_or_add_para_id(comment: CT_Comment) -> str:
+    """The `w14:paraId` of the last paragraph of `comment`, added if needed."""
+    p_lst = comment.p_lst
+    p = p_lst[-1] if p_lst else comment.add_p()
+    para_id = p.get(_w14_paraId)
+    if para_id is None:
+        para_id = "%08X" % random.randint(1, 0x7FFFFFFF)
+        p.set(_w14_paraId, para_id)
+    return para_id
+
+
+def _int(value: str | None) -> int | None:
+    return int(value) if value is not None and value.lstrip("-").isdigit() else None
+
+
+def _para_id(comment: CT_Comment) -> str | None:
+    p = next(comment.iterchildren(_p_tag, reversed=True), None)
+    return None if p is None else p.get(_w14_paraId)
+
+
+def _prefixed(e: BaseOxmlElement) -> str:
+    """The namespace-prefixed tag of a `w:` element, like "w:commentRangeStart"."""
+    return "w:%s" % e.tag.rsplit("}", 1)[1]
+
+
+def _related_part(document_part: DocumentPart, reltype: str) -> StoryPart | None:
+    try:
+        return cast("StoryPart", document_part.part_related_by(reltype))
+    except KeyError:
+        return None
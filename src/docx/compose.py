@@ -0,0 +1,580 @@
+"""Appending the body content of one document to another.
+
+The content of a document refers to other parts of its package in several ways: style
+ids, list definitions by `numId`, images and other related parts by relationship id,
+footnotes and endnotes by note id. Copying body elements from one document to another
+leaves each of those references dangling unless what they refer to is carried over too,
+under an id that is free in the target. |Composer| does that, remapping each reference in
+a single pass over the copied elements.
+"""
+
+from __future__ import annotations
+
+import copy
+import re
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Set, Tuple, cast
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.oxml.ns import nsmap, qn
+from docx.parts.image import ImagePart
+from docx.parts.ole import OlePart
+from docx.parts.story import StoryPart
+
+if TYPE_CHECKING:
+    from docx.bookmarks import BookmarkIndex
+    from docx.document import Document
+    from docx.opc.part import Part
+    from docx.oxml.numbering import CT_AbstractNum, CT_Num, CT_Numbering
+    from docx.oxml.styles import CT_Style, CT_Styles
+    from docx.oxml.xmlchemy import BaseOxmlElement
+    from docx.parts.document import DocumentPart
+    from docx.parts.numbering import NumberingPart
+
+
+def compose(documents: Iterable[Document]) -> Document:
+    """Return the first of `documents` with the body content of each of the others
+    appended to it, in order.
+
+    The time taken is linear in the total size of `documents`. See |Composer| for how
+    the content of each document is carried over.
+    """
+    documents = iter(documents)
+    try:
+        document = next(documents)
+    except StopIteration:
+        raise ValueError("compose() requires at least one document")
+    composer = Composer(document)
+    for other in documents:
+        composer.append(other)
+    return document
+
+
+class Composer:
+    """Appends the body content of other documents to `document`.
+
+    Content is appended before the final section properties of `document`, which apply
+    to it; the final section properties of the appended document are not copied. Along
+    with the content, what it refers to is copied into `document`:
+
+    * A style is mapped to the style of the same name in `document` when there is one,
+      so the appended content takes on the look of `document`. Other styles are copied,
+      under a new style id if theirs is taken.
+    * Each list definition (`w:num` and its `w:abstractNum`) is copied under new ids, so
+      lists from different documents number independently.
+    * Images and embedded OLE objects are copied unless `document` already has a part
+      with the same content, as determined by SHA1 digest. Other related parts, like
+      headers referenced by a section break, are copied along with their own related
+      parts. Hyperlinks and other external relationships are recreated.
+    * Footnotes and endnotes are copied under new note ids.
+    * Bookmarks and content controls are given ids unused in `document`. A bookmark
+      whose name is taken in `document` is renamed, like "Intro" to "Intro2", along
+      with the internal hyperlinks to it.
+
+    Comments are not carried over; comment ranges and references are removed from the
+    copied content.
+
+    A composer keeps indexes of the styles, list definitions, parts and ids in use in
+    `document` between calls to :meth:`append`, so appending many documents with one
+    composer takes time linear in their total size. Changes made to `document` other
+    than through the composer while it is in use may not be taken into account.
+    """
+
+    def __init__(self, document: Document):
+        document_part = document.part
+        package = document_part.package
+        assert package is not None
+        self._document_part = document_part
+        self._package = package
+        self._body = document.element.body
+
+        styles = cast("CT_Styles", document_part._styles_part.element)  # pyright: ignore[reportPrivateUsage]
+        self._styles = styles
+        self._styles_by_id: Dict[str, CT_Style] = {}
+        self._style_ids_by_name: Dict[str, str] = {}
+        for style in styles.style_lst:
+            self._index_style(style)
+
+        self._partnames: Set[str] = set()
+        self._parts_by_sha1: Dict[str, Part] = {}
+        for part in package.iter_parts():
+            self._partnames.add(part.partname)
+            if isinstance(part, (ImagePart, OlePart)):
+                self._parts_by_sha1.setdefault(part.sha1, part)
+        self._partname_counters: Dict[str, int] = {}
+
+        self._next_shape_id = document_part.next_id
+        self._bookmarks: _BookmarkIds | None = None
+        self._next_sdt_id: int | None = None
+        self._numbering: _NumberingIds | None = None
+        self._notes: Dict[str, _NoteIds] = {}
+
+    def append(self, other: Document):
+        """Append the body content of `other` to the document of this composer.
+
+        `other` is not changed.
+        """
+        source = SourceMap(self, other.part)
+        body = self._body
+        sectPr = body.sectPr
+        for element in other.element.body.iterchildren():
+            if element.tag == _sectPr_tag:
+                continue
+            element = copy.deepcopy(element)
+            source.rewrite(element, other.part, self._document_part)
+            if sectPr is None:
+                body.append(element)
+            else:
+                sectPr.addprevious(element)
+        self._document_part.bookmark_index.refresh()
+        self._document_part.content_control_index.refresh()
+        self._document_part.revision_index.refresh()
+
+    @property
+    def _bookmark_ids(self) -> _BookmarkIds:
+        """Bookmark names and ids in use in the document, indexed on first use."""
+        if self._bookmarks is None:
+            self._bookmarks = _BookmarkIds(self._document_part.bookmark_index)
+        return self._bookmarks
+
+    def _import_part(self, part: Part) -> Tuple[Part, bool]:
+        """Return (part, is_copy) pair for `part` of another package.
+
+        The part is a copy of `part` belonging to the document package, without
+        relationships, except that an image or OLE part whose blob matches one already
+        in the document is not copied; that part is returned instead.
+        """
+        if isinstance(part, (ImagePart, OlePart)):
+            sha1 = part.sha1
+            existing = self._parts_by_sha1.get(sha1)
+            if existing is not None:
+                return existing, False
+        else:
+            sha1 = None
+
+        part_copy = part.clone(self._package)  # pyright: ignore[reportArgumentType]
+        part_copy.partname = self._new_partname(part.partname)
+        if sha1 is not None:
+            self._parts_by_sha1[sha1] = part_copy
+        if isinstance(part_copy, ImagePart):
+            self._package.image_parts.append(part_copy)  # pyright: ignore
+        return part_copy, True
+
+    def _index_style(self, style: CT_Style):
+        style_id = style.styleId
+        if style_id is None:
+            return
+        self._styles_by_id.setdefault(style_id, style)
+        name = style.name_val
+        if name is not None:
+            self._style_ids_by_name.setdefault(name, style_id)
+
+    def _new_partname(self, partname: str) -> PackURI:
+        """A partname like `partname` but unused in the document package.
+
+        The numeric suffix of `partname`, if any, is replaced by the next unused number,
+        so "/word/media/image3.png" can become "/word/media/image12.png".
+        """
+        template = _partname_suffix.sub(r"%d\1", partname.replace("%", "%%"), count=1)
+        n = self._partname_counters.get(template, 1)
+        while template % n in self._partnames:
+            n += 1
+        self._partname_counters[template] = n + 1
+        new_partname = template % n
+        self._partnames.add(new_partname)
+        return PackURI(new_partname)
+
+    def _new_style_id(self, style_id: str) -> str:
+        """`style_id` when it is unused in the document, otherwise a numbered variant."""
+        new_id, n = style_id, 1
+        while new_id in self._styles_by_id:
+            n += 1
+            new_id = "%s%d" % (style_id, n)
+        return new_id
+
+    def _new_sdt_id(self) -> int:
+        sdt_id = self._next_sdt_id
+        if sdt_id is None:
+            sdt_id = self._document_part.content_control_index.next_id()
+        self._next_sdt_id = sdt_id + 1
+        return sdt_id
+
+    def _new_shape_id(self) -> int:
+        shape_id = self._next_shape_id
+        self._next_shape_id += 1
+        return shape_id
+
+    def _note_ids(self, kind: str) -> _NoteIds:
+        """Target footnotes or endnotes of the document, for `kind` "footnote" or "endnote"."""
+        note_ids = self._notes.get(kind)
+        if note_ids is None:
+            document_part = self._document_part
+            part = (
+                document_part._footnotes_part  # pyright: ignore[reportPrivateUsage]
+                if kind == "footnote"
+                else document_part._endnotes_part  # pyright: ignore[reportPrivateUsage]
+            )
+            note_ids = self._notes[kind] = _NoteIds(part)
+        return note_ids
+
+    @property
+    def _numbering_ids(self) -> _NumberingIds:
+        """Target numbering definitions of the document, created on first use."""
+        if self._numbering is None:
+            self._numbering = _NumberingIds(self._document_part.numbering_part)
+        return self._numbering
+
+
+class _BookmarkIds:
+    """The bookmark names of the target document and its next free bookmark id."""
+
+    def __init__(self, bookmark_index: BookmarkIndex):
+        self._names = set(bookmark_index)
+        self._next_id = bookmark_index.next_id()
+
+    def new_id(self) -> int:
+        bookmark_id = self._next_id
+        self._next_id += 1
+        return bookmark_id
+
+    def new_name(self, name: str) -> str:
+        """`name` when it is unused in the document, otherwise a numbered variant."""
+        new_name, n = name, 1
+        while new_name in self._names:
+            n += 1
+            new_name = "%s%d" % (name, n)
+        self._names.add(new_name)
+        return new_name
+
+
+class _NoteIds:
+    """The footnotes or endnotes part of the target document and its next free note id."""
+
+    def __init__(self, part: StoryPart):
+        self.part = part
+        ids = [int(note_id) for note_id in part.element.xpath("./*/@w:id")]
+        self._next_id = max(ids + [0]) + 1
+
+    def add(self, note: BaseOxmlElement) -> int:
+        """Add `note` to the part under a new note id, returning that id."""
+        note_id = self._next_id
+        self._next_id += 1
+        note.set(qn("w:id"), str(note_id))
+        self.part.element.append(note)
+        return note_id
+
+
+class _NumberingIds:
+    """The numbering definitions of the target document and the next free ids in it."""
+
+    def __init__(self, numbering_part: NumberingPart):
+        numbering = cast("CT_Numbering", numbering_part.element)
+        self._numbering = numbering
+        abstractNums = numbering.abstractNum_lst
+        nums = numbering.num_lst
+        self._next_abstractNumId = max([a.abstractNumId for a in abstractNums] + [-1]) + 1
+        self._next_numId = max([num.numId for num in nums] + [0]) + 1
+        self._last_abstractNum = abstractNums[-1] if abstractNums else None
+        self._first_num = nums[0] if nums else None
+        self._last_num = nums[-1] if nums else None
+
+    def add_abstractNum(self, abstractNum: CT_AbstractNum) -> int:
+        """Add `abstractNum` under a new abstractNumId, returning that id."""
+        abstractNum.abstractNumId = abstractNumId = self._next_abstractNumId
+        self._next_abstractNumId += 1
+        # -- all `w:abstractNum` elements precede the `w:num` elements --
+        if self._last_abstractNum is not None:
+            self._last_abstractNum.addnext(abstractNum)
+        elif self._first_num is not None:
+            self._first_num.addprevious(abstractNum)
+        else:
+            self._append(abstractNum)
+        self._last_abstractNum = abstractNum
+        return abstractNumId
+
+    def add_num(self, num: CT_Num) -> int:
+        """Add `num` under a new numId, returning that id."""
+        num.numId = numId = self._next_numId
+        self._next_numId += 1
+        if self._last_num is not None:
+            self._last_num.addnext(num)
+        else:
+            self._append(num)
+            self._first_num = num
+        self._last_num = num
+        return numId
+
+    def _append(self, element: BaseOxmlElement):
+        """Add `element` at the end of the definitions, before any cleanup element."""
+        cleanup = self._numbering.find(qn("w:numIdMacAtCleanup"))
+        if cleanup is None:
+            self._numbering.append(element)
+        else:
+            cleanup.addprevious(element)
+
+
+class SourceMap:
+    """The state of appending one source document: maps from its ids to target ids."""
+
+    def __init__(self, composer: Composer, document_part: DocumentPart):
+        self._composer = composer
+        self._document_part = document_part
+        self._style_map: Dict[str, str] = {}
+        self._num_map: Dict[int, int] = {}
+        self._abstractNum_map: Dict[int, int] = {}
+        self._rel_maps: Dict[Tuple[Part, Part], Dict[str, str]] = {}
+        self._parts: Dict[Part, Part] = {}
+        self._notes_by_id: Dict[str, Dict[str, BaseOxmlElement]] = {}
+        self._bookmark_id_map: Dict[str, str] = {}
+        self._bookmark_name_map: Dict[str, str] = {}
+
+        styles = cast("CT_Styles", document_part._styles_part.element)  # pyright: ignore[reportPrivateUsage]
+        self._styles_by_id = {style.styleId: style for style in styles.style_lst}
+        self._numbering_part = cast(
+            "NumberingPart | None", _related_part(document_part, RT.NUMBERING)
+        )
+
+    def rewrite(self, element: BaseOxmlElement, source_part: Part, target_part: Part | None):
+        """Remap the references in `element` and its descendants, in place.
+
+        Relationship ids are relative to `source_part` before and `target_part` after;
+        they are left unchanged when `target_part` is |None|.
+        """
+        removed: List[BaseOxmlElement] = []
+        for e in element.iter():
+            tag = e.tag
+            if not isinstance(tag, str):
+                continue
+            handler = _handlers.get(tag)
+            if handler is not None:
+                handler(self, e, removed)
+            if target_part is not None:
+                for name, value in e.items():
+                    if name.startswith(_r_prefix):
+                        e.set(name, self._map_rId(source_part, target_part, value))
+        for e in removed:
+            parent = e.getparent()
+            if parent is not None:
+                parent.remove(e)
+
+    def _bookmark_id(self, bookmark_id: str) -> str:
+        """The id in the target document of the bookmark having `bookmark_id`."""
+        new_id = self._bookmark_id_map.get(bookmark_id)
+        if new_id is None:
+            new_id = str(self._composer._bookmark_ids.new_id())  # pyright: ignore[reportPrivateUsage]
+            self._bookmark_id_map[bookmark_id] = new_id
+        return new_id
+
+    def _bookmark_name(self, name: str) -> str:
+        """The name in the target document of the bookmark named `name`."""
+        new_name = self._bookmark_name_map.get(name)
+        if new_name is None:
+            new_name = self._composer._bookmark_ids.new_name(name)  # pyright: ignore[reportPrivateUsage]
+            self._bookmark_name_map[name] = new_name
+        return new_name
+
+    def _import_note(self, kind: str, note_id: str) -> str:
+        """Id in the target document of the copy of footnote or endnote `note_id`."""
+        notes_by_id = self._notes_by_id.get(kind)
+        source_notes_part = _related_part(
+            self._document_part, RT.FOOTNOTES if kind == "footnote" else RT.ENDNOTES
+        )
+        if notes_by_id is None:
+            notes_by_id = self._notes_by_id[kind] = (
+                {}
+                if source_notes_part is None
+                else {note.get(qn("w:id")): note for note in source_notes_part.element}
+            )
+        note = notes_by_id.get(note_id)
+        if note is None or source_notes_part is None:
+            return note_id
+
+        note_ids = self._composer._note_ids(kind)  # pyright: ignore[reportPrivateUsage]
+        note = copy.deepcopy(note)
+        self.rewrite(note, source_notes_part, note_ids.part)
+        return str(note_ids.add(note))
+
+    def _import_num(self, numId: int) -> int:
+        """The numId in the target document of the copy of list definition `numId`."""
+        if numId == 0 or self._numbering_part is None:
+            return numId
+        new_numId = self._num_map.get(numId)
+        if new_numId is not None:
+            return new_numId
+        num = self._numbering_part.get_num(numId)
+        if num is None:
+            # -- remember the miss, a lookup that misses rebuilds the numbering indexes --
+            self._num_map[numId] = numId
+            return numId
+
+        numbering_ids = self._composer._numbering_ids  # pyright: ignore[reportPrivateUsage]
+        num = copy.deepcopy(num)
+        self.rewrite(num, self._numbering_part, None)
+        abstractNumId = num.abstractNumId.val
+        num.abstractNumId.val = self._import_abstractNum(abstractNumId)
+        new_numId = self._num_map[numId] = numbering_ids.add_num(num)
+        return new_numId
+
+    def _import_abstractNum(self, abstractNumId: int) -> int:
+        new_id = self._abstractNum_map.get(abstractNumId)
+        if new_id is not None:
+            return new_id
+        assert self._numbering_part is not None
+        abstractNum = self._numbering_part.get_abstractNum(abstractNumId)
+        if abstractNum is None:
+            self._abstractNum_map[abstractNumId] = abstractNumId
+            return abstractNumId
+        abstractNum = copy.deepcopy(abstractNum)
+        self.rewrite(abstractNum, self._numbering_part, None)
+        new_id = self._composer._numbering_ids.add_abstractNum(abstractNum)  # pyright: ignore[reportPrivateUsage]
+        self._abstractNum_map[abstractNumId] = new_id
+        return new_id
+
+    def _import_style(self, style_id: str) -> str:
+        """The id in the target document of the style `style_id` is mapped to."""
+        new_id = self._style_map.get(style_id)
+        if new_id is not None:
+            return new_id
+        style = self._styles_by_id.get(style_id)
+        if style is None:
+            return style_id
+
+        composer = self._composer
+        name = style.name_val
+        new_id = None if name is None else composer._style_ids_by_name.get(name)  # pyright: ignore[reportPrivateUsage]
+        if new_id is not None:
+            self._style_map[style_id] = new_id
+            return new_id
+
+        new_id = self._style_map[style_id] = composer._new_style_id(style_id)  # pyright: ignore[reportPrivateUsage]
+        style = copy.deepcopy(style)
+        style.styleId = new_id
+        composer._styles.append(style)  # pyright: ignore[reportPrivateUsage]
+        composer._index_style(style)  # pyright: ignore[reportPrivateUsage]
+        # -- rewritten after being mapped, so a style referring back to it finds it --
+        self.rewrite(style, self._document_part, None)
+        return new_id
+
+    def _map_rId(self, source_part: Part, target_part: Part, rId: str) -> str:
+        """The id of the relationship of `target_part` corresponding to `rId`."""
+        rel_map = self._rel_maps.setdefault((source_part, target_part), {})
+        new_rId = rel_map.get(rId)
+        if new_rId is not None:
+            return new_rId
+
+        rel = source_part.rels.get(rId)
+        if rel is None:
+            return rId
+        if rel.is_external:
+            new_rId = target_part.relate_to(rel.target_ref, rel.reltype, is_external=True)
+        else:
+            new_rId = target_part.relate_to(self._part_copy(rel.target_part), rel.reltype)
+        rel_map[rId] = new_rId
+        return new_rId
+
+    def _part_copy(self, part: Part) -> Part:
+        """The target document copy of `part`, made along with its relations if need be."""
+        part_copy = self._parts.get(part)
+        if part_copy is not None:
+            return part_copy
+
+        part_copy, is_copy = self._composer._import_part(part)  # pyright: ignore[reportPrivateUsage]
+        self._parts[part] = part_copy
+        if not is_copy:
+            return part_copy
+        # -- a fresh copy has no relationships, so it keeps the rIds of the original --
+        for rel in part.rels.values():
+            target = rel.target_ref if rel.is_external else self._part_copy(rel.target_part)
+            part_copy.load_rel(rel.reltype, target, rel.rId, rel.is_external)
+        if isinstance(part_copy, StoryPart):
+            self.rewrite(part_copy.element, part, None)
+        return part_copy
+
+
+def _related_part(part: Part, reltype: str) -> Part | None:
+    """The part related to `part` by `reltype`, |None| if there is none."""
+    try:
+        return part.part_related_by(reltype)
+    except KeyError:
+        return None
+
+
+def _map_anchor(source: SourceMap, hyperlink: BaseOxmlElement, removed: List[BaseOxmlElement]):
+    anchor = hyperlink.get(_w_anchor)
+    if anchor is not None:
+        hyperlink.set(_w_anchor, source._bookmark_name(anchor))  # pyright: ignore[reportPrivateUsage]
+
+
+def _map_bookmark(source: SourceMap, element: BaseOxmlElement, removed: List[BaseOxmlElement]):
+    bookmark_id = element.get(_w_id)
+    if bookmark_id is not None:
+        element.set(_w_id, source._bookmark_id(bookmark_id))  # pyright: ignore[reportPrivateUsage]
+    name = element.get(_w_name)
+    if name is not None:
+        element.set(_w_name, source._bookmark_name(name))  # pyright: ignore[reportPrivateUsage]
+
+
+def _map_docPr(source: SourceMap, docPr: BaseOxmlElement, removed: List[BaseOxmlElement]):
+    docPr.set("id", str(source._composer._new_shape_id()))  # pyright: ignore[reportPrivateUsage]
+
+
+def _map_note(kind: str) -> Callable[[SourceMap, BaseOxmlElement, List[BaseOxmlElement]], None]:
+    def map_note(source: SourceMap, reference: BaseOxmlElement, removed: List[BaseOxmlElement]):
+        note_id = reference.get(qn("w:id"))
+        if note_id is not None:
+            reference.set(qn("w:id"), source._import_note(kind, note_id))  # pyright: ignore[reportPrivateUsage]
+
+    return map_note
+
+
+def _map_numId(source: SourceMap, numId: BaseOxmlElement, removed: List[BaseOxmlElement]):
+    val = numId.get(qn("w:val"))
+    if val is not None and val.isdigit():
+        numId.set(qn("w:val"), str(source._import_num(int(val))))  # pyright: ignore[reportPrivateUsage]
+
+
+def _map_sdt_id(source: SourceMap, sdt_id: BaseOxmlElement, removed: List[BaseOxmlElement]):
+    if sdt_id.get(_w_val) is not None:
+        sdt_id.set(_w_val, str(source._composer._new_sdt_id()))  # pyright: ignore[reportPrivateUsage]
+
+
+def _map_style(source: SourceMap, element: BaseOxmlElement, removed: List[BaseOxmlElement]):
+    val = element.get(qn("w:val"))
+    if val is not None:
+        element.set(qn("w:val"), source._import_style(val))  # pyright: ignore[reportPrivateUsage]
+
+
+def _remove(source: SourceMap, element: BaseOxmlElement, removed: List[BaseOxmlElement]):
+    removed.append(element)
+
+
+_handlers: Dict[str, Callable[[SourceMap, BaseOxmlElement, List[BaseOxmlElement]], None]] = {
+    qn("w:pStyle"): _map_style,
+    qn("w:rStyle"): _map_style,
+    qn("w:tblStyle"): _map_style,
+    qn("w:basedOn"): _map_style,
+    qn("w:next"): _map_style,
+    qn("w:link"): _map_style,
+    qn("w:numStyleLink"): _map_style,
+    qn("w:styleLink"): _map_style,
+    qn("w:numId"): _map_numId,
+    qn("wp:docPr"): _map_docPr,
+    qn("w:footnoteReference"): _map_note("footnote"),
+    qn("w:endnoteReference"): _map_note("endnote"),
+    qn("w:commentRangeStart"): _remove,
+    qn("w:commentRangeEnd"): _remove,
+    qn("w:commentReference"): _remove,
+    qn("w:bookmarkStart"): _map_bookmark,
+    qn("w:bookmarkEnd"): _map_bookmark,
+    qn("w:hyperlink"): _map_anchor,
+    # -- `w:id` as an element rather than an attribute is the id of a content control --
+    qn("w:id"): _map_sdt_id,
+}
+
+_partname_suffix = re.compile(r"\d*(\.[^./]*)?$")
+_r_prefix = "{%s}" % nsmap["r"]
+_sectPr_tag = qn("w:sectPr")
+_w_anchor = qn("w:anchor")
+_w_id = qn("w:id")
+_w_name = qn("w:name")
+_w_val = qn("w:val")
@@ -0,0 +1,185 @@
+"""Estimates of the memory held by each part of a loaded document.
+
+An XML part is held as an lxml (libxml2) tree, which takes several times the size of its
+serialized XML, while a binary part like an image holds just its blob. The estimates
+here count tree nodes and attributes at their typical libxml2 size on a 64-bit platform
+rather than measuring allocations, so they are meant for comparing parts and documents,
+not for exact accounting.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from docx.opc.oxml import write_part_xml
+from docx.opc.part import XmlPart
+
+if TYPE_CHECKING:
+    from docx.opc.package import OpcPackage
+    from docx.opc.packuri import PackURI
+    from docx.opc.part import Part
+
+# -- approximate size in bytes of a libxml2 xmlNode and xmlAttr on a 64-bit platform --
+_NODE_SIZE = 120
+_ATTR_SIZE = 96
+
+
+def memory_report(package: OpcPackage) -> MemoryReport:
+    """Return a |MemoryReport| estimating the memory held by the parts of `package`.
+
+    Each XML part is serialized, without keeping the result, to measure its size, so
+    producing the report takes about as long as saving the document.
+    """
+    parts = [_part_memory(part) for part in package.iter_parts()]
+    parts.sort(key=lambda part: part.retained_size, reverse=True)
+
+    partnames_by_digest: Dict[str, List[PackURI]] = {}
+    blob_sizes: Dict[str, int] = {}
+    for part in package.iter_parts():
+        if isinstance(part, XmlPart):
+            continue
+        blob = part.blob
+        digest = hashlib.sha1(blob).hexdigest()
+        partnames_by_digest.setdefault(digest, []).append(part.partname)
+        blob_sizes[digest] = len(blob)
+    duplicates = [
+        (digest, blob_sizes[digest], sorted(partnames))
+        for digest, partnames in partnames_by_digest.items()
+        if len(partnames) > 1
+    ]
+
+    return MemoryReport(parts, duplicates)
+
+
+class MemoryReport:
+    """Estimated memory held by each part of a document, as produced by :func:`memory_report`."""
+
+    def __init__(self, parts: List[PartMemory], duplicates: List[Tuple[str, int, List[PackURI]]]):
+        self._parts = parts
+        self._duplicates = duplicates
+
+    def __str__(self) -> str:
+        lines = ["%-40s %12s %10s %12s" % ("part", "retained", "elements", "serialized")]
+        lines.extend(
+            "%-40s %12d %10d %12d"
+            % (part.partname, part.retained_size, part.element_count, part.serialized_size)
+            for part in self._parts
+        )
+        lines.append("%-40s %12d" % ("total", self.retained_size))
+        return "\n".join(lines)
+
+    @property
+    def duplicates(self) -> List[Tuple[str, int, List[PackURI]]]:
+        """(sha1, size, partnames) triple for each blob stored in more than one part.
+
+        Only binary parts, like images, are compared. Each such blob is held in memory
+        once per part and written to the package once per part.
+        """
+        return self._duplicates
+
+    @property
+    def parts(self) -> List[PartMemory]:
+        """|PartMemory| for each part, largest estimated retained size first."""
+        return self._parts
+
+    @property
+    def retained_size(self) -> int:
+        """Estimated total bytes held by the parts of the document."""
+        return sum(part.retained_size for part in self._parts)
+
+
+class PartMemory:
+    """Memory estimates for a single part.
+
+    `element_count` is the number of elements in the XML tree, 0 for a binary part, and
+    `blob_size` the size of the blob held by a binary part, 0 for an XML part.
+    `proxy_count` is the number of proxy objects in the proxy cache of a story part.
+    `serialized_size` is the size of the part as written to the package, before
+    compression, and `retained_size` the estimated bytes it holds in memory.
+    """
+
+    __slots__ = (
+        "partname",
+        "content_type",
+        "element_count",
+        "blob_size",
+        "proxy_count",
+        "serialized_size",
+        "retained_size",
+    )
+
+    def __init__(
+        self,
+        partname: PackURI,
+        content_type: str,
+        element_count: int,
+        blob_size: int,
+        proxy_count: int,
+        serialized_size: int,
+        retained_size: int,
+    ):
+        self.partname = partname
+        self.content_type = content_type
+        self.element_count = element_count
+        self.blob_size = blob_size
+        self.proxy_count = proxy_count
+        self.serialized_size = serialized_size
+        self.retained_size = retained_size
+
+    def __repr__(self) -> str:
+        return "PartMemory(%r, retained_size=%d, element_count=%d, blob_size=%d)" % (
+            str(self.partname),
+            self.retained_size,
+            self.element_count,
+            self.blob_size,
+        )
+
+
+class _ByteCounter:
+    """Write-only file that counts the bytes written to it and discards them."""
+
+    def __init__(self):
+        self.count = 0
+
+    def write(self, data: bytes) -> int:
+        self.count += len(data)
+        return len(data)
+
+
+def _part_memory(part: Part) -> PartMemory:
+    """|PartMemory| estimates for `part`."""
+    proxy_cache = getattr(part, "proxy_cache", None)
+    proxy_count = 0 if proxy_cache is None else len(proxy_cache)
+
+    if not isinstance(part, XmlPart):
+        blob_size = len(part.blob)
+        return PartMemory(
+            part.partname, part.content_type, 0, blob_size, proxy_count, blob_size, blob_size
+        )
+
+    element_count = text_node_count = attr_count = text_size = 0
+    for node in part.element.iter():
+        element_count += 1
+        for name, value in node.items():
+            attr_count += 1
+            text_size += len(name) + len(value)
+        # -- text and tail are each held in a separate text node --
+        for text in (node.text, node.tail):
+            if text:
+                text_node_count += 1
+                text_size += len(text)
+
+    counter = _ByteCounter()
+    write_part_xml(part.element, counter)  # pyright: ignore[reportArgumentType]
+    node_count = element_count + text_node_count
+    retained_size = node_count * _NODE_SIZE + attr_count * _ATTR_SIZE + text_size
+    return PartMemory(
+        part.partname,
+        part.content_type,
+        element_count,
+        0,
+        proxy_count,
+        counter.count,
+        retained_size,
+    )
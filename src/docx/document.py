@@ -5,26 +5,57 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, Iterator, List
+import re
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    Mapping,
+    Pattern,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 import docx
 from docx.blkcntnr import BlockItemContainer
+from docx.bookmarks import Bookmarks
+from docx.comments import add_comment
+from docx.compose import Composer
+from docx.diagnostics import memory_report
 from docx.enum.section import WD_SECTION
-from docx.enum.text import WD_BREAK
+from docx.enum.text import WD_BREAK, WD_REVISIONS_VIEW
+from docx.optimize import optimize_package
+from docx.outline import build_outline
 from docx.oxml import simpletypes
+from docx.oxml.ns import qn
+from docx.pages import iter_rendered_pages
+from docx.revisions import Revisions, accept_all, iter_text, reject_all
+from docx.sdt import ContentControls
 from docx.section import Section, Sections
-from docx.shared import ElementProxy, Emu
+from docx.shared import ElementProxy, Emu, ProxyCache, ProxySequence
 from docx.text.block import SdtBlock
+from docx.text.normalize import normalize_paragraphs
+from docx.text.replace import TextReplacer
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     import docx.types as t
+    from docx.comments import Comment, Comments
+    from docx.diagnostics import MemoryReport
+    from docx.outline import Outline
     from docx.oxml.document import CT_Body, CT_Document
+    from docx.pages import RenderedPage
     from docx.parts.document import DocumentPart
     from docx.settings import Settings
     from docx.shared import Length
     from docx.styles.style import ParagraphStyle, _TableStyle
     from docx.table import Table
     from docx.text.paragraph import Paragraph
+    from docx.text.run import Run
 
 
 class Document(ElementProxy):
@@ -101,6 +132,30 @@ class Document(ElementProxy):
             ho.get_or_add_ilvl().val = i
             ho.get_or_add_numId().val = nNum.numId
 
+    def accept_all_revisions(self) -> int:
+        """Accept every tracked change in the document, returning the number accepted.
+
+        Inserted content stays and deleted content goes, a paragraph whose mark is
+        deleted is joined to the next one, and changed formatting is kept. The body,
+        headers, footers, footnotes and endnotes are rewritten in a single pass each.
+        """
+        return accept_all(self._part)
+
+    def add_comment(
+        self,
+        runs: Run | Sequence[Run],
+        text: str = "",
+        author: str = "",
+        initials: str | None = None,
+    ) -> Comment:
+        """Add a comment having `text` on `runs` and return it.
+
+        `runs` is a run or a sequence of adjacent runs, from the first to the last run
+        commented on; the comment range begins before the first and ends after the last,
+        followed by the comment mark.
+        """
+        return add_comment(self._part, runs, text, author, initials)
+
     def add_heading(self, text: str = "", level: int = 1):
         """Return a heading paragraph newly added to the end of the document.
 
@@ -171,11 +226,88 @@ class Document(ElementProxy):
         table.style = style
         return table
 
+    def append_document(self, other: Document):
+        """Append the body content of `other` to the end of this document.
+
+        The styles, lists, images, related parts and notes the content refers to are
+        carried over as described for |Composer|. `other` is not changed. To append many
+        documents, use :func:`docx.compose` or a single |Composer|, which keep their
+        indexes of this document between appends.
+        """
+        Composer(self).append(other)
+
+    @property
+    def bookmarks(self) -> Bookmarks:
+        """The |Bookmarks| of this document, in the body and in its other stories.
+
+        Lookups by name use an index of the document built on first use, so resolving the
+        bookmark of each internal hyperlink or `REF` field of a document is fast.
+        """
+        return Bookmarks(self._part)
+
+    @property
+    def cache_proxies(self) -> bool:
+        """Read/write. |True| when proxies constructed for the main document story are reused.
+
+        When enabled, traversals like `document.paragraphs`, `paragraph.runs` or
+        `table.rows[i].cells` return the proxy object already constructed for an element
+        while that object is still referenced, rather than constructing a new one. This
+        reduces allocation when the same content is traversed repeatedly. Proxies are
+        held weakly, so the cache does not keep otherwise unreferenced objects alive.
+        Disabled by default.
+        """
+        return self._part.proxy_cache is not None
+
+    @cache_proxies.setter
+    def cache_proxies(self, value: bool):
+        if not value:
+            self._part.proxy_cache = None
+        elif self._part.proxy_cache is None:
+            self._part.proxy_cache = ProxyCache()
+
+    def clone(self) -> Document:
+        """Return a new |Document| object that is an independent copy of this one.
+
+        The copy is made in memory from the loaded parts, without saving or reparsing
+        anything, so a template opened once can cheaply produce any number of documents
+        to be filled in separately. Media such as images is shared between the copies
+        since it is never modified in place.
+        """
+        package = self._part.package.clone()
+        return cast("DocumentPart", package.main_document_part).document
+
+    @property
+    def comments(self) -> Comments:
+        """The |Comments| of this document.
+
+        Each comment provides its anchored text, replies and done state through an index
+        of the document built on first use.
+        """
+        return self._part.comments
+
+    @property
+    def content_controls(self) -> ContentControls:
+        """The |ContentControls| of this document, in the body and in its other stories.
+
+        Controls are found by tag, alias or id using an index of the document built on
+        first use.
+        """
+        return ContentControls(self._part)
+
     @property
     def core_properties(self):
         """A |CoreProperties| object providing Dublin Core properties of document."""
         return self._part.core_properties
 
+    def fill_content_controls(self, values: Mapping[str, str | None]) -> int:
+        """Fill each content control having a tag in `values` with the text mapped to it.
+
+        Returns the number of controls filled. Every control having a given tag is filled,
+        in the body, headers, footers, footnotes and endnotes. The content of each control
+        is replaced in place, keeping its formatting; see :meth:`.ContentControl.fill`.
+        """
+        return self.content_controls.fill(values)
+
     @property
     def inline_shapes(self):
         """The |InlineShapes| collection for this document.
@@ -190,10 +322,81 @@ class Document(ElementProxy):
         """Generate each `Paragraph` or `Table` in this document in document order."""
         return self._body.iter_inner_content()
 
+    def iter_list_labels(self) -> Iterator[Tuple[Paragraph, str]]:
+        """Generate a `(paragraph, label)` pair for each numbered paragraph in document.
+
+        `label` is the list label Word renders for the paragraph, like "3.2.a)" or a
+        bullet character, computed in a single pass over the main document story.
+        Paragraphs nested in tables are included, in document order.
+        """
+        from docx.text.paragraph import Paragraph
+
+        labeler = self._part.new_list_labeler()
+        if labeler is None:
+            return
+
+        for p in self._element.body.iter(qn("w:p")):
+            label = labeler.label_for(p)
+            if label is not None:
+                yield Paragraph(p, self._body), label
+
+    def iter_rendered_pages(self) -> Iterator[RenderedPage]:
+        """Generate a |RenderedPage| for each page of this document as Word last laid it out.
+
+        Pages are located by the rendered page breaks Word records when it saves a
+        document, in a single pass over the body. Each page describes its content as
+        ranges of body blocks; a paragraph or table split across pages is only copied when
+        the content of a page is asked for. A document never saved by Word is one page.
+        """
+        return iter_rendered_pages(self._element.body, self._body)
+
+    def iter_text(self, view: WD_REVISIONS_VIEW = WD_REVISIONS_VIEW.FINAL) -> Iterator[str]:
+        """Generate the text of each paragraph of the body as it reads in `view`.
+
+        `view` is a member of :ref:`WdRevisionsView`, `FINAL` for the text with tracked
+        changes accepted and `ORIGINAL` for it with them rejected. Paragraphs in tables
+        and content controls are included. Paragraph marks and table rows deleted in
+        `view` are honored, so the text generated is that of the paragraphs the document
+        would have after :meth:`accept_all_revisions` (or :meth:`reject_all_revisions`).
+        """
+        return iter_text(self._element.body, view)
+
+    def memory_report(self) -> MemoryReport:
+        """Return a |MemoryReport| estimating the memory held by each part of this document.
+
+        See :func:`docx.diagnostics.memory_report`.
+        """
+        package = self._part.package
+        assert package is not None
+        return memory_report(package)
+
+    def normalize(self) -> int:
+        """Merge adjacent runs having the same formatting throughout the document.
+
+        Returns the number of runs removed. Like :meth:`replace`, this covers the body,
+        headers, footers, footnotes and endnotes. See :meth:`.Paragraph.normalize_runs`.
+        """
+        return normalize_paragraphs(part.element for part in self._part.iter_story_parts())
+
+    def outline(self) -> Outline:
+        """Return the |Outline| of the headings in the body of this document.
+
+        A heading is a paragraph having an outline level from 0 to 8, directly or through
+        its style, like the built-in "Heading 1" to "Heading 9" styles. The outline is
+        computed in a single pass over the body, for example to build a table of contents
+        or to split the document into sections by `Heading.block_index`.
+        """
+        return build_outline(self._element.body, self.styles.element, self._body)
+
     @property
-    def paragraphs(self) -> List[Paragraph]:
+    def paragraphs(self) -> ProxySequence[Paragraph]:
         """The |Paragraph| instances in the document, in document order.
 
+        Each paragraph is constructed on first access, so `len(document.paragraphs)` or
+        `document.paragraphs[-1]` don't construct a proxy for every paragraph. The same
+        sequence is returned until an element is added to or removed from the document,
+        so `document.paragraphs[i]` in a loop doesn't search the body on each access.
+
         Note that paragraphs within revision marks such as ``<w:ins>`` or ``<w:del>`` do
         not appear in this list.
         """
@@ -204,14 +407,70 @@ class Document(ElementProxy):
         """The |DocumentPart| object of this document."""
         return self._part
 
-    def save(self, path_or_stream: str | IO[bytes]):
+    def reject_all_revisions(self) -> int:
+        """Reject every tracked change in the document, returning the number rejected.
+
+        Inserted content goes and deleted content is restored, a paragraph whose mark was
+        inserted is joined to the next one, and changed formatting is restored to what it
+        was. Like :meth:`accept_all_revisions`, each story is rewritten in one pass.
+        """
+        return reject_all(self._part)
+
+    def replace(
+        self,
+        old: str | Mapping[str, str] | Pattern[str],
+        new: str | Callable[[re.Match[str]], str] | None = None,
+    ) -> int:
+        """Replace text throughout the document, returning the number of replacements.
+
+        `old` is either a search string with `new` its replacement, a mapping of
+        search-string to replacement-string, or a compiled regular expression with `new`
+        a replacement template or a callable taking the match and returning its
+        replacement. All the entries in a mapping are replaced in a single pass.
+
+        Matches are found in the text of each paragraph, so text split across runs is
+        found. The replacement takes on the formatting of the run in which the match
+        begins. The body, including tables, headers, footers, footnotes and endnotes are
+        all searched.
+        """
+        replacer = TextReplacer.from_args(old, new)
+        return sum(replacer.replace_in([part.element]) for part in self._part.iter_story_parts())
+
+    @property
+    def revisions(self) -> Revisions:
+        """The |Revisions| of this document, its tracked changes in document order.
+
+        Changes in headers, footers, footnotes and endnotes follow those in the body.
+        """
+        return Revisions(self._part)
+
+    def save(self, path_or_stream: str | IO[bytes], optimize: bool = False):
         """Save this document to `path_or_stream`.
 
         `path_or_stream` can be either a path to a filesystem location (a string) or a
         file-like object.
+
+        When `optimize` is |True|, revision-save ids, proofing marks, duplicate media and
+        unreferenced relationships are removed from the document before it is saved; see
+        :func:`docx.optimize.optimize_package`, which can also remove unused styles.
         """
+        if optimize:
+            optimize_package(self._part.package)
         self._part.save(path_or_stream)
 
+    async def save_async(
+        self, path_or_stream: str | IO[bytes] | Any, executor: Executor | None = None
+    ):
+        """Save this document to `path_or_stream` without blocking the event loop.
+
+        The package is written in `executor`, the default executor of the running loop
+        when |None|. `path_or_stream` can also be an async byte sink; see
+        :func:`docx.aio.save_document`.
+        """
+        from docx.aio import save_document
+
+        await save_document(self, path_or_stream, executor)
+
     @property
     def sections(self) -> Sections:
         """|Sections| object providing access to each section in this document."""
@@ -228,7 +487,7 @@ class Document(ElementProxy):
         return self._part.styles
 
     @property
-    def tables(self) -> List[Table]:
+    def tables(self) -> ProxySequence[Table]:
         """All |Table| instances in the document, in document order.
 
         Note that only tables appearing at the top level of the document appear in this
@@ -251,6 +510,11 @@ class Document(ElementProxy):
             self.__body = _Body(self._element.body, self)
         return self.__body
 
+    @property
+    def _proxy_cache(self) -> ProxyCache | None:
+        """Proxy cache of the document part, |None| when not enabled."""
+        return self._part.proxy_cache
+
 
 class _Body(BlockItemContainer):
     """Proxy for `<w:body>` element in this document.
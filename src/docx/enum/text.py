@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import enum
 
-from docx.enum.base import BaseXmlEnum
+from docx.enum.base import BaseEnum, BaseXmlEnum
 
 
 class WD_PARAGRAPH_ALIGNMENT(BaseXmlEnum):
@@ -205,6 +205,75 @@ class WD_LINE_SPACING(BaseXmlEnum):
        change the line spacing proportionately."""
 
 
+class WD_REVISION_TYPE(BaseEnum):
+    """Specifies the kind of a tracked change (revision).
+
+    Example::
+
+        from docx.enum.text import WD_REVISION_TYPE
+
+        insertions = [r for r in document.revisions if r.kind == WD_REVISION_TYPE.INSERT]
+
+    MS API name: `WdRevisionType`
+
+    URL: https://learn.microsoft.com/en-us/office/vba/api/word.wdrevisiontype
+    """
+
+    INSERT = (1, "Inserted content, a paragraph mark or a table row.")
+    """Inserted content, a paragraph mark or a table row."""
+
+    DELETE = (2, "Deleted content, a paragraph mark or a table row.")
+    """Deleted content, a paragraph mark or a table row."""
+
+    PROPERTY = (3, "Changed character formatting.")
+    """Changed character formatting."""
+
+    PARAGRAPH_PROPERTY = (10, "Changed paragraph formatting.")
+    """Changed paragraph formatting."""
+
+    TABLE_PROPERTY = (11, "Changed table, row or cell formatting.")
+    """Changed table, row or cell formatting."""
+
+    SECTION_PROPERTY = (12, "Changed section properties.")
+    """Changed section properties."""
+
+    MOVED_FROM = (14, "Content moved away from here.")
+    """Content moved away from here."""
+
+    MOVED_TO = (15, "Content moved to here.")
+    """Content moved to here."""
+
+    CELL_INSERTION = (16, "An inserted table cell.")
+    """An inserted table cell."""
+
+    CELL_DELETION = (17, "A deleted table cell.")
+    """A deleted table cell."""
+
+    CELL_MERGE = (18, "Merged table cells.")
+    """Merged table cells."""
+
+
+class WD_REVISIONS_VIEW(BaseEnum):
+    """Specifies whether text is read with its tracked changes accepted or rejected.
+
+    Example::
+
+        from docx.enum.text import WD_REVISIONS_VIEW
+
+        original = list(document.iter_text(WD_REVISIONS_VIEW.ORIGINAL))
+
+    MS API name: `WdRevisionsView`
+
+    URL: https://learn.microsoft.com/en-us/office/vba/api/word.wdrevisionsview
+    """
+
+    FINAL = (0, "The document with all tracked changes accepted.")
+    """The document with all tracked changes accepted."""
+
+    ORIGINAL = (1, "The document with all tracked changes rejected.")
+    """The document with all tracked changes rejected."""
+
+
 class WD_TAB_ALIGNMENT(BaseXmlEnum):
     """Specifies the tab stop alignment to apply.
 
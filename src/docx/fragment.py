@@ -0,0 +1,571 @@
+"""Repeated blocks of content stamped from a template with placeholder slots filled.
+
+Building the same block of content many times, like a line of an invoice or a section per
+customer, through `add_paragraph()`, `add_run()` and font properties creates and discards
+proxy objects for every element. A |Fragment| instead captures a range of paragraphs and
+tables from a template once, locates each placeholder in them up front, and then stamps
+out each copy as a deep copy of the captured XML with the placeholder text filled in.
+
+Placeholders are written in the template text between double braces:
+
+* ``{{name}}`` is a text slot, replaced by ``str(value)``.
+* ``{{image:name}}`` is an image slot, replaced by an inline picture of the image at
+  `value`, a path or file-like object, or a ``(path_or_stream, width, height)`` tuple.
+* ``{{rows.field}}`` in a table row makes that row a row slot. The row is repeated once
+  for each item of the `rows` value, with ``{{rows.field}}`` filled from the `field` key
+  (or attribute) of the item. Other slots in the row are filled as usual.
+
+A placeholder may be split across several runs in the template, as Word often does; it
+takes on the formatting of the run it begins in.
+"""
+
+from __future__ import annotations
+
+import copy
+import re
+import weakref
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from docx.blkcntnr import BlockItemContainer
+from docx.compose import Composer, SourceMap
+from docx.document import Document
+from docx.oxml.ns import nsmap, qn
+from docx.oxml.parser import OxmlElement
+from docx.oxml.shape import CT_Inline
+from docx.text.textutil import ParagraphTextIndex, set_text
+
+if TYPE_CHECKING:
+    from docx.image.image import Image
+    from docx.opc.package import OpcPackage
+    from docx.opc.part import Part
+    from docx.oxml.xmlchemy import BaseOxmlElement
+    from docx.parts.document import DocumentPart
+    from docx.parts.story import StoryPart
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+
+_slot_re = re.compile(
+    r"\{\{\s*(?:(?P<image>image)\s*:\s*)?"
+    r"(?P<name>[A-Za-z_]\w*)(?:\.(?P<field>[A-Za-z_]\w*))?\s*\}\}"
+)
+
+_bookmarkEnd_tag = qn("w:bookmarkEnd")
+_bookmarkStart_tag = qn("w:bookmarkStart")
+_docPr_tag = qn("wp:docPr")
+_r_prefix = "{%s}" % nsmap["r"]
+_rPr_tag = qn("w:rPr")
+# -- `w:id` as an element rather than an attribute is the id of a content control --
+_sdt_id_tag = qn("w:id")
+_sectPr_tag = qn("w:sectPr")
+_t_tag = qn("w:t")
+_tr_tag = qn("w:tr")
+_w_id = qn("w:id")
+_w_name = qn("w:name")
+_w_val = qn("w:val")
+
+ImageValue = Union[str, IO[bytes], Tuple[Union[str, IO[bytes]], Any, Any]]
+
+
+class Fragment:
+    """Block content captured from a template, stamped out with its slots filled.
+
+    Use :meth:`capture` to create one from paragraphs and tables of a template document.
+    The template content is copied when captured, so the template can be changed or
+    discarded afterward.
+    """
+
+    def __init__(self, elements: Sequence[BaseOxmlElement], part: StoryPart):
+        self._part = part
+        self._elements = [copy.deepcopy(element) for element in elements]
+        # -- (index of `w:t` in document order, pieces) for each `w:t` having slots --
+        self._text_slots: List[Tuple[int, List[str | _Slot]]] = []
+        self._row_slots: List[_RowSlot] = []
+        self._compile()
+        self._has_drawings = any(
+            True for element in self._elements for _ in element.iter(_docPr_tag)
+        ) or any(
+            isinstance(piece, _Slot) and piece.is_image
+            for pieces in self._all_pieces()
+            for piece in pieces
+        )
+        self._has_marks = any(
+            True
+            for element in self._elements
+            for _ in element.iter(_bookmarkStart_tag, _sdt_id_tag)
+        )
+
+        self._prototypes: weakref.WeakKeyDictionary[Part, List[BaseOxmlElement]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._sources: weakref.WeakKeyDictionary[OpcPackage, SourceMap] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._next_shape_ids: weakref.WeakKeyDictionary[Part, int] = weakref.WeakKeyDictionary()
+        self._next_sdt_ids: weakref.WeakKeyDictionary[Part, int] = weakref.WeakKeyDictionary()
+        self._images: weakref.WeakKeyDictionary[Part, Dict[str, Tuple[str, Image]]] = (
+            weakref.WeakKeyDictionary()
+        )
+        # -- `w:drawing` of each picture stamped into a part, by (rId, cx, cy) --
+        self._drawings: weakref.WeakKeyDictionary[
+            Part, Dict[Tuple[str, int, int], BaseOxmlElement]
+        ] = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def capture(cls, blocks: Iterable[Paragraph | Table], remove: bool = False) -> Fragment:
+        """Return a |Fragment| of `blocks`, paragraphs and tables of a single story.
+
+        The blocks are captured in the order given. When `remove` is |True| they are
+        then removed from the template, for example when the template document itself is
+        filled with stamped copies of them.
+        """
+        blocks = list(blocks)
+        if not blocks:
+            raise ValueError("a fragment requires at least one block")
+        part = blocks[0].part
+        if any(block.part is not part for block in blocks):
+            raise ValueError("the blocks of a fragment must belong to the same story part")
+        elements = [block._element for block in blocks]  # pyright: ignore[reportPrivateUsage]
+        fragment = cls(elements, part)
+        if remove:
+            for element in elements:
+                parent = element.getparent()
+                if parent is not None:
+                    parent.remove(element)
+        return fragment
+
+    @property
+    def slots(self) -> Tuple[str, ...]:
+        """Names of the slots in this fragment, sorted, row slots included.
+
+        A row slot field is named like "rows.field".
+        """
+        names = {
+            piece.key
+            for pieces in self._all_pieces()
+            for piece in pieces
+            if isinstance(piece, _Slot)
+        }
+        return tuple(sorted(names))
+
+    def stamp(
+        self,
+        container: Document | BlockItemContainer,
+        values: Mapping[str, Any] | None = None,
+        **kwargs: Any,
+    ):
+        """Append a copy of this fragment to `container`, with its slots filled.
+
+        `container` is a document, in which case the copy is appended to its body, or a
+        block container like a table cell or header. Slot values are taken from `values`
+        and keyword arguments, the latter taking precedence. A value of |None| leaves a
+        slot empty; a slot with no value at all raises |KeyError|.
+
+        When `container` belongs to a different document than the template, the styles,
+        list definitions and images the fragment refers to are copied into that document
+        the first time the fragment is stamped into it.
+        """
+        if isinstance(container, Document):
+            container = container._body  # pyright: ignore[reportPrivateUsage]
+        values = {**values, **kwargs} if values else kwargs
+        part = container.part
+        elements = [copy.deepcopy(element) for element in self._prototype(part)]
+
+        ts = [t for element in elements for t in element.iter(_t_tag)]
+        rows = (
+            [tr for element in elements for tr in element.iter(_tr_tag)] if self._row_slots else []
+        )
+        for index, pieces in self._text_slots:
+            self._fill(ts[index], pieces, values, None, part)
+        for row_slot in self._row_slots:
+            self._expand_row(rows[row_slot.index], row_slot, values, part)
+        if self._has_drawings:
+            for element in elements:
+                for docPr in element.iter(_docPr_tag):
+                    docPr.set("id", str(self._new_shape_id(part)))
+
+        bookmarks = self._renumber_marks(elements, part) if self._has_marks else []
+
+        parent = container._element  # pyright: ignore[reportPrivateUsage]
+        last = next(parent.iterchildren(reversed=True), None)
+        if last is not None and last.tag == _sectPr_tag:
+            for element in elements:
+                last.addprevious(element)
+        else:
+            parent.extend(elements)
+        if bookmarks:
+            index = self._document_part(part).bookmark_index
+            for name, start, end in bookmarks:
+                index.add(name, start, end, part)  # pyright: ignore[reportArgumentType]
+
+    def _all_pieces(self) -> Iterable[List[str | _Slot]]:
+        for _, pieces in self._text_slots:
+            yield pieces
+        for row_slot in self._row_slots:
+            for _, pieces in row_slot.text_slots:
+                yield pieces
+
+    def _compile(self):
+        """Locate the slots in the captured elements, once for all stamps."""
+        elements = self._elements
+
+        # -- gather each placeholder into the single `w:t` it begins in --
+        for element in elements:
+            for p in element.iter(qn("w:p")):
+                index = ParagraphTextIndex(p)  # pyright: ignore[reportArgumentType]
+                for match in reversed(list(_slot_re.finditer(index.text))):
+                    index.replace(match.start(), match.end(), match.group(0))
+
+        # -- give each image placeholder a run of its own --
+        pending = [t for element in elements for t in element.iter(_t_tag)]
+        while pending:
+            t = pending.pop()
+            pending.extend(_isolate_image_slot(t))
+
+        trs = [tr for element in elements for tr in element.iter(_tr_tag)]
+        row_slots: Dict[BaseOxmlElement, _RowSlot] = {}
+        for index, tr in enumerate(trs):
+            names = {
+                match.group("name")
+                for t in tr.iter(_t_tag)
+                for match in _slot_re.finditer(t.text or "")
+                if match.group("field")
+            }
+            if len(names) > 1:
+                raise ValueError(
+                    "a table row can repeat for only one row slot, got %s"
+                    % ", ".join(sorted(names))
+                )
+            if not names:
+                continue
+            if any(ancestor in row_slots for ancestor in tr.iterancestors(_tr_tag)):
+                raise ValueError("row slots in nested tables are not supported")
+            row_slots[tr] = _RowSlot(index, names.pop(), tr)
+
+        ts = [t for element in elements for t in element.iter(_t_tag)]
+        for index, t in enumerate(ts):
+            pieces = _pieces(t.text or "")
+            if pieces is None:
+                continue
+            row_slot = next(
+                (row_slots[tr] for tr in t.iterancestors(_tr_tag) if tr in row_slots), None
+            )
+            if row_slot is None:
+                for piece in pieces:
+                    if isinstance(piece, _Slot) and piece.field is not None:
+                        raise ValueError("row slot %r is not in a table row" % piece.key)
+                self._text_slots.append((index, pieces))
+            else:
+                row_slot.add(t, pieces)
+        self._row_slots = sorted(row_slots.values(), key=lambda row_slot: row_slot.index)
+
+    def _expand_row(
+        self, tr: BaseOxmlElement, row_slot: _RowSlot, values: Mapping[str, Any], part: Part
+    ):
+        """Replace `tr` with a copy for each item of the value of `row_slot`."""
+        items = _value(values, row_slot.name)
+        for item in items or ():
+            row = copy.deepcopy(tr)
+            ts = list(row.iter(_t_tag))
+            for index, pieces in row_slot.text_slots:
+                self._fill(ts[index], pieces, values, item, part)
+            tr.addprevious(row)
+        parent = tr.getparent()
+        if parent is not None:
+            parent.remove(tr)
+
+    def _fill(
+        self,
+        t: BaseOxmlElement,
+        pieces: List[str | _Slot],
+        values: Mapping[str, Any],
+        item: Any,
+        part: Part,
+    ):
+        """Replace the placeholders in `t` with their values."""
+        first = pieces[0]
+        if isinstance(first, _Slot) and first.is_image:
+            self._fill_image(t, first.value(values, item), part)
+            return
+        texts: List[str] = []
+        for piece in pieces:
+            if isinstance(piece, str):
+                texts.append(piece)
+                continue
+            value = piece.value(values, item)
+            if value is not None:
+                texts.append(str(value))
+        set_text(t, "".join(texts))
+
+    def _document_part(self, part: Part) -> DocumentPart:
+        package = part.package
+        assert package is not None
+        document_part: DocumentPart = package.main_document_part  # pyright: ignore
+        return document_part
+
+    def _fill_image(self, t: BaseOxmlElement, value: ImageValue | None, part: Part):
+        """Replace `t` with an inline picture of the image `value`."""
+        r = t.getparent()
+        assert r is not None
+        if value is not None:
+            descriptor, width, height = value if isinstance(value, tuple) else (value, None, None)
+            rId, image = self._image(part, descriptor)
+            cx, cy = image.scaled_dimensions(width, height)
+            drawings = self._drawings.setdefault(part, {})
+            drawing = drawings.get((rId, cx, cy))
+            if drawing is None:
+                # -- the shape id is assigned along with those of the other drawings --
+                inline = CT_Inline.new_pic_inline(0, rId, image.filename, cx, cy)
+                drawing = drawings[(rId, cx, cy)] = OxmlElement("w:drawing")
+                drawing.append(inline)
+            t.addprevious(copy.deepcopy(drawing))
+        r.remove(t)
+
+    def _image(self, part: Part, descriptor: str | IO[bytes]) -> Tuple[str, Image]:
+        """(rId, image) pair for the image `descriptor` related from `part`.
+
+        An image given by path is read once per part, however often it is stamped.
+        """
+        story_part: StoryPart = part  # pyright: ignore[reportAssignmentType]
+        if not isinstance(descriptor, str):
+            return story_part.get_or_add_image(descriptor)
+        images = self._images.setdefault(part, {})
+        image = images.get(descriptor)
+        if image is None:
+            image = images[descriptor] = story_part.get_or_add_image(descriptor)
+        return image
+
+    def _new_shape_id(self, part: Part) -> int:
+        shape_id = self._next_shape_ids.get(part)
+        if shape_id is None:
+            shape_id = part.next_id  # pyright: ignore[reportAttributeAccessIssue]
+        self._next_shape_ids[part] = shape_id + 1
+        return shape_id
+
+    def _renumber_marks(
+        self, elements: List[BaseOxmlElement], part: Part
+    ) -> List[Tuple[str, BaseOxmlElement, BaseOxmlElement | None]]:
+        """Give the bookmarks and content controls in `elements` ids unused in the document.
+
+        A bookmark whose name is taken in the document is renamed, like "Intro" to
+        "Intro2". Returns a `(name, start, end)` triple for each bookmark, to be indexed
+        once `elements` are in the document.
+        """
+        document_part = self._document_part(part)
+        index = document_part.bookmark_index
+        next_id = index.next_id()
+        new_ids: Dict[str, str] = {}
+        names: Set[str] = set()
+        starts: List[Tuple[str, BaseOxmlElement]] = []
+        ends: Dict[str, BaseOxmlElement] = {}
+        has_controls = False
+        for element in elements:
+            for e in element.iter(_bookmarkStart_tag, _bookmarkEnd_tag, _sdt_id_tag):
+                if e.tag == _sdt_id_tag:
+                    e.set(_w_val, str(self._new_sdt_id(document_part)))
+                    has_controls = True
+                elif e.tag == _bookmarkEnd_tag:
+                    bookmark_id = new_ids.get(e.get(_w_id, ""))
+                    if bookmark_id is not None:
+                        e.set(_w_id, bookmark_id)
+                        ends.setdefault(bookmark_id, e)
+                else:
+                    # -- a later start having the same id, in a repeated row, gets its own --
+                    bookmark_id = new_ids[e.get(_w_id, "")] = str(next_id)
+                    next_id += 1
+                    e.set(_w_id, bookmark_id)
+                    name = e.get(_w_name)
+                    if name is None:
+                        continue
+                    new_name, n = name, 1
+                    while new_name in names or new_name in index:
+                        n += 1
+                        new_name = "%s%d" % (name, n)
+                    names.add(new_name)
+                    e.set(_w_name, new_name)
+                    starts.append((new_name, e))
+        if has_controls:
+            document_part.content_control_index.refresh()
+        return [(name, start, ends.get(start.get(_w_id, ""))) for name, start in starts]
+
+    def _new_sdt_id(self, document_part: DocumentPart) -> int:
+        sdt_id = self._next_sdt_ids.get(document_part)
+        if sdt_id is None:
+            sdt_id = document_part.content_control_index.next_id()
+        self._next_sdt_ids[document_part] = sdt_id + 1
+        return sdt_id
+
+    def _prototype(self, part: Part) -> List[BaseOxmlElement]:
+        """The captured elements with references made valid for stamping into `part`.
+
+        Relationship ids are relative to the template part the fragment was captured
+        from, so stamping into another part needs a copy having its own. The copy is
+        made once per part.
+        """
+        if part is self._part:
+            return self._elements
+        prototype = self._prototypes.get(part)
+        if prototype is not None:
+            return prototype
+
+        prototype = [copy.deepcopy(element) for element in self._elements]
+        package = part.package
+        assert package is not None
+        if package is self._part.package:
+            for element in prototype:
+                _map_rIds(element, self._part, part)
+        else:
+            source = self._sources.get(package)
+            if source is None:
+                document_part: DocumentPart = package.main_document_part  # pyright: ignore
+                template_part: DocumentPart = (
+                    self._part.package.main_document_part  # pyright: ignore
+                )
+                source = self._sources[package] = SourceMap(
+                    Composer(document_part.document), template_part
+                )
+            for element in prototype:
+                source.rewrite(element, self._part, part)
+        self._prototypes[part] = prototype
+        return prototype
+
+
+class _RowSlot:
+    """A table row repeated for each item of the value of slot `name`."""
+
+    def __init__(self, index: int, name: str, tr: BaseOxmlElement):
+        self.index = index
+        self.name = name
+        self._t_indexes = {t: i for i, t in enumerate(tr.iter(_t_tag))}
+        # -- (index of `w:t` in the row, pieces) for each `w:t` of the row having slots --
+        self.text_slots: List[Tuple[int, List[str | _Slot]]] = []
+
+    def add(self, t: BaseOxmlElement, pieces: List[str | _Slot]):
+        for piece in pieces:
+            if isinstance(piece, _Slot) and piece.field is not None and piece.name != self.name:
+                raise ValueError("row slot %r is not in a row of %r" % (piece.key, self.name))
+        self.text_slots.append((self._t_indexes[t], pieces))
+
+
+class _Slot:
+    """A placeholder in the text of a `w:t` element."""
+
+    __slots__ = ("name", "field", "is_image")
+
+    def __init__(self, name: str, field: str | None, is_image: bool):
+        self.name = name
+        self.field = field
+        self.is_image = is_image
+
+    @property
+    def key(self) -> str:
+        return self.name if self.field is None else "%s.%s" % (self.name, self.field)
+
+    def value(self, values: Mapping[str, Any], item: Any) -> Any:
+        """The value of this slot, from row `item` when it is a row slot field."""
+        if self.field is None:
+            return _value(values, self.name)
+        if isinstance(item, Mapping):
+            try:
+                return item[self.field]
+            except KeyError:
+                raise KeyError("no value for slot %r" % self.key)
+        try:
+            return getattr(item, self.field)
+        except AttributeError:
+            raise KeyError("no value for slot %r" % self.key)
+
+
+def _isolate_image_slot(t: BaseOxmlElement) -> List[BaseOxmlElement]:
+    """Move the text around the first image placeholder in `t` to runs of its own.
+
+    Returns the `w:t` elements of the new runs, which may hold further placeholders.
+    """
+    text = t.text or ""
+    match = next((m for m in _slot_re.finditer(text) if m.group("image")), None)
+    r = t.getparent()
+    if match is None or r is None:
+        return []
+    before, after = text[: match.start()], text[match.end() :]
+    preceding = [e for e in t.itersiblings(preceding=True) if e.tag != _rPr_tag][::-1]
+    following = list(t.itersiblings())
+    if not (before or after or preceding or following):
+        return []
+
+    rPr = r.find(_rPr_tag)
+
+    def new_run() -> BaseOxmlElement:
+        run = OxmlElement("w:r")
+        if rPr is not None:
+            run.append(copy.deepcopy(rPr))
+        return run
+
+    new_ts: List[BaseOxmlElement] = []
+    if before or preceding:
+        run = new_run()
+        run.extend(preceding)
+        if before:
+            new_ts.append(_new_t(run, before))
+        r.addprevious(run)
+    if after or following:
+        run = new_run()
+        if after:
+            new_ts.append(_new_t(run, after))
+        run.extend(following)
+        r.addnext(run)
+    t.text = match.group(0)
+    return new_ts
+
+
+def _map_rIds(element: BaseOxmlElement, source_part: Part, target_part: Part):
+    """Make the relationship ids in `element` relative to `target_part`, in place."""
+    for e in element.iter():
+        for name, rId in e.items():
+            if not name.startswith(_r_prefix):
+                continue
+            rel = source_part.rels.get(rId)
+            if rel is None:
+                continue
+            target = rel.target_ref if rel.is_external else rel.target_part
+            e.set(name, target_part.relate_to(target, rel.reltype, rel.is_external))
+
+
+def _new_t(run: BaseOxmlElement, text: str) -> BaseOxmlElement:
+    t = OxmlElement("w:t")
+    set_text(t, text)
+    run.append(t)
+    return t
+
+
+def _pieces(text: str) -> List[str | _Slot] | None:
+    """The literal text and slots making up `text`, |None| when it has no slots."""
+    pieces: List[str | _Slot] = []
+    end = 0
+    for match in _slot_re.finditer(text):
+        if match.start() > end:
+            pieces.append(text[end : match.start()])
+        pieces.append(_Slot(match.group("name"), match.group("field"), bool(match.group("image"))))
+        end = match.end()
+    if not pieces:
+        return None
+    if end < len(text):
+        pieces.append(text[end:])
+    return pieces
+
+
+def _value(values: Mapping[str, Any], name: str) -> Any:
+    try:
+        return values[name]
+    except KeyError:
+        raise KeyError("no value for slot %r" % name)
@@ -0,0 +1,206 @@
+"""Opt-in timing of the phases of opening and saving a document.
+
+Instrumentation is off by default and then costs nothing: :func:`enable` installs
+timing wrappers around a fixed set of methods, listed in :data:`SPAN_NAMES`, and they
+are removed again once the last callback is disabled. Each call of a wrapped method is
+reported to the callbacks as a |Span| once it returns or raises::
+
+    with docx.instrument.instrumented() as recorder:
+        document = docx.Document("slow.docx")
+        document.save("copy.docx")
+    for name, totals in recorder.totals.items():
+        print(name, totals)
+
+The wrappers are installed on the classes, so they report calls made in any thread
+while enabled.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+SPAN_NAMES = (
+    "PhysPkgReader.blob_for",
+    "XmlPart.load",
+    "Unmarshaller.unmarshal",
+    "OpcPackage.save",
+    "PackageWriter._write_parts",
+    "Part.write_to",
+    "BaseOxmlElement.xpath",
+)
+
+
+class Span:
+    """A single timed call of an instrumented method.
+
+    `attrs` holds details of the call depending on `name`, like the `partname` of the
+    part read or written and the number of `bytes` read. When the call raised, `attrs`
+    instead holds the class name of the exception as `error`.
+    """
+
+    __slots__ = ("name", "duration", "attrs")
+
+    def __init__(self, name: str, duration: float, attrs: Dict[str, Any]):
+        self.name = name
+        self.duration = duration
+        self.attrs = attrs
+
+    def __repr__(self) -> str:
+        return "Span(%r, duration=%.6f, attrs=%r)" % (self.name, self.duration, self.attrs)
+
+
+SpanCallback = Callable[[Span], None]
+
+
+class Recorder:
+    """Span callback that keeps each span and per-name totals."""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+
+    def __call__(self, span: Span):
+        self.spans.append(span)
+
+    @property
+    def totals(self) -> Dict[str, Dict[str, float]]:
+        """Totals for each span name recorded, keyed by name.
+
+        Each value has the `count` of calls, their total `duration` in seconds, and the
+        sum of each numeric attribute of the spans, like `bytes`.
+        """
+        totals: Dict[str, Dict[str, float]] = {}
+        for span in self.spans:
+            counters = totals.setdefault(span.name, {"count": 0, "duration": 0.0})
+            counters["count"] += 1
+            counters["duration"] += span.duration
+            for key, value in span.attrs.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    counters[key] = counters.get(key, 0) + value
+        return totals
+
+
+def disable(callback: SpanCallback):
+    """Stop reporting spans to `callback`, a callback passed to :func:`enable`.
+
+    The timing wrappers are removed when no callback remains.
+    """
+    with _lock:
+        _callbacks.remove(callback)
+        if not _callbacks:
+            _uninstall()
+
+
+def enable(callback: SpanCallback):
+    """Report a |Span| to `callback` for each call of an instrumented method.
+
+    `callback` is called in the thread making the call and should return quickly.
+    """
+    with _lock:
+        if not _callbacks:
+            _install()
+        _callbacks.append(callback)
+
+
+@contextmanager
+def instrumented() -> Iterator[Recorder]:
+    """Context manager recording the spans reported while it is active."""
+    recorder = Recorder()
+    enable(recorder)
+    try:
+        yield recorder
+    finally:
+        disable(recorder)
+
+
+_callbacks: List[SpanCallback] = []
+_lock = threading.Lock()
+# -- (class, attribute-name, original class attribute) of each installed wrapper --
+_installed: List[Tuple[type, str, Any]] = []
+
+AttrsFn = Callable[[Tuple[Any, ...], Any], Dict[str, Any]]
+
+
+def _hooks() -> List[Tuple[type, str, str, AttrsFn | None]]:
+    """(class, attribute-name, span-name, attrs-fn) for each method instrumented.
+
+    `attrs-fn` computes the span attributes from the positional arguments of the call,
+    including `self` or `cls`, and its return value.
+    """
+    from docx.opc.package import OpcPackage, Unmarshaller
+    from docx.opc.part import Part, XmlPart
+    from docx.opc.phys_pkg import _DirPkgReader, _ZipPkgReader
+    from docx.opc.pkgwriter import PackageWriter
+    from docx.oxml.xmlchemy import BaseOxmlElement
+
+    def blob_attrs(args: Tuple[Any, ...], blob: bytes) -> Dict[str, Any]:
+        return {"partname": str(args[1]), "bytes": len(blob)}
+
+    def load_attrs(args: Tuple[Any, ...], part: Part) -> Dict[str, Any]:
+        return {"partname": str(args[1]), "content_type": args[2], "bytes": len(args[3])}
+
+    def write_attrs(args: Tuple[Any, ...], _: None) -> Dict[str, Any]:
+        return {"partname": str(args[0].partname)}
+
+    def xpath_attrs(args: Tuple[Any, ...], result: Any) -> Dict[str, Any]:
+        attrs: Dict[str, Any] = {"xpath": args[1]}
+        if isinstance(result, list):
+            attrs["results"] = len(result)  # pyright: ignore[reportUnknownArgumentType]
+        return attrs
+
+    return [
+        (_ZipPkgReader, "blob_for", "PhysPkgReader.blob_for", blob_attrs),
+        (_DirPkgReader, "blob_for", "PhysPkgReader.blob_for", blob_attrs),
+        (XmlPart, "load", "XmlPart.load", load_attrs),
+        (Unmarshaller, "unmarshal", "Unmarshaller.unmarshal", None),
+        (OpcPackage, "save", "OpcPackage.save", None),
+        (PackageWriter, "_write_parts", "PackageWriter._write_parts", None),
+        (Part, "write_to", "Part.write_to", write_attrs),
+        (XmlPart, "write_to", "Part.write_to", write_attrs),
+        (BaseOxmlElement, "xpath", "BaseOxmlElement.xpath", xpath_attrs),
+    ]
+
+
+def _install():
+    """Replace each instrumented method with a timing wrapper."""
+    for cls, attr_name, span_name, attrs_fn in _hooks():
+        original = cls.__dict__[attr_name]
+        if isinstance(original, (classmethod, staticmethod)):
+            wrapper = type(original)(_timed(original.__func__, span_name, attrs_fn))
+        else:
+            wrapper = _timed(original, span_name, attrs_fn)
+        setattr(cls, attr_name, wrapper)
+        _installed.append((cls, attr_name, original))
+
+
+def _timed(func: Callable[..., Any], span_name: str, attrs_fn: AttrsFn | None):
+    """Wrapper of `func` reporting a span named `span_name` for each call."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any):
+        attrs: Dict[str, Any] = {}
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+            if attrs_fn is not None:
+                attrs = attrs_fn(args, result)
+            return result
+        except BaseException as e:
+            attrs = {"error": type(e).__name__}
+            raise
+        finally:
+            span = Span(span_name, time.perf_counter() - start, attrs)
+            for callback in list(_callbacks):
+                callback(span)
+
+    return wrapper
+
+
+def _uninstall():
+    """Restore the methods replaced by :func:`_install`."""
+    while _installed:
+        cls, attr_name, original = _installed.pop()
+        setattr(cls, attr_name, original)
@@ -0,0 +1,246 @@
+"""Metadata-only access to a .docx package, without loading the document itself.
+
+:func:`probe` reads just the zip directory, the content types item, the package
+relationships and the `docProps/` parts those relationships refer to. That is a few KB
+per file regardless of document size, which makes it suitable for cataloguing large
+numbers of documents.
+"""
+
+from __future__ import annotations
+
+from typing import IO, TYPE_CHECKING, Dict, List, cast
+
+from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.constants import NAMESPACE as NS
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.coreprops import CoreProperties
+from docx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from docx.opc.phys_pkg import PhysPkgReader
+from docx.opc.pkgreader import (
+    PackageReader,
+    _ContentTypeMap,  # pyright: ignore[reportPrivateUsage]
+)
+from docx.oxml.parser import parse_xml
+
+if TYPE_CHECKING:
+    from docx.opc.packuri import PackURI
+    from docx.oxml.coreprops import CT_CoreProperties
+    from docx.oxml.xmlchemy import BaseOxmlElement
+
+
+def probe(docx: str | IO[bytes]) -> DocumentProbe:
+    """Return a |DocumentProbe| with the metadata of the .docx package at `docx`.
+
+    `docx` can be a path or a file-like object, as for |Document|. The main document
+    part is not read. Raises |ValueError| when `docx` is not a Word file.
+    """
+    phys_reader = PhysPkgReader(docx)
+    try:
+        content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
+        pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)  # pyright: ignore[reportPrivateUsage]
+        partnames = {
+            srel.reltype: srel.target_partname for srel in pkg_srels if not srel.is_external
+        }
+
+        main_partname = partnames.get(RT.OFFICE_DOCUMENT)
+        content_type = (
+            None if main_partname is None else _content_type(content_types, main_partname)
+        )
+        if content_type != CT.WML_DOCUMENT_MAIN:
+            tmpl = "file '%s' is not a Word file, content type is '%s'"
+            raise ValueError(tmpl % (docx, content_type))
+
+        core_xml = _blob_or_none(phys_reader, partnames.get(RT.CORE_PROPERTIES))
+        core_properties = (
+            None
+            if core_xml is None
+            else CoreProperties(cast("CT_CoreProperties", parse_xml(core_xml)))
+        )
+        app_xml = _blob_or_none(phys_reader, partnames.get(RT.EXTENDED_PROPERTIES))
+        app_properties = None if app_xml is None else AppProperties(parse_xml(app_xml))
+        parts = [
+            PartInfo(partname, _content_type(content_types, partname), size, stored_size)
+            for partname, size, stored_size in phys_reader.iter_members()
+            if partname != CONTENT_TYPES_URI
+        ]
+    finally:
+        phys_reader.close()
+
+    return DocumentProbe(core_properties, app_properties, parts)
+
+
+class DocumentProbe:
+    """Metadata of a .docx package as read by :func:`probe`."""
+
+    def __init__(
+        self,
+        core_properties: CoreProperties | None,
+        app_properties: AppProperties | None,
+        parts: List[PartInfo],
+    ):
+        self._core_properties = core_properties
+        self._app_properties = app_properties
+        self._parts = parts
+
+    @property
+    def app_properties(self) -> AppProperties | None:
+        """|AppProperties| from `docProps/app.xml`, |None| if the package has none."""
+        return self._app_properties
+
+    @property
+    def core_properties(self) -> CoreProperties | None:
+        """|CoreProperties| from `docProps/core.xml`, |None| if the package has none.
+
+        Changes made to this object are not saved anywhere.
+        """
+        return self._core_properties
+
+    @property
+    def parts(self) -> List[PartInfo]:
+        """|PartInfo| for each part in the package, in the order they are stored.
+
+        Relationship items are included; `[Content_Types].xml` is not.
+        """
+        return self._parts
+
+    @property
+    def size(self) -> int:
+        """Total uncompressed size of the parts in the package, in bytes."""
+        return sum(part.size for part in self._parts)
+
+
+class PartInfo:
+    """Name, content type and size of a part in a package, as listed by :func:`probe`."""
+
+    __slots__ = ("partname", "content_type", "size", "stored_size")
+
+    def __init__(self, partname: PackURI, content_type: str | None, size: int, stored_size: int):
+        self.partname = partname
+        self.content_type = content_type
+        self.size = size
+        self.stored_size = stored_size
+
+    def __repr__(self) -> str:
+        return "PartInfo(%r, %r, size=%d, stored_size=%d)" % (
+            str(self.partname),
+            self.content_type,
+            self.size,
+            self.stored_size,
+        )
+
+
+class AppProperties:
+    """Read-only access to the application-defined properties in `docProps/app.xml`.
+
+    Word updates statistics like the page and word counts when it saves a document, so
+    they describe the document as last saved by Word (or another application that
+    maintains them). Each property is |None| when not present in the part.
+    """
+
+    def __init__(self, element: BaseOxmlElement):
+        self._element = element
+
+    @property
+    def application(self) -> str | None:
+        """Name of the application that last saved the document."""
+        return self._text("Application")
+
+    @property
+    def app_version(self) -> str | None:
+        """Version of the application that last saved the document, like "16.0000"."""
+        return self._text("AppVersion")
+
+    @property
+    def characters(self) -> int | None:
+        return self._int("Characters")
+
+    @property
+    def characters_with_spaces(self) -> int | None:
+        return self._int("CharactersWithSpaces")
+
+    @property
+    def company(self) -> str | None:
+        return self._text("Company")
+
+    @property
+    def lines(self) -> int | None:
+        return self._int("Lines")
+
+    @property
+    def pages(self) -> int | None:
+        return self._int("Pages")
+
+    @property
+    def paragraphs(self) -> int | None:
+        return self._int("Paragraphs")
+
+    @property
+    def template(self) -> str | None:
+        """Name of the template the document is based on, like "Normal.dotm"."""
+        return self._text("Template")
+
+    @property
+    def total_time(self) -> int | None:
+        """Total editing time of the document, in minutes."""
+        return self._int("TotalTime")
+
+    @property
+    def words(self) -> int | None:
+        return self._int("Words")
+
+    def _int(self, name: str) -> int | None:
+        """Value of child element `name` as an int, |None| if absent or not an integer."""
+        text = self._text(name)
+        if text is None:
+            return None
+        try:
+            return int(text)
+        except ValueError:
+            return None
+
+    def _text(self, name: str) -> str | None:
+        """Text of child element `name`, |None| if it is not present."""
+        child = self._element.find(_app_tags[name])
+        if child is None:
+            return None
+        return child.text or ""
+
+
+_app_tags: Dict[str, str] = {
+    name: "{%s}%s" % (NS.OFC_EXTENDED_PROPERTIES, name)
+    for name in (
+        "Application",
+        "AppVersion",
+        "Characters",
+        "CharactersWithSpaces",
+        "Company",
+        "Lines",
+        "Pages",
+        "Paragraphs",
+        "Template",
+        "TotalTime",
+        "Words",
+    )
+}
+
+
+def _blob_or_none(phys_reader: PhysPkgReader, partname: PackURI | None) -> bytes | None:
+    """Blob of `partname` in the package, |None| if `partname` is |None| or missing."""
+    if partname is None:
+        return None
+    try:
+        return phys_reader.blob_for(partname)
+    except (KeyError, IOError):
+        return None
+
+
+def _content_type(content_types: _ContentTypeMap, partname: PackURI) -> str | None:
+    """Content type of `partname`, |None| when `[Content_Types].xml` has none for it."""
+    # -- "/_rels/.rels" has no extension as far as `PackURI` is concerned, so it can't
+    # -- match the "rels" default like other rels items do.
+    if partname == PACKAGE_URI.rels_uri:
+        return CT.OPC_RELATIONSHIPS
+    try:
+        return content_types[partname]
+    except KeyError:
+        return None
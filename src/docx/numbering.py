@@ -0,0 +1,228 @@
+"""List-label rendering, computing the visible number of each numbered paragraph.
+
+Word does not store list labels like "3.2.a)" in the document, it computes them at
+render time from the numbering definitions in the numbering part and the sequence of
+numbered paragraphs that precede each one. This module reproduces that computation.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from docx.enum.style import WD_STYLE_TYPE
+
+if TYPE_CHECKING:
+    from docx.oxml.numbering import CT_Lvl
+    from docx.oxml.styles import CT_Style, CT_Styles
+    from docx.oxml.text.paragraph import CT_P
+    from docx.parts.numbering import NumberingPart
+
+_LEVEL_COUNT = 9
+_lvlText_placeholder = re.compile(r"%([1-9])")
+
+
+class ListLabeler:
+    """Computes the rendered list label of numbered paragraphs presented in document order.
+
+    Each call to :meth:`label_for` advances the counters of the list the paragraph
+    belongs to, so paragraphs must be presented once each, in document order, for the
+    labels to come out right. Per-list counters are kept per level and honor `w:start`,
+    `w:lvlRestart` and `w:startOverride`.
+
+    As in Word, `w:num` definitions that reference the same abstract numbering
+    definition continue each other's numbering unless the `w:num` has a start override,
+    in which case it numbers independently.
+    """
+
+    def __init__(self, numbering_part: NumberingPart, styles: CT_Styles | None = None):
+        self._numbering_part = numbering_part
+        self._styles = styles
+        self._counters: Dict[Tuple[str, int], List[int | None]] = {}
+        self._style_numPr_cache: Dict[str | None, Tuple[int | None, int | None]] = {}
+        self._lvl_cache: Dict[Tuple[int, int], CT_Lvl | None] = {}
+
+    def label_for(self, p: CT_P) -> str | None:
+        """Return the list label of paragraph `p`, like "3.2.a)", or |None|.
+
+        |None| is returned when `p` is not a numbered paragraph. A bulleted paragraph
+        returns its bullet character. Counters for the list are advanced as a side-effect.
+        """
+        num_id, ilvl = self._numPr_of(p)
+        if not num_id:
+            return None
+        lvl = self._lvl(num_id, ilvl)
+        if lvl is None:
+            return None
+
+        counters = self._counters_for(num_id)
+        current = counters[ilvl]
+        counters[ilvl] = self._start(num_id, ilvl) if current is None else current + 1
+        self._restart_levels_below(num_id, ilvl, counters)
+
+        if _val(lvl.numFmt_lst, None) == "none":
+            return ""
+        lvlText = _val(lvl.lvlText_lst, None)
+        if lvlText is None:
+            return ""
+        is_legal = bool(_val(lvl.isLgl_lst, False))
+
+        def render(match: re.Match[str]) -> str:
+            level = int(match.group(1)) - 1
+            level_lvl = self._lvl(num_id, level)
+            value = counters[level]
+            if value is None:
+                value = self._start(num_id, level)
+            numFmt = "decimal" if is_legal else _val(getattr(level_lvl, "numFmt_lst", []), None)
+            return format_number(value, numFmt)
+
+        return _lvlText_placeholder.sub(render, lvlText)
+
+    def _counters_for(self, num_id: int) -> List[int | None]:
+        """The per-level counters shared by the list that `num_id` belongs to."""
+        num = self._numbering_part.get_num(num_id)
+        has_override = num is not None and any(
+            ovr.startOverride is not None for ovr in num.lvlOverride_lst
+        )
+        key = (
+            ("num", num_id)
+            if num is None or has_override
+            else ("abstractNum", num.abstractNumId.val)
+        )
+        counters = self._counters.get(key)
+        if counters is None:
+            counters = self._counters[key] = [None] * _LEVEL_COUNT
+        return counters
+
+    def _lvl(self, num_id: int, ilvl: int) -> CT_Lvl | None:
+        """Effective `w:lvl` for `ilvl` of `num_id`, cached for the life of this object."""
+        key = (num_id, ilvl)
+        if key not in self._lvl_cache:
+            self._lvl_cache[key] = self._numbering_part.lvl_for(num_id, ilvl)
+        return self._lvl_cache[key]
+
+    def _numPr_of(self, p: CT_P) -> Tuple[int | None, int]:
+        """(numId, ilvl) pair in effect for `p`, from direct formatting or its style."""
+        num_id = ilvl = None
+        pPr = p.pPr
+        numPr = None if pPr is None else pPr.numPr
+        if numPr is not None:
+            num_id = None if numPr.numId is None else numPr.numId.val
+            ilvl = None if numPr.ilvl is None else numPr.ilvl.val
+
+        if num_id is None or ilvl is None:
+            style_num_id, style_ilvl = self._style_numPr(p.style)
+            num_id = style_num_id if num_id is None else num_id
+            ilvl = style_ilvl if ilvl is None else ilvl
+
+        ilvl = 0 if ilvl is None or not 0 <= ilvl < _LEVEL_COUNT else ilvl
+        return num_id, ilvl
+
+    def _restart_levels_below(self, num_id: int, ilvl: int, counters: List[int | None]):
+        """Reset counters of levels deeper than `ilvl` that restart after it."""
+        for level in range(ilvl + 1, _LEVEL_COUNT):
+            if counters[level] is None:
+                continue
+            lvl = self._lvl(num_id, level)
+            lvlRestart = None if lvl is None else _val(lvl.lvlRestart_lst, None)
+            # -- `w:lvlRestart` is the 1-based level after which this one restarts, with
+            # -- 0 meaning never. The default is to restart after any higher level.
+            if lvlRestart is None or (lvlRestart != 0 and ilvl < lvlRestart):
+                counters[level] = None
+
+    def _start(self, num_id: int, ilvl: int) -> int:
+        """Initial value of level `ilvl` of list `num_id`, honoring a start override."""
+        start_override = self._numbering_part.get_ilvl_override(num_id, ilvl)
+        if start_override is not None:
+            return start_override
+        lvl = self._lvl(num_id, ilvl)
+        return 0 if lvl is None else _val(lvl.start_lst, 0)
+
+    def _style_numPr(self, style_id: str | None) -> Tuple[int | None, int | None]:
+        """(numId, ilvl) inherited from paragraph style `style_id`, cached per style."""
+        if style_id in self._style_numPr_cache:
+            return self._style_numPr_cache[style_id]
+
+        num_id = ilvl = None
+        style = self._paragraph_style(style_id)
+        seen: List[CT_Style] = []
+        while style is not None and style not in seen and (num_id is None or ilvl is None):
+            seen.append(style)
+            numPr = None if style.pPr is None else style.pPr.numPr
+            if numPr is not None:
+                if num_id is None and numPr.numId is not None:
+                    num_id = numPr.numId.val
+                if ilvl is None and numPr.ilvl is not None:
+                    ilvl = numPr.ilvl.val
+            style = style.base_style
+
+        self._style_numPr_cache[style_id] = (num_id, ilvl)
+        return num_id, ilvl
+
+    def _paragraph_style(self, style_id: str | None) -> CT_Style | None:
+        """The `w:style` element for `style_id`, or the default paragraph style."""
+        styles = self._styles
+        if styles is None:
+            return None
+        style = styles.get_by_id(style_id) if style_id else None
+        if style is None or style.type != WD_STYLE_TYPE.PARAGRAPH:
+            return styles.default_for(WD_STYLE_TYPE.PARAGRAPH)
+        return style
+
+
+def format_number(value: int, numFmt: str | None) -> str:
+    """Return `value` rendered as text in Word number-format `numFmt`.
+
+    Formats not specifically supported fall back to decimal.
+    """
+    if numFmt == "bullet":
+        return ""
+    if numFmt == "none":
+        return ""
+    if numFmt == "decimalZero":
+        return "%02d" % value
+    if numFmt in ("upperRoman", "lowerRoman"):
+        roman = _to_roman(value)
+        return roman if numFmt == "upperRoman" else roman.lower()
+    if numFmt in ("upperLetter", "lowerLetter"):
+        letters = _to_letters(value)
+        return letters if numFmt == "upperLetter" else letters.lower()
+    if numFmt == "ordinal":
+        return _to_ordinal(value)
+    return str(value)
+
+
+def _to_letters(value: int) -> str:
+    """Word-style alphabetic number, A..Z then AA..ZZ, AAA.. and so on."""
+    if value < 1:
+        return str(value)
+    idx, repeat = (value - 1) % 26, (value - 1) // 26 + 1
+    return chr(ord("A") + idx) * repeat
+
+
+def _to_ordinal(value: int) -> str:
+    """English ordinal like "1st", "2nd", "11th"."""
+    suffix = "th" if 10 <= value % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(
+        value % 10, "th"
+    )
+    return "%d%s" % (value, suffix)
+
+
+def _to_roman(value: int) -> str:
+    """Upper-case Roman numeral for `value`, decimal when out of the Roman range."""
+    if not 0 < value < 4000:
+        return str(value)
+    numerals = (
+        (1000, "M"), (900, "CM"), (500, "D"), (400, "CD"), (100, "C"), (90, "XC"),
+        (50, "L"), (40, "XL"), (10, "X"), (9, "IX"), (5, "V"), (4, "IV"), (1, "I"),
+    )  # fmt: skip
+    roman: List[str] = []
+    for n, numeral in numerals:
+        count, value = divmod(value, n)
+        roman.append(numeral * count)
+    return "".join(roman)
+
+
+def _val(elms, default):
+    """The `val` of the first element in `elms`, or `default` when `elms` is empty."""
+    return elms[0].val if elms else default
@@ -198,6 +198,17 @@ class CONTENT_TYPE:
     WML_COMMENTS = (
         "application/vnd.openxmlformats-officedocument.wordprocessingml.comments+xml"
     )
+    WML_COMMENTS_EXTENDED = (
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.comme"
+        "ntsExtended+xml"
+    )
+    WML_COMMENTS_EXTENSIBLE = (
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.comme"
+        "ntsExtensible+xml"
+    )
+    WML_COMMENTS_IDS = (
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.commentsIds+xml"
+    )
     WML_DOCUMENT = (
         "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
     )
@@ -230,6 +241,7 @@ class CONTENT_TYPE:
         "application/vnd.openxmlformats-officedocument.wordprocessingml.numb"
         "ering+xml"
     )
+    WML_PEOPLE = "application/vnd.openxmlformats-officedocument.wordprocessingml.people+xml"
     WML_PRINTER_SETTINGS = (
         "application/vnd.openxmlformats-officedocument.wordprocessingml.prin"
         "terSettings"
@@ -257,6 +269,9 @@ class NAMESPACE:
     DML_WORDPROCESSING_DRAWING = (
         "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
     )
+    OFC_EXTENDED_PROPERTIES = (
+        "http://schemas.openxmlformats.org/officeDocument/2006/extended-properties"
+    )
     OFC_RELATIONSHIPS = (
         "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
     )
@@ -9,7 +9,9 @@ deleted or only hold the package related custom element classes.
 
 from __future__ import annotations
 
-from typing import cast
+import re
+import threading
+from typing import IO, Iterable, List, Tuple, cast
 
 from lxml import etree
 
@@ -18,8 +20,43 @@ from docx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 
 # configure XML parser
 element_class_lookup = etree.ElementNamespaceClassLookup()
-oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
-oxml_parser.set_element_class_lookup(element_class_lookup)
+# -- lxml parsers are not safe to share between threads, so each thread gets its own --
+_parsers = threading.local()
+
+
+def _new_plain_parser() -> etree.XMLParser:
+    return etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+
+
+def _new_oxml_parser() -> etree.XMLParser:
+    parser = _new_plain_parser()
+    parser.set_element_class_lookup(element_class_lookup)
+    return parser
+
+
+def get_oxml_parser() -> etree.XMLParser:
+    """The parser producing custom element classes, for the calling thread."""
+    try:
+        return _parsers.oxml_parser
+    except AttributeError:
+        parser = _parsers.oxml_parser = _new_oxml_parser()
+        return parser
+
+
+def get_plain_parser() -> etree.XMLParser:
+    """The parser producing plain elements, for the calling thread.
+
+    Used to read package items, like rels and content types, without editing them.
+    """
+    try:
+        return _parsers.plain_parser
+    except AttributeError:
+        parser = _parsers.plain_parser = _new_plain_parser()
+        return parser
+
+
+# -- parser of the importing thread, kept for code that passes it to lxml directly --
+oxml_parser = _parsers.oxml_parser = _new_oxml_parser()
 
 nsmap = {
     "a": NS.OPC_DRAWINGS,
@@ -28,6 +65,13 @@ nsmap = {
     "r": NS.OFC_RELATIONSHIPS,
 }
 
+_XML_DECLARATION = "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+_Default_tag = "{%s}Default" % NS.OPC_CONTENT_TYPES
+_Override_tag = "{%s}Override" % NS.OPC_CONTENT_TYPES
+_Relationship_tag = "{%s}Relationship" % NS.OPC_RELATIONSHIPS
+
+_xml_incompatible_chars = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+
 
 # ===========================================================================
 # functions
@@ -36,7 +80,7 @@ nsmap = {
 
 def parse_xml(text: str) -> etree._Element:
     """`etree.fromstring()` replacement that uses oxml parser."""
-    return etree.fromstring(text, oxml_parser)
+    return etree.fromstring(text, get_oxml_parser())
 
 
 def qn(tag):
@@ -60,6 +104,128 @@ def serialize_part_xml(part_elm: etree._Element):
     return etree.tostring(part_elm, encoding="UTF-8", standalone=True)
 
 
+def write_part_xml(part_elm: etree._Element, file: IO[bytes]):
+    """Serialize `part_elm` into writable binary `file`, as :func:`serialize_part_xml`.
+
+    lxml writes the XML to `file` in small chunks as it is produced, so unlike
+    :func:`serialize_part_xml`, the full serialized part never exists in memory.
+    """
+    etree.ElementTree(part_elm).write(file, encoding="UTF-8", standalone=True)
+
+
+def serialize_rels_xml(rels: Iterable[Tuple[str, str, str, bool]]) -> bytes:
+    """Return the bytes of a .rels item containing `rels`, in the order given.
+
+    Each item in `rels` is an `(rId, reltype, target_ref, is_external)` 4-tuple. The XML
+    is composed directly as text rather than by building and serializing an element
+    tree, which for a part with thousands of relationships avoids an XML parse per
+    relationship. The result is byte-for-byte what :func:`serialize_part_xml` produces
+    for the equivalent ``<Relationships>`` element.
+    """
+    children = [
+        '<Relationship Id="%s" Type="%s" Target="%s"%s/>'
+        % (
+            _escape_attr(rId),
+            _escape_attr(reltype),
+            _escape_attr(target_ref),
+            ' TargetMode="External"' if is_external else "",
+        )
+        for rId, reltype, target_ref, is_external in rels
+    ]
+    return _item_xml("Relationships", nsmap["pr"], children)
+
+
+def serialize_types_xml(
+    defaults: Iterable[Tuple[str, str]], overrides: Iterable[Tuple[str, str]]
+) -> bytes:
+    """Return the bytes of a ``[Content_Types].xml`` item.
+
+    `defaults` are `(extension, content_type)` pairs and `overrides` are `(partname,
+    content_type)` pairs, each written in the order given.
+    """
+    children = [
+        '<Default Extension="%s" ContentType="%s"/>'
+        % (_escape_attr(ext), _escape_attr(content_type))
+        for ext, content_type in defaults
+    ]
+    children.extend(
+        '<Override PartName="%s" ContentType="%s"/>'
+        % (_escape_attr(partname), _escape_attr(content_type))
+        for partname, content_type in overrides
+    )
+    return _item_xml("Types", nsmap["ct"], children)
+
+
+def parse_rels_xml(rels_xml: bytes) -> List[Tuple[str, str, str, str]]:
+    """Return an `(rId, reltype, target_ref, target_mode)` 4-tuple for each relationship
+    in .rels item `rels_xml`, in document order.
+
+    Attribute values are read directly from the parsed elements, skipping the custom
+    element-class properties used when a relationships element is edited.
+    """
+    rels_elm = etree.fromstring(rels_xml, get_plain_parser())
+    return [
+        (
+            rel.get("Id"),
+            rel.get("Type"),
+            rel.get("Target"),
+            rel.get("TargetMode", RTM.INTERNAL),
+        )
+        for rel in rels_elm.iterchildren(_Relationship_tag)
+    ]
+
+
+def parse_types_xml(
+    content_types_xml: bytes,
+) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """Return `(defaults, overrides)` lists of pairs read from `content_types_xml`.
+
+    `defaults` contains `(extension, content_type)` pairs and `overrides` contains
+    `(partname, content_type)` pairs.
+    """
+    types_elm = etree.fromstring(content_types_xml, get_plain_parser())
+    defaults: List[Tuple[str, str]] = []
+    overrides: List[Tuple[str, str]] = []
+    for child in types_elm.iterchildren(_Default_tag, _Override_tag):
+        if child.tag == _Default_tag:
+            defaults.append((child.get("Extension"), child.get("ContentType")))
+        else:
+            overrides.append((child.get("PartName"), child.get("ContentType")))
+    return defaults, overrides
+
+
+def _escape_attr(value: str) -> str:
+    """Return `value` escaped for use as a double-quoted XML attribute value.
+
+    Raises |ValueError| on characters that can't appear in XML, as lxml does.
+    """
+    if _xml_incompatible_chars.search(value):
+        raise ValueError(
+            "All strings must be XML compatible: Unicode or ASCII, no NULL bytes or"
+            " control characters"
+        )
+    # -- same escaping lxml applies to attribute values, "&" necessarily first --
+    return (
+        value.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("\t", "&#9;")
+        .replace("\n", "&#10;")
+        .replace("\r", "&#13;")
+    )
+
+
+def _item_xml(root_tag: str, namespace: str, children: List[str]) -> bytes:
+    """UTF-8 bytes of a package item with root element `root_tag` holding `children`."""
+    root = (
+        '<%s xmlns="%s">%s</%s>' % (root_tag, namespace, "".join(children), root_tag)
+        if children
+        else '<%s xmlns="%s"/>' % (root_tag, namespace)
+    )
+    return (_XML_DECLARATION + root).encode("utf-8")
+
+
 def serialize_for_reading(element):
     """Serialize `element` to human-readable XML suitable for tests.
 
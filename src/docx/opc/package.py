@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, Iterator, Unpack, cast
+from typing import IO, TYPE_CHECKING, Dict, Iterator, Self, Unpack, cast
 
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.packuri import PACKAGE_URI, PackURI
@@ -39,6 +39,27 @@ class OpcPackage:
         # subclass
         pass
 
+    def clone(self) -> Self:
+        """Return an independent in-memory copy of this package.
+
+        Each part is copied, XML parts by deep-copying their element tree and binary
+        parts like images by sharing their immutable blob, and the relationship graph is
+        rebuilt between the copies. No zip I/O or XML parsing is performed, so cloning a
+        pre-loaded template is much faster than opening it again.
+        """
+        package = type(self)()
+        parts: Dict[Part, Part] = {part: part.clone(package) for part in self.iter_parts()}
+        sources: list[tuple[OpcPackage | Part, OpcPackage | Part]] = [(self, package)]
+        sources.extend(parts.items())
+        for source, source_copy in sources:
+            for rel in source.rels.values():
+                target = rel.target_ref if rel.is_external else parts[rel.target_part]
+                source_copy.load_rel(rel.reltype, target, rel.rId, rel.is_external)
+        for part in parts.values():
+            part.after_unmarshal()
+        package.after_unmarshal()
+        return package
+
     @property
     def core_properties(self) -> CoreProperties:
         """|CoreProperties| object providing read/write access to the Dublin Core
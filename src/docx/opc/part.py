@@ -4,9 +4,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Type, cast
+import copy
+from typing import IO, TYPE_CHECKING, Callable, Type, cast
 
-from docx.opc.oxml import serialize_part_xml
+from docx.opc.oxml import serialize_part_xml, write_part_xml
 from docx.opc.packuri import PackURI
 from docx.opc.rel import Relationships
 from docx.opc.shared import cls_method_fn
@@ -67,6 +68,13 @@ class Part:
         """
         return self._blob or b""
 
+    def clone(self, package: Package) -> Part:
+        """Return a copy of this part belonging to `package`, without its relationships.
+
+        The blob is shared rather than copied since it is immutable.
+        """
+        return self.load(self._partname, self._content_type, self.blob, package)
+
     @property
     def content_type(self):
         """Content type of this part."""
@@ -154,6 +162,14 @@ class Part:
         rel = self.rels[rId]
         return rel.target_ref
 
+    def write_to(self, file: IO[bytes]):
+        """Write the serialized contents of this part to writable binary `file`.
+
+        The default is to write :attr:`blob`. Subclasses that can produce their contents
+        incrementally override this to avoid holding it in memory all at once.
+        """
+        file.write(self.blob)
+
     def _rel_ref_count(self, rId: str) -> int:
         """Return the count of references in this part to the relationship identified by `rId`.
 
@@ -221,6 +237,14 @@ class XmlPart(Part):
     def blob(self):
         return serialize_part_xml(self._element)
 
+    def clone(self, package: Package) -> XmlPart:
+        """Return a copy of this part belonging to `package`, without its relationships.
+
+        The copy has a deep copy of the element tree of this part, which is considerably
+        faster than serializing and reparsing it.
+        """
+        return type(self)(self._partname, self._content_type, copy.deepcopy(self._element), package)
+
     @property
     def element(self):
         """The root XML element of this XML part."""
@@ -240,6 +264,11 @@ class XmlPart(Part):
         """
         return self
 
+    def write_to(self, file: IO[bytes]):
+        """Serialize the XML of this part into `file`, writing the same bytes as
+        :attr:`blob` without first producing them as a single `bytes` object."""
+        write_part_xml(self._element, file)
+
     def _rel_ref_count(self, rId: str) -> int:
         """Return the count of references in this part's XML to the relationship
         identified by `rId`."""
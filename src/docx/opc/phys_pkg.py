@@ -1,11 +1,13 @@
 """Provides a general interface to a `physical` OPC package, such as a zip file."""
 
+from __future__ import annotations
+
 import os
-from typing import Unpack
-from zipfile import ZIP_DEFLATED, BadZipFile, ZipFile, is_zipfile
+from typing import IO, Iterator, Tuple, Unpack
+from zipfile import ZIP64_LIMIT, ZIP_DEFLATED, BadZipFile, ZipFile, is_zipfile
 
 from docx.opc.exceptions import PackageNotFoundError
-from docx.opc.packuri import CONTENT_TYPES_URI
+from docx.opc.packuri import CONTENT_TYPES_URI, PackURI
 from docx.types import DocumentOpts
 
 
@@ -60,6 +62,18 @@ class _DirPkgReader(PhysPkgReader):
         """Return the `[Content_Types].xml` blob from the package."""
         return self.blob_for(CONTENT_TYPES_URI)
 
+    def iter_members(self) -> Iterator[Tuple[PackURI, int, int]]:
+        """Generate a `(pack_uri, size, stored_size)` 3-tuple for each file in the package.
+
+        A directory stores files uncompressed, so `stored_size` is the same as `size`.
+        """
+        for dirpath, _, filenames in os.walk(self._path):
+            for filename in sorted(filenames):
+                path = os.path.join(dirpath, filename)
+                membername = os.path.relpath(path, self._path).replace(os.sep, "/")
+                size = os.path.getsize(path)
+                yield PackURI("/" + membername), size, size
+
     def rels_xml_for(self, source_uri):
         """Return rels item XML for source with `source_uri`, or None if the item has no
         rels item."""
@@ -102,6 +116,17 @@ class _ZipPkgReader(PhysPkgReader):
         """Return the `[Content_Types].xml` blob from the zip package."""
         return self.blob_for(CONTENT_TYPES_URI)
 
+    def iter_members(self) -> Iterator[Tuple[PackURI, int, int]]:
+        """Generate a `(pack_uri, size, stored_size)` 3-tuple for each member of the zip.
+
+        Sizes come from the zip central directory, so no member is read. `stored_size`
+        is the compressed size of the member.
+        """
+        for info in self._zipf.infolist():
+            if info.is_dir():
+                continue
+            yield PackURI("/" + info.filename), info.file_size, info.compress_size
+
     def rels_xml_for(self, source_uri):
         """Return rels item XML for source with `source_uri` or None if no rels item is
         present."""
@@ -124,6 +149,18 @@ class _ZipPkgWriter(PhysPkgWriter):
         resources it's using."""
         self._zipf.close()
 
+    def open(self, pack_uri, size_hint: int | None = None) -> IO[bytes]:
+        """Return a writable binary file for the zip member corresponding to `pack_uri`.
+
+        Data written to it is compressed into the package as it arrives. The member is
+        complete when the file is closed, and no other member can be written until then.
+        `size_hint` is the number of bytes to be written, when known. The member gets
+        zip64 size fields unless `size_hint` says it stays below the 2 GiB limit of
+        plain zip entries, since they can't be added once writing has begun.
+        """
+        force_zip64 = size_hint is None or size_hint >= ZIP64_LIMIT
+        return self._zipf.open(pack_uri.membername, "w", force_zip64=force_zip64)
+
     def write(self, pack_uri, blob):
         """Write `blob` to this zip package with the membername corresponding to
         `pack_uri`."""
@@ -3,7 +3,7 @@
 from typing import Unpack
 
 from docx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
-from docx.opc.oxml import parse_xml
+from docx.opc.oxml import parse_rels_xml, parse_types_xml
 from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.phys_pkg import PhysPkgReader
 from docx.opc.shared import CaseInsensitiveDict
@@ -115,12 +115,12 @@ class _ContentTypeMap:
     def from_xml(content_types_xml):
         """Return a new |_ContentTypeMap| instance populated with the contents of
         `content_types_xml`."""
-        types_elm = parse_xml(content_types_xml)
+        defaults, overrides = parse_types_xml(content_types_xml)
         ct_map = _ContentTypeMap()
-        for o in types_elm.overrides:
-            ct_map._add_override(o.partname, o.content_type)
-        for d in types_elm.defaults:
-            ct_map._add_default(d.extension, d.content_type)
+        for partname, content_type in overrides:
+            ct_map._add_override(partname, content_type)
+        for extension, content_type in defaults:
+            ct_map._add_default(extension, content_type)
         return ct_map
 
     def _add_default(self, extension, content_type):
@@ -178,13 +178,13 @@ class _SerializedRelationship:
     rather than a direct link to an in-memory |Part| object.
     """
 
-    def __init__(self, baseURI, rel_elm):
+    def __init__(self, baseURI, rId, reltype, target_ref, target_mode=RTM.INTERNAL):
         super(_SerializedRelationship, self).__init__()
         self._baseURI = baseURI
-        self._rId = rel_elm.rId
-        self._reltype = rel_elm.reltype
-        self._target_mode = rel_elm.target_mode
-        self._target_ref = rel_elm.target_ref
+        self._rId = rId
+        self._reltype = reltype
+        self._target_mode = target_mode
+        self._target_ref = target_ref
 
     @property
     def is_external(self):
@@ -255,7 +255,8 @@ class _SerializedRelationships:
         """
         srels = _SerializedRelationships()
         if rels_item_xml is not None:
-            rels_elm = parse_xml(rels_item_xml)
-            for rel_elm in rels_elm.Relationship_lst:
-                srels._srels.append(_SerializedRelationship(baseURI, rel_elm))
+            srels._srels = [
+                _SerializedRelationship(baseURI, rId, reltype, target_ref, target_mode)
+                for rId, reltype, target_ref, target_mode in parse_rels_xml(rels_item_xml)
+            ]
         return srels
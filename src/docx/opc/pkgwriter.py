@@ -6,17 +6,25 @@ OpcPackage.save().
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterable
+import io
+from itertools import islice
+from typing import TYPE_CHECKING, Container, Iterable
 
 from docx.opc.constants import CONTENT_TYPE as CT
-from docx.opc.oxml import CT_Types, serialize_part_xml
+from docx.opc.oxml import serialize_types_xml
 from docx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from docx.opc.part import XmlPart
 from docx.opc.phys_pkg import PhysPkgWriter
 from docx.opc.shared import CaseInsensitiveDict
 from docx.opc.spec import default_content_types
 
 if TYPE_CHECKING:
     from docx.opc.part import Part
+    from docx.oxml.xmlchemy import BaseOxmlElement
+
+# -- an XML part with more elements than this is streamed into the package rather than
+# -- serialized in memory first; its XML could then conceivably pass the 2 GiB zip limit
+_LARGE_TREE_ELEMENT_COUNT = 100_000
 
 
 class PackageWriter:
@@ -37,6 +45,21 @@ class PackageWriter:
         PackageWriter._write_parts(phys_writer, parts)
         phys_writer.close()
 
+    @staticmethod
+    def write_remaining(
+        phys_writer: PhysPkgWriter, pkg_rels, parts: Iterable[Part], written_parts: Container[Part]
+    ):
+        """Complete the package being written by `phys_writer` and close it.
+
+        The contents of `written_parts` have already been written to `phys_writer` by the
+        caller, so only their rels items are written. Everything else is written as by
+        :meth:`write`.
+        """
+        PackageWriter._write_content_types_stream(phys_writer, parts)
+        PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
+        PackageWriter._write_parts(phys_writer, parts, written_parts)
+        phys_writer.close()
+
     @staticmethod
     def _write_content_types_stream(phys_writer, parts):
         """Write ``[Content_Types].xml`` part to the physical package with an
@@ -45,11 +68,31 @@ class PackageWriter:
         phys_writer.write(CONTENT_TYPES_URI, cti.blob)
 
     @staticmethod
-    def _write_parts(phys_writer: PhysPkgWriter, parts: Iterable[Part]):
+    def _write_parts(
+        phys_writer: PhysPkgWriter, parts: Iterable[Part], written_parts: Container[Part] = ()
+    ):
         """Write the blob of each part in `parts` to the package, along with a rels item
-        for its relationships if and only if it has any."""
+        for its relationships if and only if it has any.
+
+        Each part writes itself into an open zip member. The XML of a part having a very
+        large element tree is compressed as it is serialized; its size isn't known up
+        front, so its member gets zip64 size fields. Other parts are written with their
+        size known, as plain zip entries unless they are too big for one. Parts in
+        `written_parts` are skipped apart from their rels item.
+        """
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            if part not in written_parts:
+                if isinstance(part, XmlPart) and _is_large_tree(part.element):
+                    with phys_writer.open(part.partname) as f:
+                        part.write_to(f)
+                elif isinstance(part, XmlPart):
+                    buffer = io.BytesIO()
+                    part.write_to(buffer)
+                    with phys_writer.open(part.partname, buffer.tell()) as f:
+                        f.write(buffer.getbuffer())
+                else:
+                    with phys_writer.open(part.partname, len(part.blob)) as f:
+                        part.write_to(f)
             if len(part.rels):
                 phys_writer.write(part.partname.rels_uri, part.rels.xml)
 
@@ -72,10 +115,15 @@ class _ContentTypesItem:
         self._overrides = {}
 
     @property
-    def blob(self):
+    def blob(self) -> bytes:
         """Return XML form of this content types item, suitable for storage as
-        ``[Content_Types].xml`` in an OPC package."""
-        return serialize_part_xml(self._element)
+        ``[Content_Types].xml`` in an OPC package.
+
+        Although the sequence of elements is not strictly significant, as an aid to
+        testing and readability Default elements are sorted by extension and Override
+        elements are sorted by partname.
+        """
+        return serialize_types_xml(sorted(self._defaults.items()), sorted(self._overrides.items()))
 
     @classmethod
     def from_parts(cls, parts):
@@ -98,18 +146,8 @@ class _ContentTypesItem:
         else:
             self._overrides[partname] = content_type
 
-    @property
-    def _element(self):
-        """Return XML form of this content types item, suitable for storage as
-        ``[Content_Types].xml`` in an OPC package.
 
-        Although the sequence of elements is not strictly significant, as an aid to
-        testing and readability Default elements are sorted by extension and Override
-        elements are sorted by partname.
-        """
-        _types_elm = CT_Types.new()
-        for ext in sorted(self._defaults.keys()):
-            _types_elm.add_default(ext, self._defaults[ext])
-        for partname in sorted(self._overrides.keys()):
-            _types_elm.add_override(partname, self._overrides[partname])
-        return _types_elm
+def _is_large_tree(element: BaseOxmlElement) -> bool:
+    """True when `element` has more than `_LARGE_TREE_ELEMENT_COUNT` elements in all."""
+    elements = islice(element.iter(), _LARGE_TREE_ELEMENT_COUNT + 1)
+    return sum(1 for _ in elements) > _LARGE_TREE_ELEMENT_COUNT
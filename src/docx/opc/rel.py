@@ -2,30 +2,52 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, cast
+from typing import TYPE_CHECKING, Any, Dict, Tuple, cast
 
-from docx.opc.oxml import CT_Relationships
+from docx.opc.oxml import serialize_rels_xml
 
 if TYPE_CHECKING:
     from docx.opc.part import Part
 
 
 class Relationships(Dict[str, "_Relationship"]):
-    """Collection object for |_Relationship| instances, having list semantics."""
+    """Collection object for |_Relationship| instances, having list semantics.
+
+    Relationships are indexed by (reltype, target, is_external) so finding an existing
+    relationship to reuse, as `.get_or_add()` and `.get_or_add_ext_rel()` do, takes
+    constant time rather than a scan of the collection.
+    """
 
     def __init__(self, baseURI: str):
         super(Relationships, self).__init__()
         self._baseURI = baseURI
         self._target_parts_by_rId: dict[str, Any] = {}
+        self._rels_by_key: Dict[Tuple[str, Part | str, bool], _Relationship] = {}
+        self._indexed_count = 0
+        # -- rId1 .. rId(n-1) are known to be in use when this is n --
+        self._rId_floor = 1
+
+    def __delitem__(self, rId: str):
+        super(Relationships, self).__delitem__(rId)
+        self._target_parts_by_rId.pop(rId, None)
+        # -- a deleted "rIdN" opens a gap that `._next_rId` should fill --
+        if rId.startswith("rId") and rId[3:].isdigit():
+            self._rId_floor = min(self._rId_floor, int(rId[3:]))
 
     def add_relationship(
         self, reltype: str, target: Part | str, rId: str, is_external: bool = False
     ) -> "_Relationship":
         """Return a newly added |_Relationship| instance."""
         rel = _Relationship(rId, reltype, target, self._baseURI, is_external)
+        index_is_current = rId not in self and len(self) == self._indexed_count
         self[rId] = rel
         if not is_external:
             self._target_parts_by_rId[rId] = target
+        if index_is_current:
+            self._rels_by_key.setdefault((reltype, target, rel.is_external), rel)
+            self._indexed_count = len(self)
+        else:
+            self._indexed_count = -1
         return rel
 
     def get_or_add(self, reltype: str, target_part: Part) -> _Relationship:
@@ -59,34 +81,28 @@ class Relationships(Dict[str, "_Relationship"]):
         return self._target_parts_by_rId
 
     @property
-    def xml(self) -> str:
+    def xml(self) -> bytes:
         """Serialize this relationship collection into XML suitable for storage as a
-        .rels file in an OPC package."""
-        rels_elm = CT_Relationships.new()
-        for rel in self.values():
-            rels_elm.add_rel(rel.rId, rel.reltype, rel.target_ref, rel.is_external)
-        return rels_elm.xml
+        .rels file in an OPC package.
+
+        Relationships appear in the order they were added to the collection.
+        """
+        return serialize_rels_xml(
+            (rel.rId, rel.reltype, rel.target_ref, rel.is_external) for rel in self.values()
+        )
 
     def _get_matching(
         self, reltype: str, target: Part | str, is_external: bool = False
     ) -> _Relationship | None:
         """Return relationship of matching `reltype`, `target`, and `is_external` from
         collection, or None if not found."""
-
-        def matches(rel: _Relationship, reltype: str, target: Part | str, is_external: bool):
-            if rel.reltype != reltype:
-                return False
-            if rel.is_external != is_external:
-                return False
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target != target:
-                return False
-            return True
-
-        for rel in self.values():
-            if matches(rel, reltype, target, is_external):
-                return rel
-        return None
+        key = (reltype, target, is_external)
+        rel = self._rel_index.get(key)
+        if rel is not None and self.get(rel.rId) is not rel:
+            # -- collection was changed in a way that left the index stale --
+            self._reindex()
+            rel = self._rels_by_key.get(key)
+        return rel
 
     def _get_rel_of_type(self, reltype: str):
         """Return single relationship of type `reltype` from the collection.
@@ -104,13 +120,41 @@ class Relationships(Dict[str, "_Relationship"]):
         return matching[0]
 
     @property
-    def _next_rId(self) -> str:  # pyright: ignore[reportReturnType]
+    def _next_rId(self) -> str:
         """Next available rId in collection, starting from 'rId1' and making use of any
-        gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3']."""
-        for n in range(1, len(self) + 2):
-            rId_candidate = "rId%d" % n  # like 'rId19'
-            if rId_candidate not in self:
-                return rId_candidate
+        gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3'].
+
+        The search resumes from the lowest rId that might be available rather than from
+        'rId1', so adding many relationships in turn doesn't rescan the ones in use.
+        """
+        n = self._rId_floor
+        # -- fewer items than the floor implies means some were removed behind our back --
+        if len(self) < n - 1:
+            n = 1
+        while "rId%d" % n in self:
+            n += 1
+        self._rId_floor = n
+        return "rId%d" % n
+
+    @property
+    def _rel_index(self) -> Dict[Tuple[str, Part | str, bool], _Relationship]:
+        """Relationships keyed by (reltype, target, is_external), rebuilt when stale."""
+        if len(self) != self._indexed_count:
+            self._reindex()
+        return self._rels_by_key
+
+    def _reindex(self) -> None:
+        """Rebuild the (reltype, target, is_external) index in one pass over the rels.
+
+        The first relationship having a given key is indexed, matching the relationship
+        a scan in document order would find.
+        """
+        rels_by_key: Dict[Tuple[str, Part | str, bool], _Relationship] = {}
+        for rel in self.values():
+            target = rel.target_ref if rel.is_external else rel.target_part
+            rels_by_key.setdefault((rel.reltype, target, rel.is_external), rel)
+        self._rels_by_key = rels_by_key
+        self._indexed_count = len(self)
 
 
 class _Relationship:
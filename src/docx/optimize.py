@@ -0,0 +1,255 @@
+"""Making a package smaller before it is saved.
+
+Documents that pass through many rounds of editing accumulate content that has no effect
+on how they look: revision-save ids (`w:rsid*`) and proofing marks written by Word, media
+parts holding the same bytes as another, relationships nothing refers to anymore and the
+parts only they lead to, and styles no content uses. :func:`optimize_package` removes
+them, in time linear in the size of the package.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
+
+from lxml import etree
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.part import XmlPart
+from docx.oxml.ns import nsmap, qn
+from docx.package import Package
+
+if TYPE_CHECKING:
+    from docx.opc.package import OpcPackage
+    from docx.opc.part import Part
+    from docx.oxml.xmlchemy import BaseOxmlElement
+
+# -- relationships that are only in effect while an r:id-style attribute refers to them --
+_REFERENCED_RELTYPES = frozenset(
+    (
+        RT.AUDIO,
+        RT.CHART,
+        RT.DIAGRAM_COLORS,
+        RT.DIAGRAM_DATA,
+        RT.DIAGRAM_LAYOUT,
+        RT.DIAGRAM_QUICK_STYLE,
+        RT.FOOTER,
+        RT.HEADER,
+        RT.HYPERLINK,
+        RT.IMAGE,
+        RT.OLE_OBJECT,
+        RT.PACKAGE,
+        RT.VIDEO,
+    )
+)
+
+_RSID_ATTRS = tuple(
+    qn("w:%s" % name)
+    for name in ("rsidR", "rsidRPr", "rsidRDefault", "rsidP", "rsidDel", "rsidSect", "rsidTr")
+)
+_STYLE_REF_TAGS = frozenset(
+    qn(tag) for tag in ("w:pStyle", "w:rStyle", "w:tblStyle", "w:numStyleLink", "w:styleLink")
+)
+_STYLE_LINK_TAGS = tuple(qn(tag) for tag in ("w:basedOn", "w:next", "w:link"))
+
+_o_relid = "{urn:schemas-microsoft-com:office:office}relid"
+_r_prefix = "{%s}" % nsmap["r"]
+_w_val = qn("w:val")
+
+
+class OptimizeResult:
+    """What :func:`optimize_package` removed from a package.
+
+    `merged_parts` is the number of media parts replaced by an identical one,
+    `dropped_relationships` the number of relationships removed, either unreferenced or
+    replaced by one to a merged part, `dropped_parts` the number of parts no longer in
+    the package as a result, and `removed_styles` the number of unused styles removed.
+    """
+
+    __slots__ = ("merged_parts", "dropped_relationships", "dropped_parts", "removed_styles")
+
+    def __init__(
+        self,
+        merged_parts: int = 0,
+        dropped_relationships: int = 0,
+        dropped_parts: int = 0,
+        removed_styles: int = 0,
+    ):
+        self.merged_parts = merged_parts
+        self.dropped_relationships = dropped_relationships
+        self.dropped_parts = dropped_parts
+        self.removed_styles = removed_styles
+
+    def __repr__(self) -> str:
+        return (
+            "OptimizeResult(merged_parts=%d, dropped_relationships=%d, dropped_parts=%d,"
+            " removed_styles=%d)"
+            % (
+                self.merged_parts,
+                self.dropped_relationships,
+                self.dropped_parts,
+                self.removed_styles,
+            )
+        )
+
+
+def optimize_package(package: OpcPackage, remove_unused_styles: bool = False) -> OptimizeResult:
+    """Remove content having no effect on the rendered document from `package`, in place.
+
+    * `w:rsid*` attributes, `w:proofErr` elements and the `w:rsids` list of the settings
+      part are stripped from every XML part.
+    * Media parts having the same content type and bytes are merged into one, and the
+      relationships referring to the others refer to it instead.
+    * A relationship to an image, hyperlink, header, footer or other target referred to
+      by relationship id is dropped when nothing in the XML of its part refers to it.
+      A part no remaining relationship leads to is no longer in the package.
+    * When `remove_unused_styles` is |True|, a style is removed unless it is a default
+      style, is referred to by content, numbering definitions or another style kept.
+    """
+    result = OptimizeResult()
+    parts = _reachable_parts(package)
+    part_count = len(parts)
+    xml_parts = [part for part in parts if isinstance(part, XmlPart)]
+
+    for part in xml_parts:
+        _strip_revision_marks(part.element)
+
+    canonical_parts = _canonical_media_parts(parts)
+    result.merged_parts = len(canonical_parts)
+    for part in xml_parts:
+        result.dropped_relationships += _prune_rels(part, canonical_parts)
+    if canonical_parts:
+        _forget_image_parts(package, canonical_parts)
+
+    if remove_unused_styles:
+        result.removed_styles = _remove_unused_styles(package, xml_parts)
+
+    result.dropped_parts = part_count - len(_reachable_parts(package))
+    return result
+
+
+def _canonical_media_parts(parts: List[Part]) -> Dict[Part, Part]:
+    """Maps each media part duplicating another in `parts` to the one it duplicates.
+
+    Only binary parts without relationships of their own are considered.
+    """
+    firsts: Dict[Tuple[str, str], Part] = {}
+    canonical_parts: Dict[Part, Part] = {}
+    for part in parts:
+        if isinstance(part, XmlPart) or part.rels:
+            continue
+        sha1 = hashlib.sha1(part.blob).hexdigest()
+        first = firsts.setdefault((part.content_type, sha1), part)
+        if first is not part:
+            canonical_parts[part] = first
+    return canonical_parts
+
+
+def _forget_image_parts(package: OpcPackage, canonical_parts: Dict[Part, Part]):
+    """Remove merged parts from the image-part collection of `package`, when it has one."""
+    if not isinstance(package, Package):
+        return
+    image_parts = package.image_parts
+    for part in [part for part in image_parts if part in canonical_parts]:
+        image_parts.remove(part)
+
+
+def _prune_rels(part: XmlPart, canonical_parts: Dict[Part, Part]) -> int:
+    """Retarget and drop the relationships of `part`, returning the number dropped.
+
+    A relationship to a merged media part is replaced by one to the part it duplicates.
+    A relationship of a type in `_REFERENCED_RELTYPES` is dropped when no attribute in
+    the XML of `part` refers to it.
+    """
+    rels = part.rels
+    rId_map: Dict[str, str] = {}
+    for rel in list(rels.values()):
+        if rel.is_external:
+            continue
+        canonical_part = canonical_parts.get(rel.target_part)
+        if canonical_part is not None:
+            rId_map[rel.rId] = part.relate_to(canonical_part, rel.reltype)
+
+    referenced: Set[str] = set()
+    for e in part.element.iter():
+        for name, value in e.items():
+            if not (name.startswith(_r_prefix) or name == _o_relid):
+                continue
+            new_value = rId_map.get(value)
+            if new_value is not None:
+                e.set(name, new_value)
+                value = new_value
+            referenced.add(value)
+
+    dropped = [
+        rel.rId
+        for rel in rels.values()
+        if rel.rId in rId_map or (rel.reltype in _REFERENCED_RELTYPES and rel.rId not in referenced)
+    ]
+    for rId in dropped:
+        del rels[rId]
+    return len(dropped)
+
+
+def _reachable_parts(package: OpcPackage) -> List[Part]:
+    """Each part reachable from the relationships of `package`, in one pass."""
+    seen: Set[Part] = set()
+    parts: List[Part] = []
+    sources: List[OpcPackage | Part] = [package]
+    while sources:
+        for rel in sources.pop().rels.values():
+            if rel.is_external:
+                continue
+            part = rel.target_part
+            if part in seen:
+                continue
+            seen.add(part)
+            parts.append(part)
+            sources.append(part)
+    return parts
+
+
+def _remove_unused_styles(package: OpcPackage, xml_parts: List[XmlPart]) -> int:
+    """Remove the styles nothing refers to from the styles part, returning the count."""
+    try:
+        styles_part = package.main_document_part.part_related_by(RT.STYLES)
+    except KeyError:
+        return 0
+    styles: BaseOxmlElement = styles_part.element  # pyright: ignore[reportAttributeAccessIssue]
+    style_elements: Dict[str, BaseOxmlElement] = {
+        style.get(qn("w:styleId"), ""): style for style in styles.iterchildren(qn("w:style"))
+    }
+
+    pending = [
+        style_id
+        for style_id, style in style_elements.items()
+        if style.get(qn("w:default")) in ("1", "true", "on")
+    ]
+    for part in xml_parts:
+        if part is styles_part:
+            continue
+        for e in part.element.iter(*_STYLE_REF_TAGS):
+            pending.append(e.get(_w_val, ""))
+
+    used: Set[str] = set()
+    while pending:
+        style_id = pending.pop()
+        if style_id in used:
+            continue
+        used.add(style_id)
+        style = style_elements.get(style_id)
+        if style is None:
+            continue
+        for e in style.iterchildren(*_STYLE_LINK_TAGS):
+            pending.append(e.get(_w_val, ""))
+
+    unused = [style for style_id, style in style_elements.items() if style_id not in used]
+    for style in unused:
+        styles.remove(style)
+    return len(unused)
+
+
+def _strip_revision_marks(element: BaseOxmlElement):
+    """Remove rsid attributes, proofing marks and the settings rsid list from `element`."""
+    etree.strip_attributes(element, *_RSID_ATTRS)
+    etree.strip_elements(element, qn("w:proofErr"), qn("w:rsids"), with_tail=False)
@@ -0,0 +1,184 @@
+"""The heading structure of a document, computed in a single pass over its body.
+
+Whether a paragraph is a heading, and at what level, is determined by its outline level
+(`w:outlineLvl`), given directly in its paragraph properties or inherited from its
+paragraph style and the styles that style is based on. Levels 0 to 8 are headings;
+anything else is body text. Resolving that through `Paragraph.style` looks up each style
+by XPath for every paragraph, so here each style is resolved once and its outline level
+cached by style id.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterator, List
+
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+
+if TYPE_CHECKING:
+    import docx.types as t
+    from docx.oxml.document import CT_Body
+    from docx.oxml.styles import CT_Styles
+    from docx.oxml.xmlchemy import BaseOxmlElement
+
+_HEADING_LEVELS = 9
+
+_basedOn_tag = qn("w:basedOn")
+_block_tags = frozenset(qn(tag) for tag in ("w:p", "w:tbl", "w:sdt"))
+_outlineLvl_tag = qn("w:outlineLvl")
+_p_tag = qn("w:p")
+_pPr_tag = qn("w:pPr")
+_pStyle_tag = qn("w:pStyle")
+_w_val = qn("w:val")
+
+
+class Heading:
+    """A heading paragraph and the headings nested below it.
+
+    `level` is the outline level of the heading, 0 for the top level. `block_index` is
+    the index in the body content of the paragraph, table or content control holding
+    the heading, as generated by :meth:`.Document.iter_inner_content`. The section the
+    heading begins runs to `end_index`, exclusive: the block index of the next heading
+    at the same or a higher level, or the end of the body.
+    """
+
+    __slots__ = ("level", "paragraph", "block_index", "end_index", "children")
+
+    def __init__(self, level: int, paragraph: Paragraph, block_index: int):
+        self.level = level
+        self.paragraph = paragraph
+        self.block_index = block_index
+        self.end_index = block_index + 1
+        self.children: List[Heading] = []
+
+    def __repr__(self) -> str:
+        return "Heading(level=%d, text=%r, blocks=%d:%d)" % (
+            self.level,
+            self.text,
+            self.block_index,
+            self.end_index,
+        )
+
+    def iter_headings(self) -> Iterator[Heading]:
+        """Generate this heading and each heading below it, in document order."""
+        yield self
+        for child in self.children:
+            yield from child.iter_headings()
+
+    @property
+    def text(self) -> str:
+        """The text of the heading paragraph."""
+        return self.paragraph.text
+
+
+class Outline:
+    """The headings of a document, as a tree.
+
+    `children` holds the headings not nested below another one. Iterating an outline
+    generates every heading in document order.
+    """
+
+    def __init__(self, children: List[Heading], block_count: int):
+        self.children = children
+        self.block_count = block_count
+
+    def __iter__(self) -> Iterator[Heading]:
+        for child in self.children:
+            yield from child.iter_headings()
+
+
+class _OutlineLevels:
+    """Resolves the outline level of paragraphs, caching the level of each style."""
+
+    def __init__(self, styles: CT_Styles | None):
+        self._styles_by_id: Dict[str, BaseOxmlElement] = {}
+        self._default_style_id: str | None = None
+        if styles is not None:
+            for style in styles.iterchildren(qn("w:style")):
+                if style.get(qn("w:type"), "paragraph") != "paragraph":
+                    continue
+                style_id = style.get(qn("w:styleId"), "")
+                self._styles_by_id.setdefault(style_id, style)
+                is_default = style.get(qn("w:default")) in ("1", "true", "on")
+                if is_default and self._default_style_id is None:
+                    self._default_style_id = style_id
+        self._level_by_style_id: Dict[str | None, int | None] = {}
+
+    def level_of(self, p: BaseOxmlElement) -> int | None:
+        """The heading level of paragraph `p`, |None| when it is body text."""
+        style_id = None
+        pPr = _child(p, _pPr_tag)
+        if pPr is not None:
+            outlineLvl = _child(pPr, _outlineLvl_tag)
+            if outlineLvl is not None:
+                return _heading_level(outlineLvl)
+            pStyle = _child(pPr, _pStyle_tag)
+            if pStyle is not None:
+                style_id = pStyle.get(_w_val)
+        if style_id not in self._styles_by_id:
+            style_id = self._default_style_id
+
+        try:
+            return self._level_by_style_id[style_id]
+        except KeyError:
+            level = self._level_by_style_id[style_id] = self._style_level(style_id)
+            return level
+
+    def _style_level(self, style_id: str | None) -> int | None:
+        """The outline level of paragraph style `style_id`, inherited through `w:basedOn`."""
+        seen: List[str] = []
+        while style_id is not None and style_id not in seen:
+            style = self._styles_by_id.get(style_id)
+            if style is None:
+                return None
+            seen.append(style_id)
+            pPr = _child(style, _pPr_tag)
+            outlineLvl = None if pPr is None else _child(pPr, _outlineLvl_tag)
+            if outlineLvl is not None:
+                return _heading_level(outlineLvl)
+            basedOn = _child(style, _basedOn_tag)
+            style_id = None if basedOn is None else basedOn.get(_w_val)
+        return None
+
+
+def build_outline(body: CT_Body, styles: CT_Styles | None, parent: t.ProvidesStoryPart) -> Outline:
+    """Return the |Outline| of the headings in `body`, found in one pass over it.
+
+    Headings in tables and block content controls are included, at the block index of
+    the top-level table or content control they appear in. `parent` is the parent of
+    the |Paragraph| object of each heading.
+    """
+    levels = _OutlineLevels(styles)
+    children: List[Heading] = []
+    open_headings: List[Heading] = []
+    block_index = -1
+    for block in body.iterchildren(*_block_tags):
+        block_index += 1
+        paragraphs = [block] if block.tag == _p_tag else block.iter(_p_tag)
+        for p in paragraphs:
+            level = levels.level_of(p)
+            if level is None:
+                continue
+            while open_headings and open_headings[-1].level >= level:
+                closed = open_headings.pop()
+                closed.end_index = max(block_index, closed.block_index + 1)
+            heading = Heading(level, Paragraph(p, parent), block_index)  # pyright: ignore
+            (open_headings[-1].children if open_headings else children).append(heading)
+            open_headings.append(heading)
+
+    block_count = block_index + 1
+    for heading in open_headings:
+        heading.end_index = block_count
+    return Outline(children, block_count)
+
+
+def _child(element: BaseOxmlElement, tag: str) -> BaseOxmlElement | None:
+    """First child of `element` having `tag`, without the path parsing of `find()`."""
+    return next(element.iterchildren(tag), None)
+
+
+def _heading_level(outlineLvl: BaseOxmlElement) -> int | None:
+    val = outlineLvl.get(_w_val, "")
+    if not val.isdigit() or int(val) >= _HEADING_LEVELS:
+        return None
+    return int(val)
@@ -332,3 +332,8 @@ register_element_cls("w:footnotes", CT_Footnotes)
 register_element_cls('w:footnote', CT_FtnEdn)
 register_element_cls("w:endnotes", CT_Endnotes)
 register_element_cls('w:endnote', CT_FtnEdn)
+
+from .comments import CT_Comment, CT_Comments  # noqa
+
+register_element_cls("w:comments", CT_Comments)
+register_element_cls("w:comment", CT_Comment)
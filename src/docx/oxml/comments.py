@@ -0,0 +1,54 @@
+"""Custom element classes related to comments, `w:comments` and `w:comment`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, List
+
+from docx.oxml.simpletypes import ST_DecimalNumber, ST_String
+from docx.oxml.xmlchemy import BaseOxmlElement, OptionalAttribute, RequiredAttribute, ZeroOrMore
+
+if TYPE_CHECKING:
+    from docx.oxml.table import CT_Tbl
+    from docx.oxml.text.block import CT_Sdt
+    from docx.oxml.text.paragraph import CT_P
+
+
+class CT_Comments(BaseOxmlElement):
+    """`w:comments` element, the root element of the comments part."""
+
+    comment_lst: List[CT_Comment]
+    _add_comment: Callable[..., CT_Comment]
+
+    comment = ZeroOrMore("w:comment")
+
+    def add_comment(self, comment_id: int, author: str, initials: str | None, date: str | None):
+        """Return a new `w:comment` element having `comment_id`, added at the end."""
+        comment = self._add_comment(id=comment_id, author=author)
+        if initials is not None:
+            comment.initials = initials
+        if date is not None:
+            comment.date = date
+        return comment
+
+
+class CT_Comment(BaseOxmlElement):
+    """`w:comment` element, a comment holding paragraphs and tables like a note."""
+
+    add_p: Callable[[], CT_P]
+    p_lst: List[CT_P]
+    tbl_lst: List[CT_Tbl]
+    _insert_tbl: Callable[[CT_Tbl], CT_Tbl]
+
+    id: int = RequiredAttribute("w:id", ST_DecimalNumber)  # pyright: ignore[reportAssignmentType]
+    author: str = RequiredAttribute("w:author", ST_String)  # pyright: ignore[reportAssignmentType]
+    initials: str | None = OptionalAttribute(  # pyright: ignore[reportAssignmentType]
+        "w:initials", ST_String
+    )
+    date: str | None = OptionalAttribute("w:date", ST_String)  # pyright: ignore[reportAssignmentType]
+    p = ZeroOrMore("w:p")
+    tbl = ZeroOrMore("w:tbl")
+
+    @property
+    def inner_content_elements(self) -> List[CT_P | CT_Tbl | CT_Sdt]:
+        """The `w:p`, `w:tbl` and `w:sdt` children of this comment, in document order."""
+        return self.xpath("./w:p | ./w:tbl | ./w:sdt")
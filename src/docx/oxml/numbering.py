@@ -1,5 +1,8 @@
 """Custom element classes related to the numbering part."""
 
+from lxml import etree
+
+from docx.oxml.ns import nsmap
 from docx.oxml.parser import OxmlElement
 from docx.oxml.shared import CT_DecimalNumber
 from docx.oxml.simpletypes import (
@@ -228,6 +231,7 @@ class CT_NumLvl(BaseOxmlElement):
     override with settings it contains."""
 
     startOverride = ZeroOrOne("w:startOverride", successors=("w:lvl",))
+    lvl = ZeroOrOne("w:lvl", successors=())
     ilvl = RequiredAttribute("w:ilvl", ST_DecimalNumber)
 
     def add_startOverride(self, val):
@@ -265,6 +269,12 @@ class CT_Numbering(BaseOxmlElement):
     """``<w:numbering>`` element, the root element of a numbering part, i.e.
     numbering.xml."""
 
+    # -- compiled once and parameterized by id so a lookup doesn't format a new XPath --
+    _num_xpath = etree.XPath("./w:num[@w:numId=$id]", namespaces=nsmap)
+    _abstractNum_xpath = etree.XPath(
+        "./w:abstractNum[@w:abstractNumId=$id]", namespaces=nsmap
+    )
+
     num = ZeroOrMore("w:num", successors=("w:numIdMacAtCleanup",))
     abstractNum = ZeroOrMore("w:abstractNum")
 
@@ -278,9 +288,8 @@ class CT_Numbering(BaseOxmlElement):
     def num_having_numId(self, numId):
         """Return the ``<w:num>`` child element having ``numId`` attribute matching
         `numId`."""
-        xpath = './w:num[@w:numId="%d"]' % numId
         try:
-            return self.xpath(xpath)[0]
+            return self._num_xpath(self, id=numId)[0]
         except IndexError:
             raise KeyError("no <w:num> element with numId %d" % numId)
 
@@ -289,9 +298,8 @@ class CT_Numbering(BaseOxmlElement):
         Return the ``<w:abstractNum>`` child element having ``abstractNumId`` attribute
         matching *numId*.
         """
-        xpath = './w:abstractNum[@w:abstractNumId="%d"]' % abstractNumId
         try:
-            return self.xpath(xpath)[0]
+            return self._abstractNum_xpath(self, id=abstractNumId)[0]
         except IndexError:
             raise KeyError("no <w:abstractNum> element with abstractNumId %d" % abstractNumId)
 
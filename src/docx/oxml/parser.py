@@ -1,9 +1,15 @@
 # pyright: reportImportCycles=false
 
-"""XML parser for python-docx."""
+"""XML parser for python-docx.
+
+lxml parser objects must not be used by more than one thread at a time, so each thread
+parses with its own parser instance. All of them share the one element-class lookup, so
+custom element classes registered here apply in every thread.
+"""
 
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING, Dict, Type, cast
 
 from lxml import etree
@@ -16,8 +22,26 @@ if TYPE_CHECKING:
 
 # -- configure XML parser --
 element_class_lookup = etree.ElementNamespaceClassLookup()
-oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
-oxml_parser.set_element_class_lookup(element_class_lookup)
+_parsers = threading.local()
+
+
+def _new_oxml_parser() -> etree.XMLParser:
+    parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+    parser.set_element_class_lookup(element_class_lookup)
+    return parser
+
+
+def get_oxml_parser() -> etree.XMLParser:
+    """The oxml parser for the calling thread, created the first time a thread parses."""
+    try:
+        return _parsers.oxml_parser
+    except AttributeError:
+        parser = _parsers.oxml_parser = _new_oxml_parser()
+        return parser
+
+
+# -- parser of the importing thread, kept for code that passes it to lxml directly --
+oxml_parser = _parsers.oxml_parser = _new_oxml_parser()
 
 
 def parse_xml(xml: str | bytes) -> "BaseOxmlElement":
@@ -26,7 +50,7 @@ def parse_xml(xml: str | bytes) -> "BaseOxmlElement":
     The custom parser is used, so custom element classes are produced for elements in
     `xml` that have them.
     """
-    return cast("BaseOxmlElement", etree.fromstring(xml, oxml_parser))
+    return cast("BaseOxmlElement", etree.fromstring(xml, get_oxml_parser()))
 
 
 def register_element_cls(tag: str, cls: Type["BaseOxmlElement"]):
@@ -59,4 +83,4 @@ def OxmlElement(
     nsptag = NamespacePrefixedTag(nsptag_str)
     if nsdecls is None:
         nsdecls = nsptag.nsmap
-    return oxml_parser.makeelement(nsptag.clark_name, attrib=attrs, nsmap=nsdecls)
+    return get_oxml_parser().makeelement(nsptag.clark_name, attrib=attrs, nsmap=nsdecls)
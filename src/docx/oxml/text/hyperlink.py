@@ -50,6 +50,7 @@ class CT_Hyperlink(BaseOxmlElement):
     def text(self) -> str:
         """The textual content of this hyperlink.
 
-        `CT_Hyperlink` stores the hyperlink-text as one or more `w:r` children.
+        `CT_Hyperlink` stores the hyperlink-text as one or more `w:r` children, some of
+        which can be tracked insertions.
         """
-        return "".join(r.text for r in self.xpath("w:r"))
+        return "".join(r.text for r in self.xpath("w:r | w:ins/w:r | w:moveTo/w:r"))
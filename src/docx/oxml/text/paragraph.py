@@ -7,6 +7,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Callable, List, TypeAlias, cast
 
 from docx.oxml.math import CT_OMath, CT_OMathPara
+from docx.oxml.ns import nsmap
 from docx.oxml.parser import OxmlElement
 from docx.oxml.text.field import CT_FldSimple
 from docx.oxml.text.hyperlink import CT_Hyperlink
@@ -27,6 +28,7 @@ P_Elem: TypeAlias = "CT_R | CT_Hyperlink | CT_FldSimple | CT_OMathPara | CT_OMat
 class CT_P(BaseOxmlElement):
     """`<w:p>` element, containing the properties and text for a paragraph."""
 
+    add_hyperlink: Callable[[], CT_Hyperlink]
     add_r: Callable[[], CT_R]
     get_or_add_pPr: Callable[[], CT_PPr]
     hyperlink_lst: List[CT_Hyperlink]
@@ -116,10 +118,29 @@ class CT_P(BaseOxmlElement):
         """The textual content of this paragraph.
 
         Inner-content child elements like `w:r` and `w:hyperlink` are translated to
-        their text equivalent.
+        their text equivalent. Runs of tracked insertions (`w:ins`, `w:moveTo`) are
+        included and those of tracked deletions are not, as the paragraph reads with its
+        changes accepted.
         """
-        return "".join(e.text for e in self.xpath("w:r | w:hyperlink | w:fldSimple | w:sdt"))
+        return "".join(
+            e.text
+            for e in self.xpath(
+                "w:r | w:hyperlink | w:fldSimple | w:sdt"
+                " | w:ins/w:r | w:ins/w:hyperlink | w:moveTo/w:r | w:moveTo/w:hyperlink"
+            )
+        )
 
     def _insert_pPr(self, pPr: CT_PPr) -> CT_PPr:
         self.insert(0, pPr)
         return pPr
+
+    def _new_hyperlink(self) -> CT_Hyperlink:
+        """A new `w:hyperlink` element, declaring the `r:` namespace when not in scope.
+
+        The `r:id` attribute of a hyperlink is in the relationships namespace, which is
+        not otherwise declared by a paragraph created outside a document.
+        """
+        prefixes = ("w",) if "r" in self.nsmap else ("w", "r")
+        return cast(
+            CT_Hyperlink, OxmlElement("w:hyperlink", nsdecls={pfx: nsmap[pfx] for pfx in prefixes})
+        )
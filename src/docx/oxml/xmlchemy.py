@@ -10,6 +10,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Sequence,
     Tuple,
@@ -29,6 +30,27 @@ if TYPE_CHECKING:
     from docx.oxml.simpletypes import BaseSimpleType
 
 
+# -- incremented on each change to the children of a custom element, see `tree_version()` --
+_tree_version = 0
+
+
+def tree_version() -> int:
+    """Number that changes each time a child is added to or removed from an element.
+
+    Counts the changes made through the methods of custom element classes, including an
+    element moved away from its parent by being added to another one, so a view of the
+    children of an element can be reused for as long as this number is unchanged.
+    Changes made through lxml functions like `etree.strip_elements()`, or through
+    elements that have no custom element class, are not counted.
+    """
+    return _tree_version
+
+
+def _tree_changed() -> None:
+    global _tree_version
+    _tree_version += 1
+
+
 def serialize_for_reading(element: ElementBase):
     """Serialize `element` to human-readable XML suitable for tests.
 
@@ -726,6 +748,49 @@ class BaseOxmlElement(etree.ElementBase, metaclass=MetaOxmlElement):
 
         return super().findall(xpath_str, namespaces=namespaces)
 
+    # -- the methods that add or remove children are overridden to count the change,
+    # -- see `tree_version()`
+
+    def addnext(self, element: _Element) -> None:
+        _tree_changed()
+        super().addnext(element)
+
+    def addprevious(self, element: _Element) -> None:
+        _tree_changed()
+        super().addprevious(element)
+
+    def append(self, element: _Element) -> None:
+        _tree_changed()
+        super().append(element)
+
+    def clear(self, keep_tail: bool = False) -> None:
+        _tree_changed()
+        super().clear(keep_tail)
+
+    def extend(self, elements: Iterable[_Element]) -> None:
+        _tree_changed()
+        super().extend(elements)
+
+    def insert(self, index: int, element: _Element) -> None:
+        _tree_changed()
+        super().insert(index, element)
+
+    def remove(self, element: _Element) -> None:
+        _tree_changed()
+        super().remove(element)
+
+    def replace(self, old_element: _Element, new_element: _Element) -> None:
+        _tree_changed()
+        super().replace(old_element, new_element)
+
+    def __delitem__(self, x: int | slice) -> None:
+        _tree_changed()
+        super().__delitem__(x)
+
+    def __setitem__(self, x: Any, value: Any) -> None:
+        _tree_changed()
+        super().__setitem__(x, value)
+
     @property
     def _nsptag(self) -> str:
         return NamespacePrefixedTag.from_clark_name(self.tag)
@@ -65,6 +65,10 @@ class ImageParts:
     def append(self, item: ImagePart):
         self._image_parts.append(item)
 
+    def remove(self, item: ImagePart):
+        """Remove `item`, an image part no longer in the package, from the collection."""
+        self._image_parts.remove(item)
+
     def get_or_add_image_part(self, image_descriptor: str | IO[bytes]) -> ImagePart:
         """Return |ImagePart| object containing image identified by `image_descriptor`.
 
@@ -0,0 +1,268 @@
+"""The pages of a document as Word last rendered them, found in one pass over its body.
+
+Word records where each page began when it last laid out the document with a
+`w:lastRenderedPageBreak` element. `RenderedPageBreak` splits the paragraph around a
+single break by copying it, which is fine for one break but costly for every page of a
+long document. Here the breaks are located in a single scan and each page is described
+by ranges of body blocks; the content of a paragraph or table split across pages is only
+copied when it is asked for.
+
+A break inside a hyperlink, field or other container in a paragraph is taken to follow
+that container, like `RenderedPageBreak` does for hyperlinks. A page beginning inside a
+table begins at the row holding the break, and a block content control is kept whole on
+the page it begins on.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING, Dict, Iterator, List, NamedTuple
+
+from docx.oxml.ns import qn
+
+if TYPE_CHECKING:
+    import docx.types as t
+    from docx.oxml.document import CT_Body
+    from docx.oxml.xmlchemy import BaseOxmlElement
+    from docx.table import Table
+    from docx.text.block import SdtBlock
+    from docx.text.paragraph import Paragraph
+
+_block_tags = tuple(qn(tag) for tag in ("w:p", "w:tbl", "w:sdt"))
+_hyperlink_tag = qn("w:hyperlink")
+_lrpb_tag = qn("w:lastRenderedPageBreak")
+_p_tag = qn("w:p")
+_pPr_tag = qn("w:pPr")
+_r_tag = qn("w:r")
+_rPr_tag = qn("w:rPr")
+_tbl_tag = qn("w:tbl")
+_tr_tag = qn("w:tr")
+# -- children of a paragraph contributing to `Paragraph.text` --
+_text_container_tags = frozenset(qn(tag) for tag in ("w:r", "w:hyperlink", "w:fldSimple", "w:sdt"))
+# -- tracked insertions, whose runs and hyperlinks also contribute to `Paragraph.text` --
+_insertion_tags = frozenset(qn(tag) for tag in ("w:ins", "w:moveTo"))
+# -- run content contributing to `Run.text` --
+_run_text_tags = frozenset(
+    qn(tag) for tag in ("w:br", "w:cr", "w:noBreakHyphen", "w:ptab", "w:t", "w:tab")
+)
+
+
+class PageRange(NamedTuple):
+    """The part of a body block on a page.
+
+    `block_index` is the index of the block in the body content, as generated by
+    :meth:`.Document.iter_inner_content`. For a paragraph, `start` and `end` are
+    character offsets into its text; for a table they are row indexes. `end` is |None|
+    when the range runs to the end of the block.
+    """
+
+    block_index: int
+    start: int
+    end: int | None
+
+
+class _Boundary(NamedTuple):
+    """Where a page begins: at `offset` in the block at `block_index`.
+
+    For a paragraph split across pages, `child_index` is the index in the paragraph of the
+    child the break was found in. `run_index` is the index of the break in that child
+    when it's a run, or |None| when the page begins after that child.
+    """
+
+    block_index: int
+    offset: int
+    child_index: int = -1
+    run_index: int | None = None
+
+
+class RenderedPage:
+    """A page of a document, as Word last rendered it.
+
+    `number` is the 1-based page number. `ranges` locates the body content on the page
+    without copying any of it; :meth:`iter_inner_content` provides that content as
+    paragraphs and tables.
+    """
+
+    def __init__(
+        self,
+        number: int,
+        blocks: List[BaseOxmlElement],
+        start: _Boundary,
+        end: _Boundary | None,
+        parent: t.ProvidesStoryPart,
+    ):
+        self.number = number
+        self._blocks = blocks
+        self._start = start
+        self._end = end
+        self._parent = parent
+
+    def __repr__(self) -> str:
+        return "RenderedPage(number=%d, ranges=%r)" % (self.number, self.ranges)
+
+    def iter_inner_content(self) -> Iterator[Paragraph | Table | SdtBlock]:
+        """Generate each paragraph, table and content control on this page, in order.
+
+        A block lying wholly on the page is provided as it is, so changes to it change
+        the document. A paragraph or table split across pages is provided as a copy
+        holding only the part of it on this page, made when it is reached.
+        """
+        from docx.table import Table
+        from docx.text.block import SdtBlock
+        from docx.text.paragraph import Paragraph
+
+        for block_index, start, end in self.ranges:
+            block = self._blocks[block_index]
+            if start == 0 and end is None:
+                if block.tag == _p_tag:
+                    yield Paragraph(block, self._parent)  # pyright: ignore[reportArgumentType]
+                elif block.tag == _tbl_tag:
+                    yield Table(block, self._parent)  # pyright: ignore[reportArgumentType]
+                else:
+                    yield SdtBlock(block, self._parent)  # pyright: ignore[reportArgumentType]
+            elif block.tag == _p_tag:
+                yield Paragraph(self._paragraph_fragment(block_index), self._parent)  # pyright: ignore
+            else:
+                yield Table(_table_fragment(block, start, end), self._parent)  # pyright: ignore
+
+    @property
+    def ranges(self) -> List[PageRange]:
+        """The |PageRange| of each body block on this page, in document order."""
+        start, end = self._start, self._end
+        if end is None:
+            end_index, end_offset = len(self._blocks), 0
+        else:
+            end_index, end_offset = end.block_index, end.offset
+
+        ranges: List[PageRange] = []
+        for block_index in range(start.block_index, end_index + (1 if end_offset else 0)):
+            first = start.offset if block_index == start.block_index else 0
+            last = end_offset if block_index == end_index else None
+            ranges.append(PageRange(block_index, first, last))
+        return ranges
+
+    def _paragraph_fragment(self, block_index: int) -> BaseOxmlElement:
+        """Copy of paragraph at `block_index` trimmed to the part of it on this page."""
+        p = copy.deepcopy(self._blocks[block_index])
+        children = list(p)
+        start, end = self._start, self._end
+        start = start if start.block_index == block_index and start.offset else None
+        end = end if end is not None and end.block_index == block_index else None
+
+        # -- trim the end first, leaving the indexes of the start boundary valid --
+        if end is not None:
+            child = children[end.child_index]
+            following = children[end.child_index + 1 :]
+            if end.run_index is not None:
+                following[:0] = list(child)[end.run_index :]
+            for e in following:
+                e.getparent().remove(e)
+        if start is not None:
+            child = children[start.child_index]
+            preceding = children[: start.child_index]
+            if start.run_index is None:
+                preceding.append(child)
+            else:
+                preceding.extend(e for e in list(child)[: start.run_index + 1] if e.tag != _rPr_tag)
+            for e in preceding:
+                if e.tag != _pPr_tag:
+                    e.getparent().remove(e)
+        return p
+
+
+def iter_rendered_pages(body: CT_Body, parent: t.ProvidesStoryPart) -> Iterator[RenderedPage]:
+    """Generate a |RenderedPage| for each page of `body`, in a single pass over it.
+
+    Each page is generated as soon as the break ending it is found. A body without
+    rendered page breaks, like one never saved by Word, is a single page. `parent` is
+    the parent of the block-item objects provided by each page.
+    """
+    blocks: List[BaseOxmlElement] = list(body.iterchildren(*_block_tags))
+    block_indexes: Dict[BaseOxmlElement, int] = {block: i for i, block in enumerate(blocks)}
+    row_indexes: Dict[BaseOxmlElement, Dict[BaseOxmlElement, int]] = {}
+
+    number = 1
+    start = _Boundary(0, 0)
+    for lrpb in body.iter(_lrpb_tag):
+        boundary = _boundary(lrpb, body, block_indexes, row_indexes)
+        if boundary is None or boundary[:2] <= start[:2]:
+            continue
+        yield RenderedPage(number, blocks, start, boundary, parent)
+        number += 1
+        start = boundary
+    if start.block_index < len(blocks) or number == 1:
+        yield RenderedPage(number, blocks, start, None, parent)
+
+
+def _boundary(
+    lrpb: BaseOxmlElement,
+    body: BaseOxmlElement,
+    block_indexes: Dict[BaseOxmlElement, int],
+    row_indexes: Dict[BaseOxmlElement, Dict[BaseOxmlElement, int]],
+) -> _Boundary | None:
+    """The |_Boundary| of the page beginning at rendered page break `lrpb`."""
+    ancestors: List[BaseOxmlElement] = [lrpb]
+    for ancestor in lrpb.iterancestors():
+        if ancestor is body:
+            break
+        ancestors.append(ancestor)
+    block = ancestors[-1]
+    block_index = block_indexes.get(block)
+    if block_index is None or len(ancestors) < 2:
+        return None
+
+    if block.tag == _tbl_tag:
+        rows = row_indexes.get(block)
+        if rows is None:
+            rows = row_indexes[block] = {tr: i for i, tr in enumerate(block.iterchildren(_tr_tag))}
+        row_index = rows.get(ancestors[-2], 0)
+        return _Boundary(block_index, row_index)
+    if block.tag != _p_tag:
+        return _Boundary(block_index, 0)
+
+    # -- a break in a paragraph; `child` is the child of the paragraph holding it --
+    child = ancestors[-2]
+    offset = sum(_text_length(e) for e in child.itersiblings(preceding=True))
+    if child.tag == _r_tag and child is lrpb.getparent():
+        run_index = child.index(lrpb)
+        offset += sum(
+            len(str(e)) for e in lrpb.itersiblings(preceding=True) if e.tag in _run_text_tags
+        )
+    else:
+        run_index = None
+        offset += _text_length(child)
+
+    if not _has_text_after(lrpb if run_index is not None else None, child):
+        return _Boundary(block_index + 1, 0)
+    if offset == 0:
+        return _Boundary(block_index, 0)
+    return _Boundary(block_index, offset, block.index(child), run_index)
+
+
+def _has_text_after(lrpb: BaseOxmlElement | None, child: BaseOxmlElement) -> bool:
+    """True when paragraph text follows `lrpb` in its run, or follows paragraph `child`."""
+    if lrpb is not None and any(e.tag in _run_text_tags for e in lrpb.itersiblings()):
+        return True
+    return any(
+        next(e.iter(*_run_text_tags), None) is not None
+        for e in child.itersiblings()
+        if e.tag in _text_container_tags or e.tag in _insertion_tags
+    )
+
+
+def _text_length(child: BaseOxmlElement) -> int:
+    """Length of the text paragraph `child` contributes to `Paragraph.text`."""
+    if child.tag in _text_container_tags:
+        return len(child.text)
+    if child.tag in _insertion_tags:
+        return sum(len(e.text) for e in child.iterchildren(_r_tag, _hyperlink_tag))
+    return 0
+
+
+def _table_fragment(tbl: BaseOxmlElement, start: int, end: int | None) -> BaseOxmlElement:
+    """Copy of `tbl` holding only rows `start` up to `end`, exclusive."""
+    tbl = copy.deepcopy(tbl)
+    rows = list(tbl.iterchildren(_tr_tag))
+    for tr in rows[:start] + (rows[end:] if end is not None else []):
+        tbl.remove(tr)
+    return tbl
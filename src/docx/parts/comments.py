@@ -1,49 +1,80 @@
 """|CommentsPart| and closely related objects."""
 
-from typing import Self
+from __future__ import annotations
 
-from ..opc.part import XmlPart
+from typing import TYPE_CHECKING, Self, cast
 
+from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.packuri import PackURI
+from docx.opc.part import XmlPart
+from docx.oxml.ns import nsdecls
+from docx.oxml.parser import parse_xml
+from docx.parts.story import StoryPart
 
-class CommentsPart(XmlPart):
-    """Proxy for the comments.xml part containing numbering definitions for a document
-    or glossary."""
+if TYPE_CHECKING:
+    from docx.comments import Comments
+    from docx.oxml.comments import CT_Comments
+    from docx.package import Package
+
+
+class CommentsPart(StoryPart):
+    """Comments part, containing the comments of a document.
+
+    Each comment holds paragraphs and tables like a footnote does, so this is a story
+    part.
+    """
 
     @classmethod
-    def new(cls) -> Self:
-        """Return newly created empty numbering part, containing only the root
-        ``<w:numbering>`` element."""
-        raise NotImplementedError
+    def new(cls, package: Package) -> Self:
+        """Return newly created comments part, containing no comments."""
+        xml = '<w:comments %s mc:Ignorable="w14 w15"/>' % nsdecls("w", "r", "mc", "w14", "w15")
+        element = cast("CT_Comments", parse_xml(xml))
+        return cls(PackURI("/word/comments.xml"), CT.WML_COMMENTS, element, package)
+
+    @property
+    def comments(self) -> Comments:
+        """The |Comments| of this part."""
+        from docx.comments import Comments
+
+        return Comments(self._element, self)
 
 
 class CommentsIdsPart(XmlPart):
-    """Proxy for the comments.xml part containing numbering definitions for a document
-    or glossary."""
+    """Comments-ids part, giving each comment a durable id (`w16cid:commentId`)."""
 
     @classmethod
-    def new(cls) -> Self:
-        """Return newly created empty numbering part, containing only the root
-        ``<w:numbering>`` element."""
-        raise NotImplementedError
+    def new(cls, package: Package) -> Self:
+        """Return newly created comments-ids part, containing no entries."""
+        element = parse_xml("<w16cid:commentsIds %s/>" % nsdecls("w16cid"))
+        return cls(PackURI("/word/commentsIds.xml"), CT.WML_COMMENTS_IDS, element, package)
 
 
 class CommentsExtendedPart(XmlPart):
-    """Proxy for the comments.xml part containing numbering definitions for a document
-    or glossary."""
+    """Comments-extended part, holding the reply threading and done state of comments.
+
+    A `w15:commentEx` element refers to a comment by the `w14:paraId` of the last
+    paragraph of the comment.
+    """
 
     @classmethod
-    def new(cls) -> Self:
-        """Return newly created empty numbering part, containing only the root
-        ``<w:numbering>`` element."""
-        raise NotImplementedError
+    def new(cls, package: Package) -> Self:
+        """Return newly created comments-extended part, containing no entries."""
+        element = parse_xml("<w15:commentsEx %s/>" % nsdecls("w15"))
+        return cls(
+            PackURI("/word/commentsExtended.xml"), CT.WML_COMMENTS_EXTENDED, element, package
+        )
 
 
 class CommentsExtensiblePart(XmlPart):
-    """Proxy for the comments.xml part containing numbering definitions for a document
-    or glossary."""
+    """Comments-extensible part, holding the UTC date of comments by durable id."""
 
     @classmethod
-    def new(cls) -> Self:
-        """Return newly created empty numbering part, containing only the root
-        ``<w:numbering>`` element."""
-        raise NotImplementedError
+    def new(cls, package: Package) -> Self:
+        """Return newly created comments-extensible part, containing no entries."""
+        element = parse_xml("<w16cex:commentsExtensible %s/>" % nsdecls("w16cex"))
+        return cls(
+            PackURI("/word/commentsExtensible.xml"),
+            CT.WML_COMMENTS_EXTENSIBLE,
+            element,
+            package,
+        )
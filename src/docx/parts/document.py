@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, cast
+from typing import IO, TYPE_CHECKING, Iterator, cast
 
+from docx.bookmarks import BookmarkIndex
+from docx.comments import CommentIndex
 from docx.document import Document
 from docx.enum.style import WD_STYLE_TYPE
+from docx.numbering import ListLabeler
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.parts.comments import (
     CommentsExtendedPart,
@@ -20,10 +23,13 @@ from docx.parts.people import PeoplePart
 from docx.parts.settings import SettingsPart
 from docx.parts.story import StoryPart
 from docx.parts.styles import StylesPart
+from docx.revisions import RevisionIndex
+from docx.sdt import ContentControlIndex
 from docx.shape import InlineShapes
 from docx.shared import lazyproperty
 
 if TYPE_CHECKING:
+    from docx.comments import Comments
     from docx.opc.coreprops import CoreProperties
     from docx.settings import Settings
     from docx.styles.style import BaseStyle
@@ -51,6 +57,29 @@ class DocumentPart(StoryPart):
         rId = self.relate_to(header_part, RT.HEADER)
         return header_part, rId
 
+    @lazyproperty
+    def bookmark_index(self) -> BookmarkIndex:
+        """The |BookmarkIndex| locating each bookmark in the stories of this document."""
+        return BookmarkIndex(self)
+
+    @lazyproperty
+    def comment_index(self) -> CommentIndex:
+        """The |CommentIndex| of the comments of this document and their anchors."""
+        return CommentIndex(self)
+
+    @property
+    def comments(self) -> Comments:
+        """The |Comments| of this document.
+
+        Creates an empty comments part if one is not present.
+        """
+        return self._comments_part.comments
+
+    @lazyproperty
+    def content_control_index(self) -> ContentControlIndex:
+        """The |ContentControlIndex| of the content controls in the stories of this document."""
+        return ContentControlIndex(self)
+
     @property
     def core_properties(self) -> CoreProperties:
         """A |CoreProperties| object providing read/write access to the core properties
@@ -97,6 +126,33 @@ class DocumentPart(StoryPart):
         """The |InlineShapes| instance containing the inline shapes in the document."""
         return InlineShapes(self._element.body, self)
 
+    def iter_story_parts(self) -> Iterator[StoryPart]:
+        """Generate this part followed by each other story part in the package.
+
+        Other story parts are the header, footer, footnotes and endnotes parts, those
+        that can contain paragraphs and tables. The comments part is not included.
+        """
+        yield self
+        package = self.package
+        assert package is not None
+        for part in package.iter_parts():
+            if part is self or isinstance(part, CommentsPart):
+                continue
+            if isinstance(part, StoryPart):
+                yield part
+
+    def new_list_labeler(self) -> ListLabeler | None:
+        """Return a new |ListLabeler| for the numbered paragraphs of this document.
+
+        Returns |None| when the document has no numbering part, in which case no
+        paragraph can be numbered.
+        """
+        try:
+            numbering_part = cast(NumberingPart, self.part_related_by(RT.NUMBERING))
+        except KeyError:
+            return None
+        return ListLabeler(numbering_part, self._styles_part.element)
+
     @lazyproperty
     def numbering_part(self) -> NumberingPart:
         """A |NumberingPart| object providing access to the numbering definitions for
@@ -111,6 +167,11 @@ class DocumentPart(StoryPart):
             self.relate_to(numbering_part, RT.NUMBERING)
             return numbering_part
 
+    @lazyproperty
+    def revision_index(self) -> RevisionIndex:
+        """The |RevisionIndex| of the tracked changes in the stories of this document."""
+        return RevisionIndex(self)
+
     def save(self, path_or_stream: str | IO[bytes]):
         """Save this document to `path_or_stream`, which can be either a path to a
         filesystem location (a string) or a file-like object."""
@@ -174,7 +235,7 @@ class DocumentPart(StoryPart):
         try:
             return cast(CommentsPart, self.part_related_by(RT.COMMENTS))
         except KeyError:
-            comments_part = CommentsPart.new()
+            comments_part = CommentsPart.new(self.package)
             self.relate_to(comments_part, RT.COMMENTS)
             return comments_part
 
@@ -183,7 +244,7 @@ class DocumentPart(StoryPart):
         try:
             return cast(CommentsIdsPart, self.part_related_by(RT.COMMENTS_IDS))
         except KeyError:
-            comments_ids_part = CommentsIdsPart.new()
+            comments_ids_part = CommentsIdsPart.new(self.package)
             self.relate_to(comments_ids_part, RT.COMMENTS_IDS)
             return comments_ids_part
 
@@ -192,7 +253,7 @@ class DocumentPart(StoryPart):
         try:
             return cast(CommentsExtendedPart, self.part_related_by(RT.COMMENTS_EXTENDED))
         except KeyError:
-            comments_extended_part = CommentsExtendedPart.new()
+            comments_extended_part = CommentsExtendedPart.new(self.package)
             self.relate_to(comments_extended_part, RT.COMMENTS_EXTENDED)
             return comments_extended_part
 
@@ -201,7 +262,7 @@ class DocumentPart(StoryPart):
         try:
             return cast(CommentsExtensiblePart, self.part_related_by(RT.COMMENTS_EXTENSIBLE))
         except KeyError:
-            comments_extensible_part = CommentsExtensiblePart.new()
+            comments_extensible_part = CommentsExtensiblePart.new(self.package)
             self.relate_to(comments_extensible_part, RT.COMMENTS_EXTENSIBLE)
             return comments_extensible_part
 
@@ -210,9 +271,9 @@ class DocumentPart(StoryPart):
         try:
             return cast(PeoplePart, self.part_related_by(RT.PEOPLE))
         except KeyError:
-            people_part = PeoplePart.new()
+            people_part = PeoplePart.new(self.package)
             self.relate_to(people_part, RT.PEOPLE)
-            return people_part 
+            return people_part
 
     @lazyproperty
     def _footnotes_part(self) -> FootnotesPart:
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from typing import TYPE_CHECKING, cast
 
@@ -29,6 +30,7 @@ class FootnotesPart(StoryPart):
         return cls(partname, content_type, element, package)
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def _default_footnotes_xml(cls) -> bytes:
         """Return bytes containing XML for a default footnotes part."""
         path = os.path.join(os.path.split(__file__)[0], "..", "templates", "default-footnotes.xml")
@@ -59,6 +61,7 @@ class EndnotesPart(StoryPart):
         return cls(partname, content_type, element, package)
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def _default_endnotes_xml(cls):
         """Return bytes containing XML for a default footnotes part."""
         path = os.path.join(os.path.split(__file__)[0], "..", "templates", "default-endnotes.xml")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from typing import TYPE_CHECKING
 
@@ -25,6 +26,7 @@ class FooterPart(StoryPart):
         return cls(partname, content_type, element, package)
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def _default_footer_xml(cls):
         """Return bytes containing XML for a default footer part."""
         path = os.path.join(os.path.split(__file__)[0], "..", "templates", "default-footer.xml")
@@ -45,6 +47,7 @@ class HeaderPart(StoryPart):
         return cls(partname, content_type, element, package)
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def _default_header_xml(cls):
         """Return bytes containing XML for a default header part."""
         path = os.path.join(os.path.split(__file__)[0], "..", "templates", "default-header.xml")
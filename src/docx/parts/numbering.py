@@ -1,20 +1,40 @@
 """|NumberingPart| and closely related objects."""
 
-from typing import Self
+from __future__ import annotations
 
+from typing import TYPE_CHECKING, Dict, Self, Tuple
+
+from ..opc.constants import CONTENT_TYPE as CT
+from ..opc.packuri import PackURI
 from ..opc.part import XmlPart
+from ..oxml.ns import nsdecls
+from ..oxml.parser import parse_xml
 from ..shared import lazyproperty
 
+if TYPE_CHECKING:
+    from ..opc.package import OpcPackage
+    from ..oxml.numbering import CT_AbstractNum, CT_Lvl, CT_Num, CT_Numbering
+
 
 class NumberingPart(XmlPart):
     """Proxy for the numbering.xml part containing numbering definitions for a document
     or glossary."""
 
+    _element: CT_Numbering
+
+    def __init__(self, partname, content_type, element, package):
+        super(NumberingPart, self).__init__(partname, content_type, element, package)
+        self._nums_by_id: Dict[int, CT_Num] = {}
+        self._abstractNums_by_id: Dict[int, CT_AbstractNum] = {}
+        self._indexed = False
+
     @classmethod
-    def new(cls) -> Self:
+    def new(cls, package: OpcPackage | None = None) -> Self:
         """Return newly created empty numbering part, containing only the root
         ``<w:numbering>`` element."""
-        raise NotImplementedError
+        partname = PackURI("/word/numbering.xml")
+        element = parse_xml("<w:numbering %s/>" % nsdecls("w"))
+        return cls(partname, CT.WML_NUMBERING, element, package)
 
     @lazyproperty
     def numbering_definitions(self):
@@ -22,20 +42,50 @@ class NumberingPart(XmlPart):
         (<w:num> element proxies) for this numbering part."""
         return _NumberingDefinitions(self._element)
 
-    def get_abstract_by_num_id(self, num_id: int):
-        for num in self._element.num_lst:
-            if num.numId != num_id:
+    def get_abstract_by_num_id(self, num_id: int) -> CT_AbstractNum | None:
+        """Return the `w:abstractNum` element referenced by the `w:num` having `num_id`.
+
+        Returns |None| when either the `w:num` or the abstract definition it refers to is
+        not present.
+        """
+        num = self.get_num(num_id)
+        if num is None:
+            return None
+        return self.get_abstractNum(num.abstractNumId.val)
+
+    def get_abstractNum(self, abstractNum_id: int) -> CT_AbstractNum | None:
+        """Return the `w:abstractNum` element having `abstractNum_id`, or |None|."""
+        was_indexed = self._indexed
+        abstractNum = self._indexes[1].get(abstractNum_id)
+        if was_indexed and (
+            abstractNum is None
+            or not self._is_current(abstractNum, abstractNum.abstractNumId, abstractNum_id)
+        ):
+            self._reindex()
+            abstractNum = self._abstractNums_by_id.get(abstractNum_id)
+        return abstractNum
+
+    def get_ilvl_override(self, num_id: int, ilvl: int) -> int | None:
+        """Return the `w:startOverride` value for level `ilvl` of the `w:num` having
+        `num_id`, or |None| if that level has no start override."""
+        num = self.get_num(num_id)
+        if num is None:
+            return None
+
+        for ovr in num.lvlOverride_lst:
+            if ovr.ilvl != ilvl:
                 continue
 
-            num_abs_num_id = num.abstractNumId.val
-            for abs_num in self._element.abstractNum_lst:
-                if num_abs_num_id != abs_num.abstractNumId:
-                    continue
+            startOverride = ovr.startOverride
+            return None if startOverride is None else startOverride.val
 
-                return abs_num
+        return None
 
-    def get_lvl(self, num_id: int, ilvl: int):
+    def get_lvl(self, num_id: int, ilvl: int) -> CT_Lvl | None:
         abs_num = self.get_abstract_by_num_id(num_id)
+        if abs_num is None:
+            return None
+
         ilvl_ovr = self.get_ilvl_override(num_id, ilvl)
         if ilvl_ovr is not None:
             ilvl = ilvl_ovr
@@ -46,16 +96,78 @@ class NumberingPart(XmlPart):
 
             return lvl
 
-    def get_ilvl_override(self, num_id: int, ilvl: int):
-        for num in self._element.num_lst:
-            if num.numId != num_id:
-                continue
-
-            for ovr in num.lvlOverride_lst:
-                if ovr.ilvl is None or ovr.ilvl != ilvl:
-                    continue
+    def get_num(self, num_id: int) -> CT_Num | None:
+        """Return the `w:num` element having `num_id`, or |None| if not present.
+
+        Lookups are served from a numId index built in a single pass over the part, so
+        they take constant time regardless of how many list definitions it contains. A
+        lookup that misses, or finds a definition since removed or renumbered, rebuilds
+        the index and looks again, so the index never goes stale. A lookup of an id the
+        part doesn't have therefore takes time proportional to the size of the part.
+        """
+        was_indexed = self._indexed
+        num = self._indexes[0].get(num_id)
+        if was_indexed and (num is None or not self._is_current(num, num.numId, num_id)):
+            self._reindex()
+            num = self._nums_by_id.get(num_id)
+        return num
+
+    def lvl_for(self, num_id: int, ilvl: int) -> CT_Lvl | None:
+        """Return the effective `w:lvl` definition for level `ilvl` of list `num_id`.
+
+        A `w:lvl` inside a matching `w:lvlOverride` of the `w:num` takes precedence over
+        the level of the same `ilvl` in the abstract numbering definition.
+        """
+        num = self.get_num(num_id)
+        if num is None:
+            return None
+
+        for ovr in num.lvlOverride_lst:
+            if ovr.ilvl == ilvl and ovr.lvl is not None:
+                return ovr.lvl
+
+        abstractNum = self.get_abstractNum(num.abstractNumId.val)
+        if abstractNum is None:
+            return None
+
+        for lvl in abstractNum.lvl_lst:
+            if lvl.ilvl == ilvl:
+                return lvl
+
+        return None
+
+    def refresh(self) -> None:
+        """Forget the numId and abstractNumId indexes, rebuilt when next used.
+
+        Never needed for correct lookups, which rebuild the indexes when they find them
+        out of date.
+        """
+        self._indexed = False
+
+    @property
+    def _indexes(self) -> Tuple[Dict[int, CT_Num], Dict[int, CT_AbstractNum]]:
+        """(nums_by_id, abstractNums_by_id) pair of dicts indexing this part.
+
+        The indexes are built on first use. A lookup that misses, or finds a definition
+        that is no longer in the part under that id, rebuilds them and looks again.
+        """
+        if not self._indexed:
+            self._reindex()
+        return self._nums_by_id, self._abstractNums_by_id
+
+    def _is_current(self, elm: CT_Num | CT_AbstractNum, elm_id: int, key: int) -> bool:
+        """True when indexed `elm` is still a child of this part having id `key`."""
+        return elm.getparent() is self._element and elm_id == key
+
+    def _reindex(self) -> None:
+        """Rebuild the numId and abstractNumId indexes in one pass over the children."""
+        numbering = self._element
+        self._nums_by_id = {num.numId: num for num in numbering.num_lst}
+        self._abstractNums_by_id = {
+            abstractNum.abstractNumId: abstractNum for abstractNum in numbering.abstractNum_lst
+        }
+        self._indexed = True
 
-                return ovr.startOverride.val
 
 class _NumberingDefinitions:
     """Collection of |_NumberingDefinition| instances corresponding to the ``<w:num>``
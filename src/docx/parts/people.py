@@ -1,16 +1,24 @@
 """|PeoplePart| and closely related objects."""
 
-from typing import Self
+from __future__ import annotations
 
-from ..opc.part import XmlPart
+from typing import TYPE_CHECKING, Self
+
+from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.packuri import PackURI
+from docx.opc.part import XmlPart
+from docx.oxml.ns import nsdecls
+from docx.oxml.parser import parse_xml
+
+if TYPE_CHECKING:
+    from docx.package import Package
 
 
 class PeoplePart(XmlPart):
-    """Proxy for the comments.xml part containing numbering definitions for a document
-    or glossary."""
+    """People part, identifying the authors of comments and revisions (`w15:person`)."""
 
     @classmethod
-    def new(cls) -> Self:
-        """Return newly created empty numbering part, containing only the root
-        ``<w:numbering>`` element."""
-        raise NotImplementedError
+    def new(cls, package: Package) -> Self:
+        """Return newly created people part, containing no people."""
+        element = parse_xml("<w15:people %s/>" % nsdecls("w15"))
+        return cls(PackURI("/word/people.xml"), CT.WML_PEOPLE, element, package)
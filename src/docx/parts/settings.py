@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from typing import TYPE_CHECKING, cast
 
@@ -43,6 +44,7 @@ class SettingsPart(XmlPart):
         return Settings(self._settings)
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def _default_settings_xml(cls):
         """Return a bytestream containing XML for a default settings part."""
         path = os.path.join(os.path.split(__file__)[0], "..", "templates", "default-settings.xml")
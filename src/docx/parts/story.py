@@ -7,7 +7,7 @@ from typing import IO, TYPE_CHECKING, Tuple, cast
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.part import XmlPart
 from docx.oxml.shape import CT_Inline
-from docx.shared import Length, lazyproperty
+from docx.shared import Length, ProxyCache, lazyproperty
 
 if TYPE_CHECKING:
     from docx.enum.style import WD_STYLE_TYPE
@@ -24,6 +24,9 @@ class StoryPart(XmlPart):
     `.add_paragraph()`, `.add_table()` etc.
     """
 
+    # -- optional element->proxy cache for the content of this story, see |ProxyCache| --
+    proxy_cache: ProxyCache | None = None
+
     def get_or_add_image(self, image_descriptor: str | IO[bytes]) -> Tuple[str, Image]:
         """Return (rId, image) pair for image identified by `image_descriptor`.
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from typing import TYPE_CHECKING
 
@@ -34,6 +35,7 @@ class StylesPart(XmlPart):
         return Styles(self.element)
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def _default_styles_xml(cls):
         """Return a bytestream containing XML for a default styles part."""
         path = os.path.join(
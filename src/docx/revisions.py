@@ -0,0 +1,491 @@
+"""Tracked changes (revisions): indexing them, accepting or rejecting them all at once.
+
+Inserted and deleted runs are wrapped in `w:ins` and `w:del` elements (`w:moveTo` and
+`w:moveFrom` for moved text), the text of a deleted run being held in `w:delText`.
+An inserted or deleted paragraph mark, table row or cell is flagged by an empty
+`w:ins`/`w:del` (`w:cellIns`/`w:cellDel`) in its properties, and a formatting change by
+a `w:rPrChange`, `w:pPrChange` or similar element holding the properties as they were.
+Each of these carries the author and date of the change. Legal documents can carry
+thousands of them, so indexing, accepting and rejecting them are each one pass over the
+stories of the document.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple
+
+from docx.enum.text import WD_REVISION_TYPE, WD_REVISIONS_VIEW
+from docx.oxml.ns import qn
+
+if TYPE_CHECKING:
+    from docx.oxml.text.paragraph import CT_P
+    from docx.oxml.xmlchemy import BaseOxmlElement
+    from docx.parts.document import DocumentPart
+    from docx.parts.story import StoryPart
+
+_delInstrText_tag = qn("w:delInstrText")
+_delText_tag = qn("w:delText")
+_numPr_tag = qn("w:numPr")
+_p_tag = qn("w:p")
+_pPr_tag = qn("w:pPr")
+_r_tag = qn("w:r")
+_rPr_tag = qn("w:rPr")
+_sdt_tag = qn("w:sdt")
+_sdtContent_tag = qn("w:sdtContent")
+_sectPr_tag = qn("w:sectPr")
+_tbl_tag = qn("w:tbl")
+_tc_tag = qn("w:tc")
+_tcPr_tag = qn("w:tcPr")
+_tr_tag = qn("w:tr")
+_trPr_tag = qn("w:trPr")
+_w_author = qn("w:author")
+_w_date = qn("w:date")
+_w_id = qn("w:id")
+
+_ins_tags = frozenset((qn("w:ins"), qn("w:moveTo")))
+_del_tags = frozenset((qn("w:del"), qn("w:moveFrom")))
+_cell_tags = frozenset((qn("w:cellIns"), qn("w:cellDel"), qn("w:cellMerge")))
+_kinds: Dict[str, WD_REVISION_TYPE] = {
+    qn("w:ins"): WD_REVISION_TYPE.INSERT,
+    qn("w:del"): WD_REVISION_TYPE.DELETE,
+    qn("w:moveTo"): WD_REVISION_TYPE.MOVED_TO,
+    qn("w:moveFrom"): WD_REVISION_TYPE.MOVED_FROM,
+    qn("w:rPrChange"): WD_REVISION_TYPE.PROPERTY,
+    qn("w:pPrChange"): WD_REVISION_TYPE.PARAGRAPH_PROPERTY,
+    qn("w:sectPrChange"): WD_REVISION_TYPE.SECTION_PROPERTY,
+    qn("w:tblGridChange"): WD_REVISION_TYPE.TABLE_PROPERTY,
+    qn("w:tblPrChange"): WD_REVISION_TYPE.TABLE_PROPERTY,
+    qn("w:tblPrExChange"): WD_REVISION_TYPE.TABLE_PROPERTY,
+    qn("w:tcPrChange"): WD_REVISION_TYPE.TABLE_PROPERTY,
+    qn("w:trPrChange"): WD_REVISION_TYPE.TABLE_PROPERTY,
+    qn("w:cellIns"): WD_REVISION_TYPE.CELL_INSERTION,
+    qn("w:cellDel"): WD_REVISION_TYPE.CELL_DELETION,
+    qn("w:cellMerge"): WD_REVISION_TYPE.CELL_MERGE,
+}
+_property_change_tags = frozenset(
+    qn(tag)
+    for tag in (
+        "w:pPrChange",
+        "w:rPrChange",
+        "w:sectPrChange",
+        "w:tblGridChange",
+        "w:tblPrChange",
+        "w:tblPrExChange",
+        "w:tcPrChange",
+        "w:trPrChange",
+    )
+)
+# -- the bounds of a move; they go once the move is accepted or rejected --
+_move_range_tags = frozenset(
+    qn(tag)
+    for tag in (
+        "w:moveFromRangeStart",
+        "w:moveFromRangeEnd",
+        "w:moveToRangeStart",
+        "w:moveToRangeEnd",
+    )
+)
+# -- properties a rejected formatting change leaves in place, before and after the
+# -- restored ones, by the tag of the properties element
+_kept_properties: Dict[str, Tuple[frozenset[str], frozenset[str]]] = {
+    _rPr_tag: (_ins_tags | _del_tags, frozenset()),
+    _pPr_tag: (frozenset(), frozenset((_rPr_tag, _sectPr_tag))),
+    _sectPr_tag: (frozenset((qn("w:headerReference"), qn("w:footerReference"))), frozenset()),
+    _trPr_tag: (frozenset(), frozenset((qn("w:ins"), qn("w:del")))),
+    _tcPr_tag: (frozenset(), _cell_tags),
+}
+# -- run-level elements whose runs are part of the text of their paragraph --
+_run_container_tags = frozenset(
+    qn(tag)
+    for tag in (
+        "w:customXml",
+        "w:fldSimple",
+        "w:hyperlink",
+        "w:sdt",
+        "w:sdtContent",
+        "w:smartTag",
+    )
+)
+_deleted_run_text_tags = tuple(
+    qn(tag) for tag in ("w:br", "w:cr", "w:delText", "w:noBreakHyphen", "w:ptab", "w:tab")
+)
+
+
+class Revision:
+    """A tracked change, an insertion, deletion, move or formatting change."""
+
+    def __init__(self, element: BaseOxmlElement, part: StoryPart):
+        self._element = element
+        self._part = part
+
+    def __repr__(self) -> str:
+        return "Revision(%s, author=%r)" % (self.kind.name, self.author)
+
+    @property
+    def author(self) -> str | None:
+        """The author of the change, |None| when not recorded."""
+        return self._element.get(_w_author)
+
+    @property
+    def date(self) -> dt.datetime | None:
+        """The date and time of the change, |None| when not recorded."""
+        date = self._element.get(_w_date)
+        if not date:
+            return None
+        try:
+            return dt.datetime.fromisoformat(date)
+        except ValueError:
+            return None
+
+    @property
+    def element(self) -> BaseOxmlElement:
+        """The `w:ins`, `w:del`, `w:rPrChange` or other element recording the change."""
+        return self._element
+
+    @property
+    def id(self) -> int | None:
+        """The `w:id` of the change, |None| when it has none."""
+        revision_id = self._element.get(_w_id, "")
+        return int(revision_id) if revision_id.lstrip("-").isdigit() else None
+
+    @property
+    def kind(self) -> WD_REVISION_TYPE:
+        """Member of :ref:`WdRevisionType` telling what changed."""
+        return _kinds[self._element.tag]
+
+    @property
+    def part(self) -> StoryPart:
+        """The story part the change is in."""
+        return self._part
+
+    @property
+    def target(self) -> BaseOxmlElement:
+        """The element the change applies to.
+
+        This is the `w:ins`, `w:del`, `w:moveTo` or `w:moveFrom` element itself for
+        inserted, deleted or moved runs, the paragraph for a paragraph mark, the row or
+        cell for an inserted or deleted row or cell, and the properties element, like
+        `w:rPr`, for a formatting change.
+        """
+        element = self._element
+        parent = element.getparent()
+        if parent is None or element.tag in _property_change_tags:
+            return element if parent is None else parent
+        if parent.tag == _rPr_tag:
+            # -- a paragraph-mark change, in `w:p/w:pPr/w:rPr` --
+            pPr = parent.getparent()
+            p = None if pPr is None or pPr.tag != _pPr_tag else pPr.getparent()
+            return parent if p is None else p
+        if parent.tag in (_trPr_tag, _tcPr_tag):
+            holder = parent.getparent()
+            return parent if holder is None else holder
+        return element
+
+    @property
+    def text(self) -> str:
+        """The text inserted, deleted or moved by the change.
+
+        The empty string for a change to a paragraph mark, a table row or cell or to
+        formatting.
+        """
+        element = self._element
+        if element.tag in _ins_tags:
+            return "".join(r.text for r in element.iter(_r_tag))
+        if element.tag in _del_tags:
+            return "".join(_deleted_run_text(r) for r in element.iter(_r_tag))
+        return ""
+
+
+class RevisionIndex:
+    """The tracked changes in the stories of a document, in document order.
+
+    The index is built in a single pass over the body, headers, footers, footnotes and
+    endnotes when first used. Indexed access finding a change that has since been removed
+    from the document rebuilds the index; other edits made by other means, like adding a
+    change, are only seen after :meth:`refresh`.
+    """
+
+    def __init__(self, document_part: DocumentPart):
+        self._document_part = document_part
+        self._revisions: List[Revision] | None = None
+
+    def __getitem__(self, idx: int) -> Revision:
+        revision = self._index[idx]
+        if _is_attached(revision):
+            return revision
+        self.refresh()
+        return self._index[idx]
+
+    def __iter__(self) -> Iterator[Revision]:
+        return iter(list(self._index))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def authors(self) -> List[str]:
+        """The distinct authors of the changes, in the order they first appear."""
+        authors = (revision.author for revision in self._index)
+        return list(dict.fromkeys(author for author in authors if author is not None))
+
+    def refresh(self):
+        """Forget the index, which is built again when next used."""
+        self._revisions = None
+
+    @property
+    def _index(self) -> List[Revision]:
+        revisions = self._revisions
+        if revisions is None:
+            revisions = self._revisions = self._build()
+        return revisions
+
+    def _build(self) -> List[Revision]:
+        return [
+            Revision(element, part)
+            for part in self._document_part.iter_story_parts()
+            for element in part.element.iter(*_kinds)
+        ]
+
+
+class Revisions:
+    """The tracked changes of a document, in its body and in its other stories.
+
+    Supports `len()`, iteration and indexed access. Lookups use the revision index of the
+    document part.
+    """
+
+    def __init__(self, document_part: DocumentPart):
+        self._document_part = document_part
+
+    def __getitem__(self, idx: int) -> Revision:
+        return self._index[idx]
+
+    def __iter__(self) -> Iterator[Revision]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def authors(self) -> List[str]:
+        """The distinct authors of the changes, in the order they first appear."""
+        return self._index.authors()
+
+    @property
+    def _index(self) -> RevisionIndex:
+        return self._document_part.revision_index
+
+
+def accept_all(document_part: DocumentPart) -> int:
+    """Accept each tracked change in the stories of `document_part`.
+
+    Returns the number of changes accepted.
+    """
+    return _resolve_all(document_part, accept=True)
+
+
+def iter_text(body: BaseOxmlElement, view: WD_REVISIONS_VIEW) -> Iterator[str]:
+    """Generate the text of each paragraph of `body` as it reads in `view`.
+
+    Paragraphs in tables and block-level content controls are included, in document
+    order. A paragraph whose mark is deleted in `view` is joined to the paragraph
+    following it, and the rows and cells deleted in `view` are skipped, so the text is
+    that of the paragraphs the document has once its changes are accepted (or rejected).
+    """
+    removed = _del_tags if view == WD_REVISIONS_VIEW.FINAL else _ins_tags
+    removed_cell = qn("w:cellDel") if view == WD_REVISIONS_VIEW.FINAL else qn("w:cellIns")
+    pending: List[str] = []
+    stack = [iter(body)]
+    while stack:
+        element = next(stack[-1], None)
+        if element is None:
+            stack.pop()
+            continue
+        tag = element.tag
+        if tag == _p_tag:
+            text = paragraph_text(element, view)  # pyright: ignore[reportArgumentType]
+            if _has_marker(element, (_pPr_tag, _rPr_tag), removed) and (
+                _joins_next(element) is not None
+            ):
+                pending.append(text)
+                continue
+            yield "".join(pending) + text
+            pending = []
+        elif tag == _tr_tag:
+            if not _has_marker(element, (_trPr_tag,), removed):
+                stack.append(iter(element))
+        elif tag == _tc_tag:
+            if not _has_marker(element, (_tcPr_tag,), frozenset((removed_cell,))):
+                stack.append(iter(element))
+        elif tag in (_tbl_tag, _sdt_tag, _sdtContent_tag):
+            stack.append(iter(element))
+
+
+def paragraph_text(p: CT_P, view: WD_REVISIONS_VIEW) -> str:
+    """The text of paragraph `p` with its tracked changes accepted or rejected."""
+    skipped = _del_tags if view == WD_REVISIONS_VIEW.FINAL else _ins_tags
+    pieces: List[str] = []
+
+    def collect(parent: BaseOxmlElement, deleted: bool):
+        for child in parent.iterchildren():
+            tag = child.tag
+            if tag == _r_tag:
+                pieces.append(_deleted_run_text(child) if deleted else child.text)
+            elif tag in skipped:
+                continue
+            elif tag in _del_tags:
+                collect(child, True)
+            elif tag in _ins_tags or tag in _run_container_tags:
+                collect(child, deleted)
+
+    collect(p, False)
+    return "".join(pieces)
+
+
+def reject_all(document_part: DocumentPart) -> int:
+    """Reject each tracked change in the stories of `document_part`.
+
+    Returns the number of changes rejected.
+    """
+    return _resolve_all(document_part, accept=False)
+
+
+def _deleted_run_text(r: BaseOxmlElement) -> str:
+    """The text of deleted run `r`, held in `w:delText` rather than `w:t` elements."""
+    return "".join(
+        (e.text or "") if e.tag == _delText_tag else str(e)
+        for e in r.iterchildren(*_deleted_run_text_tags)
+    )
+
+
+def _has_marker(element: BaseOxmlElement, path: Tuple[str, ...], tags: frozenset[str]) -> bool:
+    """True when the properties of `element` at `path` hold a child in `tags`."""
+    for tag in path:
+        element = next(element.iterchildren(tag), None)
+        if element is None:
+            return False
+    return any(child.tag in tags for child in element.iterchildren())
+
+
+def _joins_next(p: BaseOxmlElement) -> BaseOxmlElement | None:
+    """The paragraph `p` is joined to when its mark goes, |None| when it stays apart.
+
+    That is the paragraph directly following it, unless `p` ends a section.
+    """
+    next_p = p.getnext()
+    if next_p is None or next_p.tag != _p_tag:
+        return None
+    pPr = next(p.iterchildren(_pPr_tag), None)
+    if pPr is not None and next(pPr.iterchildren(_sectPr_tag), None) is not None:
+        return None
+    return next_p
+
+
+def _is_attached(revision: Revision) -> bool:
+    ancestors = list(revision.element.iterancestors())
+    return bool(ancestors) and ancestors[-1] is revision.part.element
+
+
+def _remove(element: BaseOxmlElement):
+    parent = element.getparent()
+    if parent is not None:
+        parent.remove(element)
+
+
+def _resolve(
+    element: BaseOxmlElement,
+    accept: bool,
+    merged: List[BaseOxmlElement],
+    shortened: List[BaseOxmlElement],
+):
+    """Accept or reject the change recorded by `element`.
+
+    A paragraph whose mark goes is added to `merged`, to be joined to the paragraph
+    following it once all changes are resolved, and a table losing a row to `shortened`.
+    """
+    tag = element.tag
+    parent = element.getparent()
+    if parent is None:
+        return
+    if tag in _property_change_tags:
+        if accept:
+            parent.remove(element)
+        else:
+            _restore_properties(element)
+        return
+    if tag in _cell_tags:
+        removed = tag == (qn("w:cellDel") if accept else qn("w:cellIns"))
+        _remove(parent.getparent() if removed else element)
+        return
+
+    # -- an insertion, deletion or move --
+    kept = (tag in _ins_tags) == accept
+    if parent.tag == _rPr_tag:
+        parent.remove(element)
+        pPr = parent.getparent()
+        if not kept and pPr is not None and pPr.tag == _pPr_tag:
+            merged.append(pPr.getparent())
+    elif parent.tag == _trPr_tag:
+        tr = parent.getparent()
+        if kept or tr is None:
+            parent.remove(element)
+        else:
+            shortened.append(tr.getparent())
+            _remove(tr)
+    elif parent.tag == _numPr_tag:
+        _remove(element if kept else parent)
+    elif kept:
+        if tag in _del_tags:
+            for e in list(element.iter(_delText_tag, _delInstrText_tag)):
+                e.tag = qn("w:t") if e.tag == _delText_tag else qn("w:instrText")
+        for child in list(element):
+            element.addprevious(child)
+        parent.remove(element)
+    else:
+        parent.remove(element)
+
+
+def _resolve_all(document_part: DocumentPart, accept: bool) -> int:
+    count = 0
+    for part in document_part.iter_story_parts():
+        merged: List[BaseOxmlElement] = []
+        shortened: List[BaseOxmlElement] = []
+        for element in list(part.element.iter(*_kinds, *_move_range_tags)):
+            if element.tag in _move_range_tags:
+                _remove(element)
+                continue
+            count += 1
+            _resolve(element, accept, merged, shortened)
+        # -- join paragraphs to the next in reverse, so each run moves only once --
+        for p in reversed(merged):
+            next_p = _joins_next(p)
+            if next_p is None:
+                continue
+            anchor = next(next_p.iterchildren(_pPr_tag), None)
+            for child in list(p):
+                if child.tag == _pPr_tag:
+                    continue
+                if anchor is None:
+                    next_p.insert(0, child)
+                else:
+                    anchor.addnext(child)
+                anchor = child
+            _remove(p)
+        # -- a table left without rows goes too --
+        for tbl in shortened:
+            if tbl is not None and next(tbl.iterchildren(_tr_tag), None) is None:
+                _remove(tbl)
+    document_part.revision_index.refresh()
+    return count
+
+
+def _restore_properties(change: BaseOxmlElement):
+    """Replace the properties holding `change` by the former ones `change` records."""
+    properties = change.getparent()
+    leading, trailing = _kept_properties.get(properties.tag, (frozenset(), frozenset()))
+    former = list(change[0]) if len(change) else []
+    head = [e for e in properties if e.tag in leading]
+    tail = [e for e in properties if e.tag in trailing]
+    for e in list(properties):
+        properties.remove(e)
+    properties.extend(head + former + tail)
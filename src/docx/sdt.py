@@ -0,0 +1,348 @@
+"""Content controls (`w:sdt`), the fields of forms and templates, found by tag, alias or id.
+
+A content control wraps a run-level range of a paragraph or block-level content like
+paragraphs, table rows or cells in a `w:sdtContent` element, and carries its name in the
+`w:tag` and `w:alias` of its `w:sdtPr`. Content controls of a document are indexed in one
+pass over its stories the first time one is looked up, so filling hundreds of them
+doesn't search the document for each one.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Mapping, NamedTuple, Tuple
+
+from docx.oxml.ns import qn
+from docx.oxml.parser import OxmlElement
+
+if TYPE_CHECKING:
+    from docx.oxml.text.run import CT_R
+    from docx.oxml.xmlchemy import BaseOxmlElement
+    from docx.parts.document import DocumentPart
+    from docx.parts.story import StoryPart
+
+_alias_tag = qn("w:alias")
+_id_tag = qn("w:id")
+_p_tag = qn("w:p")
+_pPr_tag = qn("w:pPr")
+_r_tag = qn("w:r")
+_rPr_tag = qn("w:rPr")
+_sdt_tag = qn("w:sdt")
+_sdtContent_tag = qn("w:sdtContent")
+_sdtPr_tag = qn("w:sdtPr")
+_showingPlcHdr_tag = qn("w:showingPlcHdr")
+_tag_tag = qn("w:tag")
+_w_val = qn("w:val")
+# -- elements whose content controls are block-level, holding paragraphs or tables --
+_block_container_tags = frozenset(
+    qn(tag)
+    for tag in (
+        "w:body",
+        "w:comment",
+        "w:endnote",
+        "w:footnote",
+        "w:ftr",
+        "w:hdr",
+        "w:tbl",
+        "w:tc",
+        "w:tr",
+        "w:txbxContent",
+    )
+)
+# -- parents of a content control wrapping table rows or cells rather than blocks --
+_row_container_tags = frozenset((qn("w:tbl"), qn("w:tr")))
+# -- children of a paragraph contributing to `Paragraph.text` --
+_text_container_tags = frozenset(qn(tag) for tag in ("w:r", "w:hyperlink", "w:fldSimple", "w:sdt"))
+
+_Entry = Tuple["BaseOxmlElement", "StoryPart"]
+
+
+class _Tables(NamedTuple):
+    entries: List[_Entry]
+    by_tag: Dict[str, List[_Entry]]
+    by_alias: Dict[str, List[_Entry]]
+    by_id: Dict[int, List[_Entry]]
+
+
+class ContentControlIndex:
+    """The content controls in the stories of a document, by tag, alias and id.
+
+    Each control is given as an `(sdt, part)` pair of its `w:sdt` element and the story
+    part holding it. The index is built in a single pass over the body, headers, footers,
+    footnotes and endnotes when first used. A lookup finding a control that has since
+    been removed from the document rebuilds the index; controls added by other means are
+    only seen after :meth:`refresh`.
+    """
+
+    def __init__(self, document_part: DocumentPart):
+        self._document_part = document_part
+        self._tables: _Tables | None = None
+
+    def __iter__(self) -> Iterator[_Entry]:
+        return iter(list(self._index.entries))
+
+    def __len__(self) -> int:
+        return len(self._index.entries)
+
+    def by_alias(self, alias: str) -> List[_Entry]:
+        """Each content control having `alias`, in document order."""
+        return self._lookup(lambda tables: tables.by_alias.get(alias, []))
+
+    def by_id(self, sdt_id: int) -> _Entry | None:
+        """The content control having `sdt_id`, |None| when there is no such control."""
+        entries = self._lookup(lambda tables: tables.by_id.get(sdt_id, []))
+        return entries[0] if entries else None
+
+    def by_tag(self, tag: str) -> List[_Entry]:
+        """Each content control having `tag`, in document order."""
+        return self._lookup(lambda tables: tables.by_tag.get(tag, []))
+
+    def next_id(self) -> int:
+        """An id greater than that of any content control in the document."""
+        return max(self._index.by_id, default=0) + 1
+
+    def refresh(self):
+        """Forget the index, which is built again when next used."""
+        self._tables = None
+
+    @property
+    def _index(self) -> _Tables:
+        tables = self._tables
+        if tables is None:
+            tables = self._tables = self._build()
+        return tables
+
+    def _build(self) -> _Tables:
+        tables = _Tables([], {}, {}, {})
+        for part in self._document_part.iter_story_parts():
+            for sdt in part.element.iter(_sdt_tag):
+                entry = (sdt, part)
+                tables.entries.append(entry)
+                tag, alias, sdt_id = _sdtPr_vals(sdt)
+                if tag is not None:
+                    tables.by_tag.setdefault(tag, []).append(entry)
+                if alias is not None:
+                    tables.by_alias.setdefault(alias, []).append(entry)
+                if sdt_id is not None:
+                    tables.by_id.setdefault(sdt_id, []).append(entry)
+        return tables
+
+    def _lookup(self, find: Callable[[_Tables], List[_Entry]]) -> List[_Entry]:
+        entries = find(self._index)
+        if not all(_is_attached(entry) for entry in entries):
+            self.refresh()
+            entries = find(self._index)
+        return list(entries)
+
+
+class ContentControl:
+    """A content control (structured document tag) of a document.
+
+    Either run-level, a range of a paragraph, or block-level, holding paragraphs and
+    tables, table rows or table cells.
+    """
+
+    def __init__(self, sdt: BaseOxmlElement, part: StoryPart):
+        self._sdt = sdt
+        self._part = part
+
+    def __repr__(self) -> str:
+        return "ContentControl(tag=%r, alias=%r)" % (self.tag, self.alias)
+
+    @property
+    def alias(self) -> str | None:
+        """The friendly name of the control (`w:alias`), |None| when it has none."""
+        return _sdtPr_vals(self._sdt)[1]
+
+    @property
+    def element(self) -> BaseOxmlElement:
+        """The `w:sdt` element of the control."""
+        return self._sdt
+
+    def fill(self, value: str | None):
+        """Replace the content of the control with the text `value`.
+
+        The formatting of the first paragraph and run of the current content is kept,
+        or the run properties of the control itself when it shows its placeholder. Tabs
+        and line breaks in `value` become tab and break elements; for a block-level
+        control each line of `value` becomes a paragraph. |None| empties the control.
+        """
+        _fill(self._sdt, value)
+
+    @property
+    def id(self) -> int | None:
+        """The `w:id` of the control, |None| when it has none."""
+        return _sdtPr_vals(self._sdt)[2]
+
+    @property
+    def is_inline(self) -> bool:
+        """True when this is a run-level control, in a paragraph."""
+        return _is_inline(self._sdt)
+
+    @property
+    def part(self) -> StoryPart:
+        """The story part the control is in."""
+        return self._part
+
+    @property
+    def tag(self) -> str | None:
+        """The tag of the control (`w:tag`), |None| when it has none."""
+        return _sdtPr_vals(self._sdt)[0]
+
+    @property
+    def text(self) -> str:
+        """The text of the control, with a newline between paragraphs."""
+        content = next(self._sdt.iterchildren(_sdtContent_tag), None)
+        if content is None:
+            return ""
+        if _is_inline(self._sdt):
+            return _inline_text(content)
+        return "\n".join(_inline_text(p) for p in content.iter(_p_tag))
+
+
+class ContentControls:
+    """The content controls of a document, in its body and in its other stories.
+
+    Supports `len()` and iteration. Lookups use the content-control index of the
+    document part.
+    """
+
+    def __init__(self, document_part: DocumentPart):
+        self._document_part = document_part
+
+    def __iter__(self) -> Iterator[ContentControl]:
+        return (ContentControl(sdt, part) for sdt, part in self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def fill(self, values: Mapping[str, str | None]) -> int:
+        """Fill each control having a tag in `values` with the text mapped to that tag.
+
+        Returns the number of controls filled. Tags matching no control are ignored. See
+        :meth:`.ContentControl.fill`.
+        """
+        index = self._index
+        filled = 0
+        nested = False
+        for tag, value in values.items():
+            for sdt, _ in index.by_tag(tag):
+                nested = _fill(sdt, value) or nested
+                filled += 1
+        if nested:
+            index.refresh()
+        return filled
+
+    def get_by_alias(self, alias: str) -> List[ContentControl]:
+        """Each control having the friendly name `alias`, in document order."""
+        return [ContentControl(sdt, part) for sdt, part in self._index.by_alias(alias)]
+
+    def get_by_id(self, sdt_id: int) -> ContentControl | None:
+        """The control having `w:id` `sdt_id`, |None| when there is no such control."""
+        entry = self._index.by_id(sdt_id)
+        return None if entry is None else ContentControl(*entry)
+
+    def get_by_tag(self, tag: str) -> List[ContentControl]:
+        """Each control having `tag`, in document order."""
+        return [ContentControl(sdt, part) for sdt, part in self._index.by_tag(tag)]
+
+    @property
+    def _index(self) -> ContentControlIndex:
+        return self._document_part.content_control_index
+
+
+def _fill(sdt: BaseOxmlElement, value: str | None) -> bool:
+    """Replace the content of `sdt` with `value`, returning True when it held a control."""
+    value = value or ""
+    sdtPr = next(sdt.iterchildren(_sdtPr_tag), None)
+    content = next(sdt.iterchildren(_sdtContent_tag), None)
+    if content is None:
+        content = OxmlElement("w:sdtContent")
+        sdt.append(content)
+    had_controls = next(content.iter(_sdt_tag), None) is not None
+
+    # -- run properties of the control apply while it shows its placeholder --
+    showingPlcHdr = None if sdtPr is None else next(sdtPr.iterchildren(_showingPlcHdr_tag), None)
+    first_r = next(content.iter(_r_tag), None)
+    rPr = None if first_r is None else next(first_r.iterchildren(_rPr_tag), None)
+    if (showingPlcHdr is not None or rPr is None) and sdtPr is not None:
+        rPr = next(sdtPr.iterchildren(_rPr_tag), None)
+    if showingPlcHdr is not None:
+        sdtPr.remove(showingPlcHdr)  # pyright: ignore[reportOptionalMemberAccess]
+
+    if _is_inline(sdt):
+        _replace_children(content, [_new_r(rPr, value)])
+        return had_controls
+
+    first_p = next(content.iter(_p_tag), None)
+    pPr = None if first_p is None else next(first_p.iterchildren(_pPr_tag), None)
+    parent = sdt.getparent()
+    if first_p is not None and parent is not None and parent.tag in _row_container_tags:
+        # -- a row or cell control; the cell keeps its properties and one paragraph --
+        for p in list(first_p.itersiblings(_p_tag)):
+            p.getparent().remove(p)
+        _replace_children(first_p, [e for e in (pPr, _new_r(rPr, value)) if e is not None])
+        return had_controls
+
+    _replace_children(content, [_new_p(pPr, rPr, line) for line in value.split("\n")])
+    return had_controls
+
+
+def _inline_text(element: BaseOxmlElement) -> str:
+    return "".join(e.text for e in element.iterchildren() if e.tag in _text_container_tags)
+
+
+def _is_attached(entry: _Entry) -> bool:
+    """True when the control of `entry` is still in its story."""
+    sdt, part = entry
+    ancestors = list(sdt.iterancestors())
+    return bool(ancestors) and ancestors[-1] is part.element
+
+
+def _is_inline(sdt: BaseOxmlElement) -> bool:
+    """True when `sdt` is a run-level control, in a paragraph."""
+    for ancestor in sdt.iterancestors():
+        if ancestor.tag == _p_tag:
+            return True
+        if ancestor.tag in _block_container_tags:
+            return False
+    return False
+
+
+def _new_p(pPr: BaseOxmlElement | None, rPr: BaseOxmlElement | None, text: str):
+    p = OxmlElement("w:p")
+    if pPr is not None:
+        p.append(copy.deepcopy(pPr))
+    p.append(_new_r(rPr, text))
+    return p
+
+
+def _new_r(rPr: BaseOxmlElement | None, text: str) -> CT_R:
+    r: CT_R = OxmlElement("w:r")  # pyright: ignore[reportAssignmentType]
+    if rPr is not None:
+        r.append(copy.deepcopy(rPr))
+    r.text = text
+    return r
+
+
+def _replace_children(parent: BaseOxmlElement, children: List[BaseOxmlElement]):
+    for child in list(parent):
+        parent.remove(child)
+    parent.extend(children)
+
+
+def _sdtPr_vals(sdt: BaseOxmlElement) -> Tuple[str | None, str | None, int | None]:
+    """The `(tag, alias, id)` of `sdt`, each |None| when not present."""
+    tag = alias = sdt_id = None
+    sdtPr = next(sdt.iterchildren(_sdtPr_tag), None)
+    if sdtPr is None:
+        return None, None, None
+    for child in sdtPr.iterchildren(_tag_tag, _alias_tag, _id_tag):
+        val = child.get(_w_val)
+        if child.tag == _tag_tag:
+            tag = val
+        elif child.tag == _alias_tag:
+            alias = val
+        elif val is not None and val.lstrip("-").isdigit():
+            sdt_id = int(val)
+    return tag, alias, sdt_id
@@ -18,7 +18,7 @@ if TYPE_CHECKING:
     from docx.oxml.section import CT_SectPr
     from docx.parts.document import DocumentPart
     from docx.parts.story import StoryPart
-    from docx.shared import Length
+    from docx.shared import Length, ProxyCache
 
 
 class Section:
@@ -298,6 +298,7 @@ class _BaseHeaderFooter(BlockItemContainer):
         self._sectPr = sectPr
         self._document_part = document_part
         self._hdrftr_index = header_footer_index
+        self._views = {}
 
     @property
     def is_linked_to_previous(self) -> bool:
@@ -353,6 +354,15 @@ class _BaseHeaderFooter(BlockItemContainer):
         """`w:hdr` or `w:ftr` element, root of header/footer part."""
         return self._get_or_add_definition().element
 
+    @property
+    def _proxy_cache(self) -> ProxyCache | None:
+        """Proxy cache of the header/footer part, |None| when not enabled.
+
+        Overrides the `BlockItemContainer` lookup, which relies on a parent object that a
+        header or footer does not have.
+        """
+        return self._get_or_add_definition().proxy_cache
+
     def _get_or_add_definition(self) -> HeaderPart | FooterPart:
         """Return HeaderPart or FooterPart object for this section.
 
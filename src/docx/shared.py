@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import functools
+import weakref
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -10,9 +11,11 @@ from typing import (
     Generic,
     Iterator,
     List,
+    Sequence,
     Tuple,
     TypeVar,
     cast,
+    overload,
 )
 
 if TYPE_CHECKING:
@@ -284,6 +287,8 @@ class ElementProxy:
     common type of class in python-docx other than custom element (oxml) classes.
     """
 
+    __slots__ = ("_element", "_parent", "__weakref__")
+
     def __init__(self, element: BaseOxmlElement, parent: t.ProvidesXmlPart | None = None):
         self._element = element
         self._parent = parent
@@ -317,6 +322,11 @@ class ElementProxy:
             raise ValueError("part is not accessible from this element")
         return self._parent.part
 
+    @property
+    def _proxy_cache(self) -> ProxyCache | None:
+        """Proxy cache of the part containing this object, |None| when not enabled."""
+        return getattr(self._parent, "_proxy_cache", None)
+
 
 class Parented:
     """Provides common services for document elements that occur below a part but may
@@ -326,6 +336,8 @@ class Parented:
     Provides ``self._parent`` attribute to subclasses.
     """
 
+    __slots__ = ("_parent", "__weakref__")
+
     def __init__(self, parent: t.ProvidesXmlPart):
         self._parent = parent
 
@@ -334,6 +346,11 @@ class Parented:
         """The package part containing this object."""
         return self._parent.part
 
+    @property
+    def _proxy_cache(self) -> ProxyCache | None:
+        """Proxy cache of the part containing this object, |None| when not enabled."""
+        return getattr(self._parent, "_proxy_cache", None)
+
 
 class StoryChild:
     """A document element within a story part.
@@ -346,6 +363,8 @@ class StoryChild:
     Provides `self._parent` attribute to subclasses.
     """
 
+    __slots__ = ("_parent", "__weakref__")
+
     def __init__(self, parent: t.ProvidesStoryPart):
         self._parent = parent
 
@@ -354,6 +373,126 @@ class StoryChild:
         """The package part containing this object."""
         return self._parent.part
 
+    @property
+    def _proxy_cache(self) -> ProxyCache | None:
+        """Proxy cache of the story part containing this object, |None| when not enabled."""
+        return getattr(self._parent, "_proxy_cache", None)
+
+
+class ProxyCache:
+    """Weak map from an oxml element to the proxy object constructed for it.
+
+    When enabled on a story part, traversals like `document.paragraphs` or
+    `table.rows[i].cells` return the proxy already constructed for an element, as long
+    as that proxy is still referenced elsewhere, rather than allocating a new one. Entries
+    are dropped as soon as their proxy is garbage-collected so the cache never keeps a
+    proxy, or the element it wraps, alive on its own.
+
+    A cached proxy keeps the parent it was constructed with, so an element moved to a
+    different story part should not be reached through a cache enabled before the move.
+    """
+
+    __slots__ = ("_proxies",)
+
+    def __init__(self):
+        self._proxies: weakref.WeakValueDictionary[Tuple[Any, BaseOxmlElement], Any] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def __len__(self) -> int:
+        return len(self._proxies)
+
+    def get(self, proxy_cls: Callable[[Any, Any], T], element: BaseOxmlElement, parent: Any) -> T:
+        """Return the `proxy_cls` proxy for `element`, constructing it when not cached.
+
+        A new proxy is constructed as `proxy_cls(element, parent)`.
+        """
+        key = (proxy_cls, element)
+        proxy = self._proxies.get(key)
+        if proxy is None:
+            proxy = self._proxies[key] = proxy_cls(element, parent)
+        return proxy
+
+
+class ProxySequence(Sequence[T]):
+    """Read-only sequence of proxy objects, each created on first access.
+
+    Holds the elements to be proxied, typically the result of a single `findall()`, and
+    constructs the proxy for an element, as `proxy_cls(element, parent)`, only when that
+    item is accessed. When a |ProxyCache| is provided, a proxy already constructed for
+    the element is reused. The proxy is retained so the same object is returned on each
+    subsequent access, by index or iteration, of this sequence. Once the sequence is
+    obtained, `len()` and indexed access do not depend on the number of elements;
+    obtaining it costs the `findall()`. A block-item container returns the same
+    sequence until the document changes, so that cost is paid once per change.
+
+    Like the list it replaces, the sequence is a snapshot of the elements present when
+    it was obtained and does not reflect content added or removed afterward.
+    """
+
+    def __init__(
+        self,
+        elements: Sequence[BaseOxmlElement],
+        proxy_cls: Callable[[Any, Any], T],
+        parent: Any,
+        cache: ProxyCache | None = None,
+    ):
+        self._elements = elements
+        self._proxy_cls = proxy_cls
+        self._parent = parent
+        self._cache = cache
+        self._proxies: List[T | None] = [None] * len(elements)
+
+    def __eq__(self, other: object) -> bool:
+        """Equal to any sequence having equal items in the same order, like a list."""
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        other = cast(Sequence[object], other)
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __ne__(self, other: object) -> bool:
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+    @overload
+    def __getitem__(self, idx: int) -> T: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> List[T]: ...
+
+    def __getitem__(self, idx: int | slice) -> T | List[T]:
+        if isinstance(idx, slice):
+            return [self._proxy(i) for i in range(*idx.indices(len(self._elements)))]
+        if idx < 0:
+            idx += len(self._elements)
+        if not 0 <= idx < len(self._elements):
+            raise IndexError("proxy sequence index out of range")
+        return self._proxy(idx)
+
+    def __iter__(self) -> Iterator[T]:
+        return (self._proxy(idx) for idx in range(len(self._elements)))
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __repr__(self) -> str:
+        return "%s(%r)" % (type(self).__name__, list(self))
+
+    def _proxy(self, idx: int) -> T:
+        """The proxy for the element at `idx`, created on first access."""
+        proxy = self._proxies[idx]
+        if proxy is None:
+            element, cache = self._elements[idx], self._cache
+            proxy = (
+                self._proxy_cls(element, self._parent)
+                if cache is None
+                else cache.get(self._proxy_cls, element, self._parent)
+            )
+            self._proxies[idx] = proxy
+        return proxy
+
 
 class TextAccumulator:
     """Accepts `str` fragments and joins them together, in order, on `.pop().
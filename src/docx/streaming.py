@@ -0,0 +1,217 @@
+"""|StreamingDocumentWriter|, for generating very large documents in bounded memory.
+
+A document built with |Document| keeps its whole `w:body` element tree in memory until
+it is saved. The writer here instead serializes body content into the
+`word/document.xml` member of the package as it is added, keeping only a small batch of
+recent block items in memory. All other parts (styles, numbering, images, headers and so
+on) are handled by the normal part machinery and written when the writer is closed.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import IO, TYPE_CHECKING, Iterable, Sequence, Tuple
+
+from lxml import etree
+
+from docx.api import Document
+from docx.opc.oxml import serialize_part_xml
+from docx.opc.phys_pkg import PhysPkgWriter
+from docx.opc.pkgwriter import PackageWriter
+
+if TYPE_CHECKING:
+    import docx.document
+    from docx.oxml.document import CT_Body
+    from docx.shape import InlineShape
+    from docx.shared import Length
+    from docx.styles.style import ParagraphStyle, _TableStyle
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+
+
+class StreamingDocumentWriter:
+    """Write-only document that streams its body content into `file` as it is added.
+
+    `template` is the path or stream of a document to start from, like the argument to
+    |Document|; the default template is used when it is |None|. Body content already in
+    the template comes first, followed by the block items added with :meth:`paragraph`,
+    :meth:`table` and :meth:`picture`. The last section properties of the template
+    apply to the whole generated body.
+
+    Each of those methods returns the proxy for the new block item, which can be
+    further changed, for example by adding runs to a paragraph, until the next block
+    item is added. After that it may already have been written and changes to it are
+    lost.
+
+    The package is complete only once :meth:`close` has been called, which happens
+    automatically when the writer is used as a context manager::
+
+        with StreamingDocumentWriter("report.docx") as writer:
+            for record in records:
+                writer.paragraph(record.title, style="Heading 2")
+    """
+
+    _batch_size = 256
+
+    def __init__(self, file: str | IO[bytes], template: str | IO[bytes] | None = None):
+        self._document = Document(template)
+        document_part = self._document.part
+        self._phys_writer = PhysPkgWriter(file)
+        self._file = self._phys_writer.open(document_part.partname)
+        self._next_shape_id = document_part.next_id
+        self._closed = False
+
+        head, self._tail = self._document_xml_ends()
+        self._file.write(head)
+        self._flush()
+
+    def __enter__(self) -> StreamingDocumentWriter:
+        return self
+
+    def __exit__(self, *exc_info: object):
+        self.close()
+
+    def close(self):
+        """Write the remainder of the document and the other parts of the package.
+
+        Has no effect when the writer is already closed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._flush(include_sectPr=True)
+        self._file.write(self._tail)
+        self._file.close()
+
+        document_part = self._document.part
+        package = document_part.package
+        assert package is not None
+        parts = package.parts
+        for part in parts:
+            part.before_marshal()
+        PackageWriter.write_remaining(self._phys_writer, package.rels, parts, (document_part,))
+
+    @property
+    def document(self) -> docx.document.Document:
+        """The |Document| being written.
+
+        Use it for things outside the body, like styles, sections, headers, footers and
+        core properties. Its body holds at most the most recently added block items, so
+        it is not a view of the generated content.
+        """
+        return self._document
+
+    def paragraph(self, text: str = "", style: str | ParagraphStyle | None = None) -> Paragraph:
+        """Return a new paragraph added at the end of the document.
+
+        `text` and `style` are as for :meth:`.Document.add_paragraph`.
+        """
+        self._make_room()
+        return self._document.add_paragraph(text, style)
+
+    def picture(
+        self,
+        image_path_or_stream: str | IO[bytes],
+        width: int | Length | None = None,
+        height: int | Length | None = None,
+    ) -> InlineShape:
+        """Return a new picture added in its own paragraph at the end of the document.
+
+        Arguments are as for :meth:`.Document.add_picture`. An image used more than once
+        is stored in the package only once.
+        """
+        self._make_room()
+        inline_shape = self._document.add_picture(image_path_or_stream, width, height)
+        # -- the part can only see ids in the body content not yet written, so shape ids
+        # -- are allocated here to keep them unique across the whole document.
+        docPr = inline_shape._inline.docPr  # pyright: ignore[reportPrivateUsage]
+        docPr.id = self._next_shape_id
+        docPr.name = "Picture %d" % self._next_shape_id
+        self._next_shape_id += 1
+        return inline_shape
+
+    def table(self, rows: Iterable[Sequence[str]], style: str | _TableStyle | None = None) -> Table:
+        """Return a new table added at the end of the document, containing `rows`.
+
+        Each item in `rows` is a sequence of cell text for one row. The table has as
+        many columns as the longest row; cells beyond the end of a shorter row are left
+        empty. `style` is as for :meth:`.Document.add_table`.
+        """
+        row_values = [list(values) for values in rows]
+        col_count = max((len(values) for values in row_values), default=0)
+        if col_count == 0:
+            raise ValueError("table must have at least one column")
+
+        self._make_room()
+        table = self._document.add_table(len(row_values), col_count, style)
+        for row, values in zip(table.rows, row_values):
+            for cell, text in zip(row.cells, values):
+                cell.text = text
+        return table
+
+    @property
+    def _body(self) -> CT_Body:
+        """The `w:body` element of the document, holding block items not yet written."""
+        return self._document.element.body
+
+    def _document_xml_ends(self) -> Tuple[bytes, bytes]:
+        """(head, tail) pair of the serialized document part surrounding body content.
+
+        `head` runs from the XML declaration through the `w:body` start tag and `tail`
+        from the `w:body` end tag to the end of the part. The part is serialized with a
+        comment as the only child of the body and split around it, so the start tag comes
+        out as lxml writes it, whatever its attributes, namespace declarations and
+        surrounding whitespace.
+        """
+        body = self._body
+        children = list(body)
+        for child in children:
+            body.remove(child)
+        sentinel = etree.Comment(" body content %s " % uuid.uuid4().hex)
+        body.append(sentinel)
+        try:
+            xml = serialize_part_xml(self._document.element)
+        finally:
+            body.remove(sentinel)
+            body.extend(children)
+
+        head, tail = xml.split(etree.tostring(sentinel, with_tail=False))
+        return head, tail
+
+    @property
+    def _body_qname(self) -> bytes:
+        """Prefixed tag name of the `w:body` element as it appears in the XML."""
+        body = self._body
+        localname = etree.QName(body).localname
+        qname = localname if body.prefix is None else "%s:%s" % (body.prefix, localname)
+        return qname.encode("utf-8")
+
+    def _flush(self, include_sectPr: bool = False):
+        """Write the block items in the body to the document part and remove them.
+
+        The body `w:sectPr` is written only when `include_sectPr` is |True|; otherwise
+        it stays in place so section-dependent behaviors like table width keep working.
+        """
+        body = self._body
+        sectPr = None if include_sectPr else body.sectPr
+        if sectPr is not None:
+            body.remove(sectPr)
+
+        if len(body):
+            # -- Serializing the body rather than each block item means namespace
+            # -- declarations appear once, on the body start tag, which is discarded.
+            xml = etree.tostring(body, encoding="UTF-8", with_tail=False)
+            start = xml.index(b">") + 1
+            end = len(xml) - len(b"</%s>" % self._body_qname)
+            self._file.write(xml[start:end])
+            del body[:]
+
+        if sectPr is not None:
+            body.append(sectPr)
+
+    def _make_room(self):
+        """Prepare to add a block item, writing pending block items if there are many."""
+        if self._closed:
+            raise ValueError("cannot add content to a closed StreamingDocumentWriter")
+        if len(self._body) > self._batch_size:
+            self._flush()
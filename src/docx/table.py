@@ -29,6 +29,9 @@ TableParent: TypeAlias = "Table | _Columns | _Rows"
 class Table(StoryChild):
     """Proxy class for a WordprocessingML ``<w:tbl>`` element."""
 
+    # -- `__dict__` holds the values of the `.columns` and `.rows` lazyproperties --
+    __slots__ = ("_element", "_tbl", "__dict__")
+
     def __init__(self, tbl: CT_Tbl, parent: t.ProvidesStoryPart):
         super(Table, self).__init__(parent)
         self._element = tbl
@@ -168,6 +171,7 @@ class Table(StoryChild):
         repeated.
         """
         col_count = self._column_count
+        cache = self._proxy_cache
         cells: list[_Cell] = []
         for tc in self._tbl.iter_tcs():
             for grid_span_idx in range(tc.grid_span):
@@ -176,7 +180,7 @@ class Table(StoryChild):
                 elif grid_span_idx > 0:
                     cells.append(cells[-1])
                 else:
-                    cells.append(_Cell(tc, self))
+                    cells.append(_Cell(tc, self) if cache is None else cache.get(_Cell, tc, self))
         return cells
 
     @property
@@ -192,6 +196,8 @@ class Table(StoryChild):
 class _Cell(BlockItemContainer):
     """Table cell."""
 
+    __slots__ = ("_tc",)
+
     def __init__(self, tc: CT_Tc, parent: TableParent):
         super(_Cell, self).__init__(tc, cast("t.ProvidesStoryPart", parent))
         self._parent = parent
@@ -314,6 +320,8 @@ class _Cell(BlockItemContainer):
 class _Column(Parented):
     """Table column."""
 
+    __slots__ = ("_gridCol",)
+
     def __init__(self, gridCol: CT_TblGridCol, parent: TableParent):
         super(_Column, self).__init__(parent)
         self._parent = parent
@@ -350,6 +358,8 @@ class _Columns(Parented):
     Supports ``len()``, iteration and indexed access.
     """
 
+    __slots__ = ("_tbl",)
+
     def __init__(self, tbl: CT_Tbl, parent: TableParent):
         super(_Columns, self).__init__(parent)
         self._parent = parent
@@ -387,6 +397,8 @@ class _Columns(Parented):
 class _Row(Parented):
     """Table row."""
 
+    __slots__ = ("_tr", "_element")
+
     def __init__(self, tr: CT_Row, parent: TableParent):
         super(_Row, self).__init__(parent)
         self._parent = parent
@@ -407,6 +419,8 @@ class _Row(Parented):
 
         """
 
+        cache = self._proxy_cache
+
         def iter_tc_cells(tc: CT_Tc) -> Iterator[_Cell]:
             """Generate a cell object for each layout-grid cell in `tc`.
 
@@ -426,7 +440,8 @@ class _Row(Parented):
 
             # -- Otherwise, vMerge is either "restart" or None, meaning this `tc` holds the actual
             # -- content of the cell (whether it is vertically merged or not).
-            cell = _Cell(tc, self.table)
+            table = self.table
+            cell = _Cell(tc, table) if cache is None else cache.get(_Cell, tc, table)
             for _ in range(tc.grid_span):
                 yield cell
 
@@ -510,6 +525,8 @@ class _Rows(Parented):
     Supports ``len()``, iteration, indexed access, and slicing.
     """
 
+    __slots__ = ("_tbl",)
+
     def __init__(self, tbl: CT_Tbl, parent: TableParent):
         super(_Rows, self).__init__(parent)
         self._parent = parent
@@ -523,10 +540,13 @@ class _Rows(Parented):
 
     def __getitem__(self, idx: int | slice) -> _Row | list[_Row]:
         """Provide indexed access, (e.g. `rows[0]` or `rows[1:3]`)"""
-        return list(self)[idx]
+        tr_lst = self._tbl.tr_lst
+        if isinstance(idx, slice):
+            return [self._row(tr) for tr in tr_lst[idx]]
+        return self._row(tr_lst[idx])
 
     def __iter__(self):
-        return (_Row(tr, self) for tr in self._tbl.tr_lst)
+        return (self._row(tr) for tr in self._tbl.tr_lst)
 
     def __len__(self):
         return len(self._tbl.tr_lst)
@@ -535,3 +555,8 @@ class _Rows(Parented):
     def table(self) -> Table:
         """Reference to the |Table| object this row collection belongs to."""
         return self._parent.table
+
+    def _row(self, tr: CT_Row) -> _Row:
+        """The |_Row| proxy for `tr`, reused from the proxy cache when one is enabled."""
+        cache = self._proxy_cache
+        return _Row(tr, self) if cache is None else cache.get(_Row, tr, self)
@@ -16,6 +16,8 @@ if TYPE_CHECKING:
 class SdtBlock(StoryChild):
     """Proxy object wrapping a `<w:sdt>` element."""
 
+    __slots__ = ("_sdt", "_element")
+
     def __init__(self, sdt: CT_Sdt, parent: t.ProvidesStoryPart):
         super(SdtBlock, self).__init__(parent)
         self._sdt = self._element = sdt
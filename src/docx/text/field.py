@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class Field(StoryChild):
     """Proxy object wrapping `<w:fldSimple>` element."""
 
+    __slots__ = ("_fld", "_element", "element")
+
     def __init__(self, fld: CT_FldSimple, parent: t.ProvidesStoryPart):
         super().__init__(parent)
         self._fld = self._element = self.element = fld
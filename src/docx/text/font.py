@@ -18,6 +18,8 @@ class Font(ElementProxy):
     """Proxy object for parent of a `<w:rPr>` element and providing access to
     character properties such as font name, font size, bold, and subscript."""
 
+    __slots__ = ("_r",)
+
     def __init__(self, r: CT_R, parent: Any | None = None):
         super().__init__(r, parent)
         self._element = r
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 
 
 class Footnote(BlockItemContainer):
+    __slots__ = ()
+
     def __init__(self, footnote: CT_FtnEdn, parent: FootnotesPart) -> None:
         super().__init__(footnote, parent)
         self._element = footnote
@@ -36,6 +38,8 @@ class Footnote(BlockItemContainer):
 
 
 class Footnotes(ElementProxy):
+    __slots__ = ()
+
     def __init__(self, footnotes: CT_Footnotes, parent: FootnotesPart) -> None:
         super().__init__(footnotes)
         self._element = footnotes
@@ -50,6 +54,8 @@ class Footnotes(ElementProxy):
 
 
 class Endnote(BlockItemContainer):
+    __slots__ = ()
+
     def __init__(self, endnote: CT_FtnEdn, parent: EndnotesPart) -> None:
         super().__init__(endnote, parent)
         self._element = endnote
@@ -76,6 +82,8 @@ class Endnote(BlockItemContainer):
 
 
 class Endnotes(ElementProxy):
+    __slots__ = ()
+
     def __init__(self, endnotes: CT_Endnotes, parent: EndnotesPart) -> None:
         super().__init__(endnotes)
         self._element = endnotes
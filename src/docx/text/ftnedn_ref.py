@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
 
 class FootnoteReference(StoryChild):
+    __slots__ = ("_ref", "_element", "element")
+
     def __init__(self, ref: CT_FtnEdnRef, parent: t.ProvidesStoryPart) -> None:
         super().__init__(parent)
         self._ref = self._element = self.element = ref
@@ -31,6 +33,8 @@ class FootnoteReference(StoryChild):
 
 
 class EndnoteReference(StoryChild):
+    __slots__ = ("_ref", "_element", "element")
+
     def __init__(self, ref: CT_FtnEdnRef, parent: t.ProvidesStoryPart) -> None:
         super().__init__(parent)
         self._ref = self._element = self.element = ref
@@ -9,11 +9,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from docx.shared import Parented
+from docx.shared import Parented, ProxySequence
 from docx.text.run import Run
 
 if TYPE_CHECKING:
     import docx.types as t
+    from docx.bookmarks import Bookmark
     from docx.oxml.text.hyperlink import CT_Hyperlink
 
 
@@ -25,6 +26,8 @@ class Hyperlink(Parented):
     stored.
     """
 
+    __slots__ = ("_hyperlink", "_element")
+
     def __init__(self, hyperlink: CT_Hyperlink, parent: t.ProvidesStoryPart):
         super().__init__(parent)
         self._parent = parent
@@ -43,6 +46,22 @@ class Hyperlink(Parented):
         rId = self._hyperlink.rId
         return self._parent.part.rels[rId].target_ref if rId else ""
 
+    @property
+    def bookmark(self) -> Bookmark | None:
+        """The bookmark this hyperlink jumps to, |None| when there is no such bookmark.
+
+        Also |None| when this hyperlink is not an internal link, having an address. The
+        bookmark is found by the `.fragment` of the hyperlink, using the bookmark index
+        of the document.
+        """
+        fragment = self.fragment
+        if self.address or not fragment:
+            return None
+        package = self.part.package
+        if package is None:
+            return None
+        return package.main_document_part.document.bookmarks.get(fragment)
+
     @property
     def contains_page_break(self) -> bool:
         """True when the text of this hyperlink is broken across page boundaries.
@@ -80,15 +99,19 @@ class Hyperlink(Parented):
         return self._hyperlink.innermost.anchor or ""
 
     @property
-    def runs(self) -> list[Run]:
-        """List of |Run| instances in this hyperlink.
+    def runs(self) -> ProxySequence[Run]:
+        """Sequence of |Run| instances in this hyperlink.
 
         Together these define the visible text of the hyperlink. The text of a hyperlink
         is typically contained in a single run will be broken into multiple runs if for
         example part of the hyperlink is bold or the text was changed after the document
         was saved.
+
+        Each run is constructed on first access.
         """
-        return [Run(r, self._parent) for r in self._hyperlink.innermost.r_lst]
+        return ProxySequence(
+            self._hyperlink.innermost.r_lst, Run, self._parent, self._proxy_cache
+        )
 
     @property
     def text(self) -> str:
@@ -0,0 +1,126 @@
+"""Merging of adjacent runs having the same formatting.
+
+Word splits text into a new run wherever a revision-save id or a proofing mark begins or
+ends, so a phrase that looks uniform is often stored as many runs with identical run
+properties. Merging them back makes `Paragraph.runs` shorter and `Paragraph.text` faster
+without changing how the paragraph looks.
+
+Runs are compared by the canonical (C14N) serialization of their `w:rPr`, computed once
+for each run, so two runs match when their properties are the same regardless of
+attribute order or namespace prefixes.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, List
+
+from lxml import etree
+
+from docx.oxml.ns import qn
+from docx.text.textutil import set_text
+
+if TYPE_CHECKING:
+    from docx.oxml.xmlchemy import BaseOxmlElement
+
+_r_tag = qn("w:r")
+_rPr_tag = qn("w:rPr")
+_text_tags = frozenset((qn("w:t"), qn("w:delText")))
+_proofErr_tag = qn("w:proofErr")
+# -- containers whose runs are merged, besides the paragraph itself --
+_run_container_tags = frozenset(
+    qn(tag)
+    for tag in (
+        "w:hyperlink",
+        "w:ins",
+        "w:del",
+        "w:smartTag",
+        "w:customXml",
+        "w:fldSimple",
+        "w:sdt",
+        "w:sdtContent",
+    )
+)
+# -- run content that is only text; a run holding anything else is left as it is --
+_text_content_tags = frozenset(
+    qn(tag)
+    for tag in (
+        "w:rPr",
+        "w:t",
+        "w:delText",
+        "w:tab",
+        "w:br",
+        "w:cr",
+        "w:noBreakHyphen",
+        "w:softHyphen",
+    )
+)
+
+
+def normalize_paragraph(p: BaseOxmlElement) -> int:
+    """Merge adjacent runs of `p` having the same properties, returning runs removed.
+
+    Proofing marks (`w:proofErr`) are removed first since they only separate runs. The
+    runs of hyperlinks, tracked insertions and deletions and similar containers in `p`
+    are merged with each other but not with the runs outside them. Runs holding anything
+    other than text, tabs and breaks, like a drawing or a field character, are not
+    merged.
+    """
+    etree.strip_elements(p, _proofErr_tag, with_tail=False)
+    return sum(_merge_runs(parent) for parent in _run_parents(p))
+
+
+def normalize_paragraphs(elements: Iterable[BaseOxmlElement]) -> int:
+    """Normalize each paragraph in or below `elements`, returning runs removed."""
+    return sum(normalize_paragraph(p) for element in elements for p in element.iter(qn("w:p")))
+
+
+def _merge_runs(parent: BaseOxmlElement) -> int:
+    """Merge the runs that are adjacent children of `parent`, returning runs removed."""
+    removed = 0
+    previous: BaseOxmlElement | None = None
+    previous_key: bytes | None = None
+    for child in list(parent):
+        key = _run_key(child) if child.tag == _r_tag else None
+        if key is None:
+            previous = previous_key = None
+            continue
+        if previous is not None and key == previous_key:
+            _append_run_content(previous, child)
+            parent.remove(child)
+            removed += 1
+            continue
+        previous, previous_key = child, key
+    return removed
+
+
+def _append_run_content(r: BaseOxmlElement, other: BaseOxmlElement):
+    """Move the content of run `other` to the end of run `r`, joining adjacent text."""
+    for child in list(other):
+        if child.tag == _rPr_tag:
+            continue
+        last = next(r.iterchildren(reversed=True), None)
+        if child.tag in _text_tags and last is not None and last.tag == child.tag:
+            set_text(last, (last.text or "") + (child.text or ""))
+            continue
+        r.append(child)
+
+
+def _run_key(r: BaseOxmlElement) -> bytes | None:
+    """Canonical form of the properties of run `r`, |None| when `r` can't be merged."""
+    rPr = None
+    for child in r:
+        if child.tag not in _text_content_tags:
+            return None
+        if child.tag == _rPr_tag:
+            rPr = child
+    if rPr is None:
+        return b""
+    return etree.tostring(rPr, method="c14n", exclusive=True)
+
+
+def _run_parents(p: BaseOxmlElement) -> List[BaseOxmlElement]:
+    """`p` and each container of runs below it, nested hyperlinks included."""
+    parents = [p]
+    for parent in parents:
+        parents.extend(child for child in parent if child.tag in _run_container_tags)
+    return parents
@@ -35,6 +35,8 @@ class RenderedPageBreak(Parented):
     each with a fragment of the actual text and pointing to the same address.
     """
 
+    __slots__ = ("_element", "_lastRenderedPageBreak")
+
     def __init__(
         self,
         lastRenderedPageBreak: CT_LastRenderedPageBreak,
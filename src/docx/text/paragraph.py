@@ -2,18 +2,35 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterator, List, TypeAlias, cast
+import re
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Pattern,
+    Tuple,
+    TypeAlias,
+    cast,
+)
 
 from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_REVISIONS_VIEW
 from docx.math import Math, MathPara
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.oxml.numbering import CT_NumPr
-from docx.shared import StoryChild
+from docx.revisions import paragraph_text
+from docx.shared import ProxySequence, StoryChild
 from docx.styles.style import ParagraphStyle
 from docx.text.block import SdtBlock
 from docx.text.field import Field
 from docx.text.hyperlink import Hyperlink
+from docx.text.normalize import normalize_paragraph
 from docx.text.pagebreak import RenderedPageBreak
 from docx.text.parfmt import ParagraphFormat
+from docx.text.replace import TextReplacer
 from docx.text.run import Run
 
 if TYPE_CHECKING:
@@ -29,6 +46,8 @@ ParElem: TypeAlias = "Run | Hyperlink | Field | Math | MathPara | SdtBlock"
 class Paragraph(StoryChild):
     """Proxy object wrapping a `<w:p>` element."""
 
+    __slots__ = ("_p", "_element")
+
     def __init__(self, p: CT_P, parent: t.ProvidesStoryPart):
         super(Paragraph, self).__init__(parent)
         self._p = self._element = p
@@ -63,6 +82,45 @@ class Paragraph(StoryChild):
         num_id = num_pr.get_or_add_numId()
         num_id.val = int(num.numId)
 
+    def add_hyperlink(
+        self, text: str, address: str, style: str | CharacterStyle | None = None
+    ) -> Hyperlink:
+        """Append a hyperlink to `address` displaying `text` and return it.
+
+        `address` is a URL like "https://example.com", or a "#" followed by the name of a
+        bookmark in this document, like "#_Toc147925734", for an internal link. The
+        hyperlink text has character-style `style` when provided, often "Hyperlink".
+        """
+        return self.add_hyperlinks([(text, address)], style)[0]
+
+    def add_hyperlinks(
+        self,
+        links: Iterable[Tuple[str, str]],
+        style: str | CharacterStyle | None = None,
+    ) -> List[Hyperlink]:
+        """Append a hyperlink for each `(text, address)` pair in `links`, in order.
+
+        Each hyperlink is as described for :meth:`add_hyperlink`. The containing part and
+        the character-style are resolved once for the whole batch, and links to the same
+        address share a single relationship, so this is the efficient way to add a large
+        number of hyperlinks.
+        """
+        part = self.part
+        style_id = part.get_style_id(style, WD_STYLE_TYPE.CHARACTER) if style else None
+        hyperlinks: List[Hyperlink] = []
+        for text, address in links:
+            hyperlink = self._p.add_hyperlink()
+            if address.startswith("#"):
+                hyperlink.anchor = address[1:]
+            else:
+                hyperlink.rId = part.relate_to(address, RT.HYPERLINK, is_external=True)
+            r = hyperlink.add_r()
+            if style_id:
+                r.style = style_id
+            Run(r, self).text = text
+            hyperlinks.append(Hyperlink(hyperlink, self))
+        return hyperlinks
+
     def add_run(self, text: str | None = None, style: str | CharacterStyle | None = None) -> Run:
         """Append run containing `text` and having character-style `style`.
 
@@ -167,6 +225,15 @@ class Paragraph(StoryChild):
             if isinstance(elem, CT_Sdt):
                 yield SdtBlock(elem, self)
 
+    def normalize_runs(self) -> int:
+        """Merge adjacent runs having the same formatting, returning the runs removed.
+
+        Proofing marks between runs are removed, and the text of merged runs is joined
+        into a single `w:t` element. Run objects obtained from this paragraph before the
+        call may no longer be part of it.
+        """
+        return normalize_paragraph(self._p)
+
     @property
     def paragraph_format(self):
         """The |ParagraphFormat| object providing access to the formatting properties
@@ -182,11 +249,36 @@ class Paragraph(StoryChild):
         """
         return [RenderedPageBreak(lrpb, self) for lrpb in self._p.lastRenderedPageBreaks]
 
+    def replace(
+        self,
+        old: str | Mapping[str, str] | Pattern[str],
+        new: str | Callable[[re.Match[str]], str] | None = None,
+    ) -> int:
+        """Replace text in this paragraph, returning the number of replacements made.
+
+        Accepts the same arguments as :meth:`.Document.replace`. Text split across runs
+        is found and the replacement takes on the formatting of the run where the match
+        begins.
+        """
+        return TextReplacer.from_args(old, new).replace_in_paragraph(self._p)
+
+    def revision_text(self, view: WD_REVISIONS_VIEW = WD_REVISIONS_VIEW.FINAL) -> str:
+        """The text of this paragraph as it reads in `view`.
+
+        `view` is a member of :ref:`WdRevisionsView`: `FINAL` reads the paragraph with
+        its tracked changes accepted, the same text as :attr:`text`, and `ORIGINAL` with
+        them rejected, leaving out inserted text and including deleted text.
+        """
+        return paragraph_text(self._p, view)
+
     @property
-    def runs(self) -> List[Run]:
+    def runs(self) -> ProxySequence[Run]:
         """Sequence of |Run| instances corresponding to the <w:r> elements in this
-        paragraph."""
-        return [Run(r, self) for r in self._p.r_lst]
+        paragraph.
+
+        Each run is constructed on first access.
+        """
+        return ProxySequence(self._p.r_lst, Run, self, self._proxy_cache)
 
     @property
     def style(self) -> ParagraphStyle | None:
@@ -211,7 +303,9 @@ class Paragraph(StoryChild):
     def text(self) -> str:
         """The textual content of this paragraph.
 
-        The text includes the visible-text portion of any hyperlinks in the paragraph.
+        The text includes the visible-text portion of any hyperlinks in the paragraph,
+        and text inserted with change tracking on but not text deleted. See
+        :meth:`revision_text` for the text before the changes.
         Tabs and line breaks in the XML are mapped to ``\\t`` and ``\\n`` characters
         respectively.
 
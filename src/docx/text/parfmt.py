@@ -1,7 +1,7 @@
 """Paragraph-related proxy types."""
 
 from docx.enum.text import WD_LINE_SPACING
-from docx.shared import ElementProxy, Emu, Length, Pt, Twips, lazyproperty
+from docx.shared import ElementProxy, Emu, Length, Pt, Twips
 from docx.text.tabstops import TabStops
 
 
@@ -9,6 +9,8 @@ class ParagraphFormat(ElementProxy):
     """Provides access to paragraph formatting such as justification, indentation, line
     spacing, space before and after, and widow/orphan control."""
 
+    __slots__ = ()
+
     @property
     def alignment(self):
         """A member of the :ref:`WdParagraphAlignment` enumeration specifying the
@@ -230,7 +232,7 @@ class ParagraphFormat(ElementProxy):
     def space_before(self, value):
         self._element.get_or_add_pPr().spacing_before = value
 
-    @lazyproperty
+    @property
     def tab_stops(self):
         """|TabStops| object providing access to the tab stops defined for this
         paragraph format."""
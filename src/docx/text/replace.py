@@ -0,0 +1,95 @@
+"""Find-and-replace of paragraph text, including matches that span run boundaries.
+
+Word frequently splits what looks like a single word across several runs, for example
+because of spell-check or revision marks, so a placeholder like "{{name}}" can't be
+found by searching the text of each run in isolation. Each paragraph is indexed once by
+|ParagraphTextIndex|, with the offset of each `w:t` element in its text, so a match can
+be located in the paragraph text and rewritten in just the `w:t` elements it overlaps.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, Pattern
+
+from docx.oxml.ns import qn
+from docx.text.textutil import ParagraphTextIndex
+
+if TYPE_CHECKING:
+    from docx.oxml.text.paragraph import CT_P
+    from docx.oxml.xmlchemy import BaseOxmlElement
+
+
+class TextReplacer:
+    """Replaces matches of a single compiled pattern in the paragraphs of a story.
+
+    Use :meth:`from_args` to construct one from a `str`, a mapping of search-string to
+    replacement, or a regular expression. A mapping is compiled into a single
+    alternation so any number of placeholders is replaced in one pass over each
+    paragraph rather than one pass per placeholder.
+    """
+
+    def __init__(self, pattern: Pattern[str], repl: Callable[[re.Match[str]], str]):
+        self._pattern = pattern
+        self._repl = repl
+
+    @classmethod
+    def from_args(
+        cls,
+        old: str | Mapping[str, str] | Pattern[str],
+        new: str | Callable[[re.Match[str]], str] | None = None,
+    ) -> TextReplacer:
+        """Return a |TextReplacer| for the `old` and `new` arguments of `.replace()`.
+
+        `old` can be a search string, in which case `new` is its replacement string; a
+        mapping of search-string to replacement-string, in which case `new` is not
+        used; or a compiled regular expression, in which case `new` is a replacement
+        template like `re.sub()` accepts or a callable taking the match and returning
+        the replacement text.
+        """
+        if isinstance(old, Mapping):
+            if new is not None:
+                raise ValueError("`new` is not used when `old` is a mapping")
+            mapping = {key: value for key, value in old.items() if key}
+            if not mapping:
+                return cls(re.compile(r"(?!)"), lambda match: match.group(0))
+            keys = sorted(mapping, key=len, reverse=True)
+            pattern = re.compile("|".join(re.escape(key) for key in keys))
+            return cls(pattern, lambda match: mapping[match.group(0)])
+
+        if new is None:
+            raise ValueError("`new` is required unless `old` is a mapping")
+
+        if isinstance(old, str):
+            if not old:
+                raise ValueError("search text must not be empty")
+            if not isinstance(new, str):
+                return cls(re.compile(re.escape(old)), new)
+            return cls(re.compile(re.escape(old)), lambda match: new)
+
+        if isinstance(new, str):
+            return cls(old, lambda match: match.expand(new))
+        return cls(old, new)
+
+    def replace_in(self, elements: Iterable[BaseOxmlElement]) -> int:
+        """Replace matches in each paragraph in or below `elements`, returning count."""
+        return sum(
+            self.replace_in_paragraph(p)  # pyright: ignore[reportArgumentType]
+            for element in elements
+            for p in element.iter(qn("w:p"))
+        )
+
+    def replace_in_paragraph(self, p: CT_P) -> int:
+        """Replace each match in the text of paragraph `p`, returning the match count.
+
+        A match that overlaps a tab, line-break or similar non-`w:t` run content is left
+        unchanged since that content has no text to rewrite.
+        """
+        index = ParagraphTextIndex(p)
+        matches = [m for m in self._pattern.finditer(index.text) if m.end() > m.start()]
+        count = 0
+        # -- rewrite from the end so offsets of earlier matches remain valid --
+        for match in reversed(matches):
+            if index.replace(match.start(), match.end(), self._repl(match)):
+                count += 1
+        return count
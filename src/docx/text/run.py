@@ -45,6 +45,8 @@ class Run(StoryChild):
     the style hierarchy.
     """
 
+    __slots__ = ("_r", "_element", "element")
+
     def __init__(self, r: CT_R, parent: t.ProvidesStoryPart):
         super().__init__(parent)
         self._r = self._element = self.element = r
@@ -316,6 +318,8 @@ class Run(StoryChild):
 class _Text:
     """Proxy object wrapping `<w:t>` element."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, t_elm: CT_Text):
         super(_Text, self).__init__()
         self._t = t_elm
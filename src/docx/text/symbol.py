@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 class Symbol(Parented):
     """Container for a DrawingML object."""
 
+    __slots__ = ("_sym", "_element")
+
     def __init__(self, sym: CT_Sym, parent: t.ProvidesStoryPart):
         super().__init__(parent)
         self._parent = parent
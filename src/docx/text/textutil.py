@@ -0,0 +1,123 @@
+"""Helpers for reading and rewriting the text of paragraphs, shared by the text tools.
+
+|ParagraphTextIndex| locates a range of paragraph text in the `w:t` elements holding it,
+for find-and-replace and for the placeholders of fragments.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import TYPE_CHECKING, List
+
+from lxml import etree
+
+from docx.oxml.ns import nsmap, qn
+
+if TYPE_CHECKING:
+    from docx.oxml.text.paragraph import CT_P
+    from docx.oxml.xmlchemy import BaseOxmlElement
+
+
+class _Segment:
+    """A span of paragraph text contributed by a single run-content element."""
+
+    __slots__ = ("element", "start", "end", "is_text")
+
+    def __init__(self, element: BaseOxmlElement, start: int, end: int, is_text: bool):
+        self.element = element
+        self.start = start
+        self.end = end
+        self.is_text = is_text
+
+
+class ParagraphTextIndex:
+    """The text of a paragraph with the offset at which each run-content element begins.
+
+    Only `w:t` elements are rewritable. Other run content that has a text equivalent,
+    like a tab or line-break, is present in the text so patterns see the same text as
+    `Paragraph.text`, but a match overlapping it is not rewritten.
+    """
+
+    _run_content_xpath = etree.XPath(
+        "./w:r/* | ./w:hyperlink/w:r/* | ./w:hyperlink/w:hyperlink/w:r/* | ./w:ins/w:r/*"
+        " | ./w:smartTag/w:r/* | ./w:fldSimple/w:r/* | ./w:sdt/w:sdtContent/w:r/*",
+        namespaces=nsmap,
+    )
+    _non_text_tags = frozenset(
+        qn(tag) for tag in ("w:tab", "w:br", "w:cr", "w:noBreakHyphen", "w:ptab")
+    )
+
+    def __init__(self, p: CT_P):
+        self._segments: List[_Segment] = []
+        self._starts: List[int] = []
+        texts: List[str] = []
+        offset = 0
+        t_tag = qn("w:t")
+        for e in self._run_content_xpath(p):
+            if e.tag == t_tag:
+                text, is_text = e.text or "", True
+            elif e.tag in self._non_text_tags:
+                text, is_text = str(e), False
+            else:
+                continue
+            if not text:
+                continue
+            self._segments.append(_Segment(e, offset, offset + len(text), is_text))
+            self._starts.append(offset)
+            texts.append(text)
+            offset += len(text)
+        self.text = "".join(texts)
+
+    def replace(self, start: int, end: int, new_text: str) -> bool:
+        """Replace the text in [start, end) with `new_text`, returning |True| on success.
+
+        `new_text` is placed in the `w:t` element where the match begins, so it takes on
+        the formatting of the first run in the match. Other `w:t` elements the match
+        overlaps are trimmed and removed once they are empty.
+        """
+        segments = self._segments_overlapping(start, end)
+        if not segments or not all(s.is_text for s in segments):
+            return False
+
+        first, last = segments[0], segments[-1]
+        first_text = first.element.text or ""
+        head = first_text[: start - first.start]
+        if first is last:
+            tail = first_text[end - first.start :]
+            set_text(first.element, head + new_text + tail)
+            return True
+
+        set_text(first.element, head + new_text)
+        for segment in segments[1:-1]:
+            self._remove(segment.element)
+        last_text = last.element.text or ""
+        tail = last_text[end - last.start :]
+        if tail:
+            set_text(last.element, tail)
+        else:
+            self._remove(last.element)
+        return True
+
+    def _segments_overlapping(self, start: int, end: int) -> List[_Segment]:
+        """The segments overlapping [start, end), found by bisection on segment offset."""
+        idx = max(bisect_right(self._starts, start) - 1, 0)
+        segments: List[_Segment] = []
+        for segment in self._segments[idx:]:
+            if segment.start >= end:
+                break
+            if segment.end > start:
+                segments.append(segment)
+        return segments
+
+    @staticmethod
+    def _remove(t: BaseOxmlElement):
+        parent = t.getparent()
+        if parent is not None:
+            parent.remove(t)
+
+
+def set_text(t: BaseOxmlElement, text: str):
+    """Set the text of `w:t` element `t`, preserving leading and trailing whitespace."""
+    t.text = text
+    if len(text.strip()) < len(text):
+        t.set(qn("xml:space"), "preserve")
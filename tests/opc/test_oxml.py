@@ -1,5 +1,9 @@
 """Test suite for opc.oxml module."""
 
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
 from docx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from docx.opc.oxml import (
     CT_Default,
@@ -7,6 +11,14 @@ from docx.opc.oxml import (
     CT_Relationship,
     CT_Relationships,
     CT_Types,
+    get_oxml_parser,
+    get_plain_parser,
+    oxml_parser,
+    parse_rels_xml,
+    parse_types_xml,
+    serialize_part_xml,
+    serialize_rels_xml,
+    serialize_types_xml,
 )
 from docx.oxml.xmlchemy import serialize_for_reading
 
@@ -19,6 +31,21 @@ from .unitdata.rels import (
 )
 
 
+class DescribeParsers:
+    def it_gives_each_thread_its_own_parsers(self):
+        def parsers(_: int):
+            return get_oxml_parser(), get_plain_parser()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(parsers, range(2)))
+
+        assert get_oxml_parser() is oxml_parser
+        assert get_plain_parser() is get_plain_parser()
+        assert get_plain_parser() is not oxml_parser
+        assert all(oxml is not oxml_parser for oxml, _ in results)
+        assert all(plain is not get_plain_parser() for _, plain in results)
+
+
 class DescribeCT_Default:
     def it_provides_read_access_to_xml_values(self):
         default = a_Default().element
@@ -130,3 +157,59 @@ class DescribeCT_Types:
         types.add_override("/docProps/thumbnail.jpeg", "image/jpeg")
         expected_types_xml = a_Types().xml
         assert types.xml == expected_types_xml
+
+
+class DescribeSerializeRelsXml:
+    def it_produces_the_same_bytes_as_serializing_the_element(self):
+        rels = [
+            ("rId1", "http://reltype1", "docProps/core.xml", False),
+            ("rId2", "http://linktype", 'http://x/?a=1&b="2"\t<c>', True),
+        ]
+        rels_elm = CT_Relationships.new()
+        for rel in rels:
+            rels_elm.add_rel(*rel)
+
+        assert serialize_rels_xml(rels) == rels_elm.xml
+
+    def and_it_produces_an_empty_element_when_there_are_no_rels(self):
+        assert serialize_rels_xml([]) == CT_Relationships.new().xml
+
+    def it_raises_on_a_value_that_is_not_XML_compatible(self):
+        with pytest.raises(ValueError, match="All strings must be XML compatible"):
+            serialize_rels_xml([("rId1", "http://rt", "foo\x01bar", True)])
+
+    def it_round_trips_with_parse_rels_xml(self):
+        rels = [
+            ("rId1", "http://reltype1", "docProps/core.xml", False),
+            ("rId2", "http://linktype", "http://x/?a=1&b=2", True),
+        ]
+
+        assert parse_rels_xml(serialize_rels_xml(rels)) == [
+            ("rId1", "http://reltype1", "docProps/core.xml", RTM.INTERNAL),
+            ("rId2", "http://linktype", "http://x/?a=1&b=2", RTM.EXTERNAL),
+        ]
+
+
+class DescribeSerializeTypesXml:
+    def it_produces_the_same_bytes_as_serializing_the_element(self):
+        defaults = [("jpeg", "image/jpeg"), ("xml", "application/xml")]
+        overrides = [("/docProps/core.xml", "app/vnd.type1"), ("/x&y.xml", "app/vnd.type2")]
+        types = CT_Types.new()
+        for ext, content_type in defaults:
+            types.add_default(ext, content_type)
+        for partname, content_type in overrides:
+            types.add_override(partname, content_type)
+
+        assert serialize_types_xml(defaults, overrides) == serialize_part_xml(types)
+
+    def and_it_produces_an_empty_element_when_there_are_no_types(self):
+        assert serialize_types_xml([], []) == serialize_part_xml(CT_Types.new())
+
+    def it_round_trips_with_parse_types_xml(self):
+        defaults = [("jpeg", "image/jpeg"), ("xml", "application/xml")]
+        overrides = [("/docProps/core.xml", "app/vnd.type1")]
+
+        assert parse_types_xml(serialize_types_xml(defaults, overrides)) == (
+            defaults,
+            overrides,
+        )
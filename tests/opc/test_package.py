@@ -10,11 +10,12 @@ from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.coreprops import CoreProperties
 from docx.opc.package import OpcPackage, Unmarshaller
 from docx.opc.packuri import PACKAGE_URI, PackURI
-from docx.opc.part import Part
+from docx.opc.part import Part, XmlPart
 from docx.opc.parts.coreprops import CorePropertiesPart
 from docx.opc.pkgreader import PackageReader
 from docx.opc.rel import Relationships, _Relationship
 
+from ..unitutil.cxml import element
 from ..unitutil.mock import (
     FixtureRequest,
     Mock,
@@ -99,6 +100,29 @@ class DescribeOpcPackage:
         assert part2 in pkg.iter_parts()
         assert len(list(pkg.iter_parts())) == 2
 
+    def it_can_clone_itself(self):
+        package = OpcPackage()
+        xml_part = XmlPart(PackURI("/word/document.xml"), "ct-xml", element("w:document"), package)
+        bin_part = Part(PackURI("/word/media/image1.png"), "ct-png", b"blob", package)
+        package.load_rel(RT.OFFICE_DOCUMENT, xml_part, "rId1")
+        xml_part.load_rel(RT.IMAGE, bin_part, "rId3")
+        xml_part.load_rel(RT.HYPERLINK, "https://foo.com", "rId4", is_external=True)
+
+        clone = package.clone()
+
+        assert type(clone) is OpcPackage
+        xml_copy = clone.main_document_part
+        assert type(xml_copy) is XmlPart
+        assert xml_copy is not xml_part
+        assert xml_copy.package is clone
+        assert xml_copy.element is not xml_part.element
+        assert xml_copy.element.xml == xml_part.element.xml
+        bin_copy = xml_copy.related_parts["rId3"]
+        assert bin_copy is not bin_part
+        assert bin_copy.partname == "/word/media/image1.png"
+        assert bin_copy.blob is bin_part.blob
+        assert xml_copy.target_ref("rId4") == "https://foo.com"
+
     def it_can_find_the_next_available_vector_partname(
         self, next_partname_fixture, iter_parts_, PackURI_, packuri_
     ):
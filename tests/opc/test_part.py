@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+import io
+
 import pytest
 
 from docx.opc.package import OpcPackage
@@ -66,6 +68,14 @@ class DescribePart:
         part = Part(PackURI("/part/name"), "content/type", blob)
         assert part.blob is blob
 
+    def it_can_write_its_blob_to_a_file(self):
+        part = Part(PackURI("/part/name"), "content/type", b"abcde")
+        file = io.BytesIO()
+
+        part.write_to(file)
+
+        assert file.getvalue() == b"abcde"
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -351,6 +361,16 @@ class DescribeXmlPart:
         serialize_part_xml_.assert_called_once_with(element_)
         assert blob is serialize_part_xml_.return_value
 
+    def it_can_write_its_xml_to_a_file(self, package_: Mock):
+        xml_part = XmlPart(
+            PackURI("/part/name"), "content/type", element("w:document/w:body/w:p"), package_
+        )
+        file = io.BytesIO()
+
+        xml_part.write_to(file)
+
+        assert file.getvalue() == xml_part.blob
+
     def it_knows_its_the_part_for_its_child_objects(self, part_fixture):
         xml_part = part_fixture
         assert xml_part.part is xml_part
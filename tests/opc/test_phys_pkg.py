@@ -2,6 +2,7 @@
 
 import hashlib
 import io
+import struct
 from zipfile import ZIP_DEFLATED, ZipFile
 
 import pytest
@@ -52,6 +53,16 @@ class DescribeDirPkgReader:
         rels_xml = dir_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_can_list_its_members_with_their_sizes(self, dir_reader):
+        members = {
+            pack_uri: (size, stored_size)
+            for pack_uri, size, stored_size in dir_reader.iter_members()
+        }
+
+        assert members[PackURI("/word/document.xml")] == (1819, 1819)
+        assert PackURI("/[Content_Types].xml") in members
+        assert PackURI("/_rels/.rels") in members
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -112,6 +123,15 @@ class DescribeZipPkgReader:
         rels_xml = phys_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_can_list_its_members_with_their_sizes(self, phys_reader):
+        members = {
+            pack_uri: (size, stored_size)
+            for pack_uri, size, stored_size in phys_reader.iter_members()
+        }
+
+        assert len(members) == 17
+        assert members[PackURI("/word/document.xml")] == (1820, 645)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(scope="class")
@@ -160,6 +180,38 @@ class DescribeZipPkgWriter:
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    def it_can_open_a_member_for_writing(self, pkg_file):
+        pack_uri = PackURI("/part/name.xml")
+        pkg_writer = PhysPkgWriter(pkg_file)
+
+        with pkg_writer.open(pack_uri) as f:
+            f.write(b"<Blobbity")
+            f.write(b"FooBlob/>")
+        pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.read(pack_uri.membername) == b"<BlobbityFooBlob/>"
+
+    @pytest.mark.parametrize(("size_hint", "zip64"), [(None, True), (18, False)])
+    def it_uses_zip64_sizes_unless_the_member_is_known_to_be_small(
+        self, pkg_file, size_hint, zip64
+    ):
+        pack_uri = PackURI("/part/name.xml")
+        pkg_writer = PhysPkgWriter(pkg_file)
+
+        with pkg_writer.open(pack_uri, size_hint) as f:
+            f.write(b"<BlobbityFooBlob/>")
+        pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            info = zipf.getinfo(pack_uri.membername)
+            assert zipf.read(info) == b"<BlobbityFooBlob/>"
+        # -- zip64 extra field, header id 0x0001, in the local file header --
+        local_header = pkg_file.getvalue()[info.header_offset :]
+        name_len, extra_len = struct.unpack("<HH", local_header[26:30])
+        extra = local_header[30 + name_len : 30 + name_len + extra_len]
+        assert (extra[:2] == b"\x01\x00") is zip64
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -400,16 +400,8 @@ class Describe_SerializedPart:
 
 class Describe_SerializedRelationship:
     def it_remembers_construction_values(self):
-        # test data --------------------
-        rel_elm = Mock(
-            name="rel_elm",
-            rId="rId9",
-            reltype="ReLtYpE",
-            target_ref="docProps/core.xml",
-            target_mode=RTM.INTERNAL,
-        )
         # exercise ---------------------
-        srel = _SerializedRelationship("/", rel_elm)
+        srel = _SerializedRelationship("/", "rId9", "ReLtYpE", "docProps/core.xml", RTM.INTERNAL)
         # verify -----------------------
         assert srel.rId == "rId9"
         assert srel.reltype == "ReLtYpE"
@@ -420,14 +412,7 @@ class Describe_SerializedRelationship:
         cases = (RTM.INTERNAL, RTM.EXTERNAL, "FOOBAR")
         expected_values = (False, True, False)
         for target_mode, expected_value in zip(cases, expected_values):
-            rel_elm = Mock(
-                name="rel_elm",
-                rId=None,
-                reltype=None,
-                target_ref=None,
-                target_mode=target_mode,
-            )
-            srel = _SerializedRelationship(None, rel_elm)
+            srel = _SerializedRelationship(None, None, None, None, target_mode)
             assert srel.is_external is expected_value
 
     def it_can_calculate_its_target_partname(self):
@@ -442,51 +427,33 @@ class Describe_SerializedRelationship:
             ),
         )
         for baseURI, target_ref, expected_partname in cases:
-            # setup --------------------
-            rel_elm = Mock(
-                name="rel_elm",
-                rId=None,
-                reltype=None,
-                target_ref=target_ref,
-                target_mode=RTM.INTERNAL,
-            )
             # exercise -----------------
-            srel = _SerializedRelationship(baseURI, rel_elm)
+            srel = _SerializedRelationship(baseURI, None, None, target_ref, RTM.INTERNAL)
             # verify -------------------
             assert srel.target_partname == expected_partname
 
     def it_raises_on_target_partname_when_external(self):
-        rel_elm = Mock(
-            name="rel_elm",
-            rId="rId9",
-            reltype="ReLtYpE",
-            target_ref="docProps/core.xml",
-            target_mode=RTM.EXTERNAL,
-        )
-        srel = _SerializedRelationship("/", rel_elm)
+        srel = _SerializedRelationship("/", "rId9", "ReLtYpE", "docProps/core.xml", RTM.EXTERNAL)
         with pytest.raises(ValueError, match="target_partname attribute on Relat"):
             srel.target_partname
 
 
 class Describe_SerializedRelationships:
-    def it_can_load_from_xml(self, parse_xml_, _SerializedRelationship_):
+    def it_can_load_from_xml(self, parse_rels_xml_, _SerializedRelationship_):
         # mockery ----------------------
-        baseURI, rels_item_xml, rel_elm_1, rel_elm_2 = (
-            Mock(name="baseURI"),
-            Mock(name="rels_item_xml"),
-            Mock(name="rel_elm_1"),
-            Mock(name="rel_elm_2"),
-        )
-        rels_elm = Mock(name="rels_elm", Relationship_lst=[rel_elm_1, rel_elm_2])
-        parse_xml_.return_value = rels_elm
+        baseURI, rels_item_xml = Mock(name="baseURI"), Mock(name="rels_item_xml")
+        parse_rels_xml_.return_value = [
+            ("rId1", "http://rt1", "foo.xml", RTM.INTERNAL),
+            ("rId2", "http://rt2", "http://bar", RTM.EXTERNAL),
+        ]
         # exercise ---------------------
         srels = _SerializedRelationships.load_from_xml(baseURI, rels_item_xml)
         # verify -----------------------
         expected_calls = [
-            call(baseURI, rel_elm_1),
-            call(baseURI, rel_elm_2),
+            call(baseURI, "rId1", "http://rt1", "foo.xml", RTM.INTERNAL),
+            call(baseURI, "rId2", "http://rt2", "http://bar", RTM.EXTERNAL),
         ]
-        parse_xml_.assert_called_once_with(rels_item_xml)
+        parse_rels_xml_.assert_called_once_with(rels_item_xml)
         assert _SerializedRelationship_.call_args_list == expected_calls
         assert isinstance(srels, _SerializedRelationships)
 
@@ -502,8 +469,8 @@ class Describe_SerializedRelationships:
     # fixtures ---------------------------------------------
 
     @pytest.fixture
-    def parse_xml_(self, request):
-        return function_mock(request, "docx.opc.pkgreader.parse_xml")
+    def parse_rels_xml_(self, request):
+        return function_mock(request, "docx.opc.pkgreader.parse_rels_xml")
 
     @pytest.fixture
     def _SerializedRelationship_(self, request):
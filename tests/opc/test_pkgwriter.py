@@ -4,14 +4,20 @@
 
 from __future__ import annotations
 
+import io
+import struct
+from zipfile import ZipFile
+
 import pytest
 
 from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.oxml import parse_xml
 from docx.opc.packuri import PackURI
-from docx.opc.part import Part
-from docx.opc.phys_pkg import _ZipPkgWriter
+from docx.opc.part import Part, XmlPart
+from docx.opc.phys_pkg import PhysPkgWriter, _ZipPkgWriter
 from docx.opc.pkgwriter import PackageWriter, _ContentTypesItem
 from docx.opc.rel import Relationships
+from docx.oxml.ns import nsdecls
 
 from ..unitutil.mock import (
     FixtureRequest,
@@ -21,6 +27,7 @@ from ..unitutil.mock import (
     instance_mock,
     method_mock,
     patch,
+    var_mock,
 )
 from .unitdata.types import a_Default, a_Types, an_Override
 
@@ -65,15 +72,39 @@ class DescribePackageWriter:
         rels_.__len__.return_value = 1
         part_.rels = rels_
         part_2_.rels = []
+        file_ = phys_pkg_writer_.open.return_value.__enter__.return_value
 
         PackageWriter._write_parts(phys_pkg_writer_, [part_, part_2_])
 
-        expected_calls = [
-            call(part_.partname, part_.blob),
-            call(part_.partname.rels_uri, part_.rels.xml),
-            call(part_2_.partname, part_2_.blob),
+        assert phys_pkg_writer_.open.call_args_list == [
+            call(part_.partname, len(part_.blob)),
+            call(part_2_.partname, len(part_2_.blob)),
         ]
-        assert phys_pkg_writer_.write.mock_calls == expected_calls
+        part_.write_to.assert_called_once_with(file_)
+        part_2_.write_to.assert_called_once_with(file_)
+        assert phys_pkg_writer_.write.mock_calls == [call(part_.partname.rels_uri, part_.rels.xml)]
+
+    @pytest.mark.parametrize(("large_tree_count", "zip64"), [(100_000, False), (1, True)])
+    def it_streams_only_the_xml_of_a_large_tree_with_zip64_sizes(
+        self, request: FixtureRequest, large_tree_count: int, zip64: bool
+    ):
+        var_mock(request, "docx.opc.pkgwriter._LARGE_TREE_ELEMENT_COUNT", new=large_tree_count)
+        element = parse_xml("<w:document %s><w:body/></w:document>" % nsdecls("w"))
+        part = XmlPart(PackURI("/word/document.xml"), CT.WML_DOCUMENT_MAIN, element, None)
+        pkg_file = io.BytesIO()
+        phys_writer = PhysPkgWriter(pkg_file)
+
+        PackageWriter._write_parts(phys_writer, [part])
+        phys_writer.close()
+
+        with ZipFile(pkg_file) as zipf:
+            info = zipf.getinfo("word/document.xml")
+            assert zipf.read(info) == part.blob
+        # -- zip64 extra field, header id 0x0001, in the local file header --
+        local_header = pkg_file.getvalue()[info.header_offset :]
+        name_len, extra_len = struct.unpack("<HH", local_header[26:30])
+        extra = local_header[30 + name_len : 30 + name_len + extra_len]
+        assert (extra[:2] == b"\x01\x00") is zip64
 
     # fixtures ---------------------------------------------
 
@@ -146,7 +177,7 @@ class DescribePackageWriter:
 class Describe_ContentTypesItem:
     def it_can_compose_content_types_element(self, xml_for_fixture):
         cti, expected_xml = xml_for_fixture
-        types_elm = cti._element
+        types_elm = parse_xml(cti.blob)
         assert types_elm.xml == expected_xml
 
     # fixtures ---------------------------------------------
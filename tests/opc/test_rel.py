@@ -9,7 +9,7 @@ from docx.opc.packuri import PackURI
 from docx.opc.part import Part
 from docx.opc.rel import Relationships, _Relationship
 
-from ..unitutil.mock import Mock, PropertyMock, call, class_mock, instance_mock, patch
+from ..unitutil.mock import Mock, class_mock, instance_mock
 
 
 class Describe_Relationship:
@@ -108,18 +108,38 @@ class DescribeRelationships:
         part = rels.part_with_reltype(reltype)
         assert part is known_target_part
 
-    def it_can_compose_rels_xml(self, rels, rels_elm):
-        # exercise ---------------------
-        rels.xml
-        # verify -----------------------
-        rels_elm.assert_has_calls(
-            [
-                call.add_rel("rId1", "http://rt-hyperlink", "http://some/link", True),
-                call.add_rel("rId2", "http://rt-image", "../media/image1.png", False),
-                call.xml(),
-            ],
-            any_order=True,
-        )
+    def it_can_compose_rels_xml(self, rels):
+        rels_elm = CT_Relationships.new()
+        rels_elm.add_rel("rId1", "http://rt-hyperlink", "http://some/link", True)
+        rels_elm.add_rel("rId2", "http://rt-image", "../media/image1.png", False)
+
+        assert rels.xml == rels_elm.xml
+
+    def it_reuses_an_external_relationship_found_by_its_index(self):
+        rels = Relationships("/word")
+        rIds = [rels.get_or_add_ext_rel("http://rt-hyperlink", "http://x/%d" % n) for n in range(3)]
+
+        assert rIds == ["rId1", "rId2", "rId3"]
+        assert rels.get_or_add_ext_rel("http://rt-hyperlink", "http://x/1") == "rId2"
+        assert rels.get_or_add_ext_rel("http://rt-other", "http://x/1") == "rId4"
+        assert len(rels) == 4
+
+    def it_fills_the_rId_gap_left_by_a_deleted_relationship(self):
+        rels = Relationships("/word")
+        for n in range(3):
+            rels.get_or_add_ext_rel("http://rt-hyperlink", "http://x/%d" % n)
+
+        del rels["rId2"]
+
+        assert rels.get_or_add_ext_rel("http://rt-hyperlink", "http://x/1") == "rId2"
+        assert rels.get_or_add_ext_rel("http://rt-hyperlink", "http://x/3") == "rId4"
+
+    def it_forgets_the_related_part_of_a_deleted_relationship(self, rels_with_known_target_part):
+        rels, rId, _ = rels_with_known_target_part
+
+        del rels[rId]
+
+        assert rId not in rels.related_parts
 
     def it_knows_the_next_available_rId_to_help(self, rels_with_rId_gap):
         rels, expected_next_rId = rels_with_rId_gap
@@ -173,24 +193,6 @@ class DescribeRelationships:
         rels.add_relationship(reltype="http://rt-image", target=part, rId="rId2")
         return rels
 
-    @pytest.fixture
-    def rels_elm(self):
-        """
-        Return a rels_elm mock that will be returned from
-        CT_Relationships.new()
-        """
-        # create rels_elm mock with a .xml property
-        rels_elm = Mock(name="rels_elm")
-        xml = PropertyMock(name="xml")
-        type(rels_elm).xml = xml
-        rels_elm.attach_mock(xml, "xml")
-        rels_elm.reset_mock()  # to clear attach_mock call
-        # patch CT_Relationships to return that rels_elm
-        patch_ = patch.object(CT_Relationships, "new", return_value=rels_elm)
-        patch_.start()
-        yield rels_elm
-        patch_.stop()
-
     @pytest.fixture
     def _rel_with_known_target_part(self, _rId, reltype, _target_part, _baseURI):
         rel = _Relationship(_rId, reltype, _target_part, _baseURI)
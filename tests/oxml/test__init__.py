@@ -1,10 +1,18 @@
 """Test suite for pptx.oxml.__init__.py module, primarily XML parser-related."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from lxml import etree
 
 from docx.oxml.ns import qn
-from docx.oxml.parser import OxmlElement, oxml_parser, parse_xml, register_element_cls
+from docx.oxml.parser import (
+    OxmlElement,
+    get_oxml_parser,
+    oxml_parser,
+    parse_xml,
+    register_element_cls,
+)
 from docx.oxml.shared import BaseOxmlElement
 
 
@@ -71,6 +79,19 @@ class DescribeParseXml:
         element = parse_xml(xml_bytes)
         assert isinstance(element, CustElmCls)
 
+    def it_parses_with_a_parser_of_the_calling_thread(self, xml_bytes):
+        register_element_cls("a:foo", CustElmCls)
+
+        def parse_in_thread(_: int):
+            return get_oxml_parser(), type(parse_xml(xml_bytes))
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(parse_in_thread, range(2)))
+
+        assert get_oxml_parser() is oxml_parser
+        assert all(parser is not oxml_parser for parser, _ in results)
+        assert all(cls is CustElmCls for _, cls in results)
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
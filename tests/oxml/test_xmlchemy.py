@@ -18,6 +18,7 @@ from docx.oxml.xmlchemy import (
     ZeroOrOne,
     ZeroOrOneChoice,
     serialize_for_reading,
+    tree_version,
 )
 
 from ..unitdata import BaseBuilder
@@ -39,6 +40,30 @@ class DescribeBaseOxmlElement:
         element.remove_all(*tagnames)
         assert element.xml == expected_xml
 
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda rPr, b: rPr.append(b),
+            lambda rPr, b: rPr.extend([b]),
+            lambda rPr, b: rPr.insert(0, b),
+            lambda rPr, b: rPr[0].addnext(b),
+            lambda rPr, b: rPr[0].addprevious(b),
+            lambda rPr, b: rPr.replace(rPr[0], b),
+            lambda rPr, b: rPr.remove(rPr[0]),
+            lambda rPr, b: rPr.__delitem__(0),
+            lambda rPr, b: rPr.__setitem__(0, b),
+            lambda rPr, b: rPr.clear(),
+        ],
+    )
+    def it_counts_each_change_to_its_children(self, change):
+        rPr = self.rPr_bldr("iu").element
+        b = a_b().with_nsdecls().element
+        version = tree_version()
+
+        change(rPr, b)
+
+        assert tree_version() != version
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(
@@ -1,11 +1,17 @@
 """Test suite for the docx.parts.numbering module."""
 
+from __future__ import annotations
+
+from typing import cast
+
 import pytest
 
+from docx.opc.constants import CONTENT_TYPE as CT
 from docx.oxml.numbering import CT_Numbering
 from docx.parts.numbering import NumberingPart, _NumberingDefinitions
 
 from ..oxml.unitdata.numbering import a_num, a_numbering
+from ..unitutil.cxml import element
 from ..unitutil.mock import class_mock, instance_mock
 
 
@@ -21,6 +27,14 @@ class DescribeNumberingPart:
         _NumberingDefinitions_.assert_called_once_with(numbering_elm_)
         assert numbering_definitions is numbering_definitions_
 
+    def it_can_construct_a_new_empty_numbering_part(self):
+        numbering_part = NumberingPart.new()
+
+        assert numbering_part.partname == "/word/numbering.xml"
+        assert numbering_part.content_type == CT.WML_NUMBERING
+        assert isinstance(numbering_part.element, CT_Numbering)
+        assert len(numbering_part.element) == 0
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -70,3 +84,88 @@ class Describe_NumberingDefinitions:
         numbering_elm = numbering_bldr.element
         numbering_definitions = _NumberingDefinitions(numbering_elm)
         return numbering_definitions, numbering_definition_count
+
+
+class DescribeNumberingPart_Indexes:
+    """Unit-test suite for the numId and abstractNumId indexes of NumberingPart."""
+
+    def it_can_get_a_num_by_its_numId(self):
+        numbering_part = NumberingPart(None, None, element(self.numbering_cxml), None)
+
+        num = numbering_part.get_num(2)
+
+        assert num is not None
+        assert num.numId == 2
+        assert numbering_part.get_num(42) is None
+
+    def it_can_get_an_abstractNum_by_its_id(self):
+        numbering_part = NumberingPart(None, None, element(self.numbering_cxml), None)
+
+        assert numbering_part.get_abstractNum(5).abstractNumId == 5
+        assert numbering_part.get_abstract_by_num_id(1).abstractNumId == 5
+        assert numbering_part.get_abstract_by_num_id(42) is None
+
+    def it_keeps_its_indexes_current_as_definitions_are_added_and_removed(self):
+        numbering = cast(CT_Numbering, element(self.numbering_cxml))
+        numbering_part = NumberingPart(None, None, numbering, None)
+        assert numbering_part.get_num(3) is None
+
+        num = numbering.add_num(5)
+        assert numbering_part.get_num(3) is num
+
+        numbering.remove(num)
+        assert numbering_part.get_num(3) is None
+
+    def but_it_notices_a_definition_replaced_without_changing_the_count(self):
+        numbering = cast(CT_Numbering, element(self.numbering_cxml))
+        numbering_part = NumberingPart(None, None, numbering, None)
+        first_num, last_num = numbering.num_lst
+        assert numbering_part.get_num(7) is None
+
+        numbering.replace(last_num, element("w:num{w:numId=7}/w:abstractNumId{w:val=5}"))
+        assert numbering_part.get_num(7) is numbering[-1]
+
+        # -- a definition in the middle, neither first nor last child --
+        numbering.replace(first_num, element("w:num{w:numId=8}/w:abstractNumId{w:val=5}"))
+        assert numbering_part.get_num(8) is numbering.num_lst[0]
+        assert numbering_part.get_num(1) is None
+
+        abstractNum = numbering.abstractNum_lst[0]
+        numbering.replace(abstractNum, element("w:abstractNum{w:abstractNumId=6}"))
+        assert numbering_part.get_abstractNum(6) is numbering[0]
+        assert numbering_part.get_abstractNum(5) is None
+
+    @pytest.mark.parametrize(
+        ("num_id", "ilvl", "expected_value"),
+        [(1, 0, None), (2, 0, 4), (2, 1, None), (42, 0, None)],
+    )
+    def it_knows_the_start_override_of_a_list_level(
+        self, num_id: int, ilvl: int, expected_value: int | None
+    ):
+        numbering_part = NumberingPart(None, None, element(self.numbering_cxml), None)
+        assert numbering_part.get_ilvl_override(num_id, ilvl) == expected_value
+
+    @pytest.mark.parametrize(
+        ("num_id", "ilvl", "expected_start"),
+        [(1, 0, 1), (1, 1, 3), (2, 1, 9), (1, 2, None)],
+    )
+    def it_can_resolve_the_effective_lvl_of_a_list_level(
+        self, num_id: int, ilvl: int, expected_start: int | None
+    ):
+        numbering_part = NumberingPart(None, None, element(self.numbering_cxml), None)
+
+        lvl = numbering_part.lvl_for(num_id, ilvl)
+
+        assert (None if lvl is None else lvl.start_lst[0].val) == expected_start
+
+    numbering_cxml = (
+        "w:numbering/("
+        "w:abstractNum{w:abstractNumId=5}/("
+        "w:lvl{w:ilvl=0}/w:start{w:val=1},"
+        "w:lvl{w:ilvl=1}/w:start{w:val=3}),"
+        "w:num{w:numId=1}/w:abstractNumId{w:val=5},"
+        "w:num{w:numId=2}/("
+        "w:abstractNumId{w:val=5},"
+        "w:lvlOverride{w:ilvl=0}/w:startOverride{w:val=4},"
+        "w:lvlOverride{w:ilvl=1}/w:lvl{w:ilvl=1}/w:start{w:val=9}))"
+    )
@@ -0,0 +1,115 @@
+"""Test suite for the docx.aio module."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+from typing import AsyncIterator, List
+
+import pytest
+
+from docx.aio import open_document, save_document
+from docx.api import Document
+
+from .unitutil.file import test_file
+
+
+class DescribeOpenDocument:
+    def it_opens_a_document_from_a_path(self):
+        document = asyncio.run(open_document(test_file("test.docx")))
+        assert len(document.paragraphs) > 0
+
+    def it_opens_the_default_document_when_none_is_specified(self):
+        document = asyncio.run(open_document())
+        assert document.paragraphs == []
+
+    def it_opens_a_document_from_an_async_stream(self, docx_bytes: bytes):
+        async def open_from_stream():
+            stream = asyncio.StreamReader()
+            stream.feed_data(docx_bytes)
+            stream.feed_eof()
+            return await open_document(stream)
+
+        document = asyncio.run(open_from_stream())
+
+        assert document.paragraphs[0].text == "async"
+
+    def it_opens_a_document_from_an_async_iterable_of_chunks(self, docx_bytes: bytes):
+        async def chunks() -> AsyncIterator[bytes]:
+            for i in range(0, len(docx_bytes), 1000):
+                yield docx_bytes[i : i + 1000]
+
+        document = asyncio.run(open_document(chunks()))
+
+        assert document.paragraphs[0].text == "async"
+
+    def it_can_be_cancelled_while_reading_an_async_source(self):
+        class NeverReady:
+            async def read(self, size: int = -1) -> bytes:
+                await asyncio.Event().wait()
+                return b""
+
+        async def cancel_open():
+            task = asyncio.create_task(open_document(NeverReady()))
+            await asyncio.sleep(0)
+            task.cancel()
+            await task
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(cancel_open())
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def docx_bytes(self) -> bytes:
+        document = Document()
+        document.add_paragraph("async")
+        file = io.BytesIO()
+        document.save(file)
+        return file.getvalue()
+
+
+class DescribeSaveDocument:
+    def it_saves_a_document_to_a_stream(self):
+        document = Document()
+        document.add_paragraph("saved")
+        file = io.BytesIO()
+
+        asyncio.run(document.save_async(file))
+
+        assert Document(file).paragraphs[0].text == "saved"
+
+    def it_saves_a_document_to_an_async_sink(self):
+        class Sink:
+            def __init__(self):
+                self.chunks: List[bytes] = []
+
+            async def write(self, data: bytes):
+                self.chunks.append(data)
+
+        document = Document()
+        document.add_paragraph("saved")
+        sink = Sink()
+
+        asyncio.run(save_document(document, sink))
+
+        assert Document(io.BytesIO(b"".join(sink.chunks))).paragraphs[0].text == "saved"
+
+    def it_drains_a_sink_like_a_stream_writer(self):
+        class Writer:
+            def __init__(self):
+                self.file = io.BytesIO()
+                self.drain_count = 0
+
+            def write(self, data: bytes):
+                self.file.write(data)
+
+            async def drain(self):
+                self.drain_count += 1
+
+        writer = Writer()
+
+        asyncio.run(Document().save_async(writer))
+
+        assert writer.drain_count > 0
+        assert Document(writer.file).paragraphs == []
@@ -1,9 +1,12 @@
 """Test suite for the docx.api module."""
 
+import io
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 import docx
-from docx.api import Document
+from docx.api import Document, _default_package
 from docx.opc.constants import CONTENT_TYPE as CT
 
 from .unitutil.mock import class_mock, function_mock, instance_mock
@@ -20,23 +23,48 @@ class DescribeDocument:
         docx, Package_, document_ = default_fixture
         document = Document()
         Package_.open.assert_called_once_with(docx)
+        Package_.open.return_value.clone.assert_called_once_with()
         assert document is document_
 
+    def and_it_loads_the_default_docx_only_once(self, default_fixture):
+        docx, Package_, _ = default_fixture
+
+        Document()
+        Document()
+
+        Package_.open.assert_called_once_with(docx)
+        assert Package_.open.return_value.clone.call_count == 2
+
     def it_raises_on_not_a_Word_file(self, raise_fixture):
         not_a_docx = raise_fixture
         with pytest.raises(ValueError, match="file 'foobar.xlsx' is not a Word file,"):
             Document(not_a_docx)
 
+    def it_can_open_and_save_distinct_documents_concurrently(self):
+        def round_trip(n: int) -> str:
+            document = Document()
+            document.add_paragraph("document %d" % n)
+            file = io.BytesIO()
+            document.save(file)
+            return Document(file).paragraphs[-1].text
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            texts = list(executor.map(round_trip, range(16)))
+
+        assert texts == ["document %d" % n for n in range(16)]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
     def default_fixture(self, _default_docx_path_, Package_, document_):
         docx = "barfoo.docx"
         _default_docx_path_.return_value = docx
-        document_part = Package_.open.return_value.main_document_part
+        _default_package.cache_clear()
+        document_part = Package_.open.return_value.clone.return_value.main_document_part
         document_part.document = document_
         document_part.content_type = CT.WML_DOCUMENT_MAIN
-        return docx, Package_, document_
+        yield docx, Package_, document_
+        _default_package.cache_clear()
 
     @pytest.fixture
     def open_fixture(self, Package_, document_):
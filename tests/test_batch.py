@@ -0,0 +1,103 @@
+"""Test suite for the docx.batch module."""
+
+from __future__ import annotations
+
+import os
+import pickle
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from docx.batch import BatchResult, map_documents
+
+from .unitutil.file import test_file
+
+
+class DescribeMapDocuments:
+    def it_generates_a_result_for_each_path_in_order(self):
+        paths = [test_file("test.docx"), test_file("having-images.docx")] * 3
+
+        results = list(map_documents(paths, paragraph_count, workers=2, chunksize=2))
+
+        assert [result.path for result in results] == paths
+        assert all(result.ok for result in results)
+        assert results[0].value == results[2].value
+
+    def it_can_generate_results_as_they_complete(self):
+        paths = [test_file("test.docx"), test_file("having-images.docx")] * 3
+
+        results = list(map_documents(paths, paragraph_count, workers=2, ordered=False))
+
+        assert sorted(result.path for result in results) == sorted(paths)
+
+    def it_reports_an_error_for_a_path_without_stopping_the_batch(self):
+        paths = [test_file("test.docx"), test_file("does-not-exist.docx")]
+
+        good, bad = map_documents(paths, paragraph_count, workers=1)
+
+        assert good.ok
+        assert not bad.ok
+        assert bad.value is None
+        assert isinstance(bad.error, Exception)
+        assert "Traceback" in (bad.traceback or "")
+
+    def it_reports_an_error_for_each_path_of_a_chunk_that_failed(self):
+        paths = [test_file("test.docx")] * 2
+
+        results = list(map_documents(paths, unpicklable_value, workers=1, chunksize=2))
+
+        assert [result.ok for result in results] == [False, False]
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def it_carries_on_in_a_new_pool_when_a_worker_process_dies(self, ordered: bool):
+        paths = [test_file("test.docx")] * 4 + [test_file("having-images.docx")]
+        paths += [test_file("test.docx")] * 6
+
+        results = list(map_documents(paths, exit_on_images, workers=1, ordered=ordered))
+
+        assert len(results) == len(paths)
+        failed = [r for r in results if not r.ok]
+        assert test_file("having-images.docx") in [r.path for r in failed]
+        assert all(isinstance(r.error, BrokenProcessPool) for r in failed)
+        # -- only the (at most two) chunks in flight when the worker died are lost --
+        assert len(failed) <= 2
+
+    def it_passes_a_copy_of_the_template_when_one_is_given(self):
+        paths = [test_file("test.docx")] * 3
+
+        results = map_documents(paths, add_to_template, workers=1, template=test_file("test.docx"))
+
+        counts = [result.value for result in results]
+        assert len(set(counts)) == 1
+
+    def but_it_raises_on_a_chunksize_less_than_one(self):
+        with pytest.raises(ValueError, match="chunksize must be at least 1"):
+            next(map_documents([], paragraph_count, chunksize=0))
+
+
+class DescribeBatchResult:
+    def it_can_be_pickled(self):
+        result = pickle.loads(pickle.dumps(BatchResult("a.docx", value=42)))
+        assert (result.path, result.value, result.ok) == ("a.docx", 42, True)
+
+
+# -- functions called in worker processes must be importable, so are module-level --
+
+
+def add_to_template(path, document, template):
+    template.add_paragraph("added")
+    return len(template.paragraphs)
+
+
+def exit_on_images(path, document):
+    if "images" in os.fspath(path):
+        os._exit(1)
+    return len(document.paragraphs)
+
+
+def paragraph_count(path, document):
+    return len(document.paragraphs)
+
+
+def unpicklable_value(path, document):
+    return lambda: None
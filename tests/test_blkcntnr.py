@@ -79,6 +79,19 @@ class DescribeBlockItemContainer:
             count += 1
         assert count == expected_count
 
+    def it_reuses_the_paragraphs_until_the_document_changes(self):
+        body = element("w:body/(w:p,w:p,w:p)")
+        blkcntnr = BlockItemContainer(body, None)
+        paragraphs = blkcntnr.paragraphs
+
+        assert blkcntnr.paragraphs is paragraphs
+        assert blkcntnr.tables is blkcntnr.tables
+
+        body.replace(body[1], element("w:tbl"))
+        assert blkcntnr.paragraphs is not paragraphs
+        assert [p._p for p in blkcntnr.paragraphs] == [body[0], body[2]]
+        assert [t._tbl for t in blkcntnr.tables] == [body[1]]
+
     def it_adds_a_paragraph_to_help(self, _add_paragraph_fixture):
         blkcntnr, expected_xml = _add_paragraph_fixture
         new_paragraph = blkcntnr._add_paragraph()
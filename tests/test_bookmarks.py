@@ -0,0 +1,132 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit test suite for the docx.bookmarks module."""
+
+from __future__ import annotations
+
+from typing import cast
+
+import pytest
+
+from docx import Document
+from docx.bookmarks import BookmarkIndex
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+
+from .unitutil.cxml import element
+from .unitutil.document import document_with_body
+
+
+class DescribeBookmarkIndex:
+    """Unit-test suite for `docx.bookmarks.BookmarkIndex`."""
+
+    def it_locates_each_bookmark_in_one_pass_over_the_stories(self):
+        document = document_with_body(
+            "w:body/("
+            'w:p/(w:bookmarkStart{w:id=1,w:name=a},w:r/w:t"x",w:bookmarkEnd{w:id=1}),'
+            "w:bookmarkStart{w:id=4,w:name=b},"
+            "w:tbl/w:tr/w:tc/w:p/w:bookmarkEnd{w:id=4},"
+            "w:p/w:bookmarkStart{w:id=7,w:name=a},"
+            "w:sectPr)"
+        )
+        header = document.sections[0].header
+        header.paragraphs[0]._p.append(element("w:bookmarkStart{w:id=9,w:name=h}"))
+        body = document.element.body
+        index = document.part.bookmark_index
+
+        assert list(index) == ["a", "b", "h"]
+        a, b, h = index.get("a"), index.get("b"), index.get("h")
+        assert a is not None
+        assert b is not None
+        assert h is not None
+        assert a.block is body[0]
+        assert a.end is body[0][2]
+        assert b.block is body[2]
+        assert b.end is body[2][0][0][0][0]
+        assert h.part is header.part
+        assert h.end is None
+        assert index.get("c") is None
+        assert index.next_id() == 10
+
+    def but_it_rebuilds_when_a_bookmark_was_removed_by_other_means(self):
+        document = document_with_body(
+            "w:body/(w:p/w:bookmarkStart{w:id=1,w:name=a},w:p/w:bookmarkStart{w:id=2,w:name=b})"
+        )
+        index = BookmarkIndex(document.part)
+        assert "a" in index
+
+        body = document.element.body
+        body.remove(body[0])
+
+        assert "a" not in index
+        assert "b" in index
+
+
+class DescribeBookmarks:
+    """Unit-test suite for `docx.bookmarks.Bookmarks`."""
+
+    def it_provides_access_to_a_bookmark_by_name(self):
+        document = document_with_body(
+            'w:body/w:p/(w:bookmarkStart{w:id=3,w:name=_Toc1},w:r/w:t"Intro")'
+        )
+        bookmarks = document.bookmarks
+
+        bookmark = bookmarks["_Toc1"]
+
+        assert (bookmark.name, bookmark.id) == ("_Toc1", 3)
+        assert cast(Paragraph, bookmark.block).text == "Intro"
+        assert len(bookmarks) == 1
+        assert [b.name for b in bookmarks] == ["_Toc1"]
+        assert bookmarks.get("missing") is None
+        with pytest.raises(KeyError):
+            bookmarks["missing"]
+
+    def it_can_add_a_bookmark(self):
+        document = Document()
+        first = document.add_paragraph("first", style="Heading 1")
+        run = document.add_paragraph("second").runs[0]
+        bookmarks = document.bookmarks
+        assert len(bookmarks) == 0
+
+        bookmark = bookmarks.add("span", first, run)
+        other = bookmarks.add("run", run)
+
+        assert cast(Paragraph, bookmark.block)._p is first._p
+        assert bookmark.id != other.id
+        assert first._p[1].tag.endswith("bookmarkStart")
+        assert run._r.getnext().tag.endswith("bookmarkEnd")
+        assert run._r.getprevious().get(qn("w:name")) == "run"
+        assert "span" in document.bookmarks
+        with pytest.raises(ValueError, match="already has a bookmark named 'span'"):
+            bookmarks.add("span", first)
+
+    def it_can_remove_a_bookmark(self):
+        document = document_with_body(
+            'w:body/w:p/(w:bookmarkStart{w:id=1,w:name=a},w:r/w:t"x",w:bookmarkEnd{w:id=1})'
+        )
+        bookmarks = document.bookmarks
+
+        bookmarks.remove("a")
+
+        assert "a" not in bookmarks
+        assert [child.tag for child in document.paragraphs[0]._p] == [qn("w:r")]
+        with pytest.raises(KeyError):
+            bookmarks.remove("a")
+
+
+class DescribeHyperlink_bookmark:
+    """Unit-test suite for `Hyperlink.bookmark`."""
+
+    def it_resolves_an_internal_hyperlink_to_its_bookmark(self):
+        document = Document()
+        target = document.add_paragraph("Target")
+        document.bookmarks.add("target", target)
+        paragraph = document.add_paragraph()
+        internal = paragraph.add_hyperlink("go", "#target")
+        broken = paragraph.add_hyperlink("lost", "#nowhere")
+        external = paragraph.add_hyperlink("web", "https://example.com/#target")
+
+        assert internal.bookmark is not None
+        assert cast(Paragraph, internal.bookmark.block)._p is target._p
+        assert broken.bookmark is None
+        assert external.bookmark is None
@@ -0,0 +1,166 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit test suite for the docx.comments module."""
+
+from __future__ import annotations
+
+import io
+
+from docx import Document
+from docx.comments import CommentPerson
+from docx.oxml.ns import qn
+from docx.oxml.parser import OxmlElement
+from docx.parts.comments import CommentsExtendedPart, CommentsPart
+from docx.parts.people import PeoplePart
+
+from .unitutil.cxml import element
+from .unitutil.document import document_with_body
+
+
+def _document_with_comments():
+    """Document having two comments and a reply, and the anchors of the first two."""
+    document = document_with_body(
+        "w:body/("
+        'w:p/(w:r/w:t"See ",w:commentRangeStart{w:id=1},w:r/w:t"this",'
+        'w:r/w:t" text",w:commentRangeEnd{w:id=1},w:r/w:commentReference{w:id=1}),'
+        'w:p/(w:commentRangeStart{w:id=2},w:r/w:t"one"),'
+        'w:p/(w:r/(w:t"two",w:tab),w:commentRangeEnd{w:id=2},w:r/w:commentReference{w:id=2}),'
+        "w:sectPr)"
+    )
+    part = document.part
+    comments = part._comments_part.element
+    for cxml, para_id in (
+        ('w:comment{w:id=1,w:author=Ann,w:initials=A}/w:p/w:r/w:t"Why?"', None),
+        ('w:comment{w:id=2,w:author=Bob}/w:p/w:r/w:t"Check"', "0000000B"),
+        ('w:comment{w:id=3,w:author=Ann}/w:p/w:r/w:t"Done"', "0000000C"),
+    ):
+        comment = element(cxml)
+        if para_id is not None:
+            comment[0].set(qn("w14:paraId"), para_id)
+        comments.append(comment)
+    comments[0].set(qn("w:date"), "2024-05-01T10:00:00Z")
+    extended = part._comments_extended_part.element
+    for attrs in (
+        {"w15:paraId": "0000000B", "w15:done": "1"},
+        {"w15:paraId": "0000000C", "w15:paraIdParent": "0000000B", "w15:done": "0"},
+    ):
+        extended.append(OxmlElement("w15:commentEx", attrs={qn(k): v for k, v in attrs.items()}))
+    person = OxmlElement("w15:person", attrs={qn("w15:author"): "Bob"})
+    person.append(
+        OxmlElement(
+            "w15:presenceInfo", attrs={qn("w15:providerId"): "None", qn("w15:userId"): "bob"}
+        )
+    )
+    part._people_part.element.append(person)
+    return document
+
+
+class DescribeCommentIndex:
+    """Unit-test suite for `docx.comments.CommentIndex`."""
+
+    def it_indexes_comment_anchors_text_and_extended_data(self):
+        document = _document_with_comments()
+        index = document.part.comment_index
+        body = document.element.body
+
+        assert index.comment_ids() == [1, 2, 3]
+        anchor = index.anchor(1)
+        assert anchor is not None
+        assert anchor.range_start is body[0][1]
+        assert anchor.range_end is body[0][4]
+        assert anchor.reference is body[0][5][0]
+        assert anchor.part is document.part
+        assert index.anchored_text(1) == "this text"
+        assert index.anchored_text(2) == "one\ntwo\t"
+        assert index.anchor(3) is None
+        assert index.reply_ids(2) == [3]
+        assert index.person("Bob") == CommentPerson("Bob", "None", "bob")
+        assert index.person("Ann") is None
+        assert index.next_id() == 4
+
+
+class DescribeComment:
+    """Unit-test suite for `docx.comments.Comment`."""
+
+    def it_provides_access_to_the_comment_and_its_extended_data(self):
+        document = _document_with_comments()
+
+        first, second, third = document.comments
+
+        assert (first.id, first.author, first.initials, first.text) == (1, "Ann", "A", "Why?")
+        assert first.date is not None
+        assert first.date.year == 2024
+        assert first.anchored_text == "this text"
+        assert (first.done, second.done, third.done) == (False, True, False)
+        assert [reply.id for reply in second.replies] == [3]
+        assert third.parent is not None
+        assert third.parent.id == 2
+        assert second.person == CommentPerson("Bob", "None", "bob")
+        assert document.comments.get(9) is None
+
+    def it_can_be_marked_done(self):
+        document = _document_with_comments()
+        comment = document.comments.get(1)
+        assert comment is not None
+
+        comment.done = True
+
+        assert comment.done is True
+        para_id = comment._element.p_lst[-1].get(qn("w14:paraId"))
+        assert para_id is not None
+        refreshed = document.part.comment_index
+        refreshed.refresh()
+        assert document.comments.get(1).done is True  # pyright: ignore[reportOptionalMemberAccess]
+
+
+class DescribeDocument_add_comment:
+    """Unit-test suite for `Document.add_comment()`."""
+
+    def it_anchors_a_new_comment_on_runs(self):
+        document = Document()
+        paragraph = document.add_paragraph("Before ")
+        runs = [paragraph.add_run("commented"), paragraph.add_run(" text")]
+        paragraph.add_run(" after")
+
+        comment = document.add_comment(runs, "Please check", author="Ann", initials="A")
+
+        assert (comment.id, comment.author, comment.text) == (0, "Ann", "Please check")
+        assert comment.anchored_text == "commented text"
+        assert [e.tag.rsplit("}", 1)[1] for e in paragraph._p] == [
+            "r",
+            "commentRangeStart",
+            "r",
+            "r",
+            "commentRangeEnd",
+            "r",
+            "r",
+        ]
+        assert paragraph.text == "Before commented text after"
+        document.part.comment_index.refresh()
+        assert document.part.comment_index.anchored_text(0) == "commented text"
+
+    def it_can_add_a_reply_that_survives_a_round_trip(self):
+        document = Document()
+        run = document.add_paragraph().add_run("text")
+        comment = document.add_comment(run, "Question", author="Ann")
+        reply = comment.add_reply("Answer", author="Bob")
+        reply.done = True
+
+        stream = io.BytesIO()
+        document.save(stream)
+        stream.seek(0)
+        reloaded = Document(stream)
+
+        assert isinstance(reloaded.part._comments_part, CommentsPart)
+        assert isinstance(reloaded.part._comments_extended_part, CommentsExtendedPart)
+        comment, reply = reloaded.comments
+        assert [r.text for r in comment.replies] == ["Answer"]
+        assert reply.anchored_text == "text"
+        assert (comment.done, reply.done) == (False, True)
+
+    def and_it_does_not_treat_the_comments_as_a_document_story(self):
+        document = Document()
+        document.add_comment(document.add_paragraph().add_run("x"), "note")
+
+        assert not any(isinstance(p, CommentsPart) for p in document.part.iter_story_parts())
+        assert isinstance(PeoplePart.new(document.part.package), PeoplePart)  # pyright: ignore
@@ -0,0 +1,201 @@
+# pyright: reportPrivateUsage=false
+
+"""Test suite for the docx.compose module."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+import docx
+from docx.api import Document
+from docx.compose import Composer, compose
+from docx.enum.style import WD_STYLE_TYPE
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml.ns import nsdecls, qn
+from docx.oxml.parser import parse_xml
+
+from .unitutil.file import test_file
+
+
+class DescribeCompose:
+    def it_appends_the_body_content_of_each_document_in_order(self):
+        documents = [Document() for _ in range(3)]
+        for n, document in enumerate(documents):
+            document.add_paragraph("doc %d" % n)
+        documents[1].add_table(1, 1).cell(0, 0).text = "cell"
+
+        composed = compose(documents)
+
+        assert composed is documents[0]
+        assert [p.text for p in composed.paragraphs] == ["doc 0", "doc 1", "doc 2"]
+        assert composed.tables[0].cell(0, 0).text == "cell"
+        body = composed.element.body
+        assert body[-1].tag == qn("w:sectPr")
+        assert len(body.findall(qn("w:sectPr"))) == 1
+
+    def it_is_available_as_docx_compose(self):
+        assert docx.compose is compose
+
+    def but_it_raises_when_there_are_no_documents(self):
+        with pytest.raises(ValueError, match="at least one document"):
+            compose([])
+
+
+class DescribeComposer:
+    def it_maps_styles_by_name_and_copies_those_missing(self):
+        target, source = Document(), Document()
+        source.styles["Heading 1"].element.styleId = "Berschrift1"
+        source.add_paragraph("heading", style="Heading 1")
+        custom = source.styles.add_style("Custom", WD_STYLE_TYPE.PARAGRAPH)
+        custom.base_style = source.styles["Heading 1"]
+        source.add_paragraph("custom", style="Custom")
+        clash = target.styles.add_style("Other", WD_STYLE_TYPE.PARAGRAPH)
+        clash.element.styleId = "Custom"
+
+        Composer(target).append(source)
+
+        heading, custom_p = target.paragraphs
+        assert heading.style.name == "Heading 1"
+        assert heading._p.pPr.pStyle.val == "Heading1"
+        assert custom_p.style.name == "Custom"
+        assert custom_p.style.style_id == "Custom2"
+        assert custom_p.style.base_style.name == "Heading 1"
+
+    def it_copies_list_definitions_under_new_ids(self):
+        target, source = Document(), Document()
+        paragraph = source.add_paragraph("item")
+        numPr = paragraph._p.get_or_add_pPr().get_or_add_numPr()
+        numPr.get_or_add_ilvl().val = 0
+        numPr.get_or_add_numId().val = 2
+        target_numbering = target.part.numbering_part
+        num_count = len(target_numbering.element.num_lst)
+
+        composer = Composer(target)
+        composer.append(source)
+        composer.append(source)
+
+        numIds = [p._p.pPr.numPr.numId.val for p in target.paragraphs]
+        assert len(set(numIds)) == 2
+        nums = target_numbering.element.num_lst
+        assert len(nums) == num_count + 2
+        source_abstract = source.part.numbering_part.get_abstract_by_num_id(2)
+        for numId in numIds:
+            abstractNum = target_numbering.get_abstract_by_num_id(numId)
+            assert abstractNum is not None
+            assert len(abstractNum) == len(source_abstract)
+        children = [child.tag for child in target_numbering.element]
+        assert children.index(qn("w:num")) > max(
+            i for i, tag in enumerate(children) if tag == qn("w:abstractNum")
+        )
+
+    def it_shares_identical_images_and_keeps_shape_ids_unique(self):
+        target = Document()
+        source = Document(test_file("having-images.docx"))
+        image_count = len(source.part.package.image_parts)
+
+        composer = Composer(target)
+        composer.append(source)
+        composer.append(source)
+
+        file = io.BytesIO()
+        target.save(file)
+        composed = Document(file)
+        assert len(composed.part.package.image_parts) == image_count
+        assert len(composed.inline_shapes) == 2 * len(source.inline_shapes)
+        shape_ids = [shape._inline.docPr.id for shape in composed.inline_shapes]
+        assert len(set(shape_ids)) == len(shape_ids)
+        related_parts = composed.part.related_parts
+        for blip in composed.element.body.xpath(".//a:blip"):
+            assert related_parts[blip.get(qn("r:embed"))] in composed.part.package.image_parts
+
+    def it_recreates_external_relationships(self):
+        target, source = Document(), Document()
+        target.add_paragraph().add_hyperlink("target", "https://example.com/a")
+        source.add_paragraph().add_hyperlink("source", "https://example.com/b")
+
+        Composer(target).append(source)
+
+        rIds = [h.get(qn("r:id")) for h in target.element.body.iter(qn("w:hyperlink"))]
+        assert len(set(rIds)) == 2
+        rels = target.part.rels
+        assert rels[rIds[1]].target_ref == "https://example.com/b"
+        assert rels[rIds[1]].reltype == RT.HYPERLINK
+
+    def it_copies_the_footnotes_referenced_by_the_content(self):
+        target, source = Document(), Document()
+        footnotes = source.part._footnotes_part.element
+        footnotes.append(
+            parse_xml(
+                '<w:footnote %s w:id="1"><w:p><w:r><w:t>note</w:t></w:r></w:p></w:footnote>'
+                % nsdecls("w")
+            )
+        )
+        source.element.body.sectPr.addprevious(
+            parse_xml('<w:p %s><w:r><w:footnoteReference w:id="1"/></w:r></w:p>' % nsdecls("w"))
+        )
+        target_footnotes = target.part._footnotes_part.element
+        note_count = len(target_footnotes)
+
+        composer = Composer(target)
+        composer.append(source)
+        composer.append(source)
+
+        refs = target.element.body.xpath(".//w:footnoteReference/@w:id")
+        assert len(set(refs)) == 2
+        assert len(target_footnotes) == note_count + 2
+        for ref in refs:
+            (note,) = target_footnotes.xpath("./w:footnote[@w:id=%s]" % ref)
+            assert note.xpath("string(.)") == "note"
+
+    def it_gives_bookmarks_and_content_controls_ids_unused_in_the_document(self):
+        target, source = Document(), Document()
+        for document in (target, source):
+            document.element.body.sectPr.addprevious(
+                parse_xml(
+                    '<w:p %s><w:hyperlink w:anchor="Intro"><w:r><w:t>see</w:t></w:r>'
+                    '</w:hyperlink><w:bookmarkStart w:id="0" w:name="Intro"/>'
+                    '<w:sdt><w:sdtPr><w:id w:val="7"/></w:sdtPr><w:sdtContent><w:r>'
+                    '<w:t>x</w:t></w:r></w:sdtContent></w:sdt><w:bookmarkEnd w:id="0"/>'
+                    "</w:p>" % nsdecls("w")
+                )
+            )
+
+        composer = Composer(target)
+        composer.append(source)
+        composer.append(source)
+
+        body = target.element.body
+        assert body.xpath(".//w:bookmarkStart/@w:id") == ["0", "1", "2"]
+        assert body.xpath(".//w:bookmarkEnd/@w:id") == ["0", "1", "2"]
+        assert body.xpath(".//w:bookmarkStart/@w:name") == ["Intro", "Intro2", "Intro3"]
+        assert body.xpath(".//w:hyperlink/@w:anchor") == ["Intro", "Intro2", "Intro3"]
+        assert body.xpath(".//w:sdtPr/w:id/@w:val") == ["7", "8", "9"]
+        assert [b.name for b in target.bookmarks] == ["Intro", "Intro2", "Intro3"]
+        assert target.content_controls.get_by_id(9) is not None
+
+    def it_removes_comment_marks_from_the_content(self):
+        target, source = Document(), Document()
+        source.element.body.sectPr.addprevious(
+            parse_xml(
+                '<w:p %s><w:commentRangeStart w:id="0"/><w:r><w:t>x</w:t></w:r>'
+                '<w:commentRangeEnd w:id="0"/><w:r><w:commentReference w:id="0"/></w:r>'
+                "</w:p>" % nsdecls("w")
+            )
+        )
+
+        Composer(target).append(source)
+
+        body = target.element.body
+        assert body.xpath(".//w:commentRangeStart | .//w:commentReference") == []
+        assert target.paragraphs[0].text == "x"
+
+
+class DescribeDocument_append_document:
+    def it_appends_another_document(self):
+        target, source = Document(), Document(test_file("test.docx"))
+
+        target.append_document(source)
+
+        assert [p.text for p in target.paragraphs] == [p.text for p in source.paragraphs]
@@ -0,0 +1,55 @@
+"""Test suite for the docx.diagnostics module."""
+
+from __future__ import annotations
+
+from docx.api import Document
+from docx.diagnostics import memory_report
+
+from .unitutil.file import test_file
+
+
+class DescribeMemoryReport:
+    def it_estimates_the_memory_held_by_each_part(self):
+        document = Document(test_file("having-images.docx"))
+
+        report = document.memory_report()
+
+        parts = {str(part.partname): part for part in report.parts}
+        assert set(parts) == {str(part.partname) for part in document.part.package.iter_parts()}
+        document_xml = parts["/word/document.xml"]
+        assert document_xml.element_count == len(list(document.element.iter()))
+        assert document_xml.blob_size == 0
+        assert document_xml.serialized_size == len(document.part.blob)
+        assert document_xml.retained_size > document_xml.element_count
+        images = [part for part in report.parts if part.content_type.startswith("image/")]
+        assert images
+        assert all(part.retained_size == part.blob_size > 0 for part in images)
+        assert report.retained_size == sum(part.retained_size for part in report.parts)
+        sizes = [part.retained_size for part in report.parts]
+        assert sizes == sorted(sizes, reverse=True)
+
+    def it_counts_the_proxies_cached_for_a_story_part(self):
+        document = Document()
+        document.cache_proxies = True
+        document.add_paragraph("a")
+        paragraphs = list(document.paragraphs)
+
+        report = document.memory_report()
+
+        (document_xml,) = [p for p in report.parts if p.partname == "/word/document.xml"]
+        assert document_xml.proxy_count == len(paragraphs)
+
+    def it_reports_blobs_stored_in_more_than_one_part(self):
+        document = Document(test_file("having-images.docx"))
+        package = document.part.package
+        image_part = next(iter(package.image_parts))
+        copy = image_part.clone(package)
+        copy.partname = package.next_partname("/word/media/image%d.png")
+        document.part.relate_to(copy, "http://example.com/image")
+
+        duplicates = memory_report(package).duplicates
+
+        assert duplicates == [
+            (image_part.sha1, len(image_part.blob), sorted([image_part.partname, copy.partname]))
+        ]
+        assert "total" in str(memory_report(package))
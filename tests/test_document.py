@@ -18,7 +18,7 @@ from docx.parts.document import DocumentPart
 from docx.section import Section, Sections
 from docx.settings import Settings
 from docx.shape import InlineShape, InlineShapes
-from docx.shared import Length
+from docx.shared import Length, ProxyCache
 from docx.styles.styles import Styles
 from docx.table import Table
 from docx.text.paragraph import Paragraph
@@ -117,6 +117,58 @@ class DescribeDocument:
 
         assert list(document.iter_inner_content()) == [1, 2, 3]
 
+    def it_can_iterate_the_list_labels_of_the_document(
+        self, document_part_: Mock, body_prop_: Mock, body_: Mock
+    ):
+        document_elm = cast(
+            CT_Document,
+            element(
+                'w:document/w:body/(w:p/w:r/w:t"head",w:p/w:pPr/w:numPr/w:numId{w:val=1},'
+                "w:tbl/w:tr/w:tc/w:p/w:pPr/w:numPr/w:numId{w:val=1})"
+            ),
+        )
+        body_prop_.return_value = body_
+        labeler_ = document_part_.new_list_labeler.return_value
+        labeler_.label_for.side_effect = [None, "1.", "2."]
+        document = Document(document_elm, document_part_)
+
+        pairs = list(document.iter_list_labels())
+
+        ps = document_elm.body.xpath(".//w:p")
+        assert [(p._p, label) for p, label in pairs] == [(ps[1], "1."), (ps[2], "2.")]
+        assert all(p._parent is body_ for p, _ in pairs)
+
+    def but_it_generates_no_labels_when_the_document_has_no_numbering(
+        self, document_part_: Mock
+    ):
+        document_part_.new_list_labeler.return_value = None
+        document = Document(cast(CT_Document, element("w:document/w:body/w:p")), document_part_)
+
+        assert list(document.iter_list_labels()) == []
+
+    def it_can_replace_text_throughout_its_stories(self, document_part_: Mock):
+        body_part_, header_part_ = Mock(), Mock()
+        body_part_.element = element('w:document/w:body/w:p/(w:r/w:t"{{a",w:r/w:t"}}")')
+        header_part_.element = element('w:hdr/w:p/w:r/w:t"{{a}} {{a}}"')
+        document_part_.iter_story_parts.return_value = iter((body_part_, header_part_))
+        document = Document(body_part_.element, document_part_)
+
+        count = document.replace({"{{a}}": "b"})
+
+        assert count == 3
+        assert header_part_.element.xpath("string(.)") == "b b"
+        assert body_part_.element.xpath("string(.)") == "b"
+
+    def it_can_merge_runs_throughout_its_stories(self, document_part_: Mock):
+        body_part_, header_part_ = Mock(), Mock()
+        body_part_.element = element('w:document/w:body/w:p/(w:r/w:t"a",w:r/w:t"b")')
+        header_part_.element = element('w:hdr/w:p/(w:r/w:t"c",w:r/w:t"d",w:r/w:t"e")')
+        document_part_.iter_story_parts.return_value = iter((body_part_, header_part_))
+        document = Document(body_part_.element, document_part_)
+
+        assert document.normalize() == 3
+        assert len(header_part_.element.xpath("//w:r")) == 1
+
     def it_provides_access_to_its_paragraphs(self, paragraphs_fixture):
         document, paragraphs_ = paragraphs_fixture
         paragraphs = document.paragraphs
@@ -145,6 +197,35 @@ class DescribeDocument:
         tables = document.tables
         assert tables is tables_
 
+    def it_can_enable_and_disable_proxy_caching(self, document_part_: Mock):
+        document_part_.proxy_cache = None
+        document = Document(cast(CT_Document, element("w:document/w:body/w:p")), document_part_)
+        assert document.cache_proxies is False
+
+        document.cache_proxies = True
+        cache = document_part_.proxy_cache
+        assert isinstance(cache, ProxyCache)
+        assert document.cache_proxies is True
+        assert document.paragraphs[0] is document.paragraphs[0]
+
+        document.cache_proxies = True
+        assert document_part_.proxy_cache is cache
+
+        document.cache_proxies = False
+        assert document_part_.proxy_cache is None
+        assert document.cache_proxies is False
+
+    def it_can_clone_itself(self, request, document_part_: Mock):
+        clone_ = instance_mock(request, Document, name="clone_")
+        package_clone_ = document_part_.package.clone.return_value
+        package_clone_.main_document_part.document = clone_
+        document = Document(cast(CT_Document, element("w:document")), document_part_)
+
+        clone = document.clone()
+
+        document_part_.package.clone.assert_called_once_with()
+        assert clone is clone_
+
     def it_provides_access_to_the_document_part(self, part_fixture):
         document, part_ = part_fixture
         assert document.part is part_
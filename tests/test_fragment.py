@@ -0,0 +1,179 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit test suite for the docx.fragment module."""
+
+from __future__ import annotations
+
+import pytest
+
+from docx import Document
+from docx.fragment import Fragment
+from docx.oxml.ns import nsdecls, qn
+from docx.oxml.parser import parse_xml
+from docx.shared import Inches
+
+from .unitutil.file import test_file
+
+
+def _template():
+    document = Document()
+    heading = document.add_paragraph("Invoice for ")
+    heading.add_run("{{cust").bold = True
+    heading.add_run("omer}}")
+    heading.add_run(", {{date}}")
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "Item"
+    table.cell(0, 1).text = "{{currency}}"
+    table.cell(1, 0).text = "{{lines.item}}"
+    table.cell(1, 1).text = "{{lines.amount}}"
+    logo = document.add_paragraph("Logo: {{image:logo}} end")
+    return document, [heading, table, logo]
+
+
+class DescribeFragment:
+    """Unit-test suite for `docx.fragment.Fragment`."""
+
+    def it_knows_the_slots_it_has(self):
+        document, blocks = _template()
+
+        fragment = Fragment.capture(blocks)
+
+        assert fragment.slots == (
+            "currency",
+            "customer",
+            "date",
+            "lines.amount",
+            "lines.item",
+            "logo",
+        )
+
+    def it_stamps_a_filled_copy_of_the_captured_blocks(self):
+        document, blocks = _template()
+        fragment = Fragment.capture(blocks, remove=True)
+        assert len(document.paragraphs) == 0
+
+        fragment.stamp(
+            document,
+            customer="Acme",
+            date="today",
+            currency="EUR",
+            lines=[{"item": "bolts", "amount": 3}, {"item": "nuts", "amount": 4}],
+            logo=(test_file("monty-truth.png"), Inches(1), None),
+        )
+        fragment.stamp(
+            document,
+            {"customer": "Bob", "date": None, "currency": "USD", "lines": [], "logo": None},
+        )
+
+        paragraphs = document.paragraphs
+        assert paragraphs[0].text == "Invoice for Acme, today"
+        assert paragraphs[0].runs[1].text == "Acme"
+        assert paragraphs[0].runs[1].bold is True
+        assert paragraphs[1].text == "Logo:  end"
+        assert paragraphs[2].text == "Invoice for Bob, "
+        assert paragraphs[3].text == "Logo:  end"
+        first, second = document.tables
+        assert [[c.text for c in row.cells] for row in first.rows] == [
+            ["Item", "EUR"],
+            ["bolts", "3"],
+            ["nuts", "4"],
+        ]
+        assert [[c.text for c in row.cells] for row in second.rows] == [["Item", "USD"]]
+        assert len(document.inline_shapes) == 1
+        assert document.inline_shapes[0].width == Inches(1)
+        assert document.element.body[-1].tag == qn("w:sectPr")
+
+    def it_reuses_the_image_relationship_for_each_stamp(self):
+        document, blocks = _template()
+        fragment = Fragment.capture(blocks, remove=True)
+
+        for i in range(3):
+            fragment.stamp(
+                document,
+                customer=i,
+                date="",
+                currency="",
+                lines=[],
+                logo=test_file("monty-truth.png"),
+            )
+
+        rIds = {
+            shape._inline.graphic.graphicData.pic.blipFill.blip.embed
+            for shape in document.inline_shapes
+        }
+        assert len(rIds) == 1
+        ids = document.element.xpath("//wp:docPr/@id")
+        assert len(set(ids)) == len(ids) == 3
+
+    def it_can_stamp_into_another_document(self):
+        template = Document(test_file("having-images.docx"))
+        style = template.styles.add_style("Fancy", 1)
+        paragraph = template.add_paragraph("Hello {{name}}", style)
+        blocks = [paragraph, *[p for p in template.paragraphs if p._p.xpath(".//a:blip")]]
+        fragment = Fragment.capture(blocks)
+        document = Document()
+
+        fragment.stamp(document, name="world")
+        fragment.stamp(document, name="again")
+
+        assert [p.text for p in document.paragraphs][:: len(blocks)] == [
+            "Hello world",
+            "Hello again",
+        ]
+        assert document.paragraphs[0].style.name == "Fancy"
+        image_parts = {
+            shape._inline.xpath(".//a:blip/@r:embed")[0] for shape in document.inline_shapes
+        }
+        assert all(document.part.related_parts[rId] for rId in image_parts)
+        assert len(document.part.package.image_parts) == len(template.part.package.image_parts)
+
+    def it_can_stamp_into_a_table_cell(self):
+        document = Document()
+        fragment = Fragment.capture([document.add_paragraph("{{a}}-{{b}}")], remove=True)
+        cell = document.add_table(rows=1, cols=1).cell(0, 0)
+
+        fragment.stamp(cell, a=1, b=2)
+
+        assert [p.text for p in cell.paragraphs] == ["", "1-2"]
+
+    def it_gives_bookmarks_and_content_controls_new_ids_on_each_stamp(self):
+        document = Document()
+        paragraph = document.add_paragraph("{{a}}")
+        paragraph._p.append(
+            parse_xml(
+                '<w:sdt %s><w:sdtPr><w:id w:val="7"/></w:sdtPr><w:sdtContent><w:r><w:t>x</w:t>'
+                "</w:r></w:sdtContent></w:sdt>" % nsdecls("w")
+            )
+        )
+        document.bookmarks.add("bm", paragraph)
+        fragment = Fragment.capture([paragraph])
+
+        fragment.stamp(document, a=1)
+        fragment.stamp(document, a=2)
+
+        body = document.element.body
+        starts = [
+            (e.get(qn("w:id")), e.get(qn("w:name"))) for e in body.iter(qn("w:bookmarkStart"))
+        ]
+        assert starts == [("0", "bm"), ("1", "bm2"), ("2", "bm3")]
+        assert body.xpath(".//w:bookmarkEnd/@w:id") == ["0", "1", "2"]
+        assert body.xpath(".//w:sdtPr/w:id/@w:val") == ["7", "8", "9"]
+        assert [b.name for b in document.bookmarks] == ["bm", "bm2", "bm3"]
+        assert document.bookmarks["bm3"].block.text == "2x"  # pyright: ignore
+        assert document.content_controls.get_by_id(9) is not None
+
+    def it_raises_on_a_slot_with_no_value(self):
+        document = Document()
+        fragment = Fragment.capture([document.add_paragraph("{{a}}")])
+
+        with pytest.raises(KeyError, match="no value for slot 'a'"):
+            fragment.stamp(document)
+
+    def but_it_rejects_a_row_repeating_for_two_slots(self):
+        document = Document()
+        table = document.add_table(rows=1, cols=2)
+        table.cell(0, 0).text = "{{a.x}}"
+        table.cell(0, 1).text = "{{b.x}}"
+
+        with pytest.raises(ValueError, match="only one row slot"):
+            Fragment.capture([table])
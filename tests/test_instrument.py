@@ -0,0 +1,87 @@
+# pyright: reportPrivateUsage=false
+
+"""Test suite for the docx.instrument module."""
+
+from __future__ import annotations
+
+import io
+from typing import List
+
+import pytest
+from lxml import etree
+
+from docx import instrument
+from docx.api import Document
+from docx.instrument import Span, instrumented
+from docx.opc.part import XmlPart
+from docx.oxml.xmlchemy import BaseOxmlElement
+
+from .unitutil.file import test_file
+
+
+class DescribeInstrumented:
+    def it_records_spans_for_the_phases_of_open_and_save(self):
+        with instrumented() as recorder:
+            document = Document(test_file("test.docx"))
+            document.save(io.BytesIO())
+
+        totals = recorder.totals
+        assert set(totals) >= {
+            "PhysPkgReader.blob_for",
+            "XmlPart.load",
+            "Unmarshaller.unmarshal",
+            "OpcPackage.save",
+            "PackageWriter._write_parts",
+            "Part.write_to",
+        }
+        assert set(totals) <= set(instrument.SPAN_NAMES)
+        assert totals["Unmarshaller.unmarshal"]["count"] == 1
+        assert totals["PhysPkgReader.blob_for"]["bytes"] > 0
+        loaded = {s.attrs["partname"] for s in recorder.spans if s.name == "XmlPart.load"}
+        assert "/word/document.xml" in loaded
+
+    def it_records_xpath_evaluations(self):
+        document = Document()
+        with instrumented() as recorder:
+            document.element.xpath("./w:body/w:p")
+
+        (span,) = recorder.spans
+        assert span.name == "BaseOxmlElement.xpath"
+        assert span.attrs == {"xpath": "./w:body/w:p", "results": 0}
+
+    def it_records_a_call_that_raises_with_its_error(self):
+        document = Document()
+        with instrumented() as recorder, pytest.raises(etree.XPathEvalError):
+            document.element.xpath("./w:body/[")
+
+        (span,) = recorder.spans
+        assert span.name == "BaseOxmlElement.xpath"
+        assert span.attrs == {"error": "XPathEvalError"}
+        assert span.duration >= 0
+
+    def it_restores_the_instrumented_methods_when_done(self):
+        load = XmlPart.__dict__["load"]
+        xpath = BaseOxmlElement.__dict__["xpath"]
+
+        with instrumented():
+            assert XmlPart.__dict__["load"] is not load
+
+        assert XmlPart.__dict__["load"] is load
+        assert BaseOxmlElement.__dict__["xpath"] is xpath
+
+
+class DescribeEnable:
+    def it_reports_spans_to_each_callback_until_disabled(self):
+        first: List[Span] = []
+        second: List[Span] = []
+        instrument.enable(first.append)
+        instrument.enable(second.append)
+        try:
+            Document().save(io.BytesIO())
+            instrument.disable(first.append)
+            Document().save(io.BytesIO())
+        finally:
+            instrument.disable(second.append)
+
+        assert 0 < len(first) < len(second)
+        assert not instrument._installed
@@ -0,0 +1,85 @@
+"""Test suite for the docx.metadata module."""
+
+from __future__ import annotations
+
+import io
+import zipfile
+
+import pytest
+
+from docx.api import Document
+from docx.metadata import probe
+from docx.opc.constants import CONTENT_TYPE as CT
+
+from .unitutil.file import test_file
+
+
+class DescribeProbe:
+    def it_reads_the_core_and_app_properties(self):
+        document_probe = probe(test_file("test.docx"))
+
+        core_properties = document_probe.core_properties
+        app_properties = document_probe.app_properties
+        assert core_properties is not None
+        assert core_properties.last_modified_by == "Steve Canny"
+        assert app_properties is not None
+        assert app_properties.application == "Microsoft Macintosh Word"
+        assert app_properties.pages == 1
+        assert app_properties.words == 7
+        assert app_properties.characters_with_spaces == 47
+        assert app_properties.company == ""
+
+    def it_lists_the_parts_with_their_sizes(self):
+        document_probe = probe(test_file("test.docx"))
+
+        parts = {str(part.partname): part for part in document_probe.parts}
+        document_part = parts["/word/document.xml"]
+        assert document_part.content_type == CT.WML_DOCUMENT_MAIN
+        assert (document_part.size, document_part.stored_size) == (1820, 645)
+        assert parts["/_rels/.rels"].content_type == CT.OPC_RELATIONSHIPS
+        assert "/[Content_Types].xml" not in parts
+        assert document_probe.size == sum(part.size for part in document_probe.parts)
+
+    def it_does_not_read_the_main_document_part(self, monkeypatch: pytest.MonkeyPatch):
+        read_names: list[str] = []
+        read = zipfile.ZipFile.read
+
+        def spy_read(zipf: zipfile.ZipFile, name: str, pwd: bytes | None = None) -> bytes:
+            read_names.append(name)
+            return read(zipf, name, pwd)
+
+        monkeypatch.setattr(zipfile.ZipFile, "read", spy_read)
+
+        probe(test_file("test.docx"))
+
+        assert sorted(read_names) == [
+            "[Content_Types].xml",
+            "_rels/.rels",
+            "docProps/app.xml",
+            "docProps/core.xml",
+        ]
+
+    def it_accepts_a_stream(self):
+        stream = io.BytesIO()
+        document = Document()
+        document.core_properties.title = "Probed"
+        document.save(stream)
+
+        document_probe = probe(stream)
+
+        assert document_probe.core_properties is not None
+        assert document_probe.core_properties.title == "Probed"
+
+    def it_raises_on_a_package_that_is_not_a_Word_file(self):
+        stream = io.BytesIO()
+        Document().save(stream)
+        not_docx = io.BytesIO()
+        with zipfile.ZipFile(stream) as src, zipfile.ZipFile(not_docx, "w") as dst:
+            for name in src.namelist():
+                blob = src.read(name)
+                if name == "[Content_Types].xml":
+                    blob = blob.replace(CT.WML_DOCUMENT_MAIN.encode(), b"app/vnd.other")
+                dst.writestr(name, blob)
+
+        with pytest.raises(ValueError, match="is not a Word file, content type is 'app/vnd"):
+            probe(not_docx)
@@ -0,0 +1,129 @@
+"""Unit test suite for the docx.numbering module."""
+
+from __future__ import annotations
+
+from typing import cast
+
+import pytest
+
+from docx.numbering import ListLabeler, format_number
+from docx.oxml.numbering import CT_Numbering
+from docx.oxml.styles import CT_Styles
+from docx.oxml.text.paragraph import CT_P
+from docx.parts.numbering import NumberingPart
+
+from .unitutil.cxml import element
+
+
+class DescribeListLabeler:
+    """Unit-test suite for `docx.numbering.ListLabeler` objects."""
+
+    def it_renders_multi_level_labels_in_document_order(self):
+        labeler = ListLabeler(self.numbering_part())
+        levels = [0, 1, 1, 2, 2, 1, 0, 2]
+
+        labels = [labeler.label_for(self.p(1, ilvl)) for ilvl in levels]
+
+        assert labels == ["1.", "1.a", "1.b", "1.b.i", "1.b.ii", "1.c", "2.", "2.a.i"]
+
+    def it_returns_None_for_a_paragraph_that_is_not_numbered(self):
+        labeler = ListLabeler(self.numbering_part())
+        p = cast(CT_P, element("w:p"))
+
+        assert labeler.label_for(p) is None
+        assert labeler.label_for(self.p(0, 0)) is None
+        assert labeler.label_for(self.p(42, 0)) is None
+
+    def it_continues_numbering_across_nums_sharing_an_abstractNum(self):
+        labeler = ListLabeler(self.numbering_part())
+
+        labels = [labeler.label_for(self.p(num_id, 0)) for num_id in (1, 1, 2, 1)]
+
+        assert labels == ["1.", "2.", "3.", "4."]
+
+    def it_honors_a_start_override(self):
+        labeler = ListLabeler(self.numbering_part())
+
+        labels = [labeler.label_for(self.p(num_id, 0)) for num_id in (1, 1, 3, 3, 1)]
+
+        assert labels == ["1.", "2.", "7.", "8.", "3."]
+
+    def it_honors_lvlRestart(self):
+        labeler = ListLabeler(self.numbering_part())
+        levels = [0, 3, 3, 0, 3]
+
+        labels = [labeler.label_for(self.p(1, ilvl)) for ilvl in levels]
+
+        assert labels == ["1.", "-1-", "-2-", "2.", "-3-"]
+
+    def it_gets_numbering_from_the_paragraph_style_when_not_applied_directly(self):
+        styles = cast(
+            CT_Styles,
+            element(
+                "w:styles/("
+                "w:style{w:type=paragraph,w:styleId=Base}/w:pPr/w:numPr/w:numId{w:val=1},"
+                "w:style{w:type=paragraph,w:styleId=Sub}/("
+                "w:basedOn{w:val=Base},w:pPr/w:numPr/w:ilvl{w:val=1}))"
+            ),
+        )
+        labeler = ListLabeler(self.numbering_part(), styles)
+        p_base = cast(CT_P, element("w:p/w:pPr/w:pStyle{w:val=Base}"))
+        p_sub = cast(CT_P, element("w:p/w:pPr/w:pStyle{w:val=Sub}"))
+
+        labels = [labeler.label_for(p) for p in (p_base, p_sub, p_sub)]
+
+        assert labels == ["1.", "1.a", "1.b"]
+
+    # fixture components ---------------------------------------------
+
+    def numbering_part(self) -> NumberingPart:
+        numbering = cast(
+            CT_Numbering,
+            element(
+                "w:numbering/("
+                "w:abstractNum{w:abstractNumId=0}/("
+                "w:lvl{w:ilvl=0}/(w:start{w:val=1},w:numFmt{w:val=decimal},"
+                "w:lvlText{w:val=%1.}),"
+                "w:lvl{w:ilvl=1}/(w:start{w:val=1},w:numFmt{w:val=lowerLetter},"
+                "w:lvlText{w:val=%1.%2}),"
+                "w:lvl{w:ilvl=2}/(w:start{w:val=1},w:numFmt{w:val=lowerRoman},"
+                "w:lvlText{w:val=%1.%2.%3}),"
+                "w:lvl{w:ilvl=3}/(w:start{w:val=1},w:numFmt{w:val=decimal},"
+                "w:lvlRestart{w:val=0},w:lvlText{w:val=-%4-})),"
+                "w:num{w:numId=1}/w:abstractNumId{w:val=0},"
+                "w:num{w:numId=2}/w:abstractNumId{w:val=0},"
+                "w:num{w:numId=3}/("
+                "w:abstractNumId{w:val=0},"
+                "w:lvlOverride{w:ilvl=0}/w:startOverride{w:val=7}))"
+            ),
+        )
+        return NumberingPart(None, None, numbering, None)
+
+    def p(self, num_id: int, ilvl: int) -> CT_P:
+        return cast(
+            CT_P,
+            element(
+                "w:p/w:pPr/w:numPr/(w:ilvl{w:val=%d},w:numId{w:val=%d})" % (ilvl, num_id)
+            ),
+        )
+
+
+@pytest.mark.parametrize(
+    ("value", "numFmt", "expected_value"),
+    [
+        (3, "decimal", "3"),
+        (3, None, "3"),
+        (3, "decimalZero", "03"),
+        (14, "upperRoman", "XIV"),
+        (1994, "lowerRoman", "mcmxciv"),
+        (2, "upperLetter", "B"),
+        (28, "lowerLetter", "bb"),
+        (1, "ordinal", "1st"),
+        (12, "ordinal", "12th"),
+        (23, "ordinal", "23rd"),
+        (5, "bullet", ""),
+        (5, "chineseCounting", "5"),
+    ],
+)
+def it_can_format_a_list_number(value: int, numFmt: str | None, expected_value: str):
+    assert format_number(value, numFmt) == expected_value
@@ -0,0 +1,118 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit test suite for the docx.optimize module."""
+
+from __future__ import annotations
+
+import copy
+import io
+import zipfile
+
+from docx import Document
+from docx.image.image import Image
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.optimize import optimize_package
+from docx.oxml.ns import qn
+from docx.oxml.parser import OxmlElement
+from docx.parts.image import ImagePart
+
+from .unitutil.file import test_file
+
+
+class DescribeOptimizePackage:
+    """Unit-test suite for `docx.optimize.optimize_package()`."""
+
+    def it_strips_revision_save_ids_and_proofing_marks(self):
+        document = Document()
+        p = document.add_paragraph("foo")._p
+        p.set(qn("w:rsidR"), "00AB12CD")
+        p.set(qn("w:rsidRDefault"), "00AB12CD")
+        p.insert(0, OxmlElement("w:proofErr"))
+        settings = document.settings.element
+        settings.append(OxmlElement("w:rsids"))
+
+        optimize_package(document.part.package)
+
+        assert p.get(qn("w:rsidR")) is None
+        assert p.get(qn("w:rsidRDefault")) is None
+        assert p.find(qn("w:proofErr")) is None
+        assert settings.find(qn("w:rsids")) is None
+        assert document.paragraphs[-1].text == "foo"
+
+    def it_merges_media_parts_having_the_same_bytes(self):
+        document = Document()
+        run = document.add_paragraph().add_run()
+        run.add_picture(test_file("monty-truth.png"))
+        image = Image.from_file(test_file("monty-truth.png"))
+        duplicate = ImagePart.from_image(image, PackURI("/word/media/image9.png"))
+        rId = document.part.relate_to(duplicate, RT.IMAGE)
+        drawing = copy.deepcopy(run._r[-1])
+        drawing.xpath(".//a:blip")[0].set(qn("r:embed"), rId)
+        run._r.append(drawing)
+
+        result = optimize_package(document.part.package)
+
+        assert result.merged_parts == 1
+        assert result.dropped_parts == 1
+        embeds = set(document.element.xpath("//a:blip/@r:embed"))
+        assert len(embeds) == 1
+        assert rId not in document.part.rels
+        assert duplicate not in document.part.package.image_parts
+
+    def it_drops_relationships_nothing_refers_to(self):
+        document = Document()
+        document.add_picture(test_file("monty-truth.png"))
+        document.element.body.remove(document.element.body[0])
+        document.part.relate_to("http://example.com", RT.HYPERLINK, is_external=True)
+
+        result = optimize_package(document.part.package)
+
+        assert result.dropped_relationships == 2
+        assert result.dropped_parts == 1
+        reltypes = {rel.reltype for rel in document.part.rels.values()}
+        assert RT.IMAGE not in reltypes
+        assert RT.HYPERLINK not in reltypes
+        assert RT.STYLES in reltypes
+
+    def it_can_remove_unused_styles(self):
+        document = Document()
+        document.add_paragraph("Title", "Heading 1")
+        style_count = len(document.styles)
+
+        result = optimize_package(document.part.package, remove_unused_styles=True)
+
+        names = {style.name for style in document.styles}
+        assert "Heading 1" in names
+        assert "Normal" in names
+        assert "Title" not in names
+        assert result.removed_styles == style_count - len(document.styles)
+        assert result.removed_styles > 0
+
+    def but_it_keeps_styles_by_default(self):
+        document = Document()
+        style_count = len(document.styles)
+
+        optimize_package(document.part.package)
+
+        assert len(document.styles) == style_count
+
+
+class DescribeDocument_save_optimize:
+    """Unit-test suite for `Document.save(optimize=True)`."""
+
+    def it_writes_the_optimized_package(self):
+        document = Document(test_file("having-images.docx"))
+        media_count = len(document.part.package.image_parts)
+        document.part.relate_to("http://example.com", RT.HYPERLINK, is_external=True)
+        stream = io.BytesIO()
+
+        document.save(stream, optimize=True)
+
+        with zipfile.ZipFile(stream) as z:
+            names = z.namelist()
+            document_xml = z.read("word/document.xml")
+            document_rels = z.read("word/_rels/document.xml.rels")
+        assert len([name for name in names if name.startswith("word/media/")]) == media_count
+        assert b"w:rsid" not in document_xml
+        assert b"example.com" not in document_rels
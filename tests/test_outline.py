@@ -0,0 +1,93 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit test suite for the docx.outline module."""
+
+from __future__ import annotations
+
+from typing import cast
+
+from docx import Document
+from docx.outline import build_outline
+from docx.oxml.document import CT_Body
+from docx.oxml.styles import CT_Styles
+
+from .unitutil.cxml import element
+
+_styles_cxml = (
+    "w:styles/("
+    "w:style{w:type=paragraph,w:default=1,w:styleId=Normal},"
+    "w:style{w:type=paragraph,w:styleId=H1}/w:pPr/w:outlineLvl{w:val=0},"
+    "w:style{w:type=paragraph,w:styleId=H2}/w:pPr/w:outlineLvl{w:val=1},"
+    "w:style{w:type=paragraph,w:styleId=MyH2}/w:basedOn{w:val=H2},"
+    "w:style{w:type=paragraph,w:styleId=Body}/w:pPr/w:outlineLvl{w:val=9})"
+)
+
+
+def _outline(body_cxml: str):
+    body = cast(CT_Body, element(body_cxml))
+    return build_outline(body, cast(CT_Styles, element(_styles_cxml)), None)  # pyright: ignore
+
+
+class DescribeBuildOutline:
+    """Unit-test suite for `docx.outline.build_outline()`."""
+
+    def it_builds_the_heading_tree_of_a_body(self):
+        outline = _outline(
+            "w:body/("
+            'w:p/(w:pPr/w:pStyle{w:val=H1},w:r/w:t"A"),'
+            'w:p/w:r/w:t"text",'
+            'w:p/(w:pPr/w:pStyle{w:val=MyH2},w:r/w:t"A.1"),'
+            "w:tbl,"
+            'w:p/(w:pPr/w:pStyle{w:val=H2},w:r/w:t"A.2"),'
+            'w:p/(w:pPr/w:pStyle{w:val=H1},w:r/w:t"B"),'
+            "w:sectPr)"
+        )
+
+        assert outline.block_count == 6
+        assert [(h.level, h.text, h.block_index, h.end_index) for h in outline] == [
+            (0, "A", 0, 5),
+            (1, "A.1", 2, 4),
+            (1, "A.2", 4, 5),
+            (0, "B", 5, 6),
+        ]
+        assert [h.text for h in outline.children] == ["A", "B"]
+        assert [h.text for h in outline.children[0].children] == ["A.1", "A.2"]
+
+    def it_uses_an_outline_level_given_directly_over_the_style_level(self):
+        outline = _outline(
+            "w:body/("
+            'w:p/(w:pPr/(w:pStyle{w:val=H1},w:outlineLvl{w:val=9}),w:r/w:t"not"),'
+            'w:p/(w:pPr/w:outlineLvl{w:val=1},w:r/w:t"direct"),'
+            'w:p/(w:pPr/w:pStyle{w:val=Body},w:r/w:t"body"))'
+        )
+
+        assert [(h.level, h.text) for h in outline] == [(1, "direct")]
+
+    def it_includes_headings_in_tables_at_the_index_of_the_table(self):
+        outline = _outline(
+            "w:body/("
+            'w:p/w:r/w:t"intro",'
+            'w:tbl/w:tr/w:tc/w:p/(w:pPr/w:pStyle{w:val=H1},w:r/w:t"in table"))'
+        )
+
+        assert [(h.text, h.block_index, h.end_index) for h in outline] == [("in table", 1, 2)]
+
+
+class DescribeDocument_outline:
+    """Unit-test suite for `Document.outline()`."""
+
+    def it_provides_the_outline_of_its_headings(self):
+        document = Document()
+        document.add_heading("Title", 0)
+        document.add_heading("Chapter", 1)
+        document.add_paragraph("text")
+        document.add_heading("Section", 2)
+
+        outline = document.outline()
+
+        assert [(h.level, h.text) for h in outline] == [(0, "Chapter"), (1, "Section")]
+        heading = outline.children[0]
+        assert heading.paragraph.style.name == "Heading 1"
+        blocks = list(document.iter_inner_content())
+        assert blocks[heading.block_index].text == "Chapter"
+        assert heading.end_index == len(blocks)
@@ -94,6 +94,16 @@ class DescribeImageParts:
         assert image_part in image_parts
         assert image_part is image_part_
 
+    def it_can_remove_an_image_part(self, request):
+        image_part, other_part = (instance_mock(request, ImagePart) for _ in range(2))
+        image_parts = ImageParts()
+        image_parts.append(image_part)
+        image_parts.append(other_part)
+
+        image_parts.remove(image_part)
+
+        assert list(image_parts) == [other_part]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[((2, 3), 1), ((1, 3), 2), ((1, 2), 3)])
@@ -0,0 +1,115 @@
+"""Unit test suite for the docx.pages module."""
+
+from __future__ import annotations
+
+from typing import cast
+
+from docx import Document
+from docx.oxml.document import CT_Body
+from docx.pages import PageRange, iter_rendered_pages
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+from .unitutil.cxml import element
+
+
+def _pages(body_cxml: str):
+    body = cast(CT_Body, element(body_cxml))
+    return list(iter_rendered_pages(body, None))  # pyright: ignore[reportArgumentType]
+
+
+class DescribeIterRenderedPages:
+    """Unit-test suite for `docx.pages.iter_rendered_pages()`."""
+
+    def it_splits_the_body_at_each_rendered_page_break(self):
+        pages = _pages(
+            "w:body/("
+            'w:p/w:r/w:t"one",'
+            'w:p/(w:r/w:t"two",w:r/(w:t"-a",w:lastRenderedPageBreak,w:t"b"),w:r/w:t"c"),'
+            'w:p/(w:r/w:lastRenderedPageBreak,w:r/w:t"three"),'
+            "w:sectPr)"
+        )
+
+        assert [page.number for page in pages] == [1, 2, 3]
+        assert [page.ranges for page in pages] == [
+            [PageRange(0, 0, None), PageRange(1, 0, 5)],
+            [PageRange(1, 5, None)],
+            [PageRange(2, 0, None)],
+        ]
+
+    def it_materializes_the_fragments_of_a_split_paragraph(self):
+        pages = _pages(
+            "w:body/("
+            'w:p/(w:pPr/w:jc{w:val=center},w:r/w:t"ab",'
+            'w:r/(w:rPr/w:b,w:t"c",w:lastRenderedPageBreak,w:t"d"),w:r/w:t"e"))'
+        )
+
+        first, second = (list(page.iter_inner_content()) for page in pages)
+
+        assert [p.text for p in first] == ["abc"]  # pyright: ignore[reportAttributeAccessIssue]
+        assert [p.text for p in second] == ["de"]  # pyright: ignore[reportAttributeAccessIssue]
+        fragment = cast(Paragraph, second[0])
+        assert fragment.alignment is not None
+        assert fragment.runs[0].bold is True
+
+    def it_moves_a_break_in_a_hyperlink_after_the_hyperlink(self):
+        pages = _pages(
+            "w:body/w:p/("
+            'w:r/w:t"a",w:hyperlink/w:r/(w:t"b",w:lastRenderedPageBreak,w:t"c"),w:r/w:t"d")'
+        )
+
+        assert [page.ranges for page in pages] == [[PageRange(0, 0, 3)], [PageRange(0, 3, None)]]
+        assert [p.text for p in pages[1].iter_inner_content()] == ["d"]  # pyright: ignore
+
+    def it_counts_the_text_of_tracked_insertions(self):
+        pages = _pages(
+            "w:body/("
+            'w:p/(w:r/w:t"he",w:ins/w:r/w:t"llo",w:moveTo/w:r/w:t" wor",'
+            'w:r/(w:lastRenderedPageBreak,w:t"ld")),'
+            'w:p/(w:r/(w:t"x",w:lastRenderedPageBreak),w:ins/w:r/w:t"y"),'
+            'w:p/(w:r/w:lastRenderedPageBreak,w:ins/w:r/(w:t"z",w:lastRenderedPageBreak)))'
+        )
+
+        assert [page.ranges for page in pages] == [
+            [PageRange(0, 0, 9)],
+            [PageRange(0, 9, None), PageRange(1, 0, 1)],
+            [PageRange(1, 1, None)],
+            [PageRange(2, 0, None)],
+        ]
+        assert [p.text for p in pages[0].iter_inner_content()] == ["hello wor"]  # pyright: ignore
+        assert [p.text for p in pages[2].iter_inner_content()] == ["y"]  # pyright: ignore
+
+    def it_splits_a_table_at_the_row_holding_the_break(self):
+        pages = _pages(
+            "w:body/w:tbl/("
+            'w:tblPr,w:tr/w:tc/w:p/w:r/w:t"1",'
+            'w:tr/w:tc/w:p/w:r/(w:lastRenderedPageBreak,w:t"2"),'
+            'w:tr/w:tc/w:p/w:r/w:t"3")'
+        )
+
+        assert [page.ranges for page in pages] == [[PageRange(0, 0, 1)], [PageRange(0, 1, None)]]
+        table = cast(Table, next(pages[1].iter_inner_content()))
+        assert [row.cells[0].text for row in table.rows] == ["2", "3"]
+
+    def it_provides_a_single_page_when_there_are_no_breaks(self):
+        pages = _pages('w:body/(w:p/w:r/w:t"a",w:p/w:r/w:t"b")')
+
+        assert [page.ranges for page in pages] == [[PageRange(0, 0, None), PageRange(1, 0, None)]]
+
+
+class DescribeDocument_iter_rendered_pages:
+    """Unit-test suite for `Document.iter_rendered_pages()`."""
+
+    def it_provides_the_rendered_pages_of_its_body(self):
+        document = Document()
+        document.add_paragraph("first")
+        paragraph = document.add_paragraph()
+        paragraph._p.add_r().append(element("w:lastRenderedPageBreak"))  # pyright: ignore
+        paragraph.add_run("second")
+
+        pages = list(document.iter_rendered_pages())
+
+        assert len(pages) == 2
+        blocks = list(pages[1].iter_inner_content())
+        assert [cast(Paragraph, p).text for p in blocks] == ["second"]
+        assert cast(Paragraph, blocks[0])._p is paragraph._p  # pyright: ignore
@@ -0,0 +1,177 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit test suite for the docx.revisions module."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+from docx.enum.text import WD_REVISION_TYPE, WD_REVISIONS_VIEW
+from docx.oxml.ns import qn
+from docx.revisions import RevisionIndex
+
+from .unitutil.cxml import element
+from .unitutil.document import document_with_body
+from .unitutil.mock import FixtureRequest, method_mock
+
+
+def _document():
+    """Document whose body has inserted and deleted runs, a deleted paragraph mark, a
+    formatting change and an inserted table row."""
+    document = document_with_body(
+        "w:body/("
+        'w:p/(w:r/w:t"Keep ",w:ins{w:id=1,w:author=Ann}/w:r/w:t"new",'
+        'w:del{w:id=2,w:author=Bob}/w:r/(w:delText"old",w:tab),w:r/w:t" end"),'
+        'w:p/(w:pPr/w:rPr/w:del{w:id=3,w:author=Ann},w:r/w:t"joined"),'
+        "w:p/(w:pPr/w:jc{w:val=right},"
+        'w:r/(w:rPr/(w:b,w:rPrChange{w:id=4,w:author=Bob}/w:rPr/w:i),w:t" here")),'
+        'w:tbl/(w:tblGrid,w:tr/w:tc/w:p/w:r/w:t"kept",'
+        'w:tr/(w:trPr/w:ins{w:id=5,w:author=Ann},w:tc/w:p/w:r/w:t"added")),'
+        "w:sectPr)"
+    )
+    body = document.element.body
+    body[0][1].set(qn("w:date"), "2024-05-01T10:00:00Z")
+    return document
+
+
+class DescribeRevisionIndex:
+    """Unit-test suite for `docx.revisions.RevisionIndex`."""
+
+    def it_indexes_each_tracked_change_in_one_pass(self):
+        document = _document()
+        header = document.sections[0].header
+        header.paragraphs[0]._p.append(element('w:ins{w:id=9,w:author=Cy}/w:r/w:t"h"'))
+        body = document.element.body
+
+        revisions = document.revisions
+
+        assert len(revisions) == 6
+        assert [r.kind for r in revisions] == [
+            WD_REVISION_TYPE.INSERT,
+            WD_REVISION_TYPE.DELETE,
+            WD_REVISION_TYPE.DELETE,
+            WD_REVISION_TYPE.PROPERTY,
+            WD_REVISION_TYPE.INSERT,
+            WD_REVISION_TYPE.INSERT,
+        ]
+        assert revisions.authors == ["Ann", "Bob", "Cy"]
+        assert [r.text for r in revisions] == ["new", "old\t", "", "", "", "h"]
+        assert revisions[0].date == dt.datetime(2024, 5, 1, 10, tzinfo=dt.timezone.utc)
+        assert revisions[1].date is None
+        assert revisions[1].id == 2
+        assert revisions[0].target is body[0][1]
+        assert revisions[2].target is body[1]
+        assert revisions[3].target is body[2][1][0]
+        assert revisions[4].target is body[3][2]
+        assert revisions[5].part is header.part
+
+    def it_builds_the_index_once_for_repeated_access(self, request: FixtureRequest):
+        document = _document()
+        index = document.part.revision_index
+        _build_ = method_mock(request, RevisionIndex, "_build", wraps=RevisionIndex._build)
+
+        for idx in range(len(index)):
+            assert index[idx] is list(index)[idx]
+
+        _build_.assert_called_once_with(index)
+
+    def and_it_checks_only_the_change_it_looks_up(self):
+        document = _document()
+        index = document.part.revision_index
+        body = document.element.body
+        revision = index[0]
+
+        body[1].remove(body[1].pPr)
+
+        assert index[0] is revision
+        assert len(index) == 5
+        index.refresh()
+        assert len(index) == 4
+
+    def but_it_rebuilds_when_the_change_looked_up_was_removed(self):
+        document = _document()
+        index = document.part.revision_index
+        body = document.element.body
+        assert index[0].target is body[0][1]
+
+        body[0].remove(body[0][1])
+
+        assert index[0].target is body[0][1]
+        assert index[0].kind == WD_REVISION_TYPE.DELETE
+        assert len(index) == 4
+
+
+class DescribeRevisionText:
+    """Unit-test suite for the final and original views of revised text."""
+
+    def it_reads_a_paragraph_with_its_changes_accepted_or_rejected(self):
+        paragraph = _document().paragraphs[0]
+
+        assert paragraph.text == "Keep new end"
+        assert paragraph.revision_text() == "Keep new end"
+        assert paragraph.revision_text(WD_REVISIONS_VIEW.ORIGINAL) == "Keep old\t end"
+
+    def it_reads_the_body_as_it_is_once_changes_are_accepted(self):
+        document = _document()
+        final = list(document.iter_text())
+
+        count = document.accept_all_revisions()
+
+        assert count == 5
+        assert final == ["Keep new end", "joined here", "kept", "added"]
+        assert [p.text for p in document.paragraphs] == ["Keep new end", "joined here"]
+        assert [c.text for row in document.tables[0].rows for c in row.cells] == [
+            "kept",
+            "added",
+        ]
+        assert len(document.revisions) == 0
+
+    def and_once_changes_are_rejected(self):
+        document = _document()
+        original = list(document.iter_text(WD_REVISIONS_VIEW.ORIGINAL))
+
+        count = document.reject_all_revisions()
+
+        assert count == 5
+        assert original == ["Keep old\t end", "joined", " here", "kept"]
+        assert [p.text for p in document.paragraphs] == ["Keep old\t end", "joined", " here"]
+        assert len(document.tables[0].rows) == 1
+        assert len(document.revisions) == 0
+
+
+class DescribeDocument_accept_all_revisions:
+    """Unit-test suite for `Document.accept_all_revisions()`."""
+
+    def it_joins_paragraphs_and_keeps_changed_formatting(self):
+        document = _document()
+
+        document.accept_all_revisions()
+
+        joined = document.paragraphs[1]
+        assert joined.alignment is not None
+        assert [r.text for r in joined.runs] == ["joined", " here"]
+        assert [child.tag for child in joined.runs[1]._r.rPr] == [qn("w:b")]
+        assert document.element.body.find(".//" + qn("w:ins")) is None
+
+    def but_it_removes_a_table_whose_rows_are_all_deleted(self):
+        document = document_with_body(
+            'w:body/(w:p,w:tbl/w:tr/(w:trPr/w:del{w:id=1},w:tc/w:p/w:r/w:t"x"))'
+        )
+
+        document.accept_all_revisions()
+
+        assert document.tables == []
+
+
+class DescribeDocument_reject_all_revisions:
+    """Unit-test suite for `Document.reject_all_revisions()`."""
+
+    def it_restores_deleted_text_and_former_formatting(self):
+        document = _document()
+
+        document.reject_all_revisions()
+
+        first, _, last = document.paragraphs
+        assert [r.text for r in first.runs] == ["Keep ", "old\t", " end"]
+        assert first.runs[1]._r.find(qn("w:t")) is not None
+        assert [child.tag for child in last.runs[0]._r.rPr] == [qn("w:i")]
@@ -0,0 +1,125 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit test suite for the docx.sdt module."""
+
+from __future__ import annotations
+
+import pytest
+from lxml import etree
+
+from docx.sdt import ContentControlIndex
+
+from .unitutil.cxml import element
+from .unitutil.document import document_with_body
+
+
+def _canonical(cxml_or_element: str | object) -> bytes:
+    """Canonical XML of an element or of the element described by cxml, namespaces aside."""
+    e = element(cxml_or_element) if isinstance(cxml_or_element, str) else cxml_or_element
+    return etree.tostring(e, method="c14n", exclusive=True)  # pyright: ignore
+
+
+_form_cxml = (
+    "w:body/("
+    "w:sdt/(w:sdtPr/(w:alias{w:val=Name},w:tag{w:val=name},w:id{w:val=1}),"
+    'w:sdtContent/w:p/(w:pPr/w:jc{w:val=center},w:r/(w:rPr/w:b,w:t"old"),w:r/w:t"er")),'
+    'w:p/(w:r/w:t"Date: ",'
+    'w:sdt/(w:sdtPr/(w:tag{w:val=date},w:id{w:val=2}),w:sdtContent/w:r/w:t"today")),'
+    "w:tbl/w:tr/w:sdt/(w:sdtPr/w:tag{w:val=cell},"
+    'w:sdtContent/w:tc/(w:tcPr,w:p/w:r/w:t"a",w:p/w:r/w:t"b")),'
+    "w:sectPr)"
+)
+
+
+class DescribeContentControlIndex:
+    """Unit-test suite for `docx.sdt.ContentControlIndex`."""
+
+    def it_indexes_content_controls_by_tag_alias_and_id(self):
+        document = document_with_body(_form_cxml)
+        index = ContentControlIndex(document.part)
+        body = document.element.body
+
+        assert len(index) == 3
+        assert [sdt for sdt, _ in index.by_tag("name")] == [body[0]]
+        assert [sdt for sdt, _ in index.by_alias("Name")] == [body[0]]
+        assert index.by_id(2) == (body[1][1], document.part)
+        assert index.by_tag("missing") == []
+        assert index.by_id(9) is None
+        assert index.next_id() == 3
+
+    def but_it_rebuilds_when_a_control_was_removed_by_other_means(self):
+        document = document_with_body(_form_cxml)
+        index = ContentControlIndex(document.part)
+        assert len(index.by_tag("date")) == 1
+
+        body = document.element.body
+        body.remove(body[1])
+
+        assert index.by_tag("date") == []
+        assert len(index) == 2
+
+
+class DescribeContentControls:
+    """Unit-test suite for `docx.sdt.ContentControls`."""
+
+    def it_provides_access_to_the_controls_of_a_document(self):
+        document = document_with_body(_form_cxml)
+        controls = document.content_controls
+
+        assert [(c.tag, c.alias, c.id, c.is_inline) for c in controls] == [
+            ("name", "Name", 1, False),
+            ("date", None, 2, True),
+            ("cell", None, None, False),
+        ]
+        assert [c.text for c in controls] == ["older", "today", "a\nb"]
+        assert controls.get_by_id(2).tag == "date"  # pyright: ignore[reportOptionalMemberAccess]
+        assert [c.tag for c in controls.get_by_alias("Name")] == ["name"]
+
+    @pytest.mark.parametrize(
+        ("tag", "value", "expected_cxml"),
+        [
+            (
+                "name",
+                "Ann\nLee",
+                'w:sdtContent/(w:p/(w:pPr/w:jc{w:val=center},w:r/(w:rPr/w:b,w:t"Ann")),'
+                'w:p/(w:pPr/w:jc{w:val=center},w:r/(w:rPr/w:b,w:t"Lee")))',
+            ),
+            ("date", "1 May", 'w:sdtContent/w:r/w:t"1 May"'),
+            ("cell", None, "w:sdtContent/w:tc/(w:tcPr,w:p/w:r)"),
+        ],
+    )
+    def it_fills_controls_by_tag(self, tag: str, value: str | None, expected_cxml: str):
+        document = document_with_body(_form_cxml)
+
+        filled = document.fill_content_controls({tag: value, "missing": "x"})
+
+        assert filled == 1
+        control = document.content_controls.get_by_tag(tag)[0]
+        assert _canonical(control.element[1]) == _canonical(expected_cxml)
+
+    def and_it_replaces_a_block_control_starting_with_a_table_with_paragraphs(self):
+        document = document_with_body(
+            "w:body/w:sdt/(w:sdtPr/w:tag{w:val=T},w:sdtContent/("
+            'w:tbl/w:tr/w:tc/w:p/w:r/w:t"cell",w:p/w:r/w:t"after"))'
+        )
+
+        document.fill_content_controls({"T": "new\nline"})
+
+        control = document.content_controls.get_by_tag("T")[0]
+        assert control.text == "new\nline"
+        assert _canonical(control.element[1]) == _canonical(
+            'w:sdtContent/(w:p/w:r/w:t"new",w:p/w:r/w:t"line")'
+        )
+
+    def it_uses_the_control_run_properties_in_place_of_a_placeholder(self):
+        document = document_with_body(
+            "w:body/w:p/w:sdt/(w:sdtPr/(w:rPr/w:i,w:tag{w:val=x},w:showingPlcHdr),"
+            'w:sdtContent/w:r/(w:rPr/w:rStyle{w:val=PlaceholderText},w:t"Click here"))'
+        )
+
+        document.fill_content_controls({"x": "value"})
+
+        sdt = document.element.body[0][0]
+        assert _canonical(sdt) == _canonical(
+            'w:sdt/(w:sdtPr/(w:rPr/w:i,w:tag{w:val=x}),w:sdtContent/w:r/(w:rPr/w:i,w:t"value"))'
+        )
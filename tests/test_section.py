@@ -635,6 +635,17 @@ class Describe_BaseHeaderFooter:
         _get_or_add_definition_.assert_called_once_with(header)
         assert hdr_elm is hdr
 
+    def it_provides_access_to_the_proxy_cache_of_its_part_to_help(
+        self, _get_or_add_definition_: Mock, header_part_: Mock
+    ):
+        _get_or_add_definition_.return_value = header_part_
+        header_part_.proxy_cache = None
+        header = _BaseHeaderFooter(
+            None, None, None  # pyright: ignore[reportGeneralTypeIssues]
+        )
+
+        assert header._proxy_cache is None
+
     def it_gets_the_definition_when_it_has_one(
         self, _has_definition_prop_: Mock, _definition_prop_: Mock, header_part_: Mock
     ):
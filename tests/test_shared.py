@@ -1,9 +1,24 @@
 """Test suite for the docx.shared module."""
 
+import gc
+
 import pytest
 
 from docx.opc.part import XmlPart
-from docx.shared import Cm, ElementProxy, Emu, Inches, Length, Mm, Pt, RGBColor, Twips
+from docx.oxml.ns import qn
+from docx.shared import (
+    Cm,
+    ElementProxy,
+    Emu,
+    Inches,
+    Length,
+    Mm,
+    ProxyCache,
+    ProxySequence,
+    Pt,
+    RGBColor,
+    Twips,
+)
 
 from .unitutil.cxml import element
 from .unitutil.mock import instance_mock
@@ -63,6 +78,85 @@ class DescribeElementProxy:
         return instance_mock(request, XmlPart)
 
 
+class DescribeProxyCache:
+    def it_returns_the_same_proxy_for_an_element_while_it_is_referenced(self):
+        p = element("w:p")
+        cache = ProxyCache()
+
+        proxy = cache.get(ElementProxy, p, None)
+
+        assert type(proxy) is ElementProxy
+        assert proxy.element is p
+        assert cache.get(ElementProxy, p, None) is proxy
+        assert len(cache) == 1
+
+    def but_it_drops_a_proxy_once_it_is_no_longer_referenced(self):
+        p = element("w:p")
+        cache = ProxyCache()
+        cache.get(ElementProxy, p, None)
+        gc.collect()
+
+        assert len(cache) == 0
+
+
+class DescribeProxySequence:
+    def it_knows_its_length_without_constructing_proxies(self, factory_):
+        body = element("w:body/(w:p,w:p,w:p)")
+        proxies = ProxySequence(body.findall(qn("w:p")), factory_, None)
+
+        assert len(proxies) == 3
+        assert factory_.call_count == 0
+
+    def it_constructs_each_proxy_once_on_first_access(self):
+        body = element("w:body/(w:p,w:p,w:p)")
+        proxies = ProxySequence(body.findall(qn("w:p")), ElementProxy, None)
+
+        last = proxies[-1]
+
+        assert last.element is body[2]
+        assert proxies[2] is last
+        assert list(proxies)[2] is last
+        assert [proxy.element for proxy in proxies] == list(body)
+
+    def it_returns_a_list_for_a_slice(self):
+        body = element("w:body/(w:p,w:p,w:p)")
+        proxies = ProxySequence(body.findall(qn("w:p")), ElementProxy, None)
+
+        items = proxies[1:]
+
+        assert isinstance(items, list)
+        assert items == [proxies[1], proxies[2]]
+
+    def it_raises_on_an_index_out_of_range(self):
+        proxies = ProxySequence(element("w:body/w:p").findall(qn("w:p")), ElementProxy, None)
+        with pytest.raises(IndexError, match="proxy sequence index out of range"):
+            proxies[1]
+
+    def it_compares_equal_to_a_list_of_the_same_items(self):
+        body = element("w:body/(w:p,w:p)")
+        proxies = ProxySequence(body.findall(qn("w:p")), ElementProxy, None)
+
+        assert proxies == [ElementProxy(body[0]), ElementProxy(body[1])]
+        assert proxies != [ElementProxy(body[1]), ElementProxy(body[0])]
+        assert proxies != [ElementProxy(body[0])]
+
+    def it_reuses_proxies_from_a_proxy_cache(self):
+        body = element("w:body/(w:p,w:p)")
+        cache = ProxyCache()
+        first = ProxySequence(body.findall(qn("w:p")), ElementProxy, None, cache)[1]
+
+        proxies = ProxySequence(body.findall(qn("w:p")), ElementProxy, None, cache)
+
+        assert proxies[1] is first
+        assert proxies[0] is not first
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def factory_(self, request):
+        return instance_mock(request, ElementProxy)
+
+
 class DescribeLength:
     def it_can_construct_from_convenient_units(self, construct_fixture):
         UnitCls, units_val, emu = construct_fixture
@@ -0,0 +1,120 @@
+# pyright: reportPrivateUsage=false
+
+"""Test suite for the docx.streaming module."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from docx.api import Document
+from docx.streaming import StreamingDocumentWriter
+
+from .unitutil.file import test_file
+
+
+class DescribeStreamingDocumentWriter:
+    def it_writes_paragraphs_in_the_order_they_are_added(self, batch_size_: None):
+        file = io.BytesIO()
+
+        with StreamingDocumentWriter(file) as writer:
+            writer.paragraph("Title", style="Heading 1")
+            for n in range(10):
+                writer.paragraph("para %d" % n)
+            writer.paragraph().add_run("added later")
+
+        document = Document(file)
+        assert [p.text for p in document.paragraphs] == (
+            ["Title"] + ["para %d" % n for n in range(10)] + ["added later"]
+        )
+        assert document.paragraphs[0].style.name == "Heading 1"
+        assert document.element.body.sectPr is not None
+
+    def it_writes_a_table_from_rows_of_cell_text(self):
+        file = io.BytesIO()
+
+        with StreamingDocumentWriter(file) as writer:
+            writer.table([["a", "b", "c"], ["d"]], style="Light Grid Accent 1")
+
+        table = Document(file).tables[0]
+        assert [[cell.text for cell in row.cells] for row in table.rows] == [
+            ["a", "b", "c"],
+            ["d", "", ""],
+        ]
+        assert table.style.name == "Light Grid Accent 1"
+
+    def but_it_raises_on_a_table_without_columns(self):
+        with StreamingDocumentWriter(io.BytesIO()) as writer, pytest.raises(
+            ValueError, match="at least one column"
+        ):
+            writer.table([[]])
+
+    def it_writes_pictures_with_unique_shape_ids(self, batch_size_: None):
+        file = io.BytesIO()
+
+        with StreamingDocumentWriter(file) as writer:
+            for _ in range(5):
+                writer.picture(test_file("monty-truth.png"))
+                writer.paragraph("caption")
+
+        document = Document(file)
+        shape_ids = [shape._inline.docPr.id for shape in document.inline_shapes]
+        assert len(shape_ids) == 5
+        assert len(set(shape_ids)) == 5
+        assert len(document.part.package.image_parts) == 1
+
+    def it_keeps_the_body_content_of_its_template(self):
+        template = io.BytesIO()
+        document = Document()
+        document.add_paragraph("from template")
+        document.save(template)
+        template.seek(0)
+        file = io.BytesIO()
+
+        with StreamingDocumentWriter(file, template) as writer:
+            writer.paragraph("generated")
+
+        assert [p.text for p in Document(file).paragraphs] == ["from template", "generated"]
+
+    def and_it_copes_with_a_body_start_tag_having_attributes_and_whitespace(self):
+        template = io.BytesIO()
+        document = Document()
+        document.add_paragraph("from template")
+        body = document.element.body
+        body.set("{urn:example}flag", "1")
+        body.text, body.tail = "\n  ", "\n"
+        document.save(template)
+        template.seek(0)
+        file = io.BytesIO()
+
+        with StreamingDocumentWriter(file, template) as writer:
+            writer.paragraph("generated")
+
+        assert [p.text for p in Document(file).paragraphs] == ["from template", "generated"]
+
+    def it_writes_changes_made_to_the_document_outside_the_body(self):
+        file = io.BytesIO()
+
+        with StreamingDocumentWriter(file) as writer:
+            writer.document.core_properties.title = "Report"
+            writer.document.sections[0].header.add_paragraph("header text")
+            writer.paragraph("body text")
+
+        document = Document(file)
+        assert document.core_properties.title == "Report"
+        assert document.sections[0].header.paragraphs[-1].text == "header text"
+
+    def it_raises_when_content_is_added_after_close(self):
+        writer = StreamingDocumentWriter(io.BytesIO())
+        writer.close()
+        writer.close()
+
+        with pytest.raises(ValueError, match="closed StreamingDocumentWriter"):
+            writer.paragraph("too late")
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def batch_size_(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(StreamingDocumentWriter, "_batch_size", 2)
@@ -307,7 +307,7 @@ class DescribeTable:
 
     @pytest.fixture
     def document_(self, request: FixtureRequest):
-        return instance_mock(request, Document)
+        return instance_mock(request, Document, _proxy_cache=None)
 
     @pytest.fixture
     def document_part_(self, request: FixtureRequest):
@@ -528,7 +528,7 @@ class Describe_Cell:
 
     @pytest.fixture
     def parent_(self, request: FixtureRequest):
-        return instance_mock(request, Table)
+        return instance_mock(request, Table, _proxy_cache=None)
 
     @pytest.fixture
     def tc_(self, request: FixtureRequest):
@@ -609,11 +609,11 @@ class Describe_Column:
 
     @pytest.fixture
     def parent_(self, request: FixtureRequest):
-        return instance_mock(request, Table)
+        return instance_mock(request, Table, _proxy_cache=None)
 
     @pytest.fixture
     def table_(self, request: FixtureRequest):
-        return instance_mock(request, Table)
+        return instance_mock(request, Table, _proxy_cache=None)
 
     @pytest.fixture
     def table_prop_(self, request: FixtureRequest):
@@ -652,7 +652,7 @@ class Describe_Columns:
 
     @pytest.fixture
     def table_(self, request: FixtureRequest):
-        return instance_mock(request, Table)
+        return instance_mock(request, Table, _proxy_cache=None)
 
 
 class Describe_Row:
@@ -836,11 +836,11 @@ class Describe_Row:
 
     @pytest.fixture
     def parent_(self, request: FixtureRequest):
-        return instance_mock(request, Table)
+        return instance_mock(request, Table, _proxy_cache=None)
 
     @pytest.fixture
     def table_(self, request: FixtureRequest):
-        return instance_mock(request, Table)
+        return instance_mock(request, Table, _proxy_cache=None)
 
     @pytest.fixture
     def table_prop_(self, request: FixtureRequest, table_: Mock):
@@ -917,4 +917,4 @@ class Describe_Rows:
 
     @pytest.fixture
     def parent_(self, request: FixtureRequest):
-        return instance_mock(request, Document)
+        return instance_mock(request, Document, _proxy_cache=None)
@@ -0,0 +1,66 @@
+"""Unit test suite for the docx.text.normalize module."""
+
+from __future__ import annotations
+
+import pytest
+
+from docx.text.normalize import normalize_paragraph, normalize_paragraphs
+
+from ..unitutil.cxml import element, xml
+
+
+class DescribeNormalizeParagraph:
+    """Unit-test suite for `docx.text.normalize.normalize_paragraph()`."""
+
+    @pytest.mark.parametrize(
+        ("p_cxml", "expected_count", "expected_cxml"),
+        [
+            ('w:p/(w:r/w:t"foo",w:r/w:t"bar")', 1, 'w:p/w:r/w:t"foobar"'),
+            (
+                'w:p/(w:r/(w:rPr/w:b,w:t"a"),w:proofErr,w:r/(w:rPr/w:b,w:t"b"),w:r/w:t"c")',
+                1,
+                'w:p/(w:r/(w:rPr/w:b,w:t"ab"),w:r/w:t"c")',
+            ),
+            (
+                'w:p/(w:r/(w:rPr/w:rFonts{w:ascii=A,w:hAnsi=B},w:t"a"),'
+                'w:r/(w:rPr/w:rFonts{w:hAnsi=B,w:ascii=A},w:t"b"))',
+                1,
+                'w:p/w:r/(w:rPr/w:rFonts{w:ascii=A,w:hAnsi=B},w:t"ab")',
+            ),
+            (
+                'w:p/(w:r/(w:t"a",w:tab),w:r/w:t"b",w:r/w:t"c")',
+                2,
+                'w:p/w:r/(w:t"a",w:tab,w:t"bc")',
+            ),
+            ('w:p/(w:r/w:t"a",w:bookmarkStart,w:r/w:t"b")', 0, None),
+            ('w:p/(w:r/w:t"a",w:r/w:drawing,w:r/w:t"b")', 0, None),
+            ('w:p/(w:r/w:t"a",w:r/(w:rPr/w:i,w:t"b"))', 0, None),
+            (
+                'w:p/(w:r/w:t"a",w:hyperlink/(w:r/w:t"b",w:r/w:t"c"),w:r/w:t"d")',
+                1,
+                'w:p/(w:r/w:t"a",w:hyperlink/w:r/w:t"bc",w:r/w:t"d")',
+            ),
+            (
+                'w:p/(w:r/w:t"a",w:r/w:t"b ")',
+                1,
+                'w:p/w:r/w:t{xml:space=preserve}"ab "',
+            ),
+        ],
+    )
+    def it_merges_adjacent_runs_having_the_same_properties(
+        self, p_cxml: str, expected_count: int, expected_cxml: str | None
+    ):
+        p = element(p_cxml)
+
+        count = normalize_paragraph(p)
+
+        assert count == expected_count
+        assert p.xml == xml(expected_cxml or p_cxml)
+
+    def it_normalizes_each_paragraph_in_a_story(self):
+        body = element('w:body/(w:p/(w:r/w:t"a",w:r/w:t"b"),w:tbl/w:tr/w:tc/w:p/(w:r,w:r))')
+
+        count = normalize_paragraphs([body])
+
+        assert count == 2
+        assert body.xml == xml('w:body/(w:p/w:r/w:t"ab",w:tbl/w:tr/w:tc/w:p/w:r)')
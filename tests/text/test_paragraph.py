@@ -7,6 +7,7 @@ import pytest
 from docx import types as t
 from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.oxml.text.paragraph import CT_P
 from docx.oxml.text.run import CT_R
 from docx.parts.document import DocumentPart
@@ -160,6 +161,12 @@ class DescribeParagraph:
         paragraph.text = text
         assert paragraph.text == expected_text
 
+    def it_can_merge_runs_having_the_same_formatting(self):
+        paragraph = Paragraph(element('w:p/(w:r/w:t"fo",w:proofErr,w:r/w:t"o")'), None)
+
+        assert paragraph.normalize_runs() == 1
+        assert [run.text for run in paragraph.runs] == ["foo"]
+
     def it_knows_its_alignment_value(self, alignment_get_fixture):
         paragraph, expected_value = alignment_get_fixture
         assert paragraph.alignment == expected_value
@@ -178,8 +185,12 @@ class DescribeParagraph:
     def it_provides_access_to_the_runs_it_contains(self, runs_fixture):
         paragraph, Run_, r_, r_2_, run_, run_2_ = runs_fixture
         runs = paragraph.runs
-        assert Run_.mock_calls == [call(r_, paragraph), call(r_2_, paragraph)]
+        assert Run_.mock_calls == []
+        assert len(runs) == 2
         assert runs == [run_, run_2_]
+        assert Run_.mock_calls == [call(r_, paragraph), call(r_2_, paragraph)]
+        assert runs[1] is run_2_
+        assert len(Run_.mock_calls) == 2
 
     def it_can_add_a_run_to_itself(self, add_run_fixture):
         paragraph, text, style, style_prop_, expected_xml = add_run_fixture
@@ -190,6 +201,40 @@ class DescribeParagraph:
         if style:
             style_prop_.assert_called_once_with(style)
 
+    def it_can_add_hyperlinks_to_itself(self, document_part_, part_prop_):
+        document_part_.relate_to.side_effect = ["rId7", "rId8"]
+        document_part_.get_style_id.return_value = "Hyperlink"
+        paragraph = Paragraph(cast(CT_P, element("w:p")), None)
+
+        hyperlinks = paragraph.add_hyperlinks(
+            [("foo", "https://foo.com"), ("bar", "https://bar.com"), ("toc", "#_Toc42")],
+            "Hyperlink",
+        )
+
+        assert document_part_.relate_to.call_args_list == [
+            call("https://foo.com", RT.HYPERLINK, is_external=True),
+            call("https://bar.com", RT.HYPERLINK, is_external=True),
+        ]
+        document_part_.get_style_id.assert_called_once_with("Hyperlink", WD_STYLE_TYPE.CHARACTER)
+        assert [h._hyperlink.xml for h in hyperlinks[:2]] == [
+            xml('w:hyperlink{r:id=rId7}/w:r/(w:rPr/w:rStyle{w:val=Hyperlink},w:t"foo")'),
+            xml('w:hyperlink{r:id=rId8}/w:r/(w:rPr/w:rStyle{w:val=Hyperlink},w:t"bar")'),
+        ]
+        internal_link = hyperlinks[2]
+        assert internal_link.address == ""
+        assert internal_link.fragment == "_Toc42"
+        assert internal_link.text == "toc"
+        assert paragraph._p.hyperlink_lst == [h._hyperlink for h in hyperlinks]
+
+    def it_can_add_a_hyperlink_to_itself(self, document_part_, part_prop_):
+        document_part_.relate_to.return_value = "rId3"
+        paragraph = Paragraph(cast(CT_P, element("w:p/w:r/w:t\"See \"")), None)
+
+        hyperlink = paragraph.add_hyperlink("here", "https://foo.com")
+
+        assert hyperlink._hyperlink.xml == xml('w:hyperlink{r:id=rId3}/w:r/w:t"here"')
+        assert paragraph.text == "See here"
+
     def it_can_insert_a_paragraph_before_itself(self, insert_before_fixture):
         text, style, paragraph_, add_run_calls = insert_before_fixture
         paragraph = Paragraph(None, None)
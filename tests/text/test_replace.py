@@ -0,0 +1,107 @@
+"""Unit test suite for the docx.text.replace module."""
+
+from __future__ import annotations
+
+import re
+from typing import cast
+
+import pytest
+
+from docx.oxml.text.paragraph import CT_P
+from docx.text.replace import TextReplacer
+
+from ..unitutil.cxml import element, xml
+
+
+class DescribeTextReplacer:
+    """Unit-test suite for `docx.text.replace.TextReplacer` objects."""
+
+    @pytest.mark.parametrize(
+        ("p_cxml", "old", "new", "expected_cxml"),
+        [
+            ('w:p/w:r/w:t"foo bar"', "bar", "baz", 'w:p/w:r/w:t"foo baz"'),
+            (
+                'w:p/(w:r/w:t"{{na",w:r/(w:rPr/w:b,w:t"me}}!"))',
+                "{{name}}",
+                "Joe",
+                'w:p/(w:r/w:t"Joe",w:r/(w:rPr/w:b,w:t"!"))',
+            ),
+            (
+                'w:p/(w:r/w:t"a{",w:r/w:t"{x",w:r/w:t"}}")',
+                "{{x}}",
+                "1",
+                'w:p/(w:r/w:t"a1",w:r,w:r)',
+            ),
+            (
+                'w:p/(w:r/w:t"xx",w:hyperlink/w:r/w:t"xx")',
+                "xxx",
+                "y",
+                'w:p/(w:r/w:t"y",w:hyperlink/w:r/w:t"x")',
+            ),
+            ('w:p/w:r/(w:t"a",w:tab,w:t"b")', "ab", "c", 'w:p/w:r/(w:t"a",w:tab,w:t"b")'),
+        ],
+    )
+    def it_replaces_text_split_across_runs(
+        self, p_cxml: str, old: str, new: str, expected_cxml: str
+    ):
+        p = cast(CT_P, element(p_cxml))
+
+        TextReplacer.from_args(old, new).replace_in_paragraph(p)
+
+        assert p.xml == xml(expected_cxml)
+
+    def it_does_not_rewrite_a_match_that_spans_a_tab(self):
+        p = cast(CT_P, element('w:p/w:r/(w:t"a",w:tab,w:t"b")'))
+
+        count = TextReplacer.from_args(re.compile(r"a\tb"), "x").replace_in_paragraph(p)
+
+        assert count == 0
+        assert p.xml == xml('w:p/w:r/(w:t"a",w:tab,w:t"b")')
+
+    def it_replaces_all_the_keys_of_a_mapping_in_one_pass(self):
+        p = cast(CT_P, element('w:p/(w:r/w:t"{a} and {a",w:r/w:t"b} or {b}")'))
+        replacer = TextReplacer.from_args({"{a}": "1", "{ab}": "2", "{b}": "{a}"})
+
+        count = replacer.replace_in_paragraph(p)
+
+        assert count == 3
+        assert p.text == "1 and 2 or {a}"
+
+    def it_can_replace_using_a_regular_expression(self):
+        p = cast(CT_P, element('w:p/(w:r/w:t"2024-0",w:r/w:t"1-31")'))
+        pattern = re.compile(r"(\d{4})-(\d\d)-(\d\d)")
+
+        TextReplacer.from_args(pattern, r"\3/\2/\1").replace_in_paragraph(p)
+        assert p.text == "31/01/2024"
+
+        TextReplacer.from_args(re.compile(r"\d+"), lambda m: str(int(m.group()) + 1)).replace_in(
+            [p]
+        )
+        assert p.text == "32/2/2025"
+
+    def it_preserves_significant_whitespace_in_the_text_it_writes(self):
+        p = cast(CT_P, element('w:p/w:r/w:t"x"'))
+
+        TextReplacer.from_args("x", " y ").replace_in_paragraph(p)
+
+        assert p.xml == xml('w:p/w:r/w:t{xml:space=preserve}" y "')
+
+    def it_replaces_in_each_paragraph_below_the_elements_it_is_given(self):
+        body = element('w:body/(w:p/w:r/w:t"x",w:tbl/w:tr/w:tc/w:p/w:r/w:t"x")')
+
+        count = TextReplacer.from_args("x", "y").replace_in([body])
+
+        assert count == 2
+        assert [p.text for p in body.xpath(".//w:p")] == ["y", "y"]
+
+    @pytest.mark.parametrize(
+        ("old", "new", "message"),
+        [
+            ("", "x", "search text must not be empty"),
+            ("x", None, "`new` is required unless `old` is a mapping"),
+            ({"x": "y"}, "z", "`new` is not used when `old` is a mapping"),
+        ],
+    )
+    def it_raises_on_invalid_arguments(self, old, new, message: str):
+        with pytest.raises(ValueError, match=message):
+            TextReplacer.from_args(old, new)
@@ -0,0 +1,50 @@
+"""Unit test suite for the docx.text.textutil module."""
+
+from __future__ import annotations
+
+from typing import cast
+
+import pytest
+
+from docx.oxml.text.paragraph import CT_P
+from docx.text.textutil import ParagraphTextIndex, set_text
+
+from ..unitutil.cxml import element, xml
+
+
+class DescribeParagraphTextIndex:
+    """Unit-test suite for `docx.text.textutil.ParagraphTextIndex` objects."""
+
+    def it_indexes_the_text_of_a_paragraph_across_runs(self):
+        p = cast(CT_P, element('w:p/(w:r/w:t"ab",w:hyperlink/w:r/(w:tab,w:t"cd"))'))
+
+        index = ParagraphTextIndex(p)
+
+        assert index.text == "ab\tcd"
+
+    def it_can_replace_a_range_of_the_text_spanning_runs(self):
+        p = cast(CT_P, element('w:p/(w:r/w:t"abc",w:r/w:t"def")'))
+
+        assert ParagraphTextIndex(p).replace(1, 5, "X") is True
+
+        assert p.xml == xml('w:p/(w:r/w:t"aX",w:r/w:t"f")')
+
+    def but_not_a_range_overlapping_a_tab(self):
+        p = cast(CT_P, element('w:p/w:r/(w:t"ab",w:tab,w:t"cd")'))
+
+        assert ParagraphTextIndex(p).replace(1, 4, "X") is False
+
+
+class DescribeSetText:
+    """Unit-test suite for `docx.text.textutil.set_text()`."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected_cxml"),
+        [("foo", 'w:t"foo"'), (" foo", 'w:t{xml:space=preserve}" foo"')],
+    )
+    def it_preserves_leading_and_trailing_space(self, text: str, expected_cxml: str):
+        t = element("w:t")
+
+        set_text(t, text)
+
+        assert t.xml == xml(expected_cxml)
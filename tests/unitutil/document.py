@@ -0,0 +1,16 @@
+"""Utility functions for building documents for unit testing."""
+
+from __future__ import annotations
+
+from docx import Document
+from docx.document import Document as DocumentObject
+
+from .cxml import element
+
+
+def document_with_body(body_cxml: str) -> DocumentObject:
+    """A new default document whose `w:body` is the element described by `body_cxml`."""
+    document = Document()
+    body = document.element.body
+    body.getparent().replace(body, element(body_cxml))
+    return document